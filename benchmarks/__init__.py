@@ -0,0 +1,10 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Micro-benchmarks for Pyoda Time.
+
+These are loosely modelled on the ``NodaTime.Benchmarks`` project. They are not part of the test suite; each module
+can be run directly from the root of the repository, for example::
+
+    python -m benchmarks.bench_towards_zero_division
+"""
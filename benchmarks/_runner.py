@@ -0,0 +1,37 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Shared helpers for running and reporting micro-benchmarks."""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+__all__ = ["compare", "measure", "report"]
+
+
+def measure(func: Callable[[], object], *, number: int = 10_000, repeat: int = 5) -> float:
+    """Return the best observed time, in nanoseconds, of a single call to ``func``."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def report(title: str, cases: Mapping[str, Callable[[], object]], *, number: int = 10_000) -> dict[str, float]:
+    """Measure and print each benchmark case, returning the nanoseconds per call keyed by case name."""
+    print(title)
+    results: dict[str, float] = {}
+    for name, func in cases.items():
+        results[name] = nanoseconds = measure(func, number=number)
+        print(f"  {name:<60} {nanoseconds:>12,.1f} ns")
+    return results
+
+
+def compare(title: str, baseline: Mapping[str, float], candidate: Mapping[str, float]) -> None:
+    """Print the speed-up of ``candidate`` over ``baseline`` for each case present in both."""
+    print(title)
+    for name, before in baseline.items():
+        if (after := candidate.get(name)) is not None:
+            print(f"  {name:<60} {before:>10,.1f} ns -> {after:>10,.1f} ns  ({before / after:.2f}x)")
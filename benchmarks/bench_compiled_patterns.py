@@ -0,0 +1,76 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for parsing with custom patterns which are compiled to a single regular expression.
+
+Each case is measured twice: once with patterns built as they were before compilation, so that they're parsed by
+stepping through the text with each parse action in turn, and once with patterns built as they are now.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pyoda_time.text import (
+    DurationPattern,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    LocalTimePattern,
+    OffsetPattern,
+)
+from pyoda_time.text.patterns._stepped_pattern_builder import _SteppedPatternBuilder
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@contextmanager
+def _stepped_only() -> Iterator[None]:
+    """Temporarily build patterns without the regular expressions of their parse actions."""
+    add_parse_action = _SteppedPatternBuilder._add_parse_action
+
+    def add_parse_action_without_regex(
+        self: _SteppedPatternBuilder[Any], parse_action: Any, regex: str | None = None, regex_setter: Any = None
+    ) -> None:
+        add_parse_action(self, parse_action)
+
+    setattr(_SteppedPatternBuilder, "_add_parse_action", add_parse_action_without_regex)
+    try:
+        yield
+    finally:
+        setattr(_SteppedPatternBuilder, "_add_parse_action", add_parse_action)
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    # Patterns created with the invariant culture aren't cached, so these are built afresh each time.
+    log_timestamp = LocalDateTimePattern.create_with_invariant_culture("uuuu-MM-dd'T'HH:mm:ss.fffffffff")
+    sortable = LocalDateTimePattern.create_with_invariant_culture("uuuu-MM-dd HH:mm:ss")
+    local_date = LocalDatePattern.create_with_invariant_culture("uuuuMMdd")
+    local_time = LocalTimePattern.create_with_invariant_culture("HH:mm:ss.FFFFFFFFF")
+    offset = OffsetPattern.create_with_invariant_culture("+HH:mm")
+    duration = DurationPattern.create_with_invariant_culture("-D:hh:mm:ss.FFFFFFFFF")
+    return {
+        "uuuu-MM-dd'T'HH:mm:ss.fffffffff": lambda: log_timestamp.parse("2021-03-04T05:06:07.123456789"),
+        "uuuu-MM-dd'T'HH:mm:ss.fffffffff (invalid)": lambda: log_timestamp.parse("2021-03-04T05:06:07.12345678x"),
+        "uuuu-MM-dd HH:mm:ss": lambda: sortable.parse("2021-03-04 05:06:07"),
+        "uuuuMMdd": lambda: local_date.parse("20210304"),
+        "HH:mm:ss.FFFFFFFFF": lambda: local_time.parse("13:45:56.789"),
+        "+HH:mm": lambda: offset.parse("-05:30"),
+        "-D:hh:mm:ss.FFFFFFFFF": lambda: duration.parse("-1:02:03:04.5"),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with both stepped and compiled patterns, and report the speed-up."""
+    with _stepped_only():
+        stepped_cases = _cases()
+    before = report("Stepped parse actions", stepped_cases)
+    after = report("Compiled regular expression", _cases())
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for writing 10,000 formatted values to a text stream with ``format_many``.
+
+The baseline writes ``format(value)`` and a newline to the stream for each value, which is the obvious way of
+exporting values without ``format_many``.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any
+
+from pyoda_time import Duration, LocalDate, LocalDateTime
+from pyoda_time.text import DurationPattern, LocalDatePattern, LocalDateTimePattern
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def _columns() -> dict[str, tuple[Any, list[Any]]]:
+    dates = [LocalDate(2021, 1, 1).plus_days(i) for i in range(10_000)]
+    return {
+        "LocalDate (ISO)": (LocalDatePattern.iso, dates),
+        "LocalDateTime (custom)": (
+            LocalDateTimePattern.create_with_invariant_culture("dd/MM/uuuu HH:mm:ss"),
+            [date.at(LocalDateTime(2021, 1, 1, 5, 6, 7).time_of_day) for date in dates],
+        ),
+        "Duration (roundtrip)": (DurationPattern.roundtrip, [Duration.from_seconds(i) for i in range(10_000)]),
+    }
+
+
+def _write_each(pattern: Any, values: Sequence[Any]) -> str:
+    writer = io.StringIO()
+    for value in values:
+        writer.write(pattern.format(value))
+        writer.write("\n")
+    return writer.getvalue()
+
+
+def _format_many(pattern: Any, values: Sequence[Any]) -> str:
+    writer = io.StringIO()
+    pattern.format_many(values, writer)
+    return writer.getvalue()
+
+
+def _cases(function: Callable[[Any, Sequence[Any]], str]) -> dict[str, Callable[[], object]]:
+    return {
+        name: lambda pattern=pattern, values=values: function(pattern, values)  # type: ignore[misc]
+        for name, (pattern, values) in _columns().items()
+    }
+
+
+def main() -> None:
+    """Run the benchmarks value by value and with ``format_many``, and report the speed-up."""
+    before = report("format and write (10,000 values)", _cases(_write_each), number=5)
+    after = report("format_many (10,000 values)", _cases(_format_many), number=5)
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for converting between days-since-epoch values and ISO years, months and days.
+
+Each case is measured twice: once with the year-based calculation of ``_YearMonthDayCalculator`` (which estimates the
+year, corrects it using the year-start cache, and then finds the month), and once with the closed-form conversions of
+``_GregorianYearMonthDayCalculator``. Before the closed-form conversions, the year-based calculation was used for
+everything outside 1900-2100; within that range, days-since-epoch values were converted using a table of year starts
+(so the 2021 cases of the first run don't show the previous timings).
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import partial
+from itertools import cycle
+from typing import TYPE_CHECKING
+
+from pyoda_time import CalendarSystem, LocalDate
+from pyoda_time._year_month_day import _YearMonthDay
+from pyoda_time.calendars._gregorian_year_month_day_calculator import _GregorianYearMonthDayCalculator
+from pyoda_time.calendars._year_month_day_calculator import _YearMonthDayCalculator
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pyoda_time._year_month_day_calendar import _YearMonthDayCalendar
+
+
+def _year_based_calendar_from_days(days_since_epoch: int) -> _YearMonthDayCalendar:
+    """The previous ``_get_gregorian_year_month_day_calendar_from_days_since_epoch`` outside 1900-2100."""
+    return CalendarSystem.iso._get_year_month_day_calendar_from_days_since_epoch(days_since_epoch)
+
+
+@contextmanager
+def _year_based() -> Iterator[None]:
+    """Temporarily convert using the year-based calculation of the base class."""
+    cls = _GregorianYearMonthDayCalculator
+    methods = {
+        name: cls.__dict__[name]
+        for name in (
+            "_get_gregorian_year_month_day_calendar_from_days_since_epoch",
+            "_get_year_month_day_from_days_since_epoch",
+            "_get_days_since_epoch",
+        )
+    }
+    setattr(cls, "_get_gregorian_year_month_day_calendar_from_days_since_epoch", _year_based_calendar_from_days)
+    setattr(
+        cls,
+        "_get_year_month_day_from_days_since_epoch",
+        _YearMonthDayCalculator._get_year_month_day_from_days_since_epoch,
+    )
+    setattr(cls, "_get_days_since_epoch", _YearMonthDayCalculator._get_days_since_epoch)
+    try:
+        yield
+    finally:
+        for name, method in methods.items():
+            setattr(cls, name, method)
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    calculator = CalendarSystem.iso._year_month_day_calculator
+    cases: dict[str, Callable[[], object]] = {}
+    for year in (-5000, 1500, 2021, 9000):
+        year_month_day = _YearMonthDay._ctor(year=year, month=8, day=17)
+        days = calculator._get_days_since_epoch(year_month_day)
+        cases[f"days -> LocalDate ({year})"] = partial(LocalDate._ctor, days_since_epoch=days)
+        cases[f"year/month/day -> days ({year})"] = partial(calculator._get_days_since_epoch, year_month_day)
+    # Dates spread over the whole range, as in archival data, rarely hit the year start cache.
+    spread_days = cycle(range(CalendarSystem.iso._min_days, CalendarSystem.iso._max_days, 7919))
+    spread_dates = cycle(
+        _YearMonthDay._ctor(year=year, month=8, day=17)
+        for year in range(CalendarSystem.iso.min_year, CalendarSystem.iso.max_year, 13)
+    )
+    cases["days -> LocalDate (spread over the whole range)"] = lambda: LocalDate._ctor(
+        days_since_epoch=next(spread_days)
+    )
+    cases["year/month/day -> days (spread over the whole range)"] = lambda: calculator._get_days_since_epoch(
+        next(spread_dates)
+    )
+    return cases
+
+
+def main() -> None:
+    """Run the benchmarks with the year-based and closed-form conversions, and compare the two."""
+    with _year_based():
+        before = report("Year-based conversions", _cases())
+    after = report("Closed-form conversions", _cases())
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
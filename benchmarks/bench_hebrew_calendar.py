@@ -0,0 +1,57 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for the Hebrew calendar, of the kind of conversions used to find holidays.
+
+The "spread" cases cycle through years across the whole range of the calendar. The results can be compared across
+commits by running this module on each.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from itertools import cycle
+from typing import TYPE_CHECKING
+
+from pyoda_time import CalendarSystem, LocalDate
+from pyoda_time.calendars import HebrewMonthNumbering
+
+from ._runner import report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _spread(function: Callable[[int], object]) -> Callable[[], object]:
+    """Returns a function calling the given one with every seventh year of the calendar in turn."""
+    years = cycle(range(1, 9999, 7))
+    return lambda: function(next(years))
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    civil = CalendarSystem.hebrew_civil
+    scriptural = CalendarSystem.hebrew_scriptural
+    iso_date = LocalDate(2024, 10, 17)
+    hebrew_date = LocalDate(5785, 7, 15, scriptural)
+    return {
+        "LocalDate(5785, 7, 15) (scriptural)": partial(LocalDate, 5785, 7, 15, scriptural),
+        "LocalDate(5785, 1, 15) (civil)": partial(LocalDate, 5785, 1, 15, civil),
+        "ISO date with_calendar (scriptural)": partial(iso_date.with_calendar, scriptural),
+        "ISO date with_calendar (civil)": partial(iso_date.with_calendar, civil),
+        "Hebrew date with_calendar (ISO)": partial(hebrew_date.with_calendar, CalendarSystem.iso),
+        "Hebrew date plus_days(100)": partial(hebrew_date.plus_days, 100),
+        "get_days_in_month (Heshvan)": partial(scriptural.get_days_in_month, 5785, 8),
+        "LocalDate(year, 7, 15), spread (scriptural)": _spread(lambda year: LocalDate(year, 7, 15, scriptural)),
+        "get_days_in_year, spread": _spread(
+            CalendarSystem.get_hebrew_calendar(HebrewMonthNumbering.CIVIL).get_days_in_year
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    report("Hebrew calendar", _cases())
+
+
+if __name__ == "__main__":
+    main()
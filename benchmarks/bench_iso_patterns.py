@@ -0,0 +1,127 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for the hand-written ISO-8601 patterns, compared with the generic patterns and with the standard library.
+
+The generic patterns are created with the same pattern text while the fast paths are disabled. The standard library
+timings use ``datetime.fromisoformat`` and ``datetime.isoformat`` on equivalent values, as a reference point for what
+a C implementation achieves.
+"""
+
+from __future__ import annotations
+
+import datetime
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pyoda_time import DateTimeZoneProviders, Instant, LocalDate, LocalDateTime, Offset
+from pyoda_time.text import (
+    InstantPattern,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    OffsetDateTimePattern,
+    ZonedDateTimePattern,
+)
+from pyoda_time.text._iso_patterns import (
+    _IsoInstantPattern,
+    _IsoLocalDatePattern,
+    _IsoLocalDateTimePattern,
+    _IsoOffsetDateTimePattern,
+    _IsoZonedDateTimePattern,
+)
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@contextmanager
+def _generic_only() -> Iterator[None]:
+    """Temporarily create patterns without selecting a fast path."""
+    wraps = {
+        cls: cls.__dict__["_wrap"]
+        for cls in (
+            _IsoLocalDatePattern,
+            _IsoLocalDateTimePattern,
+            _IsoInstantPattern,
+            _IsoOffsetDateTimePattern,
+            _IsoZonedDateTimePattern,
+        )
+    }
+
+    def no_wrap(*args: Any) -> Any:
+        return args[-1]
+
+    for cls in wraps:
+        setattr(cls, "_wrap", staticmethod(no_wrap))
+    try:
+        yield
+    finally:
+        for cls, wrap in wraps.items():
+            setattr(cls, "_wrap", wrap)
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    # Patterns created with the invariant culture aren't cached, so these are built afresh each time.
+    local_date = LocalDatePattern.create_with_invariant_culture("uuuu'-'MM'-'dd")
+    general_iso = LocalDateTimePattern.create_with_invariant_culture("uuuu'-'MM'-'dd'T'HH':'mm':'ss")
+    extended_iso = LocalDateTimePattern.create_with_invariant_culture("uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF")
+    instant = InstantPattern.create_with_invariant_culture("uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF'Z'")
+    rfc3339 = OffsetDateTimePattern.create_with_invariant_culture("uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<Z+HH:mm>")
+    zoned = ZonedDateTimePattern.create_with_invariant_culture(
+        "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF z '('o<g>')'", DateTimeZoneProviders.tzdb
+    )
+    date_value = LocalDate(2021, 3, 4)
+    local_date_time_value = LocalDateTime(2021, 3, 4, 5, 6, 7).plus_nanoseconds(123456789)
+    instant_value = Instant.from_utc(2021, 3, 4, 5, 6, 7).plus_nanoseconds(123456789)
+    offset_date_time_value = local_date_time_value.with_offset(Offset.from_hours(-5))
+    zoned_date_time_value = instant_value.in_zone(DateTimeZoneProviders.tzdb["America/New_York"])
+    return {
+        "parse LocalDate": lambda: local_date.parse("2021-03-04"),
+        "parse LocalDateTime (general)": lambda: general_iso.parse("2021-03-04T05:06:07"),
+        "parse LocalDateTime (extended)": lambda: extended_iso.parse("2021-03-04T05:06:07.123456789"),
+        "parse Instant (extended)": lambda: instant.parse("2021-03-04T05:06:07.123456789Z"),
+        "parse OffsetDateTime (RFC 3339)": lambda: rfc3339.parse("2021-03-04T05:06:07.123456789-05:00"),
+        "parse ZonedDateTime (extended)": lambda: zoned.parse("2021-03-04T00:06:07.123456789 America/New_York (-05)"),
+        "format LocalDate": lambda: local_date.format(date_value),
+        "format LocalDateTime (general)": lambda: general_iso.format(local_date_time_value),
+        "format LocalDateTime (extended)": lambda: extended_iso.format(local_date_time_value),
+        "format Instant (extended)": lambda: instant.format(instant_value),
+        "format OffsetDateTime (RFC 3339)": lambda: rfc3339.format(offset_date_time_value),
+        "format ZonedDateTime (extended)": lambda: zoned.format(zoned_date_time_value),
+    }
+
+
+def _standard_library_cases() -> dict[str, Callable[[], object]]:
+    date_value = datetime.date(2021, 3, 4)
+    date_time_value = datetime.datetime(2021, 3, 4, 5, 6, 7, 123456)
+    aware_value = date_time_value.replace(tzinfo=datetime.UTC)
+    offset_value = date_time_value.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=-5)))
+    return {
+        "parse LocalDate": lambda: datetime.date.fromisoformat("2021-03-04"),
+        "parse LocalDateTime (general)": lambda: datetime.datetime.fromisoformat("2021-03-04T05:06:07"),
+        "parse LocalDateTime (extended)": lambda: datetime.datetime.fromisoformat("2021-03-04T05:06:07.123456"),
+        "parse Instant (extended)": lambda: datetime.datetime.fromisoformat("2021-03-04T05:06:07.123456Z"),
+        "parse OffsetDateTime (RFC 3339)": lambda: datetime.datetime.fromisoformat("2021-03-04T05:06:07.123456-05:00"),
+        "format LocalDate": date_value.isoformat,
+        "format LocalDateTime (general)": lambda: date_time_value.isoformat(timespec="seconds"),
+        "format LocalDateTime (extended)": date_time_value.isoformat,
+        "format Instant (extended)": aware_value.isoformat,
+        "format OffsetDateTime (RFC 3339)": offset_value.isoformat,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with generic and hand-written patterns, and compare both with the standard library."""
+    with _generic_only():
+        generic_cases = _cases()
+    before = report("Generic patterns", generic_cases)
+    after = report("Hand-written ISO patterns", _cases())
+    standard_library = report("datetime (microsecond precision)", _standard_library_cases())
+    compare("Speed-up over generic patterns", before, after)
+    compare("Slow-down relative to datetime", standard_library, after)
+
+
+if __name__ == "__main__":
+    main()
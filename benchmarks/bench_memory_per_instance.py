@@ -0,0 +1,106 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Memory benchmarks for the core value types.
+
+Each case creates a large number of distinct values and uses ``tracemalloc`` to measure the memory they occupy,
+including any objects they own (for example the ``Duration`` inside an ``Instant``), but not objects they share (such
+as calendar systems and time zones). The result is reported in bytes per instance, alongside the size of the instance
+itself and whether it has a per-instance ``__dict__``.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from pyoda_time import (
+    DateTimeZoneProviders,
+    Duration,
+    Instant,
+    LocalDate,
+    LocalDateTime,
+    LocalTime,
+    Offset,
+    OffsetDateTime,
+    PyodaConstants,
+    ZonedDateTime,
+)
+from pyoda_time._calendar_ordinal import _CalendarOrdinal
+from pyoda_time._local_instant import _LocalInstant
+from pyoda_time._year_month_day_calendar import _YearMonthDayCalendar
+from pyoda_time.time_zones import ZoneInterval
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_COUNT = 100_000
+
+
+def _nano_of_day(i: int) -> int:
+    """Return a distinct, valid nanosecond-of-day for each ``i``, large enough not to be a cached small int."""
+    return 1_000_000_007 * i % PyodaConstants.NANOSECONDS_PER_DAY
+
+
+def bytes_per_instance(factory: Callable[[int], object], count: int = _COUNT) -> float:
+    """Return the memory allocated per value when ``count`` values are created by ``factory`` and kept alive.
+
+    The list which holds the values is allocated before measuring starts, so it isn't included.
+    """
+    values: list[object] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            values[i] = factory(i)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def _cases() -> dict[str, Callable[[int], object]]:
+    london = DateTimeZoneProviders.tzdb["Europe/London"]
+    base_local_date_time = LocalDateTime(2020, 1, 1, 0, 0)
+    base_instant = Instant.from_utc(2020, 1, 1, 0, 0)
+    offset = Offset.from_hours(1)
+    return {
+        "Instant": lambda i: Instant._ctor(days=18_000 + i, nano_of_day=_nano_of_day(i)),
+        "Duration": lambda i: Duration._ctor(days=i, nano_of_day=_nano_of_day(i)),
+        "LocalDate": lambda i: LocalDate._ctor(days_since_epoch=i),
+        "LocalTime": lambda i: LocalTime._ctor(nanoseconds=_nano_of_day(i)),
+        "LocalDateTime": lambda i: base_local_date_time.plus_seconds(i * 997),
+        "Offset": lambda i: Offset._ctor(seconds=i % 36_000),
+        "OffsetDateTime": lambda i: OffsetDateTime(base_local_date_time.plus_seconds(i * 997), offset),
+        "ZonedDateTime": lambda i: ZonedDateTime(instant=base_instant.plus_nanoseconds(i * 997), zone=london),
+        "_YearMonthDayCalendar": lambda i: _YearMonthDayCalendar._ctor(
+            year=2000 + i % 1000, month=1 + i % 12, day=1 + i % 28, calendar_ordinal=_CalendarOrdinal.ISO
+        ),
+        "_LocalInstant": lambda i: _LocalInstant._ctor(days=i, nano_of_day=_nano_of_day(i)),
+        "ZoneInterval": lambda i: ZoneInterval(
+            name="Interval",
+            start=base_instant.plus_nanoseconds(i * 997),
+            end=base_instant.plus_nanoseconds(i * 997 + 1_000_000_000),
+            wall_offset=offset,
+            savings=Offset.zero,
+        ),
+    }
+
+
+def main() -> None:
+    """Report the memory used by each core value type."""
+    print(f"Memory per instance ({_COUNT:,} instances)")
+    print(f"  {'Type':<24} {'bytes/instance':>16} {'sys.getsizeof':>16} {'__dict__':>10}")
+    for name, factory in _cases().items():
+        sample = factory(1)
+        print(
+            f"  {name:<24} {bytes_per_instance(factory):>16,.1f} {sys.getsizeof(sample):>16,} "
+            f"{'yes' if hasattr(sample, '__dict__') else 'no':>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for matching month, day and era names, directly and through the generic patterns.
+
+Matching is measured twice: once with the previous approach, which compared each candidate name case-insensitively in
+turn (genitive names first, then non-genitive ones), and once with the name tries of ``_PyodaFormatInfo``. The pattern
+cases only use the tries; they can be compared across commits by running this module on each.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyoda_time import CalendarSystem
+from pyoda_time._compatibility._culture_info import CultureInfo
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text import LocalDatePattern
+from pyoda_time.text._value_cursor import _ValueCursor
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pyoda_time.text._name_trie import _NameTrie
+
+
+def _find_longest_match(cursor: _ValueCursor, *value_lists: Sequence[str]) -> tuple[int, int] | None:
+    """The previous matching of ``_SteppedPatternBuilder._add_parse_longest_text_action``."""
+    best_index = -1
+    longest_match = 0
+    for values in value_lists:
+        for i, candidate in enumerate(values):
+            if candidate is None or len(candidate) <= longest_match:
+                continue
+            if cursor._match_case_insensitive(candidate, False):
+                best_index = i
+                longest_match = len(candidate)
+    return (best_index, longest_match) if best_index != -1 else None
+
+
+def _cursor(text: str) -> _ValueCursor:
+    cursor = _ValueCursor(text)
+    cursor.move_next()
+    return cursor
+
+
+def _scan_cases(info: _PyodaFormatInfo) -> dict[str, Callable[[], object]]:
+    month = _cursor("Septembre 2021")
+    short_month = _cursor("déc. 2021")
+    day = _cursor("dimanche 4")
+    era = _cursor("ap. J.-C.")
+    eras = [info.get_era_names(era) for era in CalendarSystem.iso.eras()]
+
+    def match_era() -> object:
+        for names in eras:
+            for name in names:
+                if era._match_case_insensitive(name, False):
+                    return name
+        return None
+
+    return {
+        "long month name": lambda: _find_longest_match(month, info.long_month_genitive_names, info.long_month_names),
+        "short month name": lambda: _find_longest_match(
+            short_month, info.short_month_genitive_names, info.short_month_names
+        ),
+        "long day name": lambda: _find_longest_match(day, info.long_day_names),
+        "era name": match_era,
+    }
+
+
+def _trie_cases(info: _PyodaFormatInfo) -> dict[str, Callable[[], object]]:
+    def match(trie: _NameTrie[object], text: str) -> Callable[[], object]:
+        cursor = _cursor(text)
+        return lambda: trie._match_longest(cursor)
+
+    return {
+        "long month name": match(info._long_month_name_trie, "Septembre 2021"),
+        "short month name": match(info._short_month_name_trie, "déc. 2021"),
+        "long day name": match(info._long_day_name_trie, "dimanche 4"),
+        "era name": match(info._get_era_name_trie(CalendarSystem.iso), "ap. J.-C."),
+    }
+
+
+def _pattern_cases(culture: CultureInfo) -> dict[str, Callable[[], object]]:
+    long_date = LocalDatePattern.create("dddd d MMMM uuuu", culture)
+    short_date = LocalDatePattern.create("ddd d MMM yyyy g", culture)
+    return {
+        "parse LocalDate (dddd d MMMM uuuu)": lambda: long_date.parse("dimanche 5 septembre 2021"),
+        "parse LocalDate (ddd d MMM yyyy g)": lambda: short_date.parse("dim. 5 sept. 2021 ap. J.-C."),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with linear scans and tries, and compare the two."""
+    culture = CultureInfo.read_only(CultureInfo.get_culture_info("fr-FR"))
+    info = _PyodaFormatInfo._get_format_info(culture)
+    before = report("Linear scan of names (fr-FR)", _scan_cases(info))
+    after = report("Name tries (fr-FR)", _trie_cases(info))
+    compare("Speed-up", before, after)
+    report("Patterns (fr-FR)", _pattern_cases(culture))
+
+
+if __name__ == "__main__":
+    main()
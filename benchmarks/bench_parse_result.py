@@ -0,0 +1,54 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for creating ``ParseResult`` values, directly and through the generic patterns.
+
+Failures are checked with ``success`` only, as callers which try several patterns (or just validate text) do, so
+their exceptions are never requested. The results can be compared across commits by running this module on each.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyoda_time import LocalDate
+from pyoda_time.text import LocalDatePattern, LocalDateTimePattern, ParseResult
+from pyoda_time.text._value_cursor import _ValueCursor
+
+from ._runner import report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    # Patterns created with the invariant culture aren't cached, and none of these have a hand-written fast path.
+    local_date = LocalDatePattern.create_with_invariant_culture("dd MMMM uuuu")
+    local_date_time = LocalDateTimePattern.create_with_invariant_culture("dd/MM/uuuu HH:mm:ss")
+    # The standard "G" pattern of LocalDateTime tries two patterns for each value.
+    composite = LocalDateTimePattern.create_with_invariant_culture("G")
+    value = LocalDate(2021, 3, 4)
+    cursor = _ValueCursor("2021-03-04")
+    cursor.move(4)
+    return {
+        "ParseResult.for_value": lambda: ParseResult.for_value(value),
+        "ParseResult._mismatched_character": lambda: ParseResult._mismatched_character(cursor, "/").success,
+        "ParseResult._day_of_month_out_of_range": lambda: (
+            ParseResult._day_of_month_out_of_range("31 February 2021", 31, 2, 2021).success
+        ),
+        "parse LocalDate (success)": lambda: local_date.parse("04 March 2021").success,
+        "parse LocalDate (bad day of month)": lambda: local_date.parse("31 February 2021").success,
+        "parse LocalDateTime (success)": lambda: local_date_time.parse("04/03/2021 05:06:07").success,
+        "parse LocalDateTime (bad separator)": lambda: local_date_time.parse("04-03-2021 05:06:07").success,
+        "parse LocalDateTime (extra text)": lambda: local_date_time.parse("04/03/2021 05:06:07 UTC").success,
+        "parse LocalDateTime composite (second pattern)": lambda: composite.parse("03/04/2021 05:06:07").success,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    report("ParseResult", _cases())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for zone interval lookups in ``_PrecalculatedDateTimeZone``, without the zone interval cache.
+
+The cold cases read each zone from the bundled TZDB data and make a single lookup, as the first request for a zone in a
+new process would. The warm cases sweep a zone once a month from 1900 to 2090, either with the tail zone intervals
+kept as they are looked up, or with them expanded into the interval table ahead of time (as by
+``DateTimeZoneCache.warm``).
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyoda_time import Duration, Instant
+from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+from pyoda_time.time_zones._tzdb_date_time_zone_source import TzdbDateTimeZoneSource
+
+from ._runner import report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_SOURCE = TzdbDateTimeZoneSource.default
+_SWEEP = [Instant.from_utc(1900, 1, 1, 0, 0) + Duration.from_days(days) for days in range(0, 69_400, 30)]
+
+
+def _load(zone_id: str) -> _PrecalculatedDateTimeZone:
+    zone = getattr(time_zone := _SOURCE.for_id(zone_id), "_time_zone", time_zone)
+    assert isinstance(zone, _PrecalculatedDateTimeZone)
+    return zone
+
+
+def _first_lookup(zone_ids: Sequence[str], instant: Instant) -> None:
+    for zone_id in zone_ids:
+        _load(zone_id).get_zone_interval(instant)
+
+
+def _sweep(zone: _PrecalculatedDateTimeZone) -> None:
+    for instant in _SWEEP:
+        zone.get_zone_interval(instant)
+
+
+def _cold_cases() -> dict[str, Callable[[], object]]:
+    precalculated = [zone_id for zone_id in _SOURCE.get_ids() if _SOURCE.canonical_id_map[zone_id] == zone_id]
+    precalculated = [zone_id for zone_id in precalculated if not _SOURCE.for_id(zone_id)._is_fixed]
+    return {
+        "Europe/London, 2026": partial(_first_lookup, ["Europe/London"], Instant.from_utc(2026, 6, 1, 0, 0)),
+        "Australia/Sydney, 2090": partial(_first_lookup, ["Australia/Sydney"], Instant.from_utc(2090, 6, 1, 0, 0)),
+        f"All {len(precalculated)} canonical zones, 2026": partial(
+            _first_lookup, precalculated, Instant.from_utc(2026, 6, 1, 0, 0)
+        ),
+    }
+
+
+def _warm_cases() -> dict[str, Callable[[], object]]:
+    looked_up = _load("Europe/London")
+    expanded = _load("Europe/London")
+    expanded._expand_tail_zone(_SWEEP[-1])
+    return {
+        "Europe/London, tail zone intervals kept on lookup": partial(_sweep, looked_up),
+        "Europe/London, tail zone expanded ahead of time": partial(_sweep, expanded),
+    }
+
+
+def main() -> None:
+    """Run the cold and warm benchmarks."""
+    report("Cold: read zone and first get_zone_interval", _cold_cases(), number=3)
+    report(f"Warm: get_zone_interval sweep ({len(_SWEEP)} instants)", _warm_cases(), number=20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for splitting a column of day numbers into calendar fields with ``CalendarSystem.split_days``, compared
+with constructing a ``LocalDate`` for each value.
+
+Each column holds 1,000 dates spread across 1900-2100 (ISO). The per-value baseline collects the same five fields into
+lists.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyoda_time import CalendarSystem, LocalDate
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_CALENDARS = (CalendarSystem.iso, CalendarSystem.julian, CalendarSystem.coptic, CalendarSystem.hebrew_civil)
+_DAYS = [-25567 + i * 73 for i in range(1000)]
+
+
+def _split_each(calendar: CalendarSystem, values: Sequence[int]) -> tuple[list[int], ...]:
+    years: list[int] = []
+    months: list[int] = []
+    days: list[int] = []
+    days_of_year: list[int] = []
+    days_of_week: list[int] = []
+    for value in values:
+        date = LocalDate._ctor(days_since_epoch=value, calendar=calendar)
+        years.append(date.year)
+        months.append(date.month)
+        days.append(date.day)
+        days_of_year.append(date.day_of_year)
+        days_of_week.append(date.day_of_week)
+    return years, months, days, days_of_year, days_of_week
+
+
+def _cases(batch: bool) -> dict[str, Callable[[], object]]:
+    return {
+        calendar.id: partial(calendar.split_days, _DAYS) if batch else partial(_split_each, calendar, _DAYS)
+        for calendar in _CALENDARS
+    }
+
+
+def main() -> None:
+    """Run the benchmarks per value and in batches, and report the speed-up."""
+    before = report("LocalDate per value (1,000 values)", _cases(batch=False), number=20)
+    after = report("split_days (1,000 values)", _cases(batch=True), number=20)
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for formatting values with long patterns, which append many pieces to a ``StringBuilder``.
+
+Each pattern case is measured twice: once with the previous ``StringBuilder``, which concatenated each appended
+string onto a single ``str``, and once with the current one, which joins the pieces once at the end. ``Period``
+values are formatted without a ``StringBuilder``, and are included for comparison across runs.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Self
+
+from pyoda_time import Duration, LocalDateTime, Period
+from pyoda_time.text import DurationPattern, LocalDateTimePattern
+from pyoda_time.text.patterns import _stepped_pattern_builder
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class _ConcatenatingStringBuilder:
+    """The previous implementation of ``StringBuilder``, which reallocates its string on every append."""
+
+    __slots__ = ("__string",)
+
+    def __init__(self, string: str = "", start_index: int = 0, length: int = 0, capacity: int = 16) -> None:
+        self.__string = string
+
+    def __getitem__(self, item: int) -> str:
+        return self.__string.__getitem__(item)
+
+    @property
+    def length(self) -> int:
+        return len(self.__string)
+
+    @length.setter
+    def length(self, value: int) -> None:
+        self.__string = self.__string[:value]
+
+    def append(self, string: str) -> Self:
+        self.__string += string
+        return self
+
+    def to_string(self) -> str:
+        return self.__string
+
+
+@contextmanager
+def _concatenating_string_builder() -> Iterator[None]:
+    """Temporarily format with the previous ``StringBuilder``."""
+    string_builder = getattr(_stepped_pattern_builder, "StringBuilder")
+    setattr(_stepped_pattern_builder, "StringBuilder", _ConcatenatingStringBuilder)
+    try:
+        yield
+    finally:
+        setattr(_stepped_pattern_builder, "StringBuilder", string_builder)
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    # Each field may only appear once, so pad the fields out with literal text escaped one character at a time,
+    # which adds a format action (and so an append) per character.
+    separator = "".join(f"\\{c}" for c in " -- and then -- ")
+    long_pattern = LocalDateTimePattern.create_with_invariant_culture(
+        separator.join(["dddd", "dd", "MMMM", "uuuu", "HH", "mm", "ss", "fffffffff"])
+    )
+    duration_pattern = DurationPattern.create_with_invariant_culture("-D'd' hh'h' mm'm' ss.FFFFFFFFF's'")
+    local_date_time = LocalDateTime(2021, 3, 4, 5, 6, 7).plus_nanoseconds(123456789)
+    duration = Duration.from_nanoseconds(-123456789012345678)
+    period = Period.from_years(1) + Period.from_months(2) + Period.from_days(3) + Period.from_nanoseconds(4)
+
+    def format_durations() -> None:
+        for _ in range(100):
+            duration_pattern.format(duration)
+
+    def format_periods() -> None:
+        for _ in range(100):
+            str(period)
+
+    return {
+        "LocalDateTime, 120-action pattern": lambda: long_pattern.format(local_date_time),
+        "Duration x 100": format_durations,
+        "Period x 100": format_periods,
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with both string builders, and report the speed-up."""
+    with _concatenating_string_builder():
+        before = report("Concatenating StringBuilder", _cases(), number=200)
+    after = report("Joining StringBuilder", _cases(), number=200)
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for ``_towards_zero_division`` and the public members which depend upon it.
+
+Each caller is measured twice: once with the ``Decimal``-based implementation which predates the integer fast path,
+and once with the current implementation.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from decimal import ROUND_DOWN, Decimal
+from typing import TYPE_CHECKING
+
+from pyoda_time import (
+    CalendarSystem,
+    DateTimeZoneProviders,
+    Duration,
+    Instant,
+    LocalDate,
+    LocalTime,
+    Offset,
+    Period,
+)
+from pyoda_time.text import LocalTimePattern, OffsetPattern
+from pyoda_time.utility import _csharp_compatibility
+from pyoda_time.utility._csharp_compatibility import _towards_zero_division
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+def _decimal_towards_zero_division(x: float | Decimal, y: float | Decimal) -> int:
+    return int((Decimal(x) / Decimal(y)).quantize(0, ROUND_DOWN))
+
+
+@contextmanager
+def _patched(implementation: Callable[[float | Decimal, float | Decimal], int]) -> Iterator[None]:
+    """Temporarily replace ``_towards_zero_division`` in every module which has imported it."""
+    modules = [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith("pyoda_time") and getattr(module, "_towards_zero_division", None) is _towards_zero_division
+    ]
+    for module in modules:
+        setattr(module, "_towards_zero_division", implementation)
+    try:
+        yield
+    finally:
+        for module in modules:
+            setattr(module, "_towards_zero_division", _towards_zero_division)
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    duration = Duration.from_nanoseconds(-123_456_789_012_345)
+    local_time = LocalTime(13, 45, 56, 789)
+    instant = Instant.from_unix_time_ticks(15_000_000_000_000_000)
+    london = DateTimeZoneProviders.tzdb["Europe/London"]
+    london_instant = Instant.from_utc(2015, 6, 1, 12, 0)
+    gregorian = CalendarSystem.gregorian
+    local_time_pattern = LocalTimePattern.extended_iso
+    offset_pattern = OffsetPattern.general_invariant
+    return {
+        "_towards_zero_division(int, int)": lambda: _csharp_compatibility._towards_zero_division(-123_456_789, 1_000),
+        "Duration.from_nanoseconds (negative)": lambda: Duration.from_nanoseconds(-123_456_789_012_345),
+        "Duration.hours": lambda: duration.hours,
+        "Period.from_nanoseconds.normalize()": lambda: Period.from_nanoseconds(123_456_789_012_345).normalize(),
+        "LocalTime.clock_hour_of_half_day": lambda: local_time.clock_hour_of_half_day,
+        "LocalTime.millisecond": lambda: local_time.millisecond,
+        "Offset.from_milliseconds": lambda: Offset.from_milliseconds(-12_345_000),
+        "Instant.to_unix_time_seconds": instant.to_unix_time_seconds,
+        "Instant.to_unix_time_milliseconds": instant.to_unix_time_milliseconds,
+        "CalendarSystem.gregorian LocalDate(1850, 3, 4).day_of_year": lambda: LocalDate(
+            1850, 3, 4, gregorian
+        ).day_of_year,
+        "LocalDate(2020, 3, 4).plus_days(40_000)": lambda: LocalDate(2020, 3, 4).plus_days(40_000),
+        "DateTimeZone.get_zone_interval (precalculated)": lambda: london.get_zone_interval(london_instant),
+        "LocalTimePattern.extended_iso.parse": lambda: local_time_pattern.parse("13:45:56.789"),
+        "OffsetPattern.general_invariant.format": lambda: offset_pattern.format(Offset.from_hours_and_minutes(5, 30)),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with both the legacy and current implementations, and report the speed-up."""
+    cases = _cases()
+    with _patched(_decimal_towards_zero_division):
+        before = report("Decimal-based _towards_zero_division", cases)
+    after = report("Integer fast path", cases)
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for parsing runs of digits with ``_ValueCursor``, directly and through the generic patterns.
+
+Each case is measured twice: once with the previous ``_parse_digits`` and ``_parse_fraction``, which examined one
+character at a time, and once with the current ones, which take the whole run of digits with a single slice.
+``_parse_int64`` is only measured directly, as no pattern uses it.
+"""
+
+from __future__ import annotations
+
+import math
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from pyoda_time import LocalDateTime, LocalTime
+from pyoda_time.text import DurationPattern, LocalDateTimePattern, LocalTimePattern
+from pyoda_time.text._value_cursor import _ValueCursor
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+def _parse_digits_by_character(self: _ValueCursor, minimum_digits: int, maximum_digits: int) -> tuple[bool, int]:
+    """The previous implementation of ``_ValueCursor._parse_digits``."""
+    result = 0
+    local_index = self.index
+    max_index = local_index + maximum_digits
+    max_index = min(self.length, max_index)
+    while local_index < max_index:
+        digit = self.value[local_index]
+        if not digit.isdigit() or not "0" <= digit <= "9":
+            break
+        result = result * 10 + int(digit)
+        local_index += 1
+    count: int = local_index - self.index
+    if count < minimum_digits:
+        return False, result
+    self.move(local_index)
+    return True, result
+
+
+def _parse_fraction_by_character(
+    self: _ValueCursor, maximum_digits: int, scale: int, minimum_digits: int
+) -> tuple[bool, int]:
+    """The previous implementation of ``_ValueCursor._parse_fraction``."""
+    result = 0
+    local_index = self.index
+    min_index = local_index + minimum_digits
+    if min_index > self.length:
+        return False, result
+    max_index = min(local_index + maximum_digits, self.length)
+    while local_index < max_index:
+        digit = self.value[local_index]
+        if not digit.isdigit() or not ("0" <= digit <= "9"):
+            break
+        result = result * 10 + int(digit)
+        local_index += 1
+    count: int = local_index - self.index
+    if count < minimum_digits:
+        return False, result
+    result = int(result * math.pow(10.0, scale - count))
+    self.move(local_index)
+    return True, result
+
+
+def _parse_int64_by_character(self: _ValueCursor) -> int:
+    """The digit loop of the previous ``_ValueCursor._parse_int64``, without the overflow handling (which the cases
+    below never reach)."""
+    result = 0
+    negative = self.current == "-"
+    if negative:
+        self.move_next()
+    while result < 922337203685477580 and (digit := getattr(self, "_ValueCursor__get_digit")()) != -1:
+        result = result * 10 + digit
+        if not self.move_next():
+            break
+    return -result if negative else result
+
+
+@contextmanager
+def _parse_by_character() -> Iterator[None]:
+    """Temporarily parse digits one character at a time."""
+    methods = {name: _ValueCursor.__dict__[name] for name in ("_parse_digits", "_parse_fraction", "_parse_int64")}
+    setattr(_ValueCursor, "_parse_digits", _parse_digits_by_character)
+    setattr(_ValueCursor, "_parse_fraction", _parse_fraction_by_character)
+    setattr(_ValueCursor, "_parse_int64", _parse_int64_by_character)
+    try:
+        yield
+    finally:
+        for name, method in methods.items():
+            setattr(_ValueCursor, name, method)
+
+
+def _from_start(text: str, parse: Callable[[_ValueCursor], object]) -> Callable[[], object]:
+    """Returns a function which parses from the start of ``text``, reusing one cursor so that only parsing is
+    measured."""
+    cursor = _ValueCursor(text)
+
+    def parse_from_start() -> object:
+        cursor.move(0)
+        return parse(cursor)
+
+    return parse_from_start
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    # Patterns created with the invariant culture aren't cached, and none of these have a hand-written fast path.
+    local_date_time = LocalDateTimePattern.create_with_invariant_culture("dd/MM/uuuu HH:mm:ss.fffffffff")
+    local_time = LocalTimePattern.create_with_invariant_culture("H:m:s.FFF")
+    duration = DurationPattern.create_with_invariant_culture("-D:hh:mm:ss.FFFFFFFFF")
+    assert local_date_time.parse("04/03/2021 05:06:07.123456789").value == LocalDateTime(
+        2021, 3, 4, 5, 6, 7
+    ).plus_nanoseconds(123456789)
+    assert local_time.parse("5:6:7.12").value == LocalTime(5, 6, 7, 120)
+    return {
+        "_parse_digits (4 of 4)": _from_start("2021-03-04", lambda cursor: cursor._parse_digits(4, 4)),
+        "_parse_digits (1 of 2)": _from_start("5:06", lambda cursor: cursor._parse_digits(1, 2)),
+        "_parse_fraction (9 of 9)": _from_start("123456789Z", lambda cursor: cursor._parse_fraction(9, 9, 1)),
+        "_parse_fraction (2 of 3)": _from_start("12Z", lambda cursor: cursor._parse_fraction(3, 9, 1)),
+        "_parse_int64 (18 digits)": _from_start("-123456789012345678", lambda cursor: cursor._parse_int64()),
+        "parse LocalDateTime (dd/MM/uuuu HH:mm:ss.fffffffff)": lambda: local_date_time.parse(
+            "04/03/2021 05:06:07.123456789"
+        ),
+        "parse LocalTime (H:m:s.FFF)": lambda: local_time.parse("5:6:7.12"),
+        "parse Duration (-D:hh:mm:ss.FFFFFFFFF)": lambda: duration.parse("-1234567:05:06:07.123456789"),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks with the previous and current digit parsing, and compare the two."""
+    with _parse_by_character():
+        before = report("Parsing digits one character at a time", _cases())
+    after = report("Parsing a run of digits at once", _cases())
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
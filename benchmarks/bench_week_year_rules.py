@@ -0,0 +1,58 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for the batch methods of ``IWeekYearRule``, compared with calling the single-value methods for each date.
+
+Each column holds 1,000 ISO dates spread across 1900-2100. The per-value baseline constructs a ``LocalDate`` for each
+value and collects the week-year and week of week-year into lists.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from pyoda_time import CalendarSystem, IsoDayOfWeek, LocalDate
+from pyoda_time.calendars import CalendarWeekRule, WeekYearRules
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pyoda_time.calendars import IWeekYearRule
+
+_RULES = {
+    "ISO": WeekYearRules.iso,
+    "FirstDay (Sunday)": WeekYearRules.from_calendar_week_rule(CalendarWeekRule.FIRST_DAY, IsoDayOfWeek.SUNDAY),
+}
+_DAYS = [-25567 + i * 73 for i in range(1000)]
+
+
+def _split_each(rule: IWeekYearRule, values: Sequence[int]) -> tuple[list[int], list[int]]:
+    week_years: list[int] = []
+    weeks: list[int] = []
+    for value in values:
+        date = LocalDate._ctor(days_since_epoch=value, calendar=CalendarSystem.iso)
+        week_years.append(rule.get_week_year(date))
+        weeks.append(rule.get_week_of_week_year(date))
+    return week_years, weeks
+
+
+def _split_many(rule: IWeekYearRule, values: Sequence[int]) -> tuple[object, object]:
+    return rule.get_week_year_many(values), rule.get_week_of_week_year_many(values)
+
+
+def _cases(batch: bool) -> dict[str, Callable[[], object]]:
+    return {name: partial(_split_many if batch else _split_each, rule, _DAYS) for name, rule in _RULES.items()}
+
+
+def main() -> None:
+    """Run the benchmarks per value and in batches, and report the speed-up."""
+    before = report("get_week_year/get_week_of_week_year per value (1,000 values)", _cases(batch=False), number=20)
+    after = report("get_week_year_many/get_week_of_week_year_many (1,000 values)", _cases(batch=True), number=20)
+    compare("Speed-up", before, after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Benchmarks for finding the start of a year, directly and through date conversions in non-ISO calendars.
+
+Each case is measured three times:
+
+- with the previous cache, a dict of 1024 entry objects per calculator, each checked with a method call and read with
+  a property (and a new object for each miss)
+- with the current cache, a flat ``array('q')`` of packed entries checked inline, but without the precomputed tables
+- as things are now: the Coptic, Julian and Islamic calculators precompute the start of every year in their range
+
+The "spread" cases cycle through years across the whole range of the calendar.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import partial
+from itertools import cycle
+from typing import TYPE_CHECKING, Final
+
+from pyoda_time import CalendarSystem, LocalDate
+from pyoda_time.calendars._year_month_day_calculator import _YearMonthDayCalculator
+
+from ._runner import compare, report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_CALENDARS: Final[tuple[CalendarSystem, ...]] = (
+    CalendarSystem.julian,
+    CalendarSystem.coptic,
+    CalendarSystem.islamic_bcl,
+)
+
+
+class _DictCacheEntry:
+    """The previous ``_YearStartCacheEntry``."""
+
+    def __init__(self, year: int, days: int) -> None:
+        self.__value = (days << 7) | ((year >> 10) & 127)
+
+    def _is_valid_for_year(self, year: int) -> bool:
+        return ((year >> 10) & 127) == (self.__value & 127)
+
+    @property
+    def _start_of_year_days(self) -> int:
+        return self.__value >> 7
+
+
+def _get_start_of_year_in_days_from_dict(self: _YearMonthDayCalculator, year: int) -> int:
+    """The previous ``_YearMonthDayCalculator._get_start_of_year_in_days``."""
+    cache_index = year & 1023
+    cache_entry = self._bench_dict_cache[cache_index]  # type: ignore[attr-defined]
+    if not cache_entry._is_valid_for_year(year):
+        days = self._calculate_start_of_year_days(year)
+        cache_entry = _DictCacheEntry(year, days)
+        self._bench_dict_cache[cache_index] = cache_entry  # type: ignore[attr-defined]
+    return cache_entry._start_of_year_days  # type: ignore[no-any-return]
+
+
+@contextmanager
+def _without_tables() -> Iterator[None]:
+    """Temporarily drop the precomputed tables, so that the array cache is used for everything."""
+    name = "_YearMonthDayCalculator__precomputed_start_of_year_days"
+    calculators = [calendar._year_month_day_calculator for calendar in _CALENDARS]
+    tables = [getattr(calculator, name) for calculator in calculators]
+    for calculator in calculators:
+        setattr(calculator, name, None)
+    try:
+        yield
+    finally:
+        for calculator, table in zip(calculators, tables, strict=True):
+            setattr(calculator, name, table)
+
+
+@contextmanager
+def _dict_cache() -> Iterator[None]:
+    """Temporarily use the previous cache."""
+    for calendar in _CALENDARS:
+        calendar._year_month_day_calculator._bench_dict_cache = {  # type: ignore[attr-defined]
+            i: _DictCacheEntry(64512, 0) for i in range(1024)
+        }
+    method = _YearMonthDayCalculator.__dict__["_get_start_of_year_in_days"]
+    setattr(_YearMonthDayCalculator, "_get_start_of_year_in_days", _get_start_of_year_in_days_from_dict)
+    try:
+        with _without_tables():
+            yield
+    finally:
+        setattr(_YearMonthDayCalculator, "_get_start_of_year_in_days", method)
+
+
+def _spread(calculator: _YearMonthDayCalculator) -> Callable[[], int]:
+    """Returns a function finding the start of every seventh year in the calendar in turn, mostly missing the cache."""
+    years = cycle(range(calculator._min_year, calculator._max_year + 1, 7))
+    return lambda: calculator._get_start_of_year_in_days(next(years))
+
+
+def _cases() -> dict[str, Callable[[], object]]:
+    cases: dict[str, Callable[[], object]] = {}
+    for calendar in _CALENDARS:
+        calculator = calendar._year_month_day_calculator
+        name = calendar.id
+        cases[f"start of year, same year ({name})"] = partial(calculator._get_start_of_year_in_days, 1500)
+        cases[f"start of year, spread ({name})"] = _spread(calculator)
+        cases[f"LocalDate.plus_days ({name})"] = partial(LocalDate(1500, 3, 4, calendar).plus_days, 400)
+    return cases
+
+
+def main() -> None:
+    """Run the benchmarks with each cache, and compare them."""
+    with _dict_cache():
+        dict_cache = report("dict of entry objects", _cases())
+    with _without_tables():
+        array_cache = report("array('q') cache", _cases())
+    tables = report("array('q') cache and precomputed tables", _cases())
+    compare("Speed-up of the array cache", dict_cache, array_cache)
+    compare("Speed-up of the array cache and precomputed tables", dict_cache, tables)
+
+
+if __name__ == "__main__":
+    main()
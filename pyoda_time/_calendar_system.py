@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING, Annotated, Final, final, overload
 
 from .calendars._badi_year_month_day_calculator import _BadiYearMonthDayCalculator
@@ -641,6 +642,36 @@ class CalendarSystem(metaclass=_CalendarSystemMeta):
         _Preconditions._check_argument_range("year", year, self.__min_year, self.__max_year)
         return self._year_month_day_calculator._get_months_in_year(year)
 
+    def split_days(
+        self, days_since_epoch: Iterable[int]
+    ) -> tuple[array[int], array[int], array[int], array[int], array[int]]:
+        """Returns the year, month, day of month, day of year and day of week of each of a sequence of dates in this
+        calendar.
+
+        This is equivalent to constructing a ``LocalDate`` for each value and reading its ``year``, ``month``, ``day``,
+        ``day_of_year`` and ``day_of_week`` properties, but is considerably more efficient for large batches: no
+        objects are created for each value, and in the ISO, Gregorian and Julian calendars the fields are computed
+        directly from the day numbers. Other calendars convert one value at a time.
+
+        Each result is an ``array``, which supports the buffer protocol; for example the years can be wrapped without
+        copying by ``numpy.frombuffer(years, dtype=numpy.int32)``.
+
+        :param days_since_epoch: The dates, each expressed as a number of days since the Unix epoch (1970-01-01 ISO).
+            Any iterable of integers is accepted, including a NumPy ``int64`` array.
+        :raises ValueError: Any of the values is outside the range of this calendar.
+        :return: A tuple of five arrays, each in the same order as the given values: the absolute years (signed 32-bit
+            integers); the months and days of month (unsigned bytes); the days of year (unsigned 16-bit integers); and
+            the days of week as ``IsoDayOfWeek`` values (unsigned bytes).
+        """
+        values = [int(value) for value in days_since_epoch]
+        if values:
+            _Preconditions._check_argument_range("days_since_epoch", min(values), self._min_days, self._max_days)
+            _Preconditions._check_argument_range("days_since_epoch", max(values), self._min_days, self._max_days)
+        years, months, days, days_of_year = self._year_month_day_calculator._split_days(values)
+        # 1970-01-01 was a Thursday. Python's % floors, so this is correct for negative values too.
+        days_of_week: array[int] = array("B", [(value + 3) % 7 + 1 for value in values])
+        return years, months, days, days_of_year, days_of_week
+
     def _validate_year_month_day(self, year: int, month: int, day: int) -> None:
         self._year_month_day_calculator._validate_year_month_day(year, month, day)
 
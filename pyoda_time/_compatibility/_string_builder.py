@@ -9,9 +9,12 @@ class StringBuilder:
     """A bare-bones implementation of .NET's ``System.Text.StringBuilder``.
 
     Represents a mutable sequence of characters.
+
+    Appended strings are kept in a list and only joined when the whole string is needed, so building a string from
+    many pieces takes linear rather than quadratic time.
     """
 
-    __slots__ = ("__string",)
+    __slots__ = ("__length", "__parts")
 
     def __init__(
         self,
@@ -20,22 +23,50 @@ class StringBuilder:
         length: int = 0,
         capacity: int = 16,
     ) -> None:
-        self.__string = string
+        self.__parts: list[str] = [string] if string else []
+        self.__length: int = len(string)
+
+    def __join(self) -> str:
+        """Joins the parts into a single string, which then becomes the only part."""
+        parts = self.__parts
+        if len(parts) == 1:
+            return parts[0]
+        string = "".join(parts)
+        self.__parts = [string] if string else []
+        return string
 
-    def __getitem__(self, item: int) -> str:
-        return self.__string.__getitem__(item)
+    def __getitem__(self, item: int | slice) -> str:
+        length = self.__length
+        if isinstance(item, int) and -length <= item < length:
+            # Indexing near the end (typically the last character) is common, and doesn't need a join.
+            if item < 0:
+                item += length
+            last = self.__parts[-1]
+            offset = item - (length - len(last))
+            if offset >= 0:
+                return last[offset]
+        return self.__join().__getitem__(item)
 
     @property
     def length(self) -> int:
-        return len(self.__string)
+        return self.__length
 
     @length.setter
     def length(self, value: int) -> None:
         assert 0 <= value <= self.length
-        self.__string = self.__string[:value]
+        parts = self.__parts
+        excess = self.__length - value
+        # Remove whole parts from the end, then truncate the last remaining part if necessary.
+        while excess > 0 and len(parts[-1]) <= excess:
+            excess -= len(parts.pop())
+        if excess > 0:
+            parts[-1] = parts[-1][:-excess]
+        self.__length = value
 
     def append(self, string: str) -> Self:
-        self.__string += string
+        if string:
+            self.__parts.append(string)
+            self.__length += len(string)
         return self
 
     def append_line(self, string: str = "") -> Self:
@@ -43,4 +74,4 @@ class StringBuilder:
         return self
 
     def to_string(self) -> str:
-        return self.__string
+        return self.__join() if self.__parts else ""
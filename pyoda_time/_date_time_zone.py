@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import math
 import threading
+from array import array
 from typing import TYPE_CHECKING, Final, _ProtocolMeta, overload
 
+from ._ambiguous_time_error import AmbiguousTimeError
 from ._duration import Duration
 from ._instant import Instant
 from ._offset import Offset
@@ -22,7 +26,7 @@ from .utility._csharp_compatibility import _csharp_modulo, _towards_zero_divisio
 from .utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
     from ._interval import Interval
     from ._local_date import LocalDate
@@ -161,6 +165,41 @@ class DateTimeZone(abc.ABC, _IZoneIntervalMap, metaclass=_DateTimeZoneMeta):
     def get_zone_interval(self, instant: Instant) -> ZoneInterval:
         raise NotImplementedError
 
+    def get_utc_offsets(self, unix_nanoseconds: Iterable[int]) -> array[int]:
+        """Returns the offsets from UTC, in seconds, for each of a sequence of instants.
+
+        This is equivalent to calling ``get_utc_offset`` for each instant, but is considerably more efficient for large
+        batches: each zone interval between the earliest and latest instants is only computed once, after which each
+        value is located with a binary search over the transitions. The values do not need to be sorted.
+
+        The result is an ``array`` of signed 32-bit integers, which supports the buffer protocol; for example it can be
+        wrapped without copying by ``numpy.frombuffer(result, dtype=numpy.int32)``.
+
+        :param unix_nanoseconds: The instants for which to calculate the offsets, each expressed as a number of
+            nanoseconds since the Unix epoch. Any iterable of integers is accepted, including a NumPy ``int64`` array.
+        :raises ValueError: Any of the values is outside the range of ``Instant``.
+        :return: The offsets from UTC in seconds, in the same order as the given instants.
+        """
+        values = [int(value) for value in unix_nanoseconds]
+        if not values:
+            return array("i")
+        start: Instant = Instant._from_unix_time_nanoseconds(min(values))
+        end: Instant = Instant._from_unix_time_nanoseconds(max(values))
+
+        interval: ZoneInterval = self.get_zone_interval(start)
+        transitions: list[int] = []
+        offsets: list[int] = [interval.wall_offset.seconds]
+        # The final interval always ends after the end of time, so this terminates.
+        while interval._raw_end <= end:
+            transition: Instant = interval._raw_end
+            interval = self.get_zone_interval(transition)
+            transitions.append(transition._to_unix_time_nanoseconds())
+            offsets.append(interval.wall_offset.seconds)
+
+        if not transitions:
+            return array("i", offsets) * len(values)
+        return array("i", [offsets[bisect.bisect_right(transitions, value)] for value in values])
+
     def map_local(self, local_date_time: LocalDateTime) -> ZoneLocalMapping:
         """Returns complete information about how the given ``LocalDateTime`` is mapped in this time zone.
 
@@ -291,6 +330,112 @@ class DateTimeZone(abc.ABC, _IZoneIntervalMap, metaclass=_DateTimeZoneMeta):
         """
         return self.resolve_local(local_date_time=local_date_time, resolver=Resolvers.lenient_resolver)
 
+    def resolve_local_many(
+        self, local_nanoseconds: Iterable[int], resolver: ZoneLocalMappingResolver
+    ) -> tuple[array[int], array[int], array[int]]:
+        """Maps each of a sequence of local date/time values to an instant in this time zone, following the given
+        ``ZoneLocalMappingResolver`` to handle ambiguity and skipped times.
+
+        This is the batch equivalent of ``resolve_local``. Rather than allocating a ``ZoneLocalMapping`` and a
+        ``ZonedDateTime`` for each value, the zone intervals covering the whole batch are computed once, and each value
+        is mapped with a binary search over them. The resolver is only consulted for values which are ambiguous or
+        skipped; unambiguous values always map to their single matching instant, as they do for every resolver
+        provided by ``Resolvers``.
+
+        If the resolver raises ``SkippedTimeError`` or ``AmbiguousTimeError`` for a value (as ``strict_resolver``
+        does), the error is not propagated; instead, the instant and offset for that position are left as zero.
+
+        :param local_nanoseconds: The local date/time values to map, each expressed as a number of nanoseconds since
+            the local Unix epoch (1970-01-01T00:00:00 in the ISO calendar). Any iterable of integers is accepted,
+            including a NumPy ``int64`` array.
+        :param resolver: The resolver to apply to ambiguous and skipped values.
+        :raises ValueError: Any of the values is outside the range of ``LocalDateTime``.
+        :return: A tuple of three arrays, each in the same order as the given values: the resulting instants as
+            nanoseconds since the Unix epoch (signed 64-bit integers); the offsets from UTC in seconds (signed 32-bit
+            integers); and a mask (unsigned bytes) which is 0 for unambiguous values, 1 for skipped values and 2 for
+            ambiguous values.
+        """
+        _Preconditions._check_not_null(resolver, "resolver")
+        values = [int(value) for value in local_nanoseconds]
+        instants: array[int] = array("q", bytes(8 * len(values)))
+        offsets: array[int] = array("i", bytes(4 * len(values)))
+        mask: array[int] = array("B", bytes(len(values)))
+        if not values:
+            return instants, offsets, mask
+
+        # Collect every zone interval which could contain any of the values, plus one either side.
+        interval: ZoneInterval = self.get_zone_interval(Instant._from_unix_time_nanoseconds(min(values)))
+        if interval.has_start:
+            interval = self.get_zone_interval(interval._raw_start - Duration.epsilon)
+        end: Instant = Instant._from_unix_time_nanoseconds(max(values))
+        intervals: list[ZoneInterval] = [interval]
+        while interval.has_end and interval._raw_start <= end:
+            interval = self.get_zone_interval(interval._raw_end)
+            intervals.append(interval)
+
+        transitions: list[int] = [zone_interval._raw_start._to_unix_time_nanoseconds() for zone_interval in intervals]
+        ends: list[int] = [zone_interval._raw_end._to_unix_time_nanoseconds() for zone_interval in intervals]
+        wall_offsets: list[int] = [zone_interval.wall_offset.nanoseconds for zone_interval in intervals]
+        local_starts: list[float] = [
+            start + wall_offset if zone_interval.has_start else -math.inf
+            for start, wall_offset, zone_interval in zip(transitions, wall_offsets, intervals, strict=True)
+        ]
+        local_ends: list[float] = [
+            end_ + wall_offset if zone_interval.has_end else math.inf
+            for end_, wall_offset, zone_interval in zip(ends, wall_offsets, intervals, strict=True)
+        ]
+        # The start of the first interval is not a transition within the batch.
+        del transitions[0]
+        last = len(intervals) - 1
+
+        from ._local_date_time import LocalDateTime
+        from ._local_instant import _LocalInstant
+
+        for index, value in enumerate(values):
+            # Treat the local value as an instant for a first guess, just as map_local does.
+            guess = bisect.bisect_right(transitions, value)
+            if local_starts[guess] <= value < local_ends[guess]:
+                if guess > 0 and local_starts[guess - 1] <= value < local_ends[guess - 1]:
+                    early, late = guess - 1, guess
+                elif guess < last and local_starts[guess + 1] <= value < local_ends[guess + 1]:
+                    early, late = guess, guess + 1
+                else:
+                    wall_offset = wall_offsets[guess]
+                    instants[index] = value - wall_offset
+                    offsets[index] = wall_offset // PyodaConstants.NANOSECONDS_PER_SECOND
+                    continue
+                count = 2
+            elif guess > 0 and local_starts[guess - 1] <= value < local_ends[guess - 1]:
+                wall_offset = wall_offsets[guess - 1]
+                instants[index] = value - wall_offset
+                offsets[index] = wall_offset // PyodaConstants.NANOSECONDS_PER_SECOND
+                continue
+            elif guess < last and local_starts[guess + 1] <= value < local_ends[guess + 1]:
+                wall_offset = wall_offsets[guess + 1]
+                instants[index] = value - wall_offset
+                offsets[index] = wall_offset // PyodaConstants.NANOSECONDS_PER_SECOND
+                continue
+            else:
+                # In a gap: the guessed interval is either the one before or the one after it.
+                if value - wall_offsets[guess] < (transitions[guess - 1] if guess > 0 else -math.inf):
+                    early, late = guess - 1, guess
+                else:
+                    early, late = guess, guess + 1
+                count = 0
+
+            mask[index] = 1 if count == 0 else 2
+            days, nano_of_day = divmod(value, PyodaConstants.NANOSECONDS_PER_DAY)
+            local_date_time = LocalDateTime._ctor(local_instant=_LocalInstant._ctor(days=days, nano_of_day=nano_of_day))
+            mapping = ZoneLocalMapping._ctor(self, local_date_time, intervals[early], intervals[late], count)
+            try:
+                zoned_date_time = resolver(mapping)
+            except (AmbiguousTimeError, SkippedTimeError):
+                continue
+            instants[index] = zoned_date_time.to_instant()._to_unix_time_nanoseconds()
+            offsets[index] = zoned_date_time.offset.seconds
+
+        return instants, offsets, mask
+
     # endregion
 
     def __get_earlier_matching_interval(
@@ -64,6 +64,8 @@ class _DurationMeta(type):
 class Duration(metaclass=_DurationMeta):
     """Represents a fixed (and calendar-independent) length of time."""
 
+    __slots__ = ("__days", "__nano_of_day")
+
     # Implementation note:
     #
     # Noda Time's `Duration` far exceeds the range of the equivalent BCL type, namely `TimeSpan`.
@@ -68,6 +68,8 @@ class Instant(metaclass=_InstantMeta):
     being considered "less than" later points.
     """
 
+    __slots__ = ("__duration",)
+
     # These correspond to -9998-01-01 and 9999-12-31 respectively.
     _MIN_DAYS: Final[int] = -4371222
     _MAX_DAYS: Final[int] = 2932896
@@ -77,6 +79,8 @@ class Instant(metaclass=_InstantMeta):
     __MIN_MILLISECONDS: Final[int] = _MIN_DAYS * PyodaConstants.MILLISECONDS_PER_DAY
     __MAX_MILLISECONDS: Final[int] = (_MAX_DAYS + 1) * PyodaConstants.MILLISECONDS_PER_DAY - 1
     __MIN_SECONDS: Final[int] = _MIN_DAYS * PyodaConstants.SECONDS_PER_DAY
+    __MIN_NANOSECONDS: Final[int] = _MIN_DAYS * PyodaConstants.NANOSECONDS_PER_DAY
+    __MAX_NANOSECONDS: Final[int] = (_MAX_DAYS + 1) * PyodaConstants.NANOSECONDS_PER_DAY - 1
     __MAX_SECONDS: Final[int] = (_MAX_DAYS + 1) * PyodaConstants.SECONDS_PER_DAY - 1
 
     @classmethod
@@ -219,6 +223,19 @@ class Instant(metaclass=_InstantMeta):
         _Preconditions._check_argument_range("ticks", ticks, cls.__MIN_TICKS, cls.__MAX_TICKS)
         return Instant._from_trusted_duration(Duration.from_ticks(ticks))
 
+    @classmethod
+    def _from_unix_time_nanoseconds(cls, nanoseconds: int) -> Instant:
+        """Initializes a new Instant based on a number of nanoseconds since the Unix epoch."""
+        _Preconditions._check_argument_range("nanoseconds", nanoseconds, cls.__MIN_NANOSECONDS, cls.__MAX_NANOSECONDS)
+        days, nano_of_day = divmod(nanoseconds, PyodaConstants.NANOSECONDS_PER_DAY)
+        return Instant._ctor(days=days, nano_of_day=nano_of_day)
+
+    def _to_unix_time_nanoseconds(self) -> int:
+        """Gets the number of nanoseconds since the Unix epoch."""
+        return (
+            self.__duration._floor_days * PyodaConstants.NANOSECONDS_PER_DAY + self.__duration._nanosecond_of_floor_day
+        )
+
     @classmethod
     def _from_trusted_duration(cls, duration: Duration) -> Instant:
         """Creates an Instant with the given duration, with no validation (in release mode)."""
@@ -71,6 +71,8 @@ class LocalDate(metaclass=_LocalDateMeta):
     The default value of this type is 0001-01-01 (January 1st, 1 C.E.) in the ISO calendar.
     """
 
+    __slots__ = ("__year_month_day_calendar",)
+
     def __init__(
         self,
         year: int = 1,
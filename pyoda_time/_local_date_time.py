@@ -66,6 +66,8 @@ class LocalDateTime(metaclass=_LocalDateTimeMeta):
     The default value of this type is 0001-01-01T00:00:00 (midnight on January 1st, 1 C.E.) in the ISO calendar.
     """
 
+    __slots__ = ("__date", "__time")
+
     def __init__(
         self,
         year: int = 1,
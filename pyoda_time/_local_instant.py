@@ -25,6 +25,8 @@ class _LocalInstant:
     than it used to be... almost solely for time zones.
     """
 
+    __slots__ = ("__duration",)
+
     @classmethod
     def before_min_value(cls) -> _LocalInstant:
         # TODO: In Noda Time this is a public static readonly field
@@ -62,6 +62,8 @@ class LocalTime(metaclass=_LocalTimeMeta):
     """LocalTime is an immutable struct representing a time of day, with no reference to a particular calendar, time
     zone or date."""
 
+    __slots__ = ("__nanoseconds",)
+
     def __init__(self, hour: int = 0, minute: int = 0, second: int = 0, millisecond: int = 0) -> None:
         """Initialises a ``LocalTime`` at the given hour, minute, second and millisecond.
 
@@ -35,6 +35,8 @@ class _OffsetMeta(type):
 class Offset(metaclass=_OffsetMeta):
     """An offset from UTC in seconds."""
 
+    __slots__ = ("__seconds",)
+
     __MIN_HOURS: Final[int] = -18
     __MAX_HOURS: Final[int] = 18
     __MIN_SECONDS: Final[int] = -18 * PyodaConstants.SECONDS_PER_HOUR
@@ -47,6 +47,8 @@ class OffsetDateTime:
     the ISO calendar.
     """
 
+    __slots__ = ("__local_date", "__offset_time")
+
     def __init__(self, local_date_time: LocalDateTime = LocalDateTime(), offset: Offset = Offset()) -> None:
         from . import OffsetTime
 
@@ -77,7 +79,8 @@ class OffsetDateTime:
         offset: Offset | None = None,
         calendar: CalendarSystem | None = None,
     ) -> OffsetDateTime:
-        from . import LocalDate, OffsetTime
+        from ._local_date import LocalDate
+        from ._offset_time import OffsetTime
 
         if instant is not None and offset is not None:
             days = instant._days_since_epoch
@@ -511,8 +514,17 @@ class OffsetDateTime:
 
     # region Formatting
 
-    # TODO: def __repr__(self) -> str: [requires OffsetDateTimePattern]
-    # TODO: def __format__(self) -> str: [requires OffsetDateTimePattern]
+    def __repr__(self) -> str:
+        from ._compatibility._culture_info import CultureInfo
+        from .text import OffsetDateTimePattern
+
+        return OffsetDateTimePattern._bcl_support.format(self, None, CultureInfo.current_culture)
+
+    def __format__(self, format_spec: str) -> str:
+        from ._compatibility._culture_info import CultureInfo
+        from .text import OffsetDateTimePattern
+
+        return OffsetDateTimePattern._bcl_support.format(self, format_spec, CultureInfo.current_culture)
 
     # endregion
 
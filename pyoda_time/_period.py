@@ -736,7 +736,7 @@ class Period(metaclass=_PeriodMeta):
         #  This implementation is a very rough approximation of that...
         if self == Period.zero:
             return "P0D"
-        s = "P"
+        parts = ["P"]
         date_components = {
             "Y": self.years,
             "M": self.months,
@@ -745,9 +745,9 @@ class Period(metaclass=_PeriodMeta):
         }
         for suffix, value in date_components.items():
             if value != 0:
-                s += f"{value}{suffix}"
+                parts.append(f"{value}{suffix}")
         if self.has_time_component:
-            s += "T"
+            parts.append("T")
             time_components = {
                 "H": self.hours,
                 "M": self.minutes,
@@ -758,8 +758,8 @@ class Period(metaclass=_PeriodMeta):
             }
             for suffix, value in time_components.items():
                 if value != 0:
-                    s += f"{value}{suffix}"
-        return s
+                    parts.append(f"{value}{suffix}")
+        return "".join(parts)
 
     def __hash__(self) -> int:
         return hash(
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class _YearMonthDayCalendar:
     """A compact representation of a year, month, day and calendar ordinal (integer ID) in a single 32-bit integer."""
 
+    __slots__ = ("__value",)
+
     # These constants are internal so they can be used in YearMonthDay
     _CALENDAR_BITS: Final[int] = 6  # Up to 64 calendars.
     _DAY_BITS: Final[int] = 6  # Up to 64 days in a month.
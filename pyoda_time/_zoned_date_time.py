@@ -28,6 +28,8 @@ __all__ = ["ZonedDateTime"]
 
 
 class ZonedDateTime:
+    __slots__ = ("__offset_date_time", "__zone")
+
     @classmethod
     def _ctor(cls, offset_date_time: OffsetDateTime, zone: DateTimeZone) -> ZonedDateTime:
         self = super().__new__(cls)
@@ -227,6 +229,22 @@ class ZonedDateTime:
 
     # endregion
 
+    # region Formatting
+
+    def __repr__(self) -> str:
+        from ._compatibility._culture_info import CultureInfo
+        from .text import ZonedDateTimePattern
+
+        return ZonedDateTimePattern._bcl_support.format(self, None, CultureInfo.current_culture)
+
+    def __format__(self, format_spec: str) -> str:
+        from ._compatibility._culture_info import CultureInfo
+        from .text import ZonedDateTimePattern
+
+        return ZonedDateTimePattern._bcl_support.format(self, format_spec, CultureInfo.current_culture)
+
+    # endregion
+
     # region Operators
 
     def __eq__(self, other: object) -> bool:
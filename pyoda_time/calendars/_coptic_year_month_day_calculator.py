@@ -10,6 +10,7 @@ from ._fixed_month_year_month_day_calculator import _FixedMonthYearMonthDayCalcu
 class _CopticYearMonthDayCalculator(_FixedMonthYearMonthDayCalculator):
     def __init__(self) -> None:
         super().__init__(1, 9715, -615558)
+        self._precompute_start_of_year_days()
 
     def _calculate_start_of_year_days(self, year: int) -> int:
         # Unix epoch is 1970-01-01 Gregorian which is 1686-04-23 Coptic.
@@ -4,16 +4,19 @@
 
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING, Final, final
 
-from ..utility._preconditions import _Preconditions
-
-if TYPE_CHECKING:
-    from .._year_month_day import _YearMonthDay
+from .._calendar_ordinal import _CalendarOrdinal
+from .._year_month_day import _YearMonthDay
 from .._year_month_day_calendar import _YearMonthDayCalendar
 from ..utility._csharp_compatibility import _towards_zero_division
+from ..utility._preconditions import _Preconditions
 from ._g_j_year_month_day_calculator import _GJYearMonthDayCalculator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @final
 class _GregorianYearMonthDayCalculator(_GJYearMonthDayCalculator):
@@ -22,104 +25,72 @@ class _GregorianYearMonthDayCalculator(_GJYearMonthDayCalculator):
 
     __FIRST_OPTIMIZED_YEAR: Final[int] = 1900
     __LAST_OPTIMIZED_YEAR: Final[int] = 2100
-    __FIRST_OPTIMIZED_DAY: Final[int] = -25567
-    __LAST_OPTIMIZED_DAY: Final[int] = 47846
+    # The days-since-unix-epoch of the first and last days of the supported range of years.
+    __MIN_DAYS: Final[int] = -4371222
+    __MAX_DAYS: Final[int] = 2932896
     # The 0-based days-since-unix-epoch for the start of each month
     __MONTH_START_DAYS: Final[list[int]] = list(range((__LAST_OPTIMIZED_YEAR + 1 - __FIRST_OPTIMIZED_YEAR) * 12 + 1))
     # The 1-based days-since-unix-epoch for the start of each year
     __YEAR_START_DAYS: Final[list[int]] = list(range(__LAST_OPTIMIZED_YEAR + 1 - __FIRST_OPTIMIZED_YEAR))
 
     __DAYS_FROM_0000_to_1970: Final[int] = 719527
+    # The days from 0000-03-01 to 1970-01-01. The conversions below count from the March before the year 0 starts, so
+    # that the leap day is the last day of each (shifted) year.
+    __DAYS_FROM_0000_03_01_TO_1970: Final[int] = 719468
+    __DAYS_PER_400_YEARS: Final[int] = 146097
     __AVERAGE_DAYS_PER_10_YEARS: Final[int] = 3652
 
     @classmethod
     def _get_gregorian_year_month_day_calendar_from_days_since_epoch(
         cls, days_since_epoch: int
     ) -> _YearMonthDayCalendar:
-        from .. import CalendarSystem
-        from .._calendar_ordinal import _CalendarOrdinal
+        if days_since_epoch < cls.__MIN_DAYS or days_since_epoch > cls.__MAX_DAYS:
+            from .. import CalendarSystem
 
-        # TODO: unchecked
-        if days_since_epoch < cls.__FIRST_OPTIMIZED_DAY or days_since_epoch > cls.__LAST_OPTIMIZED_DAY:
+            # Let the calendar system report the out-of-range value.
             return CalendarSystem.iso._get_year_month_day_calendar_from_days_since_epoch(days_since_epoch)
-        # Divide by more than we need to, in order to guarantee that we only need to move forward.
-        # We can still only be out by 1 year.
-        year_index = _towards_zero_division(days_since_epoch - cls.__FIRST_OPTIMIZED_DAY, 366)
-        index_value = cls.__YEAR_START_DAYS[year_index]
-        # Zero-based day of year
-        d: int = days_since_epoch - index_value
-        year: int = year_index + cls.__FIRST_OPTIMIZED_YEAR
-        is_leap: bool = cls.__is_gregorian_leap_year(year)
-        days_in_year: int = 366 if is_leap else 365
-        if d >= days_in_year:
-            year += 1
-            d -= days_in_year
-            is_leap = cls.__is_gregorian_leap_year(year)
-
-        # The remaining code is copied from GJYearMonthDayCalculator (and tweaked)
-
-        start_of_month: int
-        # Perform a hard-coded binary search to get the month.
-        if is_leap:
-            start_of_month = (
-                -1
-                if d < 31
-                else 30
-                if d < 60
-                else 59
-                if d < 91
-                else 90
-                if d < 121
-                else 120
-                if d < 152
-                else 151
-                if d < 182
-                else 181
-                if d < 213
-                else 212
-                if d < 244
-                else 243
-                if d < 274
-                else 273
-                if d < 305
-                else 304
-                if d < 335
-                else 334
-            )
+        year, month, day = cls.__civil_from_days(days_since_epoch)
+        return _YearMonthDayCalendar._ctor(year=year, month=month, day=day, calendar_ordinal=_CalendarOrdinal.ISO)
+
+    @classmethod
+    def __civil_from_days(cls, days_since_epoch: int) -> tuple[int, int, int]:
+        """Converts a days-since-epoch value to a year, month and day, without any loops, branches on the year or
+        lookups.
+
+        This is Howard Hinnant's ``civil_from_days`` algorithm
+        (https://howardhinnant.github.io/date_algorithms.html#civil_from_days). Years are shifted to start on March 1st
+        and grouped into 400-year eras of exactly 146097 days. As Python's ``//`` floors, negative days need no special
+        handling.
+        """
+        days = days_since_epoch + cls.__DAYS_FROM_0000_03_01_TO_1970
+        era = days // cls.__DAYS_PER_400_YEARS
+        day_of_era = days - era * cls.__DAYS_PER_400_YEARS  # [0, 146096]
+        year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365  # [0, 399]
+        day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)  # [0, 365]
+        shifted_month = (5 * day_of_year + 2) // 153  # [0, 11], where 0 is March
+        day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+        if shifted_month < 10:
+            return year_of_era + era * 400, shifted_month + 3, day
+        return year_of_era + era * 400 + 1, shifted_month - 9, day
+
+    @classmethod
+    def __days_from_civil(cls, year: int, month: int, day: int) -> int:
+        """Converts a year, month and day to a days-since-epoch value; the inverse of ``__civil_from_days``.
+
+        This is Howard Hinnant's ``days_from_civil`` algorithm
+        (https://howardhinnant.github.io/date_algorithms.html#days_from_civil).
+        """
+        if month <= 2:
+            year -= 1
+            shifted_month = month + 9
         else:
-            start_of_month = (
-                -1
-                if d < 31
-                else 30
-                if d < 59
-                else 58
-                if d < 90
-                else 89
-                if d < 120
-                else 119
-                if d < 151
-                else 150
-                if d < 181
-                else 180
-                if d < 212
-                else 211
-                if d < 243
-                else 242
-                if d < 273
-                else 272
-                if d < 304
-                else 303
-                if d < 334
-                else 333
-            )
-        month: int = _towards_zero_division(start_of_month, 29) + 1
-        day_of_month: int = d - start_of_month
-        return _YearMonthDayCalendar._ctor(
-            year=year,
-            month=month,
-            day=day_of_month,
-            calendar_ordinal=_CalendarOrdinal.ISO,
+            shifted_month = month - 3
+        era = year // 400
+        year_of_era = year - era * 400
+        day_of_era = (
+            year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + (153 * shifted_month + 2) // 5 + day - 1
         )
+        return era * cls.__DAYS_PER_400_YEARS + day_of_era - cls.__DAYS_FROM_0000_03_01_TO_1970
 
     def __init__(self) -> None:
         super().__init__(
@@ -152,10 +123,45 @@ class _GregorianYearMonthDayCalculator(_GJYearMonthDayCalculator):
         month_of_year = year_month_day._month
         day_of_month = year_month_day._day
         if year < self.__FIRST_OPTIMIZED_YEAR or year > self.__LAST_OPTIMIZED_YEAR:
-            return super()._get_days_since_epoch(year_month_day)
+            return self.__days_from_civil(year, month_of_year, day_of_month)
         year_month_index = (year - self.__FIRST_OPTIMIZED_YEAR) * 12 + month_of_year
         return self.__MONTH_START_DAYS[year_month_index] + day_of_month
 
+    def _get_year_month_day_from_days_since_epoch(self, days_since_epoch: int) -> _YearMonthDay:
+        year, month, day = self.__civil_from_days(days_since_epoch)
+        return _YearMonthDay._ctor(year=year, month=month, day=day)
+
+    def _split_days(self, days_since_epoch: Iterable[int]) -> tuple[array[int], array[int], array[int], array[int]]:
+        # This is __civil_from_days inlined into a single loop, which also works out the day of year: the shifted
+        # day of year counts from March 1st, so January and February come 306 days after the start of the (shifted)
+        # year, and March onwards come 59 days (60 in a leap year) after the start of the actual year.
+        years: array[int] = array("i")
+        months: array[int] = array("B")
+        days: array[int] = array("B")
+        days_of_year: array[int] = array("H")
+        days_from_0000_03_01_to_1970 = self.__DAYS_FROM_0000_03_01_TO_1970
+        days_per_400_years = self.__DAYS_PER_400_YEARS
+        for value in days_since_epoch:
+            shifted_days = value + days_from_0000_03_01_to_1970
+            era = shifted_days // days_per_400_years
+            day_of_era = shifted_days - era * days_per_400_years
+            year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+            shifted_day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+            shifted_month = (5 * shifted_day_of_year + 2) // 153
+            year = year_of_era + era * 400
+            if shifted_month < 10:
+                months.append(shifted_month + 3)
+                # Eras start on a multiple of 400 years, so the year of era tells us whether this is a leap year.
+                is_leap = year_of_era % 4 == 0 and (year_of_era % 100 != 0 or year_of_era == 0)
+                days_of_year.append(shifted_day_of_year + (61 if is_leap else 60))
+            else:
+                year += 1
+                months.append(shifted_month - 9)
+                days_of_year.append(shifted_day_of_year - 305)
+            years.append(year)
+            days.append(shifted_day_of_year - (153 * shifted_month + 2) // 5 + 1)
+        return years, months, days, days_of_year
+
     def _validate_year_month_day(self, year: int, month: int, day: int) -> None:
         self._validate_gregorian_year_month_day(year, month, day)
 
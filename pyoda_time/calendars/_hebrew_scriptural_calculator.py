@@ -4,11 +4,11 @@
 
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING, Final
 
 from ..utility._csharp_compatibility import _csharp_modulo, _towards_zero_division
 from ..utility._preconditions import _Preconditions
-from ._year_start_cache_entry import _YearStartCacheEntry
 
 if TYPE_CHECKING:
     from .._year_month_day import _YearMonthDay
@@ -29,149 +29,75 @@ class _HebrewScripturalCalculator:
     __IS_KISLEV_SHORT_CACHE_BIT: Final[int] = 1 << 1
     # Number of bits to shift the elapsed days in order to get the cache value.
     __ELAPSED_DAYS_CACHE_SHIFT: Final[int] = 2
+    # The bit which is combined with the two bits above to make the "year type" used to index the month tables below.
+    __IS_LEAP_YEAR_TYPE_BIT: Final[int] = 1 << 2
 
-    # Cache of when each year starts (in  terms of absolute days). This is the heart of
-    # the algorithm, so just caching this is highly effective.
+    # Table of when each year starts (in terms of absolute days), indexed by year. This is the heart of
+    # the algorithm, so just storing this is highly effective.
     # Each entry additionally encodes the length of Heshvan and Kislev. We could encode
     # more information too, but those are the tricky bits.
-    __YEAR_CACHE: Final[dict[int, _YearStartCacheEntry]] = _YearStartCacheEntry._create_cache()
+    # Entries are populated lazily; as the elapsed days are always positive for valid years, 0 means "not yet known".
+    __YEAR_TABLE: Final[array[int]] = array("q", [0]) * (_MAX_YEAR + 1)
+
+    @staticmethod
+    def __generate_month_tables() -> tuple[tuple[tuple[int, ...], ...], tuple[bytes, ...]]:
+        """Generates the month tables for each year type, which is a combination of the Heshvan/Kislev cache bits and
+        whether or not the year is a leap year.
+
+        The first table is the number of days preceding each (1-indexed) scriptural month, and the second is the
+        scriptural month for each (1-indexed) day of the year.
+        """
+        month_starts: list[tuple[int, ...]] = []
+        months_by_day_of_year: list[bytes] = []
+        for year_type in range(8):
+            is_leap = (year_type & 4) != 0
+            month_lengths = [0, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 0]
+            month_lengths[8] = 30 if (year_type & 1) != 0 else 29
+            month_lengths[9] = 29 if (year_type & 2) != 0 else 30
+            if is_leap:
+                month_lengths[12] = 30
+                month_lengths[13] = 29
+            starts = [0] * 14
+            # An out-of-range day of year is treated as being in Elul, as the arithmetic used to.
+            months = bytearray([6]) * 386
+            days = 0
+            # Months in the order in which they occur within the year. Adar II is empty in non-leap years, so starts
+            # at the same point as Nisan.
+            for month in (7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6):
+                starts[month] = days
+                months[days + 1 : days + 1 + month_lengths[month]] = bytes([month]) * month_lengths[month]
+                days += month_lengths[month]
+            month_starts.append(tuple(starts))
+            months_by_day_of_year.append(bytes(months))
+        return tuple(month_starts), tuple(months_by_day_of_year)
+
+    # Indexed by year type and then scriptural month, or day of year; see __generate_month_tables.
+    __MONTH_STARTS, __MONTHS_BY_DAY_OF_YEAR = __generate_month_tables()
 
     @staticmethod
     def _is_leap_year(year: int) -> bool:
         return ((year * 7) + 1) % 19 < 7
 
+    @classmethod
+    def __get_year_type(cls, year: int, cache: int) -> int:
+        """Returns the index into the month tables for the given year, whose cache entry is also given."""
+        return (cache & (cls.__IS_HESHVAN_LONG_CACHE_BIT | cls.__IS_KISLEV_SHORT_CACHE_BIT)) | (
+            cls.__IS_LEAP_YEAR_TYPE_BIT if ((year * 7) + 1) % 19 < 7 else 0
+        )
+
     @classmethod
     def _get_year_month_day(cls, year: int, day_of_year: int) -> _YearMonthDay:
         from .._year_month_day import _YearMonthDay
 
-        # TODO: unchecked
-
         # Work out everything about the year in one go.
-        cache: int = cls.__get_or_populate_cache(year)
-        heshvan_length: int = 30 if (cache & cls.__IS_HESHVAN_LONG_CACHE_BIT) != 0 else 29
-        kislev_length: int = 29 if (cache & cls.__IS_KISLEV_SHORT_CACHE_BIT) != 0 else 30
-        is_leap: bool = cls._is_leap_year(year)
-        first_adar_length = 30 if is_leap else 29
-
-        if day_of_year < 31:
-            # Tishri
-            return _YearMonthDay._ctor(year=year, month=7, day=day_of_year)
-        if day_of_year < 31 + heshvan_length:
-            # Heshvan
-            return _YearMonthDay._ctor(year=year, month=8, day=day_of_year - 30)
-        # Now "day of year without Heshvan"...
-        day_of_year -= heshvan_length
-        if day_of_year < 31 + kislev_length:
-            # Kislev
-            return _YearMonthDay._ctor(year=year, month=9, day=day_of_year - 30)
-        # Now "day of year without Heshvan or Kislev"...
-        day_of_year -= kislev_length
-        if day_of_year < 31 + 29:
-            # Tevet
-            return _YearMonthDay._ctor(year=year, month=10, day=day_of_year - 30)
-        if day_of_year < 31 + 29 + 30:
-            # Shevat
-            return _YearMonthDay._ctor(year=year, month=11, day=day_of_year - (30 + 29))
-        if day_of_year < 31 + 29 + 30 + first_adar_length:
-            # Adar / Adar I
-            return _YearMonthDay._ctor(year=year, month=12, day=day_of_year - (30 + 29 + 30))
-        # Now "day of year without first month of Adar"
-        day_of_year -= first_adar_length
-        if is_leap:
-            if day_of_year < 31 + 29 + 30 + 29:
-                return _YearMonthDay._ctor(year=year, month=13, day=day_of_year - (30 + 29 + 30))
-            # Now "day of year without any Adar"
-            day_of_year -= 29
-        # We could definitely do a binary search from here, but it would only
-        # a few comparisons at most, and simplicity trumps optimization.
-        if day_of_year < 31 + 29 + 30 + 30:
-            # Nisan
-            return _YearMonthDay._ctor(year=year, month=1, day=day_of_year - (30 + 29 + 30))
-        if day_of_year < 31 + 29 + 30 + 30 + 29:
-            # Iyar
-            return _YearMonthDay._ctor(year=year, month=2, day=day_of_year - (30 + 29 + 30 + 30))
-        if day_of_year < 31 + 29 + 30 + 30 + 29 + 30:
-            # Sivan
-            return _YearMonthDay._ctor(year=year, month=3, day=day_of_year - (30 + 29 + 30 + 30 + 29))
-        if day_of_year < 31 + 29 + 30 + 30 + 29 + 30 + 29:
-            # Tamuz
-            return _YearMonthDay._ctor(year=year, month=4, day=day_of_year - (30 + 29 + 30 + 30 + 29 + 30))
-        if day_of_year < 31 + 29 + 30 + 30 + 29 + 30 + 29 + 30:
-            # Av
-            return _YearMonthDay._ctor(year=year, month=5, day=day_of_year - (30 + 29 + 30 + 30 + 29 + 30 + 29))
-        # Elul
-        return _YearMonthDay._ctor(year=year, month=6, day=day_of_year - (30 + 29 + 30 + 30 + 29 + 30 + 29 + 30))
+        year_type: int = cls.__get_year_type(year, cls.__get_or_populate_cache(year))
+        month: int = cls.__MONTHS_BY_DAY_OF_YEAR[year_type][day_of_year]
+        return _YearMonthDay._ctor(year=year, month=month, day=day_of_year - cls.__MONTH_STARTS[year_type][month])
 
     @classmethod
     def _get_days_from_start_of_year_to_start_of_month(cls, year: int, month: int) -> int:  # type: ignore[return]
-        # Work out everything about the year in one go. (Admittedly we don't always need it all... but for
-        # anything other than Tishri and Heshvan, we at least need the length of Heshvan...)
-
-        # TODO: unchecked
-
-        cache: int = cls.__get_or_populate_cache(year)
-        heshvan_length = 30 if (cache & cls.__IS_HESHVAN_LONG_CACHE_BIT) != 0 else 29
-        kislev_length = 29 if (cache & cls.__IS_KISLEV_SHORT_CACHE_BIT) != 0 else 30
-        is_leap = cls._is_leap_year(year)
-        first_adar_length = 30 if is_leap else 29
-        second_adar_length = 29 if is_leap else 0
-        match month:
-            case 1:  # Nisan
-                return 30 + heshvan_length + kislev_length + (29 + 30) + first_adar_length + second_adar_length
-            case 2:  # Iyar
-                return 30 + heshvan_length + kislev_length + (29 + 30) + first_adar_length + second_adar_length + 30
-            case 3:  # Sivan
-                return (
-                    30 + heshvan_length + kislev_length + 29 + 30 + first_adar_length + second_adar_length + (30 + 29)
-                )
-            case 4:  # Tamuz
-                return (
-                    30
-                    + heshvan_length
-                    + kislev_length
-                    + 29
-                    + 30
-                    + first_adar_length
-                    + second_adar_length
-                    + (30 + 29 + 30)
-                )
-            case 5:  # Av
-                return (
-                    30
-                    + heshvan_length
-                    + kislev_length
-                    + 29
-                    + 30
-                    + first_adar_length
-                    + second_adar_length
-                    + (30 + 29 + 30 + 29)
-                )
-            case 6:  # Elul
-                return (
-                    30
-                    + heshvan_length
-                    + kislev_length
-                    + 29
-                    + 30
-                    + first_adar_length
-                    + second_adar_length
-                    + (30 + 29 + 30 + 29 + 30)
-                )
-            case 7:  # Tishri
-                return 0
-            case 8:  # Heshvan
-                return 30
-            case 9:  # Kislev
-                return 30 + heshvan_length
-            case 10:  # Tevet
-                return 30 + heshvan_length + kislev_length
-            case 11:  # Shevet
-                return 30 + heshvan_length + kislev_length + 29
-            case 12:  # Adar / Adar I
-                return 30 + heshvan_length + kislev_length + 29 + 30
-            case 13:  # Adar II
-                return 30 + heshvan_length + kislev_length + 29 + 30 + first_adar_length
-
+        if 1 <= month <= 13:
+            return cls.__MONTH_STARTS[cls.__get_year_type(year, cls.__get_or_populate_cache(year))][month]
         _Preconditions._throw_argument_out_of_range_exception("month", month, 1, 13)
 
     @classmethod
@@ -235,38 +161,30 @@ class _HebrewScripturalCalculator:
     @classmethod
     def __get_or_populate_cache(cls, year: int) -> int:
         """Returns the cached "elapsed day at start of year / IsHeshvanLong / IsKislevShort" combination, populating the
-        cache if necessary.
+        table if necessary.
 
         Bits 2-24 are the "elapsed days start of year"; bit 0 is "is Heshvan long"; bit 1 is "is Kislev short". If the
-        year is out of the range for the cache, the value is populated but not cached.
+        year is out of the range for the table, the value is populated but not stored.
         """
         if year < cls._MIN_YEAR or year > cls._MAX_YEAR:
             return cls.__compute_cache_entry(year)
-        cache_index: int = _YearStartCacheEntry._get_cache_index(year)
-        cache_entry: _YearStartCacheEntry = cls.__YEAR_CACHE[cache_index]
-        if not cache_entry._is_valid_for_year(year):
-            days: int = cls.__compute_cache_entry(year)
-            cache_entry = _YearStartCacheEntry(year, days)
-            cls.__YEAR_CACHE[cache_index] = cache_entry
-        return cache_entry._start_of_year_days
+        cache_entry: int = cls.__YEAR_TABLE[year]
+        if cache_entry == 0:
+            cache_entry = cls.__YEAR_TABLE[year] = cls.__compute_cache_entry(year)
+        return cache_entry
 
     @classmethod
     def __compute_cache_entry(cls, year: int) -> int:
-        """Computes the cache entry value for the given year, but without populating the cache."""
+        """Computes the cache entry value for the given year, but without populating the table."""
         days: int = cls.__elapsed_days_no_cache(year)
-        # We want the elapsed days for the next year as well. Check the cache if possible.
+        # We want the elapsed days for the next year as well. Check the table if possible.
         next_year = year + 1
-        next_year_days: int
-        if next_year < cls._MAX_YEAR:
-            cache_index: int = _YearStartCacheEntry._get_cache_index(next_year)
-            cache_entry: _YearStartCacheEntry = cls.__YEAR_CACHE[cache_index]
-            next_year_days = (
-                cache_entry._start_of_year_days >> cls.__ELAPSED_DAYS_CACHE_SHIFT
-                if cache_entry._is_valid_for_year(next_year)
-                else cls.__elapsed_days_no_cache(next_year)
-            )
-        else:
-            next_year_days = cls.__elapsed_days_no_cache(year + 1)
+        next_year_entry: int = cls.__YEAR_TABLE[next_year] if cls._MIN_YEAR <= next_year <= cls._MAX_YEAR else 0
+        next_year_days: int = (
+            next_year_entry >> cls.__ELAPSED_DAYS_CACHE_SHIFT
+            if next_year_entry != 0
+            else cls.__elapsed_days_no_cache(next_year)
+        )
         days_in_year = next_year_days - days
         is_heshvan_long = _csharp_modulo(days_in_year, 10) == 5
         is_kislev_short = _csharp_modulo(days_in_year, 10) == 3
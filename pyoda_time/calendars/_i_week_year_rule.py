@@ -7,6 +7,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable
+
     from .. import LocalDate
     from .._calendar_system import CalendarSystem
     from .._iso_day_of_week import IsoDayOfWeek
@@ -26,3 +29,19 @@ class IWeekYearRule(Protocol):
     def get_week_of_week_year(self, date: LocalDate) -> int: ...
 
     def get_weeks_in_week_year(self, week_year: int, calendar: CalendarSystem | None = None) -> int: ...
+
+    def get_week_year_many(
+        self, days_since_epoch: Iterable[int], calendar: CalendarSystem | None = None
+    ) -> array[int]: ...
+
+    def get_week_of_week_year_many(
+        self, days_since_epoch: Iterable[int], calendar: CalendarSystem | None = None
+    ) -> array[int]: ...
+
+    def get_local_date_many(
+        self,
+        week_years: Iterable[int],
+        weeks_of_week_year: Iterable[int],
+        days_of_week: Iterable[int],
+        calendar: CalendarSystem | None = None,
+    ) -> array[int]: ...
@@ -73,6 +73,7 @@ class _IslamicYearMonthDayCalculator(_RegularYearMonthDayCalculator):
 
         # The pattern of leap years within a cycle, one bit per year, for this calendar.
         self.__leap_year_pattern_bits: Final[int] = self.__get_leap_year_pattern_bits(leap_year_pattern)
+        self._precompute_start_of_year_days()
 
     def _get_days_from_start_of_year_to_start_of_month(self, year: int, month: int) -> int:
         # The number of days at the *start* of a month isn't affected by
@@ -4,19 +4,28 @@
 
 from __future__ import annotations
 
-from typing import Final, final
+from array import array
+from typing import TYPE_CHECKING, Final, final
 
 from ..utility._csharp_compatibility import _sealed
 from ._g_j_year_month_day_calculator import _GJYearMonthDayCalculator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @_sealed
 @final
 class _JulianYearMonthDayCalculator(_GJYearMonthDayCalculator):
     __AVERAGE_DAYS_PER_10_JULIAN_YEARS: Final[int] = 3653  # Ideally 365.25 per year
+    # The days from 0000-03-01 (Julian) to 1970-01-01 (Gregorian). As in _GregorianYearMonthDayCalculator, _split_days
+    # counts from the March before the year 0 starts, so that the leap day is the last day of each (shifted) year.
+    __DAYS_FROM_0000_03_01_TO_1970: Final[int] = 719470
+    __DAYS_PER_4_YEARS: Final[int] = 1461
 
     def __init__(self) -> None:
         super().__init__(-9997, 9998, self.__AVERAGE_DAYS_PER_10_JULIAN_YEARS, -719164)
+        self._precompute_start_of_year_days()
 
     def _is_leap_year(self, year: int) -> bool:
         return (year & 3) == 0
@@ -39,3 +48,31 @@ class _JulianYearMonthDayCalculator(_GJYearMonthDayCalculator):
 
         # Accounts for the difference between January 1st 1968 and December 19th 1969.
         return relative_year * 365 + leap_years - (366 + 352)
+
+    def _split_days(self, days_since_epoch: Iterable[int]) -> tuple[array[int], array[int], array[int], array[int]]:
+        # This is the Julian equivalent of _GregorianYearMonthDayCalculator._split_days, with 4-year cycles (starting
+        # with a leap year) instead of 400-year eras.
+        years: array[int] = array("i")
+        months: array[int] = array("B")
+        days: array[int] = array("B")
+        days_of_year: array[int] = array("H")
+        days_from_0000_03_01_to_1970 = self.__DAYS_FROM_0000_03_01_TO_1970
+        days_per_4_years = self.__DAYS_PER_4_YEARS
+        for value in days_since_epoch:
+            shifted_days = value + days_from_0000_03_01_to_1970
+            cycle = shifted_days // days_per_4_years
+            day_of_cycle = shifted_days - cycle * days_per_4_years  # [0, 1460]
+            year_of_cycle = (day_of_cycle - day_of_cycle // 1460) // 365  # [0, 3]
+            shifted_day_of_year = day_of_cycle - 365 * year_of_cycle  # [0, 365]
+            shifted_month = (5 * shifted_day_of_year + 2) // 153  # [0, 11], where 0 is March
+            year = year_of_cycle + cycle * 4
+            if shifted_month < 10:
+                months.append(shifted_month + 3)
+                days_of_year.append(shifted_day_of_year + (61 if year_of_cycle == 0 else 60))
+            else:
+                year += 1
+                months.append(shifted_month - 9)
+                days_of_year.append(shifted_day_of_year - 305)
+            years.append(year)
+            days.append(shifted_day_of_year - (153 * shifted_month + 2) // 5 + 1)
+        return years, months, days, days_of_year
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Final, final
 
 from ..utility._csharp_compatibility import _sealed, _towards_zero_division
@@ -11,6 +13,8 @@ from ..utility._preconditions import _Preconditions
 from ._i_week_year_rule import IWeekYearRule
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .._calendar_system import CalendarSystem
     from .._iso_day_of_week import IsoDayOfWeek
     from .._local_date import LocalDate
@@ -26,6 +30,9 @@ class _SimpleWeekYearRule(IWeekYearRule):
         self.__min_days_in_first_week: Final[int] = min_days_in_first_week
         self.__first_day_of_week: Final[IsoDayOfWeek] = first_day_of_week
         self.__irregular_weeks: Final[bool] = irregular_weeks
+        # The start of each week-year which has been asked for so far, by calculator and then week-year.
+        # See __get_week_year_days_since_epoch.
+        self.__week_year_start_cache: Final[dict[_YearMonthDayCalculator, dict[int, int]]] = {}
 
     def get_local_date(
         self,
@@ -155,6 +162,151 @@ class _SimpleWeekYearRule(IWeekYearRule):
         start_of_next_week_year = start_of_week_year + weeks_in_week_year * 7
         return calendar_year if days_since_epoch < start_of_next_week_year else calendar_year + 1
 
+    def get_week_year_many(self, days_since_epoch: Iterable[int], calendar: CalendarSystem | None = None) -> array[int]:
+        """Returns the week-year of each of a sequence of dates.
+
+        This is equivalent to calling ``get_week_year`` for the ``LocalDate`` of each value, but is considerably more
+        efficient for large batches: the start of each week-year spanned by the batch is only computed once, after
+        which each value is located with a binary search.
+
+        :param days_since_epoch: The dates, each expressed as a number of days since the Unix epoch (1970-01-01 ISO).
+            Any iterable of integers is accepted, including a NumPy ``int64`` array.
+        :param calendar: The calendar system of the dates; defaults to the ISO calendar.
+        :raises ValueError: Any of the values is outside the range of the calendar.
+        :return: The week-years (signed 32-bit integers), in the same order as the given values.
+        """
+        return self.__split_days(days_since_epoch, calendar, with_weeks=False)[0]
+
+    def get_week_of_week_year_many(
+        self, days_since_epoch: Iterable[int], calendar: CalendarSystem | None = None
+    ) -> array[int]:
+        """Returns the week of the week-year of each of a sequence of dates.
+
+        This is equivalent to calling ``get_week_of_week_year`` for the ``LocalDate`` of each value, but is
+        considerably more efficient for large batches, in the same way as ``get_week_year_many``.
+
+        :param days_since_epoch: The dates, each expressed as a number of days since the Unix epoch (1970-01-01 ISO).
+            Any iterable of integers is accepted, including a NumPy ``int64`` array.
+        :param calendar: The calendar system of the dates; defaults to the ISO calendar.
+        :raises ValueError: Any of the values is outside the range of the calendar.
+        :return: The weeks of the week-year (unsigned bytes), in the same order as the given values.
+        """
+        return self.__split_days(days_since_epoch, calendar, with_weeks=True)[1]
+
+    def get_local_date_many(
+        self,
+        week_years: Iterable[int],
+        weeks_of_week_year: Iterable[int],
+        days_of_week: Iterable[int],
+        calendar: CalendarSystem | None = None,
+    ) -> array[int]:
+        """Returns the date of each of a sequence of week-year, week of week-year and day of week values.
+
+        This is equivalent to calling ``get_local_date`` for each combination, with the same validation, but returns
+        the dates as numbers of days since the Unix epoch rather than constructing a ``LocalDate`` for each one. The
+        start and length of each week-year are only computed once.
+
+        :param week_years: The week-years of the dates.
+        :param weeks_of_week_year: The weeks of the week-year of the dates.
+        :param days_of_week: The days of the week of the dates, as ``IsoDayOfWeek`` values or the equivalent integers.
+        :param calendar: The calendar system of the dates; defaults to the ISO calendar.
+        :raises ValueError: The sequences are of different lengths, or any combination is invalid in the same way as
+            for ``get_local_date``.
+        :return: The dates, each expressed as a number of days since the Unix epoch (signed 32-bit integers), in the
+            same order as the given values.
+        """
+        if calendar is None:
+            from .. import CalendarSystem
+
+            calendar = CalendarSystem.iso
+        _Preconditions._check_not_null(calendar, "calendar")
+        year_month_day_calculator = calendar._year_month_day_calculator
+        min_days = calendar._min_days
+        max_days = calendar._max_days
+        first_day_of_week = int(self.__first_day_of_week)
+        # The number of weeks in, and start of, each week-year seen so far.
+        week_year_info: dict[int, tuple[int, int]] = {}
+        result: array[int] = array("i")
+        for week_year, week_of_week_year, day_of_week in zip(week_years, weeks_of_week_year, days_of_week, strict=True):
+            if (info := week_year_info.get(week_year)) is None:
+                # get_weeks_in_week_year validates the week-year, so must come first.
+                max_weeks = self.get_weeks_in_week_year(week_year, calendar)
+                info = week_year_info[week_year] = (
+                    max_weeks,
+                    self.__get_week_year_days_since_epoch(year_month_day_calculator, week_year),
+                )
+            max_weeks, start_of_week_year = info
+            if day_of_week < 1 or day_of_week > 7:
+                _Preconditions._check_argument_range("day_of_week", int(day_of_week), 1, 7)
+            if week_of_week_year < 1 or week_of_week_year > max_weeks:
+                # TODO: ArgumentOutOfRangeException
+                raise ValueError(f"week_of_week_year {week_of_week_year} is out of range (1, {max_weeks})")
+            days = start_of_week_year + (week_of_week_year - 1) * 7 + (day_of_week - first_day_of_week + 7) % 7
+            if days < min_days or days > max_days:
+                # TODO: ArgumentOutOfRangeException
+                raise ValueError("The combination of week_year, week_of_week_year and day_of_week is invalid")
+            # As in get_local_date, short weeks in irregular rules may have put the date in the wrong week-year.
+            if self.__irregular_weeks:
+                calendar_year = year_month_day_calculator._get_year(days)[0]
+                if week_year != calendar_year and week_year != (
+                    calendar_year - 1
+                    if days < self.__get_week_year_days_since_epoch(year_month_day_calculator, calendar_year)
+                    else calendar_year
+                ):
+                    # TODO: ArgumentOutOfRangeException
+                    raise ValueError("The combination of week_year, week_of_week_year and day_of_week is invalid")
+            result.append(days)
+        return result
+
+    def __split_days(
+        self, days_since_epoch: Iterable[int], calendar: CalendarSystem | None, *, with_weeks: bool
+    ) -> tuple[array[int], array[int]]:
+        """Works out the week-year, and optionally the week of week-year, of each of a sequence of dates, for the batch
+        methods."""
+        if calendar is None:
+            from .. import CalendarSystem
+
+            calendar = CalendarSystem.iso
+        _Preconditions._check_not_null(calendar, "calendar")
+        values = [int(value) for value in days_since_epoch]
+        if not values:
+            return array("i"), array("B")
+        min_value, max_value = min(values), max(values)
+        _Preconditions._check_argument_range("days_since_epoch", min_value, calendar._min_days, calendar._max_days)
+        _Preconditions._check_argument_range("days_since_epoch", max_value, calendar._min_days, calendar._max_days)
+
+        # Every value is in the week-year of its calendar year, or the one either side. Values in the week-year before
+        # the first calendar year get an index of -1. As in get_week_year and get_week_of_week_year, the start of that
+        # week-year is only computed if weeks are needed for such values, as the calendar may not be able to compute
+        # it (e.g. for year 0 in the Badi calendar).
+        year_month_day_calculator = calendar._year_month_day_calculator
+        first_year = year_month_day_calculator._get_year(min_value)[0]
+        years = range(first_year, year_month_day_calculator._get_year(max_value)[0] + 2)
+        week_year_starts = [self.__get_week_year_days_since_epoch(year_month_day_calculator, year) for year in years]
+        if self.__irregular_weeks:
+            # In irregular rules, a day can belong to the *previous* week-year, but never the *next* week-year; so
+            # find the calendar year, and then check whether its week-year has started. (See get_week_year.)
+            year_starts = [year_month_day_calculator._get_start_of_year_in_days(year) for year in years]
+            indexes = []
+            for value in values:
+                index = bisect_right(year_starts, value) - 1
+                if value < week_year_starts[index]:
+                    index -= 1
+                indexes.append(index)
+        else:
+            # In regular rules, each week-year ends where the next one starts.
+            indexes = [bisect_right(week_year_starts, value) - 1 for value in values]
+        week_years = array("i", [first_year + index for index in indexes])
+        if not with_weeks:
+            return week_years, array("B")
+        if min_value < week_year_starts[0]:
+            # Appended, so that the index of -1 refers to it.
+            week_year_starts.append(self.__get_week_year_days_since_epoch(year_month_day_calculator, first_year - 1))
+        weeks = array(
+            "B", [(value - week_year_starts[index]) // 7 + 1 for value, index in zip(values, indexes, strict=True)]
+        )
+        return week_years, weeks
+
     def __validate_week_year(self, week_year: int, calendar: CalendarSystem) -> None:
         """Validate that at least one day in the calendar falls in the given week year."""
         if calendar.min_year < week_year < calendar.max_year:
@@ -185,7 +337,20 @@ class _SimpleWeekYearRule(IWeekYearRule):
         The week-year may be 1 higher or lower than the max/min calendar year. For non-regular rules (i.e. where some
         weeks can be short) it returns the day when the week-year *would* have started if it were regular. So this
         *always* returns a date on firstDayOfWeek.
+
+        Each result is cached for the lifetime of the rule; there are at most a few thousand week-years per calendar.
         """
+        if (cache := self.__week_year_start_cache.get(year_month_day_calculator)) is None:
+            cache = self.__week_year_start_cache.setdefault(year_month_day_calculator, {})
+        if (start := cache.get(week_year)) is None:
+            start = cache[week_year] = self.__calculate_week_year_days_since_epoch(year_month_day_calculator, week_year)
+        return start
+
+    def __calculate_week_year_days_since_epoch(
+        self, year_month_day_calculator: _YearMonthDayCalculator, week_year: int
+    ) -> int:
+        """Computes the days at the start of the given week-year, as described in
+        ``__get_week_year_days_since_epoch``, without using the cache."""
         # TODO: unchecked
 
         # Need to be slightly careful here, as the week-year can reasonably be (just) outside the calendar year range.
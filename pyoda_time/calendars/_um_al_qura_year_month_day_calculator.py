@@ -58,9 +58,9 @@ class _UmAlQuraYearMonthDayCalculator(_RegularYearMonthDayCalculator):
         for i in range(int(len(data) / 2)):
             month_lengths[i] = (data[i * 2] << 8) | (data[i * 2 + 1])
 
-        # Populate arrays from index 1
+        # Populate arrays from index 1, up to the max year; the last entry is filled in below.
         total_days = 0
-        for year in range(1, len(month_lengths)):
+        for year in range(1, len(month_lengths) - 1):
             year_start_days[year] = computed_days_at_start_of_min_year + total_days
             month_bits = month_lengths[year]
             year_length = 29 * 12
@@ -71,10 +71,11 @@ class _UmAlQuraYearMonthDayCalculator(_RegularYearMonthDayCalculator):
 
         # Fill in the cache with dummy data for before/after the min/max year, pretending
         # that both of the "extra" years were 354 days long.
+        # (The C# arrays have the length of month_lengths up front, so their last index is that of month_lengths.)
         year_start_days[0] = computed_days_at_start_of_min_year - 354
-        year_start_days[len(year_start_days) - 1] = computed_days_at_start_of_min_year + total_days
+        year_start_days[len(month_lengths) - 1] = computed_days_at_start_of_min_year + total_days
         year_lengths[0] = 354
-        year_lengths[len(year_start_days) - 1] = 354
+        year_lengths[len(month_lengths) - 1] = 354
 
     _ctor(
         generated_data=__GENERATED_DATA,
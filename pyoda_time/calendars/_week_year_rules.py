@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 
 class _WeekYearRulesMeta(type):
+    # Rules cache the start of each week-year they have computed, so the ISO rule is shared.
+    __iso: IWeekYearRule | None = None
+
     @property
     def iso(cls) -> IWeekYearRule:
         """Returns an ``IWeekYearRule`` consistent with ISO-8601.
@@ -29,10 +32,12 @@ class _WeekYearRulesMeta(type):
 
         :return: A ``IWeekYearRule`` consistent with ISO-8601.
         """
-        from .. import IsoDayOfWeek
-        from ._simple_week_year_rule import _SimpleWeekYearRule
+        if cls.__iso is None:
+            from .. import IsoDayOfWeek
+            from ._simple_week_year_rule import _SimpleWeekYearRule
 
-        return _SimpleWeekYearRule(4, IsoDayOfWeek.MONDAY, False)
+            cls.__iso = _SimpleWeekYearRule(4, IsoDayOfWeek.MONDAY, False)
+        return cls.__iso
 
 
 class WeekYearRules(metaclass=_WeekYearRulesMeta):
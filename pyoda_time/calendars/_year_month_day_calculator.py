@@ -5,13 +5,22 @@
 from __future__ import annotations
 
 import abc
+from array import array
 from typing import TYPE_CHECKING, Final, overload
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .._year_month_day import _YearMonthDay
 from ..utility._csharp_compatibility import _towards_zero_division
 from ..utility._preconditions import _Preconditions
-from ._year_start_cache_entry import _YearStartCacheEntry
+from ._year_start_cache_entry import (
+    _CACHE_INDEX_BITS,
+    _CACHE_INDEX_MASK,
+    _ENTRY_VALIDATION_BITS,
+    _ENTRY_VALIDATION_MASK,
+    _YearStartCacheEntry,
+)
 
 
 class _YearMonthDayCalculator(abc.ABC):
@@ -54,7 +63,10 @@ class _YearMonthDayCalculator(abc.ABC):
         self.__days_at_start_of_year_1 = days_at_start_of_year_1
         # Cache to speed up working out when a particular year starts.
         # See the ``YearStartCacheEntry`` documentation and ``GetStartOfYearInDays`` for more details.
-        self.__year_cache: Final[dict[int, _YearStartCacheEntry]] = _YearStartCacheEntry._create_cache()
+        self.__year_cache: Final[array[int]] = _YearStartCacheEntry._create_cache()
+        # See ``_precompute_start_of_year_days``.
+        self.__first_precomputed_year: int = 0
+        self.__precomputed_start_of_year_days: array[int] | None = None
 
     # region Abstract methods
 
@@ -135,15 +147,39 @@ class _YearMonthDayCalculator(abc.ABC):
         return start_of_month + year_month_day._day - 1
 
     def _get_start_of_year_in_days(self, year: int) -> int:
-        """Fetches the start of the year (in days since 1970-01-01 ISO) from the cache, or calculates and caches it."""
+        """Fetches the start of the year (in days since 1970-01-01 ISO) from the precomputed table if there is one, or
+        from the cache, calculating and caching it if necessary."""
         # TODO Preconditions.DebugCheckArgumentRange(...)
-        cache_index = _YearStartCacheEntry._get_cache_index(year)
+        if (table := self.__precomputed_start_of_year_days) is not None and 0 <= (
+            table_index := year - self.__first_precomputed_year
+        ) < len(table):
+            return table[table_index]
+        # This is _YearStartCacheEntry's logic, inlined.
+        cache_index = year & _CACHE_INDEX_MASK
         cache_entry = self.__year_cache[cache_index]
-        if not cache_entry._is_valid_for_year(year):
-            days = self._calculate_start_of_year_days(year)
-            cache_entry = _YearStartCacheEntry(year, days)
-            self.__year_cache[cache_index] = cache_entry
-        return cache_entry._start_of_year_days
+        validator = (year >> _CACHE_INDEX_BITS) & _ENTRY_VALIDATION_MASK
+        if (cache_entry & _ENTRY_VALIDATION_MASK) == validator:
+            return cache_entry >> _ENTRY_VALIDATION_BITS
+        days = self._calculate_start_of_year_days(year)
+        self.__year_cache[cache_index] = (days << _ENTRY_VALIDATION_BITS) | validator
+        return days
+
+    def _precompute_start_of_year_days(self) -> None:
+        """Calculates the start of every year in the range of the calendar (and of the years either side of it) up
+        front, so that ``_get_start_of_year_in_days`` never needs to calculate or cache anything.
+
+        This is for calendars with bounded year ranges where the table is small and quick to build; it's called at the
+        end of their constructors, as it relies on ``_calculate_start_of_year_days`` for the first year only, and on
+        ``_get_days_in_year`` for the rest.
+        """
+        first_year = self._min_year - 1
+        start_of_year = self._calculate_start_of_year_days(first_year)
+        table: array[int] = array("q")
+        for year in range(first_year, self._max_year + 2):
+            table.append(start_of_year)
+            start_of_year += self._get_days_in_year(year)
+        self.__first_precomputed_year = first_year
+        self.__precomputed_start_of_year_days = table
 
     def compare(self, lhs: _YearMonthDay, rhs: _YearMonthDay) -> int:
         """Compares two YearMonthDay values according to the rules of this calendar. The default implementation simply
@@ -208,6 +244,30 @@ class _YearMonthDayCalculator(abc.ABC):
         year, zero_based_day = self._get_year(days_since_epoch)
         return self._get_year_month_day(year=year, day_of_year=zero_based_day + 1)
 
+    def _split_days(self, days_since_epoch: Iterable[int]) -> tuple[array[int], array[int], array[int], array[int]]:
+        """Works out the year, month, day and day of year for each of a sequence of days-since-epoch values, which are
+        assumed to have been validated previously.
+
+        This implementation just converts one value at a time, in the same way as
+        ``_get_year_month_day_from_days_since_epoch``; calculators which can do better override it.
+
+        :param days_since_epoch: The number of days since the epoch of each date.
+        :return: A 4-tuple of arrays of the years (signed 32-bit integers), months, days (unsigned bytes) and days of
+            year (unsigned 16-bit integers), in the same order as the given values.
+        """
+        years: array[int] = array("i")
+        months: array[int] = array("B")
+        days: array[int] = array("B")
+        days_of_year: array[int] = array("H")
+        for value in days_since_epoch:
+            year, zero_based_day = self._get_year(value)
+            year_month_day = self._get_year_month_day_from_year_and_day_of_year(year, zero_based_day + 1)
+            years.append(year)
+            months.append(year_month_day._month)
+            days.append(year_month_day._day)
+            days_of_year.append(zero_based_day + 1)
+        return years, months, days, days_of_year
+
     def _get_year(self, days_since_epoch: int) -> tuple[int, int]:
         """Work out the year from the number of days since the epoch, as well as the day of that year (0-based).
 
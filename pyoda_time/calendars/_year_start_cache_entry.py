@@ -4,52 +4,62 @@
 
 from __future__ import annotations
 
+from array import array
 from typing import Final
 
+# The layout of the cache, and of each entry in it. These are module-level so that the lookups in
+# ``_YearMonthDayCalculator._get_start_of_year_in_days`` (which inline the methods below) are as cheap as possible.
+_CACHE_INDEX_BITS: Final[int] = 10
+_CACHE_SIZE: Final[int] = 1 << _CACHE_INDEX_BITS
+_CACHE_INDEX_MASK: Final[int] = _CACHE_SIZE - 1
+_ENTRY_VALIDATION_BITS: Final[int] = 7
+_ENTRY_VALIDATION_MASK: Final[int] = (1 << _ENTRY_VALIDATION_BITS) - 1
+
 
 class _YearStartCacheEntry:
-    """Type containing as much logic as possible for how the cache of "start of year" data works."""
+    """Type containing as much logic as possible for how the cache of "start of year" data works.
 
-    __CACHE_INDEX_BITS: Final[int] = 10
-    __CACHE_SIZE: Final[int] = 1 << __CACHE_INDEX_BITS
-    __CACHE_INDEX_MASK: Final[int] = __CACHE_SIZE - 1
-    __ENTRY_VALIDATION_BITS: Final[int] = 7
-    __ENTRY_VALIDATION_MASK: Final[int] = (1 << __ENTRY_VALIDATION_BITS) - 1
-    _INVALID_ENTRY_YEAR: Final[int] = (__ENTRY_VALIDATION_MASK >> 1) << __CACHE_INDEX_BITS
+    A cache is a flat ``array('q')`` of ``_CACHE_SIZE`` entries, indexed by the bottom ``_CACHE_INDEX_BITS`` bits of
+    the year. Each entry packs the start of the year (in days since the Unix epoch) above a validator, which is the next
+    ``_ENTRY_VALIDATION_BITS`` bits of the year; an entry is only valid for a year whose validator matches.
+    """
 
-    def __init__(self, year: int, days: int) -> None:
-        self.__value = (days << self.__ENTRY_VALIDATION_BITS) | self.__get_validator(year)
+    _INVALID_ENTRY_YEAR: Final[int] = (_ENTRY_VALIDATION_MASK >> 1) << _CACHE_INDEX_BITS
 
     @classmethod
     def __get_validator(cls, year: int) -> int:
         """Returns the validator to use for a given year, a non-negative number containing at most
-        __ENTRY_VALIDATION_BITS bits."""
-        return (year >> cls.__CACHE_INDEX_BITS) & cls.__ENTRY_VALIDATION_MASK
+        _ENTRY_VALIDATION_BITS bits."""
+        return (year >> _CACHE_INDEX_BITS) & _ENTRY_VALIDATION_MASK
 
     @classmethod
     def _get_cache_index(cls, year: int) -> int:
         """Returns the cache index, in [0, CacheSize), that should be used to store the given year's cache entry."""
-        return year & cls.__CACHE_INDEX_MASK
+        return year & _CACHE_INDEX_MASK
 
     @classmethod
-    def _create_cache(cls) -> dict[int, _YearStartCacheEntry]:
-        cache = {i: _YearStartCacheEntry.__invalid() for i in range(cls.__CACHE_SIZE)}
-        return cache
+    def _create_cache(cls) -> array[int]:
+        """Creates a cache in which every entry is invalid."""
+        return array("q", [cls._create_entry(cls._INVALID_ENTRY_YEAR, 0)]) * _CACHE_SIZE
 
     @classmethod
-    def __invalid(cls) -> _YearStartCacheEntry:
-        """Entry which is guaranteed to be obviously invalid for any real date, by having a validation value which is
-        larger than any valid year number."""
-        return _YearStartCacheEntry(cls._INVALID_ENTRY_YEAR, 0)
+    def _create_entry(cls, year: int, days: int) -> int:
+        """Returns the cache entry for the given year, which starts the given number of days since the Unix epoch."""
+        return (days << _ENTRY_VALIDATION_BITS) | cls.__get_validator(year)
 
-    def _is_valid_for_year(self, year: int) -> bool:
-        """Returns whether this cache entry is valid for the given year, and so is safe to use.
+    @classmethod
+    def _is_valid_for_year(cls, entry: int, year: int) -> bool:
+        """Returns whether the given cache entry is valid for the given year, and so is safe to use.
 
         (We assume that we have located this entry via the correct cache index.)
+
+        The entry for ``_INVALID_ENTRY_YEAR``, with which caches are filled, is guaranteed to be invalid for any real
+        date, as that year is larger than any valid year number, and no valid year (even a negative one) shares its
+        validator.
         """
-        return self.__get_validator(year) == (self.__value & self.__ENTRY_VALIDATION_MASK)
+        return cls.__get_validator(year) == (entry & _ENTRY_VALIDATION_MASK)
 
-    @property
-    def _start_of_year_days(self) -> int:
-        """Returns the (signed) number of days since the Unix epoch for the cache entry."""
-        return self.__value >> self.__ENTRY_VALIDATION_BITS
+    @staticmethod
+    def _get_start_of_year_days(entry: int) -> int:
+        """Returns the (signed) number of days since the Unix epoch for the given cache entry."""
+        return entry >> _ENTRY_VALIDATION_BITS
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import itertools
 import threading
 from typing import TYPE_CHECKING, Final, TypeVar, cast, final
 
@@ -13,9 +14,10 @@ from ..calendars import Era
 from ..utility._cache import _Cache
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from .._annual_date import AnnualDate
+    from .._calendar_system import CalendarSystem
     from .._compatibility._i_format_provider import IFormatProvider
     from .._duration import Duration
     from .._instant import Instant
@@ -28,6 +30,8 @@ if TYPE_CHECKING:
     from .._year_month import YearMonth
     from .._zoned_date_time import ZonedDateTime
     from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+    from ..text._name_trie import _NameTrie
+    from ..text.patterns._i_pattern_parser import _IPatternParser
 from ..utility._csharp_compatibility import _sealed
 from ..utility._preconditions import _Preconditions
 from ._pattern_resources import _PatternResources
@@ -36,10 +40,21 @@ T = TypeVar("T")
 
 
 class _PyodaFormatInfoMeta(type):
+    __invariant_info: _PyodaFormatInfo | None = None
+    __invariant_info_lock: Final[threading.Lock] = threading.Lock()
+
     @property
     def invariant_info(self) -> _PyodaFormatInfo:
         """A ``_PyodaFormatInfo`` wrapping the invariant culture."""
-        return _PyodaFormatInfo(CultureInfo.invariant_culture)
+        # A single instance, as in Noda Time, so that patterns for the invariant culture share its pattern caches.
+        if (info := _PyodaFormatInfoMeta.__invariant_info) is None:
+            with _PyodaFormatInfoMeta.__invariant_info_lock:
+                if (info := _PyodaFormatInfoMeta.__invariant_info) is None:
+                    info = _PyodaFormatInfoMeta.__invariant_info = _PyodaFormatInfo(CultureInfo.invariant_culture)
+        return info
+
+    def _clear_invariant_info(self) -> None:
+        _PyodaFormatInfoMeta.__invariant_info = None
 
     @property
     def current_info(cls) -> _PyodaFormatInfo:
@@ -90,6 +105,14 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
         self.__long_month_genitive_names: list[str] | None = None
         self.__long_day_names: list[str] | None = None
 
+        self.__short_month_name_trie: _NameTrie[int] | None = None
+        self.__long_month_name_trie: _NameTrie[int] | None = None
+        self.__short_day_name_trie: _NameTrie[int] | None = None
+        self.__long_day_name_trie: _NameTrie[int] | None = None
+        # The designators the trie was built from, as they're fetched from the DateTimeFormatInfo each time.
+        self.__am_pm_designator_trie: tuple[str, str, _NameTrie[int]] | None = None
+        self.__era_name_tries: dict[CalendarSystem, _NameTrie[Era]] = {}
+
         self.__duration_pattern_parser: _FixedFormatInfoPatternParser[Duration] | None = None
         self.__offset_pattern_parser: _FixedFormatInfoPatternParser[Offset] | None = None
         self.__instant_pattern_parser: _FixedFormatInfoPatternParser[Instant] | None = None
@@ -102,6 +125,44 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
         self.__zoned_date_time_pattern_parser: _FixedFormatInfoPatternParser[ZonedDateTime] | None = None
         self.__annual_date_pattern_parser: _FixedFormatInfoPatternParser[AnnualDate] | None = None
         self.__year_month_pattern_parser: _FixedFormatInfoPatternParser[YearMonth] | None = None
+        self.__pattern_cache_size: int | None = None
+
+    def __create_pattern_parser(self, pattern_parser: _IPatternParser[T]) -> _FixedFormatInfoPatternParser[T]:
+        """Creates the caching pattern parser for one pattern type. Must be called under the field lock."""
+        from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+
+        return _FixedFormatInfoPatternParser(pattern_parser, self, self._pattern_cache_size)
+
+    @property
+    def _pattern_cache_size(self) -> int:
+        """The maximum number of patterns cached for each pattern type, by the parsers already created and those
+        created later."""
+        if self.__pattern_cache_size is None:
+            from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+
+            return _FixedFormatInfoPatternParser._DEFAULT_CACHE_SIZE
+        return self.__pattern_cache_size
+
+    @_pattern_cache_size.setter
+    def _pattern_cache_size(self, value: int) -> None:
+        _Preconditions._check_argument_range("value", value, 1, 0x7FFFFFFF)
+        with self.__FIELD_LOCK:
+            self.__pattern_cache_size = value
+            for parser in (
+                self.__duration_pattern_parser,
+                self.__offset_pattern_parser,
+                self.__instant_pattern_parser,
+                self.__local_time_pattern_parser,
+                self.__local_date_pattern_parser,
+                self.__local_date_time_pattern_parser,
+                self.__offset_date_time_pattern_parser,
+                self.__offset_time_pattern_parser,
+                self.__zoned_date_time_pattern_parser,
+                self.__annual_date_pattern_parser,
+                self.__year_month_pattern_parser,
+            ):
+                if parser is not None:
+                    parser._cache_size = value
 
     def __ensure_months_initialized(self) -> None:
         if self.__long_month_names is not None:
@@ -187,9 +248,8 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
             with self.__FIELD_LOCK:
                 if self.__duration_pattern_parser is None:
                     from ..text._duration_pattern_parser import _DurationPatternParser
-                    from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
 
-                    self.__duration_pattern_parser = _FixedFormatInfoPatternParser(_DurationPatternParser(), self)
+                    self.__duration_pattern_parser = self.__create_pattern_parser(_DurationPatternParser())
         return self.__duration_pattern_parser
 
     @property
@@ -197,10 +257,9 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
         if self.__offset_pattern_parser is None:
             with self.__FIELD_LOCK:
                 if self.__offset_pattern_parser is None:
-                    from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
                     from ..text._offset_pattern_parser import _OffsetPatternParser
 
-                    self.__offset_pattern_parser = _FixedFormatInfoPatternParser(_OffsetPatternParser(), self)
+                    self.__offset_pattern_parser = self.__create_pattern_parser(_OffsetPatternParser())
         return self.__offset_pattern_parser
 
     @property
@@ -209,14 +268,12 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
             with self.__FIELD_LOCK:
                 if self.__instant_pattern_parser is None:
                     from pyoda_time.text import InstantPattern, LocalDatePattern
-                    from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
                     from pyoda_time.text._instant_pattern_parser import _InstantPatternParser
 
-                    self.__instant_pattern_parser = _FixedFormatInfoPatternParser(
+                    self.__instant_pattern_parser = self.__create_pattern_parser(
                         _InstantPatternParser._ctor(
                             InstantPattern._DEFAULT_TEMPLATE_VALUE, LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
-                        ),
-                        self,
+                        )
                     )
         return self.__instant_pattern_parser
 
@@ -226,11 +283,10 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
             with self.__FIELD_LOCK:
                 if self.__local_time_pattern_parser is None:
                     from pyoda_time._local_time import LocalTime
-                    from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
                     from pyoda_time.text._local_time_pattern_parser import _LocalTimePatternParser
 
-                    self.__local_time_pattern_parser = _FixedFormatInfoPatternParser(
-                        _LocalTimePatternParser._ctor(LocalTime.midnight), self
+                    self.__local_time_pattern_parser = self.__create_pattern_parser(
+                        _LocalTimePatternParser._ctor(LocalTime.midnight)
                     )
 
         return self.__local_time_pattern_parser
@@ -243,13 +299,10 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
                     from pyoda_time.text import LocalDatePattern
                     from pyoda_time.text._local_date_pattern_parser import _LocalDatePatternParser
 
-                    from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
-
-                    self.__local_date_pattern_parser = _FixedFormatInfoPatternParser(
+                    self.__local_date_pattern_parser = self.__create_pattern_parser(
                         _LocalDatePatternParser._ctor(
                             LocalDatePattern._DEFAULT_TEMPLATE_VALUE, LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
-                        ),
-                        self,
+                        )
                     )
         return self.__local_date_pattern_parser
 
@@ -261,21 +314,54 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
                     from pyoda_time.text import LocalDatePattern, LocalDateTimePattern
                     from pyoda_time.text._local_date_time_pattern_parser import _LocalDateTimePatternParser
 
-                    from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
-
-                    self.__local_date_time_pattern_parser = _FixedFormatInfoPatternParser(
+                    self.__local_date_time_pattern_parser = self.__create_pattern_parser(
                         _LocalDateTimePatternParser._ctor(
                             LocalDateTimePattern._DEFAULT_TEMPLATE_VALUE, LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
-                        ),
-                        self,
+                        )
                     )
         return self.__local_date_time_pattern_parser
 
+    @property
+    def _offset_date_time_pattern_parser(self) -> _FixedFormatInfoPatternParser[OffsetDateTime]:
+        if self.__offset_date_time_pattern_parser is None:
+            with self.__FIELD_LOCK:
+                if self.__offset_date_time_pattern_parser is None:
+                    from pyoda_time.text import LocalDatePattern
+                    from pyoda_time.text._offset_date_time_pattern import OffsetDateTimePattern
+                    from pyoda_time.text._offset_date_time_pattern_parser import _OffsetDateTimePatternParser
+
+                    self.__offset_date_time_pattern_parser = self.__create_pattern_parser(
+                        _OffsetDateTimePatternParser._ctor(
+                            OffsetDateTimePattern._DEFAULT_TEMPLATE_VALUE, LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
+                        )
+                    )
+        return self.__offset_date_time_pattern_parser
+
     # TODO:
-    #  internal FixedFormatInfoPatternParser<OffsetDateTime> OffsetDateTimePatternParser
     #  internal FixedFormatInfoPatternParser<OffsetDate> OffsetDatePatternParser
     #  internal FixedFormatInfoPatternParser<OffsetTime> OffsetTimePatternParser
-    #  internal FixedFormatInfoPatternParser<ZonedDateTime> ZonedDateTimePatternParser
+
+    @property
+    def _zoned_date_time_pattern_parser(self) -> _FixedFormatInfoPatternParser[ZonedDateTime]:
+        if self.__zoned_date_time_pattern_parser is None:
+            with self.__FIELD_LOCK:
+                if self.__zoned_date_time_pattern_parser is None:
+                    from pyoda_time.text import LocalDatePattern
+                    from pyoda_time.text._zoned_date_time_pattern import ZonedDateTimePattern
+                    from pyoda_time.text._zoned_date_time_pattern_parser import _ZonedDateTimePatternParser
+                    from pyoda_time.time_zones import Resolvers
+
+                    self.__zoned_date_time_pattern_parser = self.__create_pattern_parser(
+                        _ZonedDateTimePatternParser._ctor(
+                            ZonedDateTimePattern._DEFAULT_TEMPLATE_VALUE,
+                            Resolvers.strict_resolver,
+                            None,
+                            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+                        )
+                    )
+        return self.__zoned_date_time_pattern_parser
+
+    # TODO:
     #  internal FixedFormatInfoPatternParser<YearMonth> YearMonthPatternParser
 
     @property
@@ -286,11 +372,8 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
                     from pyoda_time.text import AnnualDatePattern
                     from pyoda_time.text._annual_date_pattern_parser import _AnnualDatePatternParser
 
-                    from ..text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
-
-                    self.__annual_date_pattern_parser = _FixedFormatInfoPatternParser(
-                        _AnnualDatePatternParser._ctor(AnnualDatePattern._DEFAULT_TEMPLATE_VALUE),
-                        self,
+                    self.__annual_date_pattern_parser = self.__create_pattern_parser(
+                        _AnnualDatePatternParser._ctor(AnnualDatePattern._DEFAULT_TEMPLATE_VALUE)
                     )
         return self.__annual_date_pattern_parser
 
@@ -364,6 +447,84 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
         self.__ensure_days_initialized()
         return self.__short_day_names
 
+    # The name tries below are built on first demand without taking the field lock: the names they're built from take
+    # it themselves, and building a trie twice is harmless.
+
+    @property
+    def _short_month_name_trie(self) -> _NameTrie[int]:
+        """Gets a trie of ``short_month_genitive_names`` and ``short_month_names``, mapping them to month numbers."""
+        if self.__short_month_name_trie is None:
+            self.__short_month_name_trie = self.__create_month_name_trie(
+                self.short_month_genitive_names, self.short_month_names
+            )
+        return self.__short_month_name_trie
+
+    @property
+    def _long_month_name_trie(self) -> _NameTrie[int]:
+        """Gets a trie of ``long_month_genitive_names`` and ``long_month_names``, mapping them to month numbers."""
+        if self.__long_month_name_trie is None:
+            self.__long_month_name_trie = self.__create_month_name_trie(
+                self.long_month_genitive_names, self.long_month_names
+            )
+        return self.__long_month_name_trie
+
+    @staticmethod
+    def __create_month_name_trie(genitive_names: Sequence[str], non_genitive_names: Sequence[str]) -> _NameTrie[int]:
+        """Creates a trie of month names, where genitive names take precedence over identical non-genitive ones."""
+        from ..text._name_trie import _NameTrie
+
+        names: Iterable[tuple[int, str]] = enumerate(genitive_names)
+        if genitive_names != non_genitive_names:
+            names = itertools.chain(names, enumerate(non_genitive_names))
+        return _NameTrie((name, month) for month, name in names)
+
+    @property
+    def _short_day_name_trie(self) -> _NameTrie[int]:
+        """Gets a trie of ``short_day_names``, mapping them to ``IsoDayOfWeek`` values."""
+        if self.__short_day_name_trie is None:
+            from ..text._name_trie import _NameTrie
+
+            self.__short_day_name_trie = _NameTrie((name, day) for day, name in enumerate(self.short_day_names))
+        return self.__short_day_name_trie
+
+    @property
+    def _long_day_name_trie(self) -> _NameTrie[int]:
+        """Gets a trie of ``long_day_names``, mapping them to ``IsoDayOfWeek`` values."""
+        if self.__long_day_name_trie is None:
+            from ..text._name_trie import _NameTrie
+
+            self.__long_day_name_trie = _NameTrie((name, day) for day, name in enumerate(self.long_day_names))
+        return self.__long_day_name_trie
+
+    @property
+    def _am_pm_designator_trie(self) -> _NameTrie[int]:
+        """Gets a trie of the AM and PM designators, mapping them to 0 and 1 respectively."""
+        am_designator = self.am_designator
+        pm_designator = self.pm_designator
+        cached = self.__am_pm_designator_trie
+        if cached is None or cached[0] != am_designator or cached[1] != pm_designator:
+            from ..text._name_trie import _NameTrie
+
+            cached = self.__am_pm_designator_trie = (
+                am_designator,
+                pm_designator,
+                _NameTrie(((am_designator, 0), (pm_designator, 1))),
+            )
+        return cached[2]
+
+    def _get_era_name_trie(self, calendar: CalendarSystem) -> _NameTrie[Era]:
+        """Gets a trie of the names of the eras of the given calendar, as returned by ``get_era_names``.
+
+        Where two eras share a name, the one which comes first in ``calendar.eras()`` is used.
+        """
+        if (trie := self.__era_name_tries.get(calendar)) is None:
+            from ..text._name_trie import _NameTrie
+
+            trie = self.__era_name_tries[calendar] = _NameTrie(
+                (name, era) for era in calendar.eras() for name in self.get_era_names(era)
+            )
+        return trie
+
     @property
     def date_time_format(self) -> DateTimeFormatInfo:
         """Gets the BCL date time format associated with this formatting information.
@@ -462,6 +623,7 @@ class _PyodaFormatInfo(metaclass=_PyodaFormatInfoMeta):
         Only used for test purposes.
         """
         cls.__CACHE.clear()
+        cls._clear_invariant_info()
 
     @classmethod
     def _get_format_info(cls, culture_info: CultureInfo) -> _PyodaFormatInfo:
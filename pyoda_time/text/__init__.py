@@ -4,25 +4,34 @@
 
 __all__: list[str] = [
     "AnnualDatePattern",
+    "BatchParseResult",
     "DurationPattern",
     "InstantPattern",
     "InvalidPatternError",
     "LocalDatePattern",
     "LocalDateTimePattern",
     "LocalTimePattern",
+    "OffsetDateTimePattern",
     "OffsetPattern",
     "ParseResult",
+    "PatternCache",
+    "PatternCacheStatistics",
     "UnparsableValueError",
+    "ZonedDateTimePattern",
     "patterns",
 ]
 
 from ._annual_date_pattern import AnnualDatePattern
+from ._batch_parse_result import BatchParseResult
 from ._duration_pattern import DurationPattern
 from ._instant_pattern import InstantPattern
 from ._invalid_pattern_exception import InvalidPatternError
 from ._local_date_pattern import LocalDatePattern
 from ._local_date_time_pattern import LocalDateTimePattern
 from ._local_time_pattern import LocalTimePattern
+from ._offset_date_time_pattern import OffsetDateTimePattern
 from ._offset_pattern import OffsetPattern
 from ._parse_result import ParseResult
+from ._pattern_cache import PatternCache, PatternCacheStatistics
 from ._unparsable_value_error import UnparsableValueError
+from ._zoned_date_time_pattern import ZonedDateTimePattern
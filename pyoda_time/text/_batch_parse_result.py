@@ -0,0 +1,190 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, final
+
+from ..utility._csharp_compatibility import _private, _sealed
+from ..utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from ._i_pattern import IPattern
+
+
+@_private
+@final
+@_sealed
+class BatchParseResult[T]:
+    """The result of parsing many text values with a single pattern.
+
+    Successfully parsed values are available by position in ``values``, with ``None`` in the position of each value
+    which failed to parse. The positions of failures are recorded compactly in ``failure_indices``; the exception
+    describing an individual failure is only created when it is requested with ``exception_at``, so a batch containing
+    many malformed values doesn't pay for error messages which are never read.
+    """
+
+    __values: list[T | None]
+    __failure_indices: array[int]
+    __texts: Sequence[str]
+    __texts_are_failures: bool
+    __pattern: IPattern[T]
+
+    @classmethod
+    def __ctor(
+        cls,
+        values: list[T | None],
+        failure_indices: array[int],
+        texts: Sequence[str],
+        texts_are_failures: bool,
+        pattern: IPattern[T],
+    ) -> BatchParseResult[T]:
+        """Creates a result.
+
+        ``texts`` is either the whole input, indexed like ``values``, or (if ``texts_are_failures`` is ``True``) just
+        the text values which failed to parse, indexed like ``failure_indices``.
+        """
+        self = super().__new__(cls)
+        self.__values = values
+        self.__failure_indices = failure_indices
+        self.__texts = texts
+        self.__texts_are_failures = texts_are_failures
+        self.__pattern = pattern
+        return self
+
+    @property
+    def values(self) -> list[T | None]:
+        """The parsed values, in the order of the text values they were parsed from.
+
+        Each value which failed to parse is represented by ``None``.
+        """
+        return self.__values
+
+    @property
+    def failure_indices(self) -> array[int]:
+        """The positions of the text values which failed to parse, in ascending order."""
+        return self.__failure_indices
+
+    @property
+    def success(self) -> bool:
+        """``True`` if every text value was parsed successfully; ``False`` otherwise."""
+        return not self.__failure_indices
+
+    @property
+    def failure_count(self) -> int:
+        """The number of text values which failed to parse."""
+        return len(self.__failure_indices)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def failure_mask(self) -> bytearray:
+        """Returns a mask with one byte per text value, which is 1 where the value failed to parse and 0 elsewhere.
+
+        :return: A new mask of failures.
+        """
+        mask = bytearray(len(self.__values))
+        for index in self.__failure_indices:
+            mask[index] = 1
+        return mask
+
+    def failed_text_at(self, index: int) -> str:
+        """Returns the text value at the given position, which must have failed to parse.
+
+        :param index: The position of the text value within the batch.
+        :return: The text value which failed to parse.
+        :raises ValueError: The text value at ``index`` was parsed successfully.
+        """
+        position = self.__failure_position(index)
+        return self.__texts[position] if self.__texts_are_failures else self.__texts[index]
+
+    def exception_at(self, index: int) -> Exception:
+        """Returns the exception describing why the text value at the given position failed to parse.
+
+        The exception is created afresh on each call, by parsing the text value again.
+
+        :param index: The position of the text value within the batch.
+        :return: The exception describing the failure.
+        :raises ValueError: The text value at ``index`` was parsed successfully.
+        """
+        return self.__pattern.parse(self.failed_text_at(index)).exception
+
+    def get_values_or_throw(self) -> list[T]:
+        """Returns the parsed values if every text value was parsed successfully, or raises the exception for the
+        first failure otherwise.
+
+        :return: The parsed values.
+        """
+        if self.__failure_indices:
+            raise self.exception_at(self.__failure_indices[0])
+        return self.__values  # type: ignore[return-value]
+
+    def __failure_position(self, index: int) -> int:
+        """Finds the position of ``index`` within the failure indices by binary search."""
+        failure_indices = self.__failure_indices
+        position = bisect_left(failure_indices, index)
+        _Preconditions._check_argument(
+            position < len(failure_indices) and failure_indices[position] == index,
+            "index",
+            "The text value at index {0} was parsed successfully",
+            index,
+        )
+        return position
+
+    @classmethod
+    def _parse_many(cls, pattern: IPattern[T], texts: Iterable[str]) -> BatchParseResult[T]:
+        """Parses each text value with the given pattern, recording the failed text values alongside their
+        positions."""
+        try_parse = cls.__get_try_parse(pattern)
+        parse = pattern.parse
+        values: list[T | None] = []
+        failure_indices = array("q")
+        failed_texts: list[str] = []
+        for index, text in enumerate(texts):
+            if try_parse is None or (value := try_parse(text)) is None:
+                result = parse(text)
+                if not result.success:
+                    values.append(None)
+                    failure_indices.append(index)
+                    failed_texts.append(text)
+                    continue
+                value = result.value
+            values.append(value)
+        return cls.__ctor(values, failure_indices, failed_texts, True, pattern)
+
+    @classmethod
+    def _parse_column(cls, pattern: IPattern[T], texts: Sequence[str]) -> BatchParseResult[T]:
+        """Parses each text value in a sequence with the given pattern.
+
+        Unlike ``_parse_many``, the length of the input is known up front, and failed text values are looked up in
+        the sequence on demand rather than being copied.
+        """
+        _Preconditions._check_not_null(texts, "texts")
+        try_parse = cls.__get_try_parse(pattern)
+        parse = pattern.parse
+        values: list[T | None] = [None] * len(texts)
+        failure_indices = array("q")
+        for index, text in enumerate(texts):
+            if try_parse is None or (value := try_parse(text)) is None:
+                result = parse(text)
+                if not result.success:
+                    failure_indices.append(index)
+                    continue
+                value = result.value
+            values[index] = value
+        return cls.__ctor(values, failure_indices, texts, False, pattern)
+
+    @staticmethod
+    def __get_try_parse(pattern: IPattern[T]) -> Callable[[str], T | None] | None:
+        """Returns the pattern's method for parsing text without creating a ``ParseResult``, if it has one.
+
+        Only some internal patterns provide such a method (see ``_IPartialPattern._get_try_parse``); composite
+        patterns and user-supplied implementations of ``IPattern`` are always parsed with ``parse``.
+        """
+        get_try_parse: Callable[[], Callable[[str], T | None] | None] | None = getattr(pattern, "_get_try_parse", None)
+        return get_try_parse() if get_try_parse is not None else None
@@ -69,7 +69,7 @@ class _CompositePattern[T]:
             result: ParseResult[T] = pattern.parse(text)
             if result.success or not result._continue_after_error_with_multiple_formats:
                 return result
-        return ParseResult[T]._no_matching_format(_ValueCursor(text))
+        return ParseResult._no_matching_format(_ValueCursor(text))
 
     def parse_partial(self, cursor: _ValueCursor) -> ParseResult[T]:
         index = cursor.index
@@ -79,7 +79,7 @@ class _CompositePattern[T]:
             if result.success or not result._continue_after_error_with_multiple_formats:
                 return result
         cursor.move(index)
-        return ParseResult[T]._no_matching_format(cursor)
+        return ParseResult._no_matching_format(cursor)
 
     def format(self, value: T) -> str:
         return self.__find_format_pattern(value).format(value)
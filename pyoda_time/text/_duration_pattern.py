@@ -7,12 +7,18 @@ from typing import TYPE_CHECKING, _ProtocolMeta, final
 
 from pyoda_time._duration import Duration
 from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._batch_parse_result import BatchParseResult
 from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._pattern_writer import _format_many, _format_to
 from pyoda_time.text.patterns._pattern_bcl_support import _PatternBclSupport
 from pyoda_time.utility._csharp_compatibility import _private, _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from _typeshed import SupportsWrite
+
     from pyoda_time._compatibility._culture_info import CultureInfo
     from pyoda_time._compatibility._string_builder import StringBuilder
     from pyoda_time.text._parse_result import ParseResult
@@ -103,6 +109,28 @@ class DurationPattern(IPattern[Duration], metaclass=__DurationPatternMeta):
         """
         return self.__pattern.parse(text)
 
+    def parse_many(self, texts: Iterable[str]) -> BatchParseResult[Duration]:
+        """Parses each of the given text values according to the rules of this pattern.
+
+        Failures are recorded by position in the result, and the exception for each failure is only created on
+        demand. Like ``parse``, this method never raises an exception for invalid text values.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_many(self.__pattern, texts)
+
+    def parse_column(self, texts: Sequence[str]) -> BatchParseResult[Duration]:
+        """Parses each text value in the given sequence according to the rules of this pattern.
+
+        This behaves like ``parse_many``, but as the sequence can be indexed, the text values which fail to parse are
+        not copied into the result.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_column(self.__pattern, texts)
+
     def format(self, value: Duration) -> str:
         """Formats the given duration as text according to the rules of this pattern.
 
@@ -121,6 +149,29 @@ class DurationPattern(IPattern[Duration], metaclass=__DurationPatternMeta):
         """
         return self.__pattern.append_format(value, builder)
 
+    def format_to(self, value: Duration, writer: SupportsWrite[str]) -> None:
+        """Formats the given duration as text according to the rules of this pattern, writing it to the given text
+        stream.
+
+        :param value: The duration to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        """
+        _format_to(self.__pattern, value, writer)
+
+    def format_many(self, values: Iterable[Duration], writer: SupportsWrite[str], separator: str = "\n") -> int:
+        """Formats each of the given values as text according to the rules of this pattern, writing them to the given
+        text stream.
+
+        The text is buffered and written in chunks, rather than being written (or returned) value by value. No
+        separator is written before the first value or after the last one.
+
+        :param values: The values to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        :param separator: The text to write between consecutive values.
+        :return: The number of values written.
+        """
+        return _format_many(self.__pattern, values, writer, separator)
+
     @classmethod
     def __create(cls, pattern_text: str, format_info: _PyodaFormatInfo) -> DurationPattern:
         """Creates a pattern for the given pattern text and format info.
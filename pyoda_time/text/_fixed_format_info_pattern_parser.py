@@ -5,10 +5,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Final, final
 
+from ..utility._cache import _Cache
 from ..utility._csharp_compatibility import _sealed
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..globalization._pyoda_format_info import _PyodaFormatInfo
+    from ..utility._cache import _CacheStatistics
     from ._i_pattern import IPattern
     from .patterns._i_pattern_parser import _IPatternParser
 
@@ -18,15 +22,45 @@ if TYPE_CHECKING:
 class _FixedFormatInfoPatternParser[T]:
     """A pattern parser for a single format info, which caches patterns by text/style."""
 
-    # TODO: This is dramatically simplified compared to Noda Time
+    # Noda Time caches 50 patterns per parser. User-supplied pattern text is the usual reason for a larger working
+    # set; see _cache_size.
+    _DEFAULT_CACHE_SIZE: Final[int] = 50
 
-    def __init__(self, pattern_parser: _IPatternParser[T], format_info: _PyodaFormatInfo) -> None:
+    def __init__(
+        self, pattern_parser: _IPatternParser[T], format_info: _PyodaFormatInfo, cache_size: int = _DEFAULT_CACHE_SIZE
+    ) -> None:
         self.__pattern_parser = pattern_parser
         self.__format_info = format_info
-        # TODO: Noda Time uses the Cache class from utility here...
-        self.__cache: Final[dict[str, IPattern[T]]] = {}
+        self.__cache: Final[_Cache[str, IPattern[T]]] = _Cache(cache_size, self.__create_pattern)
+
+    def __create_pattern(self, pattern_text: str) -> IPattern[T]:
+        return self.__pattern_parser.parse_pattern(pattern_text, self.__format_info)
 
     def _parse_pattern(self, pattern: str) -> IPattern[T]:
-        if not (ret := self.__cache.get(pattern)):
-            ret = self.__cache[pattern] = self.__pattern_parser.parse_pattern(pattern, self.__format_info)
-        return ret
+        return self.__cache.get_or_add(pattern)
+
+    def _precompile(self, patterns: Iterable[str]) -> None:
+        """Parses and caches each of the given patterns, so that later requests for them are cache hits.
+
+        This is intended for use at startup, with the patterns an application is known to use. Patterns beyond the
+        capacity of the cache evict the least recently used ones, as usual.
+
+        :param patterns: The pattern text values to parse.
+        :raises InvalidPatternError: One of the patterns is invalid.
+        """
+        for pattern in patterns:
+            self.__cache.get_or_add(pattern)
+
+    @property
+    def _cache_size(self) -> int:
+        """The maximum number of patterns cached by this parser."""
+        return self.__cache.capacity
+
+    @_cache_size.setter
+    def _cache_size(self, value: int) -> None:
+        self.__cache.capacity = value
+
+    @property
+    def _cache_statistics(self) -> _CacheStatistics:
+        """The hits, misses, current size and capacity of the pattern cache, for diagnostic purposes."""
+        return self.__cache.statistics()
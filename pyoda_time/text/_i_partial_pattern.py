@@ -2,6 +2,7 @@
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
 from abc import abstractmethod
+from collections.abc import Callable
 
 from pyoda_time.text._i_pattern import IPattern, T
 from pyoda_time.text._parse_result import ParseResult
@@ -24,3 +25,13 @@ class _IPartialPattern(IPattern[T]):
         :return: The result of parsing from the cursor.
         """
         ...
+
+    def _get_try_parse(self) -> Callable[[str], T | None] | None:
+        """Returns a method which parses text without creating a ``ParseResult``, if this pattern has one.
+
+        This is used when parsing many values at once. The method returns ``None`` whenever it can't produce a value,
+        whether or not the text is invalid; callers must then use ``parse`` to find out.
+
+        :return: The method, or ``None`` if every value must be parsed with ``parse``.
+        """
+        return None
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Final, Self, final
 from pyoda_time._instant import Instant
 from pyoda_time.text._i_pattern import IPattern
 from pyoda_time.text._invalid_pattern_exception import InvalidPatternError
+from pyoda_time.text._iso_patterns import _IsoInstantPattern
 from pyoda_time.text._local_date_time_pattern import LocalDateTimePattern
 from pyoda_time.text._text_error_messages import _TextErrorMessages
 from pyoda_time.text.patterns._i_pattern_parser import _IPatternParser
@@ -60,7 +61,7 @@ class _InstantPatternParser(_IPatternParser[Instant]):
         local_pattern: IPattern[LocalDateTime] = LocalDateTimePattern._create(
             pattern, format_info, self.__local_template_value, self.__two_digit_year_max
         )._underlying_pattern
-        return self.__LocalDateTimePatternAdapter._ctor(local_pattern)
+        return _IsoInstantPattern._wrap(local_pattern, self.__LocalDateTimePatternAdapter._ctor(local_pattern))
 
     @_sealed
     @final
@@ -0,0 +1,562 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Hand-written parsing and formatting for the invariant ISO-8601 patterns.
+
+The patterns here are selected automatically when a ``LocalDatePattern``, ``LocalDateTimePattern``,
+``InstantPattern``, ``OffsetDateTimePattern`` or ``ZonedDateTimePattern`` is created with one of the pattern texts
+below and an ISO template value. Each one only handles the unambiguous common case - four-digit non-negative years and
+field values which are all in range - and delegates everything else (including every failure) to the pattern built by
+the generic machinery, so that results and error messages are identical.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Final, final
+
+from pyoda_time._calendar_ordinal import _CalendarOrdinal
+from pyoda_time._calendar_system import CalendarSystem
+from pyoda_time._instant import Instant
+from pyoda_time._local_date import LocalDate
+from pyoda_time._local_date_time import LocalDateTime
+from pyoda_time._local_time import LocalTime
+from pyoda_time._offset_date_time import OffsetDateTime
+from pyoda_time._offset_time import OffsetTime
+from pyoda_time._pyoda_constants import PyodaConstants
+from pyoda_time._year_month_day_calendar import _YearMonthDayCalendar
+from pyoda_time._zoned_date_time import ZonedDateTime
+from pyoda_time.calendars._gregorian_year_month_day_calculator import _GregorianYearMonthDayCalculator
+from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._parse_result import ParseResult
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyoda_time._compatibility._string_builder import StringBuilder
+    from pyoda_time._date_time_zone import DateTimeZone
+    from pyoda_time._i_date_time_zone_provider import IDateTimeZoneProvider
+    from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+    from pyoda_time.text._value_cursor import _ValueCursor
+    from pyoda_time.time_zones import ZoneLocalMappingResolver
+
+_ISO_DATE_PATTERN_TEXT: Final[str] = "uuuu'-'MM'-'dd"
+_GENERAL_ISO_PATTERN_TEXT: Final[str] = "uuuu'-'MM'-'dd'T'HH':'mm':'ss"
+_EXTENDED_ISO_PATTERN_TEXT: Final[str] = "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF"
+
+# Pattern text -> (whether there are optional fractional seconds, suffix, whether the pattern uses the culture's time
+# separator rather than a quoted ':')
+_LOCAL_DATE_TIME_PATTERN_TEXTS: Final[dict[str, tuple[bool, str, bool]]] = {
+    _GENERAL_ISO_PATTERN_TEXT: (False, "", False),
+    _EXTENDED_ISO_PATTERN_TEXT: (True, "", False),
+    _GENERAL_ISO_PATTERN_TEXT + "'Z'": (False, "Z", False),
+    _EXTENDED_ISO_PATTERN_TEXT + "'Z'": (True, "Z", False),
+    # InstantPattern.general
+    "uuuu-MM-ddTHH:mm:ss'Z'": (False, "Z", True),
+}
+
+# Pattern text -> (whether there are optional fractional seconds, embedded offset pattern)
+_OFFSET_DATE_TIME_PATTERN_TEXTS: Final[dict[str, tuple[bool, str]]] = {
+    _GENERAL_ISO_PATTERN_TEXT + "o<G>": (False, "G"),
+    _EXTENDED_ISO_PATTERN_TEXT + "o<G>": (True, "G"),
+    _EXTENDED_ISO_PATTERN_TEXT + "o<Z+HH:mm>": (True, "Z+HH:mm"),
+}
+
+# Pattern text -> (whether there are optional fractional seconds, embedded offset pattern, whether the zone ID comes
+# before the offset)
+_ZONED_DATE_TIME_PATTERN_TEXTS: Final[dict[str, tuple[bool, str, bool]]] = {
+    _GENERAL_ISO_PATTERN_TEXT + " z '('o<g>')'": (False, "g", True),
+    _EXTENDED_ISO_PATTERN_TEXT + " z '('o<g>')'": (True, "g", True),
+    _GENERAL_ISO_PATTERN_TEXT + "o<G> z": (False, "G", False),
+    _EXTENDED_ISO_PATTERN_TEXT + "o<G> z": (True, "G", False),
+}
+
+_DATE_REGEX: Final[str] = "([0-9]{4})-([0-9]{2})-([0-9]{2})"
+_TIME_REGEX: Final[str] = "T([0-9]{2}):([0-9]{2}):([0-9]{2})"
+# ";FFFFFFFFF" accepts either a dot or a comma, which must be followed by at least one digit.
+_FRACTION_REGEX: Final[str] = "(?:[.,]([0-9]{1,9}))?"
+
+# The embedded offset patterns, each with a single group capturing the whole offset.
+_OFFSET_REGEXES: Final[dict[str, str]] = {
+    "g": "([+-][0-9]{2}(?::[0-9]{2}(?::[0-9]{2})?)?)",
+    "G": "(Z|[+-][0-9]{2}(?::[0-9]{2}(?::[0-9]{2})?)?)",
+    "Z+HH:mm": "(Z|[+-][0-9]{2}:[0-9]{2})",
+}
+# The embedded offset patterns are only handled here when the format info expands "g" to these patterns, and uses
+# ':' as the time separator.
+_INVARIANT_OFFSET_PATTERNS: Final[tuple[str, str, str]] = ("+HH:mm:ss", "+HH:mm", "+HH")
+_MAX_OFFSET_SECONDS: Final[int] = 18 * PyodaConstants.SECONDS_PER_HOUR
+
+# Days in each month of a non-leap year, indexed by month.
+_DAYS_IN_MONTH: Final[tuple[int, ...]] = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_iso_date(year: int, month: int, day: int) -> bool:
+    """Returns whether the given values (with a non-negative year) form a valid ISO date."""
+    if month < 1 or month > 12 or day < 1:
+        return False
+    if day <= 28:
+        return True
+    if month == 2:
+        return day <= (29 if (year & 3) == 0 and (year % 100 != 0 or year % 400 == 0) else 28)
+    return day <= _DAYS_IN_MONTH[month]
+
+
+def _try_parse_time(hour: str, minute: str, second: str, fraction: str | None) -> int | None:
+    """Returns the nanosecond of the day represented by the given captures, or None if any value is out of range."""
+    hours = int(hour)
+    minutes = int(minute)
+    seconds = int(second)
+    if hours > 23 or minutes > 59 or seconds > 59:
+        return None
+    nanoseconds = (hours * 3600 + minutes * 60 + seconds) * PyodaConstants.NANOSECONDS_PER_SECOND
+    if fraction is not None:
+        nanoseconds += int(fraction) * 10 ** (9 - len(fraction))
+    return nanoseconds
+
+
+def _try_parse_date_time(match: re.Match[str], fractional: bool) -> tuple[_YearMonthDayCalendar, int] | None:
+    """Returns the date and nanosecond of the day captured by the first groups of a match, or None if any value is
+    out of range."""
+    year = int(match[1])
+    month = int(match[2])
+    day = int(match[3])
+    if not _is_valid_iso_date(year, month, day):
+        return None
+    nanosecond_of_day = _try_parse_time(match[4], match[5], match[6], match[7] if fractional else None)
+    if nanosecond_of_day is None:
+        return None
+    return (
+        _YearMonthDayCalendar._ctor(year=year, month=month, day=day, calendar_ordinal=_CalendarOrdinal.ISO),
+        nanosecond_of_day,
+    )
+
+
+def _try_parse_offset(text: str) -> int | None:
+    """Returns the offset in seconds represented by text matched by one of ``_OFFSET_REGEXES``, or None if it is out
+    of range."""
+    if text == "Z":
+        return 0
+    hours = int(text[1:3])
+    minutes = int(text[4:6]) if len(text) > 3 else 0
+    seconds = int(text[7:9]) if len(text) > 6 else 0
+    if minutes > 59 or seconds > 59:
+        return None
+    total = hours * PyodaConstants.SECONDS_PER_HOUR + minutes * PyodaConstants.SECONDS_PER_MINUTE + seconds
+    if total > _MAX_OFFSET_SECONDS:
+        return None
+    return -total if text[0] == "-" else total
+
+
+def _supports_offset_patterns(format_info: _PyodaFormatInfo) -> bool:
+    return format_info.time_separator == ":" and _INVARIANT_OFFSET_PATTERNS == (
+        format_info.offset_pattern_long,
+        format_info.offset_pattern_medium,
+        format_info.offset_pattern_short,
+    )
+
+
+def _format_offset(seconds: int, offset_pattern: str) -> str:
+    if seconds == 0 and offset_pattern != "g":
+        return "Z"
+    sign = "-" if seconds < 0 else "+"
+    minutes, second = divmod(abs(seconds), 60)
+    hour, minute = divmod(minutes, 60)
+    if offset_pattern == "Z+HH:mm" or (second == 0 and minute != 0):
+        return f"{sign}{hour:02d}:{minute:02d}"
+    if second != 0:
+        return f"{sign}{hour:02d}:{minute:02d}:{second:02d}"
+    return f"{sign}{hour:02d}"
+
+
+def _format_date(year: int, month: int, day: int) -> str:
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _format_time(nanosecond_of_day: int, fractional: bool) -> str:
+    seconds, nanosecond_of_second = divmod(nanosecond_of_day, PyodaConstants.NANOSECONDS_PER_SECOND)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    if fractional and nanosecond_of_second != 0:
+        # Equivalent to _FormatHelper._append_fraction_truncate, including removal of the decimal separator.
+        return f"T{hour:02d}:{minute:02d}:{second:02d}.{nanosecond_of_second:09d}".rstrip("0")
+    return f"T{hour:02d}:{minute:02d}:{second:02d}"
+
+
+@final
+@_sealed
+@_private
+class _IsoLocalDatePattern(_IPartialPattern[LocalDate]):
+    """Fast path for ``LocalDatePattern.iso``."""
+
+    __REGEX: Final[re.Pattern[str]] = re.compile(_DATE_REGEX)
+
+    __fallback: _IPartialPattern[LocalDate]
+
+    @classmethod
+    def _wrap(
+        cls, pattern_text: str, template_value: LocalDate, pattern: _IPartialPattern[LocalDate]
+    ) -> _IPartialPattern[LocalDate]:
+        """Returns a fast path for the given pattern if there is one, or the pattern itself otherwise."""
+        if pattern_text != _ISO_DATE_PATTERN_TEXT or template_value.calendar != CalendarSystem.iso:
+            return pattern
+        self = super().__new__(cls)
+        self.__fallback = pattern
+        return self
+
+    def _try_parse(self, text: str) -> LocalDate | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        # Null text is reported by the generic pattern.
+        if text is None or (match := self.__REGEX.fullmatch(text)) is None:
+            return None
+        year = int(match[1])
+        month = int(match[2])
+        day = int(match[3])
+        if not _is_valid_iso_date(year, month, day):
+            return None
+        return LocalDate._ctor(
+            year_month_day_calendar=_YearMonthDayCalendar._ctor(
+                year=year, month=month, day=day, calendar_ordinal=_CalendarOrdinal.ISO
+            )
+        )
+
+    def _get_try_parse(self) -> Callable[[str], LocalDate | None]:
+        return self._try_parse
+
+    def parse(self, text: str) -> ParseResult[LocalDate]:
+        if (value := self._try_parse(text)) is not None:
+            return ParseResult.for_value(value)
+        return self.__fallback.parse(text)
+
+    def parse_partial(self, cursor: _ValueCursor) -> ParseResult[LocalDate]:
+        return self.__fallback.parse_partial(cursor)
+
+    def format(self, value: LocalDate) -> str:
+        if 0 <= (year := value.year) <= 9999:
+            return _format_date(year, value.month, value.day)
+        return self.__fallback.format(value)
+
+    def append_format(self, value: LocalDate, builder: StringBuilder) -> StringBuilder:
+        if 0 <= value.year <= 9999:
+            return builder.append(self.format(value))
+        return self.__fallback.append_format(value, builder)
+
+
+@final
+@_sealed
+@_private
+class _IsoLocalDateTimePattern(_IPartialPattern[LocalDateTime]):
+    """Fast path for ``LocalDateTimePattern.general_iso`` and ``LocalDateTimePattern.extended_iso``, optionally
+    followed by a 'Z' as used by ``InstantPattern.general`` and ``InstantPattern.extended_iso``."""
+
+    __fallback: _IPartialPattern[LocalDateTime]
+    __regex: re.Pattern[str]
+    __fractional: bool
+    __suffix: str
+
+    @classmethod
+    def _wrap(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        template_value: LocalDateTime,
+        pattern: _IPartialPattern[LocalDateTime],
+    ) -> _IPartialPattern[LocalDateTime]:
+        """Returns a fast path for the given pattern if there is one, or the pattern itself otherwise."""
+        if (options := _LOCAL_DATE_TIME_PATTERN_TEXTS.get(pattern_text)) is None:
+            return pattern
+        fractional, suffix, uses_time_separator = options
+        if template_value.calendar != CalendarSystem.iso or (uses_time_separator and format_info.time_separator != ":"):
+            return pattern
+        self = super().__new__(cls)
+        self.__fallback = pattern
+        self.__fractional = fractional
+        self.__suffix = suffix
+        self.__regex = re.compile(
+            _DATE_REGEX + _TIME_REGEX + (_FRACTION_REGEX if self.__fractional else "") + re.escape(self.__suffix)
+        )
+        return self
+
+    def _try_parse_days_and_nanoseconds(self, text: str) -> tuple[_YearMonthDayCalendar, int] | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        # Null text is reported by the generic pattern.
+        if text is None or (match := self.__regex.fullmatch(text)) is None:
+            return None
+        return _try_parse_date_time(match, self.__fractional)
+
+    def _try_parse(self, text: str) -> LocalDateTime | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        if (parsed := self._try_parse_days_and_nanoseconds(text)) is None:
+            return None
+        return LocalDateTime._ctor(
+            local_date=LocalDate._ctor(year_month_day_calendar=parsed[0]),
+            local_time=LocalTime._ctor(nanoseconds=parsed[1]),
+        )
+
+    def _get_try_parse(self) -> Callable[[str], LocalDateTime | None]:
+        return self._try_parse
+
+    def parse(self, text: str) -> ParseResult[LocalDateTime]:
+        if (value := self._try_parse(text)) is not None:
+            return ParseResult.for_value(value)
+        return self.__fallback.parse(text)
+
+    def parse_partial(self, cursor: _ValueCursor) -> ParseResult[LocalDateTime]:
+        return self.__fallback.parse_partial(cursor)
+
+    def _format_fields(self, year: int, month: int, day: int, nanosecond_of_day: int) -> str:
+        return _format_date(year, month, day) + _format_time(nanosecond_of_day, self.__fractional) + self.__suffix
+
+    def format(self, value: LocalDateTime) -> str:
+        if 0 <= (year := value.year) <= 9999:
+            return self._format_fields(year, value.month, value.day, value.nanosecond_of_day)
+        return self.__fallback.format(value)
+
+    def append_format(self, value: LocalDateTime, builder: StringBuilder) -> StringBuilder:
+        if 0 <= value.year <= 9999:
+            return builder.append(self.format(value))
+        return self.__fallback.append_format(value, builder)
+
+
+@final
+@_sealed
+@_private
+class _IsoInstantPattern(IPattern[Instant]):
+    """Fast path for ``InstantPattern.general`` and ``InstantPattern.extended_iso``, which works directly with the
+    days and nanoseconds of an ``Instant`` rather than converting via ``LocalDateTime``."""
+
+    __local_pattern: _IsoLocalDateTimePattern
+    __fallback: IPattern[Instant]
+
+    @classmethod
+    def _wrap(cls, local_pattern: IPattern[LocalDateTime], pattern: IPattern[Instant]) -> IPattern[Instant]:
+        """Returns a fast path for the instant pattern adapting ``local_pattern``, if there is one, or ``pattern``
+        itself otherwise."""
+        if not isinstance(local_pattern, _IsoLocalDateTimePattern):
+            return pattern
+        self = super().__new__(cls)
+        self.__local_pattern = local_pattern
+        self.__fallback = pattern
+        return self
+
+    def _try_parse(self, text: str) -> Instant | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        if (parsed := self.__local_pattern._try_parse_days_and_nanoseconds(text)) is None:
+            return None
+        year_month_day_calendar, nanosecond_of_day = parsed
+        days = CalendarSystem.iso._get_days_since_epoch(year_month_day_calendar._to_year_month_day())
+        return Instant._ctor(days=days, nano_of_day=nanosecond_of_day)
+
+    def _get_try_parse(self) -> Callable[[str], Instant | None]:
+        return self._try_parse
+
+    def parse(self, text: str) -> ParseResult[Instant]:
+        if (value := self._try_parse(text)) is not None:
+            return ParseResult.for_value(value)
+        return self.__fallback.parse(text)
+
+    def format(self, value: Instant) -> str:
+        if value._is_valid:
+            ymdc = _GregorianYearMonthDayCalculator._get_gregorian_year_month_day_calendar_from_days_since_epoch(
+                value._days_since_epoch
+            )
+            if 0 <= (year := ymdc._year) <= 9999:
+                return self.__local_pattern._format_fields(year, ymdc._month, ymdc._day, value._nanosecond_of_day)
+        return self.__fallback.format(value)
+
+    def append_format(self, value: Instant, builder: StringBuilder) -> StringBuilder:
+        if value._is_valid:
+            return builder.append(self.format(value))
+        return self.__fallback.append_format(value, builder)
+
+
+@final
+@_sealed
+@_private
+class _IsoOffsetDateTimePattern(_IPartialPattern[OffsetDateTime]):
+    """Fast path for ``OffsetDateTimePattern.general_iso``, ``OffsetDateTimePattern.extended_iso`` and
+    ``OffsetDateTimePattern.rfc3339``."""
+
+    __fallback: _IPartialPattern[OffsetDateTime]
+    __regex: re.Pattern[str]
+    __fractional: bool
+    __offset_pattern: str
+
+    @classmethod
+    def _wrap(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        template_value: OffsetDateTime,
+        pattern: _IPartialPattern[OffsetDateTime],
+    ) -> _IPartialPattern[OffsetDateTime]:
+        """Returns a fast path for the given pattern if there is one, or the pattern itself otherwise."""
+        if (options := _OFFSET_DATE_TIME_PATTERN_TEXTS.get(pattern_text)) is None:
+            return pattern
+        if template_value.calendar != CalendarSystem.iso or not _supports_offset_patterns(format_info):
+            return pattern
+        self = super().__new__(cls)
+        self.__fallback = pattern
+        self.__fractional, self.__offset_pattern = options
+        self.__regex = re.compile(
+            _DATE_REGEX + _TIME_REGEX + (_FRACTION_REGEX if self.__fractional else "") + _OFFSET_REGEXES[options[1]]
+        )
+        return self
+
+    def _try_parse(self, text: str) -> OffsetDateTime | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        # Null text is reported by the generic pattern.
+        if text is None or (match := self.__regex.fullmatch(text)) is None:
+            return None
+        if (parsed := _try_parse_date_time(match, self.__fractional)) is None:
+            return None
+        if (offset_seconds := _try_parse_offset(match[self.__regex.groups])) is None:
+            return None
+        return OffsetDateTime._ctor(
+            local_date=LocalDate._ctor(year_month_day_calendar=parsed[0]),
+            offset_time=OffsetTime._ctor(nanosecond_of_day=parsed[1], offset_seconds=offset_seconds),
+        )
+
+    def _get_try_parse(self) -> Callable[[str], OffsetDateTime | None]:
+        return self._try_parse
+
+    def parse(self, text: str) -> ParseResult[OffsetDateTime]:
+        if (value := self._try_parse(text)) is not None:
+            return ParseResult.for_value(value)
+        return self.__fallback.parse(text)
+
+    def parse_partial(self, cursor: _ValueCursor) -> ParseResult[OffsetDateTime]:
+        return self.__fallback.parse_partial(cursor)
+
+    def format(self, value: OffsetDateTime) -> str:
+        if 0 <= (year := value.year) <= 9999:
+            return (
+                _format_date(year, value.month, value.day)
+                + _format_time(value.nanosecond_of_day, self.__fractional)
+                + _format_offset(value.offset.seconds, self.__offset_pattern)
+            )
+        return self.__fallback.format(value)
+
+    def append_format(self, value: OffsetDateTime, builder: StringBuilder) -> StringBuilder:
+        if 0 <= value.year <= 9999:
+            return builder.append(self.format(value))
+        return self.__fallback.append_format(value, builder)
+
+
+@final
+@_sealed
+@_private
+class _IsoZonedDateTimePattern(_IPartialPattern[ZonedDateTime]):
+    """Fast path for ``ZonedDateTimePattern.general_format_only_iso`` and
+    ``ZonedDateTimePattern.extended_format_only_iso`` (once given a zone provider), and for the same local date/time
+    patterns followed directly by the offset and then the zone ID, as in "2024-03-01T10:00:00+00:00 Europe/London".
+
+    Only zone IDs which the zone provider advertises are handled here; the fixed "UTC" zones (with or without an
+    offset) are left to the generic pattern.
+    """
+
+    __fallback: _IPartialPattern[ZonedDateTime]
+    __regex: re.Pattern[str]
+    __fractional: bool
+    __offset_pattern: str
+    __zone_first: bool
+    __zone_provider: IDateTimeZoneProvider | None
+    __zone_ids: frozenset[str]
+
+    @classmethod
+    def _wrap(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        template_value: ZonedDateTime,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        pattern: _IPartialPattern[ZonedDateTime],
+    ) -> _IPartialPattern[ZonedDateTime]:
+        """Returns a fast path for the given pattern if there is one, or the pattern itself otherwise."""
+        if (options := _ZONED_DATE_TIME_PATTERN_TEXTS.get(pattern_text)) is None:
+            return pattern
+        if template_value.calendar != CalendarSystem.iso or not _supports_offset_patterns(format_info):
+            return pattern
+        self = super().__new__(cls)
+        self.__fallback = pattern
+        self.__fractional, self.__offset_pattern, self.__zone_first = options
+        offset_regex = _OFFSET_REGEXES[self.__offset_pattern]
+        self.__regex = re.compile(
+            _DATE_REGEX
+            + _TIME_REGEX
+            + (_FRACTION_REGEX if self.__fractional else "")
+            + (f" ([^ ]+) \\({offset_regex}\\)" if self.__zone_first else f"{offset_regex} ([^ ]+)")
+        )
+        # Without a resolver or zone provider, the generic pattern can only format. The zone ID is matched here as
+        # everything up to the next space, which is only equivalent to the generic longest-match search when no ID
+        # contains a space.
+        self.__zone_provider = None
+        self.__zone_ids = frozenset()
+        if zone_provider is not None and resolver is not None:
+            zone_ids = frozenset(zone_provider.ids)
+            if not any(" " in zone_id for zone_id in zone_ids):
+                self.__zone_provider = zone_provider
+                self.__zone_ids = zone_ids
+        return self
+
+    def _try_parse(self, text: str) -> ZonedDateTime | None:
+        """Parses text in the common case, returning None if the generic pattern needs to be used instead."""
+        # Null text is reported by the generic pattern.
+        if self.__zone_provider is None or text is None or (match := self.__regex.fullmatch(text)) is None:
+            return None
+        if (parsed := _try_parse_date_time(match, self.__fractional)) is None:
+            return None
+        # The zone ID and offset are always the last two groups.
+        last_group = self.__regex.groups
+        zone_id, offset_text = (
+            (match[last_group - 1], match[last_group])
+            if self.__zone_first
+            else (match[last_group], match[last_group - 1])
+        )
+        # The generic pattern always parses "UTC" (with or without an offset) as a fixed zone, even if the zone
+        # provider has a zone with that ID.
+        if zone_id.startswith("UTC") or zone_id not in self.__zone_ids:
+            return None
+        if (offset_seconds := _try_parse_offset(offset_text)) is None:
+            return None
+        offset_date_time = OffsetDateTime._ctor(
+            local_date=LocalDate._ctor(year_month_day_calendar=parsed[0]),
+            offset_time=OffsetTime._ctor(nanosecond_of_day=parsed[1], offset_seconds=offset_seconds),
+        )
+        zone: DateTimeZone = self.__zone_provider[zone_id]
+        # The offset is only valid if the zone has that offset at the instant it gives; this is equivalent to the
+        # validation of the mapping of the local date/time in the generic pattern.
+        if zone.get_utc_offset(offset_date_time.to_instant()).seconds != offset_seconds:
+            return None
+        return ZonedDateTime._ctor(offset_date_time=offset_date_time, zone=zone)
+
+    def _get_try_parse(self) -> Callable[[str], ZonedDateTime | None]:
+        return self._try_parse
+
+    def parse(self, text: str) -> ParseResult[ZonedDateTime]:
+        if (value := self._try_parse(text)) is not None:
+            return ParseResult.for_value(value)
+        return self.__fallback.parse(text)
+
+    def parse_partial(self, cursor: _ValueCursor) -> ParseResult[ZonedDateTime]:
+        return self.__fallback.parse_partial(cursor)
+
+    def format(self, value: ZonedDateTime) -> str:
+        local_date_time = value.local_date_time
+        if 0 <= (year := local_date_time.year) <= 9999:
+            local_text = _format_date(year, local_date_time.month, local_date_time.day) + _format_time(
+                local_date_time.nanosecond_of_day, self.__fractional
+            )
+            offset_text = _format_offset(value.offset.seconds, self.__offset_pattern)
+            if self.__zone_first:
+                return f"{local_text} {value.zone.id} ({offset_text})"
+            return f"{local_text}{offset_text} {value.zone.id}"
+        return self.__fallback.format(value)
+
+    def append_format(self, value: ZonedDateTime, builder: StringBuilder) -> StringBuilder:
+        if 0 <= value.year <= 9999:
+            return builder.append(self.format(value))
+        return self.__fallback.append_format(value, builder)
@@ -7,14 +7,21 @@ from typing import TYPE_CHECKING, Final, _ProtocolMeta, cast, final
 
 from pyoda_time._local_date import LocalDate
 from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._batch_parse_result import BatchParseResult
 from pyoda_time.text._i_partial_pattern import _IPartialPattern
 from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._iso_patterns import _IsoLocalDatePattern
 from pyoda_time.text._local_date_pattern_parser import _LocalDatePatternParser
+from pyoda_time.text._pattern_writer import _format_many, _format_to
 from pyoda_time.text.patterns._pattern_bcl_support import _PatternBclSupport
 from pyoda_time.utility._csharp_compatibility import _private, _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from _typeshed import SupportsWrite
+
     from pyoda_time._calendar_system import CalendarSystem
     from pyoda_time._compatibility._culture_info import CultureInfo
     from pyoda_time._compatibility._string_builder import StringBuilder
@@ -141,6 +148,28 @@ class LocalDatePattern(IPattern[LocalDate], metaclass=__LocalDatePatternMeta):
         """
         return self._underlying_pattern.parse(text)
 
+    def parse_many(self, texts: Iterable[str]) -> BatchParseResult[LocalDate]:
+        """Parses each of the given text values according to the rules of this pattern.
+
+        Failures are recorded by position in the result, and the exception for each failure is only created on
+        demand. Like ``parse``, this method never raises an exception for invalid text values.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_many(self._underlying_pattern, texts)
+
+    def parse_column(self, texts: Sequence[str]) -> BatchParseResult[LocalDate]:
+        """Parses each text value in the given sequence according to the rules of this pattern.
+
+        This behaves like ``parse_many``, but as the sequence can be indexed, the text values which fail to parse are
+        not copied into the result.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_column(self._underlying_pattern, texts)
+
     def format(self, value: LocalDate) -> str:
         """Formats the given local date as text according to the rules of this pattern.
 
@@ -159,6 +188,29 @@ class LocalDatePattern(IPattern[LocalDate], metaclass=__LocalDatePatternMeta):
         """
         return self._underlying_pattern.append_format(value, builder)
 
+    def format_to(self, value: LocalDate, writer: SupportsWrite[str]) -> None:
+        """Formats the given local date as text according to the rules of this pattern, writing it to the given text
+        stream.
+
+        :param value: The local date to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        """
+        _format_to(self._underlying_pattern, value, writer)
+
+    def format_many(self, values: Iterable[LocalDate], writer: SupportsWrite[str], separator: str = "\n") -> int:
+        """Formats each of the given values as text according to the rules of this pattern, writing them to the given
+        text stream.
+
+        The text is buffered and written in chunks, rather than being written (or returned) value by value. No
+        separator is written before the first value or after the last one.
+
+        :param values: The values to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        :param separator: The text to write between consecutive values.
+        :return: The number of values written.
+        """
+        return _format_many(self._underlying_pattern, values, writer, separator)
+
     @classmethod
     def _create(
         cls, pattern_text: str, format_info: _PyodaFormatInfo, template_value: LocalDate, two_digit_year_max: int
@@ -184,6 +236,7 @@ class LocalDatePattern(IPattern[LocalDate], metaclass=__LocalDatePatternMeta):
         if isinstance(pattern, LocalDatePattern):
             pattern = pattern._underlying_pattern
         partial_pattern = cast(_IPartialPattern[LocalDate], pattern)
+        partial_pattern = _IsoLocalDatePattern._wrap(pattern_text, template_value, partial_pattern)
         return LocalDatePattern.__ctor(pattern_text, format_info, template_value, two_digit_year_max, partial_pattern)
 
     @classmethod
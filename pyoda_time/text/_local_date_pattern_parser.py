@@ -221,13 +221,11 @@ class _LocalDatePatternParser(_IPatternParser[LocalDate]):
 
         def _parse_era(self, format_info: _PyodaFormatInfo, cursor: _ValueCursor) -> ParseResult[Any] | None:
             # TODO: compare_info = format_info.compare_info
-            for era in self._calendar.eras():
-                for era_name in format_info.get_era_names(era):
-                    # TODO: compare_info is passed to this method in Noda Time...
-                    if cursor._match_case_insensitive(era_name, True):
-                        self.__era = era
-                        return None
-            return ParseResult[Any]._mismatched_text(cursor, "g")
+            if (match := format_info._get_era_name_trie(self._calendar)._match_longest(cursor)) is not None:
+                self.__era, length = match
+                cursor.move(cursor.index + length)
+                return None
+            return ParseResult._mismatched_text(cursor, "g")
 
         def calculate_value(self, used_fields: _PatternFields, value: str) -> ParseResult[LocalDate]:
             return self._calculate_value(used_fields, value, LocalDate)
@@ -265,9 +263,7 @@ class _LocalDatePatternParser(_IPatternParser[LocalDate]):
 
             day = self._day_of_month if used_fields.has_any(_PatternFields.DAY_OF_MONTH) else self._template_value.day
             if day > self._calendar.get_days_in_month(self._year, self._month_of_year_numeric):
-                return ParseResult[LocalDate]._day_of_month_out_of_range(
-                    text, day, self._month_of_year_numeric, self._year
-                )
+                return ParseResult._day_of_month_out_of_range(text, day, self._month_of_year_numeric, self._year)
 
             # Avoid further revalidation
             value = LocalDate._ctor(
@@ -280,8 +276,8 @@ class _LocalDatePatternParser(_IPatternParser[LocalDate]):
             )
 
             if used_fields.has_any(_PatternFields.DAY_OF_WEEK) and self._day_of_week != value.day_of_week.value:
-                return ParseResult[LocalDate]._inconsistent_day_of_week_text_value(text)
-            return ParseResult[LocalDate].for_value(value)
+                return ParseResult._inconsistent_day_of_week_text_value(text)
+            return ParseResult.for_value(value)
 
         def __calculate_simple_iso_value(self, text: str) -> ParseResult[LocalDate]:
             """Optimized computation for a pattern with an ISO calendar template value, and year/month/day fields."""
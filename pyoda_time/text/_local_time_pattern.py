@@ -8,14 +8,20 @@ from typing import TYPE_CHECKING, Final, _ProtocolMeta, cast, final
 
 from pyoda_time._local_time import LocalTime
 from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._batch_parse_result import BatchParseResult
 from pyoda_time.text._composite_pattern_builder import CompositePatternBuilder
 from pyoda_time.text._i_partial_pattern import _IPartialPattern
 from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._pattern_writer import _format_many, _format_to
 from pyoda_time.text.patterns._pattern_bcl_support import _PatternBclSupport
 from pyoda_time.utility._csharp_compatibility import _private, _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from _typeshed import SupportsWrite
+
     from pyoda_time._compatibility._culture_info import CultureInfo
     from pyoda_time._compatibility._string_builder import StringBuilder
     from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
@@ -250,6 +256,28 @@ class LocalTimePattern(IPattern[LocalTime], metaclass=_CombinedMeta):
         """
         return self.__underlying_pattern.parse(text)
 
+    def parse_many(self, texts: Iterable[str]) -> BatchParseResult[LocalTime]:
+        """Parses each of the given text values according to the rules of this pattern.
+
+        Failures are recorded by position in the result, and the exception for each failure is only created on
+        demand. Like ``parse``, this method never raises an exception for invalid text values.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_many(self.__underlying_pattern, texts)
+
+    def parse_column(self, texts: Sequence[str]) -> BatchParseResult[LocalTime]:
+        """Parses each text value in the given sequence according to the rules of this pattern.
+
+        This behaves like ``parse_many``, but as the sequence can be indexed, the text values which fail to parse are
+        not copied into the result.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_column(self.__underlying_pattern, texts)
+
     def format(self, value: LocalTime) -> str:
         """Formats the given local time as text according to the rules of this pattern.
 
@@ -268,6 +296,29 @@ class LocalTimePattern(IPattern[LocalTime], metaclass=_CombinedMeta):
         """
         return self.__underlying_pattern.append_format(value, builder)
 
+    def format_to(self, value: LocalTime, writer: SupportsWrite[str]) -> None:
+        """Formats the given local time as text according to the rules of this pattern, writing it to the given text
+        stream.
+
+        :param value: The local time to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        """
+        _format_to(self.__underlying_pattern, value, writer)
+
+    def format_many(self, values: Iterable[LocalTime], writer: SupportsWrite[str], separator: str = "\n") -> int:
+        """Formats each of the given values as text according to the rules of this pattern, writing them to the given
+        text stream.
+
+        The text is buffered and written in chunks, rather than being written (or returned) value by value. No
+        separator is written before the first value or after the last one.
+
+        :param values: The values to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        :param separator: The text to write between consecutive values.
+        :return: The number of values written.
+        """
+        return _format_many(self.__underlying_pattern, values, writer, separator)
+
     @classmethod
     def _create(cls, pattern_text: str, format_info: _PyodaFormatInfo, template_value: LocalTime) -> LocalTimePattern:
         """Creates a pattern for the given pattern text, format info, and template value.
@@ -0,0 +1,68 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, final
+
+from ..utility._csharp_compatibility import _sealed
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ._value_cursor import _ValueCursor
+
+# The key under which a node stores the value of the name ending at that node. Every other key is a single character
+# of a name in lower case, which is never empty.
+_VALUE: Final[str] = ""
+
+
+@final
+@_sealed
+class _NameTrie[T]:
+    """A case-insensitive prefix trie of text values, such as month names, used to find the longest one at the current
+    point in a value being parsed.
+
+    Names are compared a character at a time using ``str.lower()``, in the same way as
+    ``_ValueCursor._match_case_insensitive``, so finding the longest name takes one pass over the value however many
+    names there are.
+
+    Instances are immutable once created, and may be used freely between threads.
+    """
+
+    __slots__ = ("__root",)
+
+    def __init__(self, names: Iterable[tuple[str | None, T]]) -> None:
+        """Creates a trie of the given names and the values they map to.
+
+        If the same name (ignoring case) occurs more than once, the first value for it is used. Empty and ``None``
+        names are ignored, as they can never be the longest match.
+
+        :param names: The names and their values, in order of preference.
+        """
+        self.__root: dict[str, Any] = {}
+        for name, value in names:
+            if not name:
+                continue
+            node = self.__root
+            for character in name:
+                node = node.setdefault(character.lower(), {})
+            node.setdefault(_VALUE, value)
+
+    def _match_longest(self, cursor: _ValueCursor) -> tuple[T, int] | None:
+        """Finds the longest name at the current point in the cursor, without moving it.
+
+        :param cursor: The cursor to match against.
+        :return: A 2-tuple of the value of the longest name and its length, or ``None`` if no name matches.
+        """
+        text = cursor.value
+        start_index = cursor.index
+        node = self.__root
+        best: tuple[T, int] | None = None
+        for index in range(start_index, len(text)):
+            if (child := node.get(text[index].lower())) is None:
+                break
+            node = child
+            if _VALUE in node:
+                best = node[_VALUE], index + 1 - start_index
+        return best
@@ -0,0 +1,444 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, _ProtocolMeta, cast, final
+
+from pyoda_time._local_date_time import LocalDateTime
+from pyoda_time._offset import Offset
+from pyoda_time._offset_date_time import OffsetDateTime
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._batch_parse_result import BatchParseResult
+from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._iso_patterns import _IsoOffsetDateTimePattern
+from pyoda_time.text._local_date_pattern import LocalDatePattern
+from pyoda_time.text._pattern_writer import _format_many, _format_to
+from pyoda_time.text.patterns._pattern_bcl_support import _PatternBclSupport
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from _typeshed import SupportsWrite
+
+    from pyoda_time._calendar_system import CalendarSystem
+    from pyoda_time._compatibility._culture_info import CultureInfo
+    from pyoda_time._compatibility._string_builder import StringBuilder
+    from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+    from pyoda_time.text._parse_result import ParseResult
+
+
+class _OffsetDateTimePatternMeta(type):
+    __DEFAULT_FORMAT_PATTERN: Final[str] = "G"  # General ISO
+    __pattern_bcl_support: _PatternBclSupport[OffsetDateTime] | None = None
+
+    @property
+    def _bcl_support(self) -> _PatternBclSupport[OffsetDateTime]:
+        if self.__pattern_bcl_support is None:
+
+            def pattern_parser(format_info: _PyodaFormatInfo) -> _FixedFormatInfoPatternParser[OffsetDateTime]:
+                return format_info._offset_date_time_pattern_parser
+
+            self.__pattern_bcl_support = _PatternBclSupport(self.__DEFAULT_FORMAT_PATTERN, pattern_parser)
+        return self.__pattern_bcl_support
+
+    @property
+    def general_iso(cls) -> OffsetDateTimePattern:
+        """Gets an invariant offset date/time pattern based on ISO-8601 (down to the second), including offset from
+        UTC. This corresponds to the text pattern "uuuu'-'MM'-'dd'T'HH':'mm':'sso<G>".
+
+        The calendar system is not parsed or formatted as part of this pattern. This pattern corresponds to the 'G'
+        standard pattern.
+
+        :return: An invariant offset date/time pattern based on ISO-8601 (down to the second), including offset from
+            UTC.
+        """
+        return OffsetDateTimePattern._Patterns._general_iso_pattern_impl
+
+    @property
+    def extended_iso(cls) -> OffsetDateTimePattern:
+        """Gets an invariant offset date/time pattern based on ISO-8601 (down to the nanosecond), including offset from
+        UTC. This corresponds to the text pattern "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<G>".
+
+        The calendar system is not parsed or formatted as part of this pattern. This pattern corresponds to the 'o'
+        standard pattern.
+
+        :return: An invariant offset date/time pattern based on ISO-8601 (down to the nanosecond), including offset
+            from UTC.
+        """
+        return OffsetDateTimePattern._Patterns._extended_iso_pattern_impl
+
+    @property
+    def rfc3339(cls) -> OffsetDateTimePattern:
+        """Gets an invariant offset date/time pattern based on RFC 3339 (down to the nanosecond), including offset from
+        UTC as hours and minutes only. This corresponds to the text pattern
+        "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<Z+HH:mm>".
+
+        The minutes of the offset are always included, but any sub-minute component of the offset is lost. An offset
+        of zero is formatted as 'Z', but all of 'Z', '+00:00' and '-00:00' are parsed the same way. The RFC 3339
+        meaning of '-00:00' is not supported by Pyoda Time. Note that parsing is case-sensitive (so 'T' and 'Z' must
+        be upper case). The calendar system is not parsed or formatted as part of this pattern.
+
+        :return: An invariant offset date/time pattern based on RFC 3339 (down to the nanosecond), including offset
+            from UTC as hours and minutes only.
+        """
+        return OffsetDateTimePattern._Patterns._rfc3339_pattern_impl
+
+    @property
+    def full_roundtrip(cls) -> OffsetDateTimePattern:
+        """Gets an invariant offset date/time pattern based on ISO-8601 (down to the nanosecond) including offset from
+        UTC and calendar ID. This corresponds to the text pattern
+        "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<G> '('c')'".
+
+        This pattern corresponds to the 'r' standard pattern.
+
+        :return: An invariant offset date/time pattern based on ISO-8601 (down to the nanosecond) including offset
+            from UTC and calendar ID.
+        """
+        return OffsetDateTimePattern._Patterns._full_roundtrip_pattern_impl
+
+
+class _CombinedMeta(_ProtocolMeta, _OffsetDateTimePatternMeta):
+    """Intermediary class which prevents a metaclass conflict."""
+
+
+@_sealed
+@final
+@_private
+class OffsetDateTimePattern(IPattern[OffsetDateTime], metaclass=_CombinedMeta):
+    """Represents a pattern for parsing and formatting ``OffsetDateTime`` values."""
+
+    _DEFAULT_TEMPLATE_VALUE: Final[OffsetDateTime] = LocalDateTime(2000, 1, 1, 0, 0).with_offset(Offset.zero)
+
+    __pattern_text: str
+    __format_info: _PyodaFormatInfo
+    __underlying_pattern: _IPartialPattern[OffsetDateTime]
+    __template_value: OffsetDateTime
+    __two_digit_year_max: int
+
+    class _PatternsMeta(type):
+        __general_iso_pattern_impl: OffsetDateTimePattern | None = None
+        __extended_iso_pattern_impl: OffsetDateTimePattern | None = None
+        __rfc3339_pattern_impl: OffsetDateTimePattern | None = None
+        __full_roundtrip_pattern_impl: OffsetDateTimePattern | None = None
+
+        @property
+        def _general_iso_pattern_impl(self) -> OffsetDateTimePattern:
+            if self.__general_iso_pattern_impl is None:
+                self.__general_iso_pattern_impl = OffsetDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'sso<G>"
+                )
+            return self.__general_iso_pattern_impl
+
+        @property
+        def _extended_iso_pattern_impl(self) -> OffsetDateTimePattern:
+            if self.__extended_iso_pattern_impl is None:
+                self.__extended_iso_pattern_impl = OffsetDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<G>"
+                )
+            return self.__extended_iso_pattern_impl
+
+        @property
+        def _rfc3339_pattern_impl(self) -> OffsetDateTimePattern:
+            if self.__rfc3339_pattern_impl is None:
+                self.__rfc3339_pattern_impl = OffsetDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<Z+HH:mm>"
+                )
+            return self.__rfc3339_pattern_impl
+
+        @property
+        def _full_roundtrip_pattern_impl(self) -> OffsetDateTimePattern:
+            if self.__full_roundtrip_pattern_impl is None:
+                self.__full_roundtrip_pattern_impl = OffsetDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<G> '('c')'"
+                )
+            return self.__full_roundtrip_pattern_impl
+
+    class _Patterns(metaclass=_PatternsMeta):
+        pass
+
+    @property
+    def _underlying_pattern(self) -> _IPartialPattern[OffsetDateTime]:
+        """Returns the pattern that this object delegates to.
+
+        Mostly useful to avoid this public class implementing an internal interface.
+        """
+        return self.__underlying_pattern
+
+    @property
+    def pattern_text(self) -> str:
+        """Gets the pattern text for this pattern, as supplied on creation.
+
+        :return: The pattern text for this pattern, as supplied on creation.
+        """
+        return self.__pattern_text
+
+    @property
+    def template_value(self) -> OffsetDateTime:
+        """Gets the value used as a template for parsing: any field values unspecified in the pattern are taken from
+        the template.
+
+        :return: The value used as a template for parsing.
+        """
+        return self.__template_value
+
+    @property
+    def two_digit_year_max(self) -> int:
+        """Maximum two-digit-year in the template to treat as the current century. If the value parsed is higher than
+        this, the result is adjusted to the previous century. This value defaults to 30. To create a pattern with a
+        different value, use ``with_two_digit_year_max``.
+
+        :return: The value used for the maximum two-digit-year, in the range 0-99 inclusive.
+        """
+        return self.__two_digit_year_max
+
+    @classmethod
+    def __ctor(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        template_value: OffsetDateTime,
+        two_digit_year_max: int,
+        pattern: _IPartialPattern[OffsetDateTime],
+    ) -> OffsetDateTimePattern:
+        self = super().__new__(cls)
+        self.__pattern_text = pattern_text
+        self.__format_info = format_info
+        self.__underlying_pattern = pattern
+        self.__template_value = template_value
+        self.__two_digit_year_max = two_digit_year_max
+        return self
+
+    def parse(self, text: str) -> ParseResult[OffsetDateTime]:
+        """Parses the given text value according to the rules of this pattern.
+
+        This method never throws an exception (barring a bug in Pyoda Time itself). Even errors such as the argument
+        being null are wrapped in a parse result.
+
+        :param text: The text value to parse.
+        :return: The result of parsing, which may be successful or unsuccessful.
+        """
+        return self.__underlying_pattern.parse(text)
+
+    def parse_many(self, texts: Iterable[str]) -> BatchParseResult[OffsetDateTime]:
+        """Parses each of the given text values according to the rules of this pattern.
+
+        Failures are recorded by position in the result, and the exception for each failure is only created on
+        demand. Like ``parse``, this method never raises an exception for invalid text values.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_many(self.__underlying_pattern, texts)
+
+    def parse_column(self, texts: Sequence[str]) -> BatchParseResult[OffsetDateTime]:
+        """Parses each text value in the given sequence according to the rules of this pattern.
+
+        This behaves like ``parse_many``, but as the sequence can be indexed, the text values which fail to parse are
+        not copied into the result.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_column(self.__underlying_pattern, texts)
+
+    def format(self, value: OffsetDateTime) -> str:
+        """Formats the given offset date/time as text according to the rules of this pattern.
+
+        :param value: The offset date/time to format.
+        :return: The offset date/time formatted according to this pattern.
+        """
+        return self.__underlying_pattern.format(value)
+
+    def append_format(self, value: OffsetDateTime, builder: StringBuilder) -> StringBuilder:
+        """Formats the given value as text according to the rules of this pattern, appending to the given
+        ``StringBuilder``.
+
+        :param value: The value to format.
+        :param builder: The ``StringBuilder`` to append to.
+        :return: The builder passed in as ``builder``.
+        """
+        return self.__underlying_pattern.append_format(value, builder)
+
+    def format_to(self, value: OffsetDateTime, writer: SupportsWrite[str]) -> None:
+        """Formats the given offset date/time as text according to the rules of this pattern, writing it to the given
+        text stream.
+
+        :param value: The offset date/time to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        """
+        _format_to(self.__underlying_pattern, value, writer)
+
+    def format_many(self, values: Iterable[OffsetDateTime], writer: SupportsWrite[str], separator: str = "\n") -> int:
+        """Formats each of the given values as text according to the rules of this pattern, writing them to the given
+        text stream.
+
+        The text is buffered and written in chunks, rather than being written (or returned) value by value. No
+        separator is written before the first value or after the last one.
+
+        :param values: The values to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        :param separator: The text to write between consecutive values.
+        :return: The number of values written.
+        """
+        return _format_many(self.__underlying_pattern, values, writer, separator)
+
+    @classmethod
+    def _create(
+        cls, pattern_text: str, format_info: _PyodaFormatInfo, template_value: OffsetDateTime, two_digit_year_max: int
+    ) -> OffsetDateTimePattern:
+        """Creates a pattern for the given pattern text, format info, template value and two-digit-year maximum.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param format_info: The format info to use in the pattern
+        :param template_value: Template value to use for unspecified fields
+        :param two_digit_year_max: Maximum two-digit-year in the template to treat as the current century.
+        :return: A pattern for parsing and formatting offset date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        _Preconditions._check_not_null(pattern_text, "pattern_text")
+        _Preconditions._check_not_null(format_info, "format_info")
+        # Use the "fixed" parser for the common case of the default template value.
+        pattern: IPattern[OffsetDateTime]
+        if (
+            template_value == cls._DEFAULT_TEMPLATE_VALUE
+            and two_digit_year_max == LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
+        ):
+            pattern = format_info._offset_date_time_pattern_parser._parse_pattern(pattern_text)
+        else:
+            from pyoda_time.text._offset_date_time_pattern_parser import _OffsetDateTimePatternParser
+
+            pattern = _OffsetDateTimePatternParser._ctor(template_value, two_digit_year_max).parse_pattern(
+                pattern_text, format_info
+            )
+        # If ParsePattern returns a standard pattern instance, we need to get the underlying partial pattern.
+        if isinstance(pattern, OffsetDateTimePattern):
+            pattern = pattern._underlying_pattern
+        partial_pattern: _IPartialPattern[OffsetDateTime] = cast(_IPartialPattern[OffsetDateTime], pattern)
+        partial_pattern = _IsoOffsetDateTimePattern._wrap(pattern_text, format_info, template_value, partial_pattern)
+        return OffsetDateTimePattern.__ctor(
+            pattern_text, format_info, template_value, two_digit_year_max, partial_pattern
+        )
+
+    @classmethod
+    def create(
+        cls, pattern_text: str, culture_info: CultureInfo, template_value: OffsetDateTime | None = None
+    ) -> OffsetDateTimePattern:
+        """Creates a pattern for the given pattern text, culture, and template value.
+
+        See the user guide for the available pattern text options.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param culture_info: The culture to use in the pattern
+        :param template_value: Template value to use for unspecified fields. Defaults to midnight on 2000-01-01 with
+            an offset of zero if not provided.
+        :return: A pattern for parsing and formatting offset date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        if template_value is None:
+            template_value = cls._DEFAULT_TEMPLATE_VALUE
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo._get_format_info(culture_info),
+            template_value,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    @classmethod
+    def create_with_current_culture(cls, pattern_text: str) -> OffsetDateTimePattern:
+        """Creates a pattern for the given pattern text in the current thread's current culture.
+
+        See the user guide for the available pattern text options. Note that the current culture
+        is captured at the time this method is called - it is not captured at the point of parsing
+        or formatting values.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :return: A pattern for parsing and formatting offset date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo.current_info,
+            cls._DEFAULT_TEMPLATE_VALUE,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    @classmethod
+    def create_with_invariant_culture(cls, pattern_text: str) -> OffsetDateTimePattern:
+        """Creates a pattern for the given pattern text in the invariant culture, using the default template value of
+        midnight January 1st 2000 at an offset of 0.
+
+        See the user guide for the available pattern text options.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :return: A pattern for parsing and formatting offset date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo.invariant_info,
+            cls._DEFAULT_TEMPLATE_VALUE,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    def with_pattern_text(self, pattern_text: str) -> OffsetDateTimePattern:
+        """Creates a pattern for the given pattern text, with the same localization information, template value and
+        two-digit-year maximum as this pattern.
+
+        :param pattern_text: The pattern text to use in the new pattern.
+        :return: A new pattern with the given pattern text.
+        """
+        return self._create(pattern_text, self.__format_info, self.__template_value, self.__two_digit_year_max)
+
+    def __with_format_info(self, format_info: _PyodaFormatInfo) -> OffsetDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified localization
+        information.
+
+        :param format_info: The localization information to use in the new pattern.
+        :return: A new pattern with the given localization information.
+        """
+        return self._create(self.__pattern_text, format_info, self.__template_value, self.__two_digit_year_max)
+
+    def with_culture(self, culture_info: CultureInfo) -> OffsetDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified culture.
+
+        :param culture_info: The culture to use in the new pattern.
+        :return: A new pattern with the given culture.
+        """
+        return self.__with_format_info(_PyodaFormatInfo._get_format_info(culture_info))
+
+    def with_template_value(self, new_template_value: OffsetDateTime) -> OffsetDateTimePattern:
+        """Creates a pattern for the same original pattern text and culture as this pattern, but with the specified
+        template value.
+
+        :param new_template_value: The template value to use in the new pattern.
+        :return: A new pattern with the given template value.
+        """
+        return self._create(self.__pattern_text, self.__format_info, new_template_value, self.__two_digit_year_max)
+
+    def with_calendar(self, calendar: CalendarSystem) -> OffsetDateTimePattern:
+        """Creates a pattern like this one, but with the template value modified to use the specified calendar system.
+
+        Care should be taken in two (relatively rare) scenarios. Although the default template value is supported by all
+        Pyoda Time calendar systems, if a pattern is created with a different template value and then this method is
+        called with a calendar system which doesn't support that date, an exception will be thrown. Additionally, if the
+        pattern only specifies some date fields, it's possible that the new template value will not be suitable for all
+        values.
+
+        :param calendar: The calendar system to convert the template value into.
+        :return: A new pattern with a template value in the specified calendar system.
+        """
+        return self.with_template_value(self.__template_value.with_calendar(calendar))
+
+    def with_two_digit_year_max(self, two_digit_year_max: int) -> OffsetDateTimePattern:
+        """Creates a pattern like this one, but with a different ``two_digit_year_max`` value.
+
+        :param two_digit_year_max: The value to use for ``two_digit_year_max`` in the new pattern,
+            in the range 0-99 inclusive.
+        :return: A new pattern with the specified maximum two-digit-year.
+        """
+        return self._create(self.__pattern_text, self.__format_info, self.__template_value, two_digit_year_max)
@@ -0,0 +1,326 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, final
+
+from pyoda_time._offset_date_time import OffsetDateTime
+from pyoda_time.text import ParseResult
+from pyoda_time.text._invalid_pattern_exception import InvalidPatternError
+from pyoda_time.text._local_date_pattern_parser import _LocalDatePatternParser
+from pyoda_time.text._local_date_time_pattern_parser import _LocalDateTimeParseBucket
+from pyoda_time.text._local_time_pattern_parser import _LocalTimePatternParser
+from pyoda_time.text._offset_date_time_pattern import OffsetDateTimePattern
+from pyoda_time.text._offset_pattern import OffsetPattern
+from pyoda_time.text._parse_bucket import _ParseBucket
+from pyoda_time.text._text_error_messages import _TextErrorMessages
+from pyoda_time.text.patterns._date_pattern_helper import _DatePatternHelper
+from pyoda_time.text.patterns._i_pattern_parser import _IPatternParser
+from pyoda_time.text.patterns._pattern_fields import _PatternFields
+from pyoda_time.text.patterns._stepped_pattern_builder import _SteppedPatternBuilder
+from pyoda_time.text.patterns._time_pattern_helper import _TimePatternHelper
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from pyoda_time._calendar_system import CalendarSystem
+    from pyoda_time._local_date import LocalDate
+    from pyoda_time._local_date_time import LocalDateTime
+    from pyoda_time._local_time import LocalTime
+    from pyoda_time._offset import Offset
+    from pyoda_time.calendars import Era
+    from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+    from pyoda_time.text._i_pattern import IPattern
+    from pyoda_time.text.patterns._pattern_cursor import _PatternCursor
+
+
+@final
+@_sealed
+@_private
+class _OffsetDateTimeParseBucket(_ParseBucket[OffsetDateTime]):
+    _date: _LocalDatePatternParser._LocalDateParseBucket
+    _time: _LocalTimePatternParser._LocalTimeParseBucket
+    _offset: Offset
+
+    @classmethod
+    def _ctor(cls, template_value: OffsetDateTime, two_digit_year_max: int) -> _OffsetDateTimeParseBucket:
+        self = super().__new__(cls)
+        self._date = _LocalDatePatternParser._LocalDateParseBucket._ctor(template_value.date, two_digit_year_max)
+        self._time = _LocalTimePatternParser._LocalTimeParseBucket._ctor(template_value.time_of_day)
+        self._offset = template_value.offset
+        return self
+
+    def calculate_value(self, used_fields: _PatternFields, value: str) -> ParseResult[OffsetDateTime]:
+        local_result = _LocalDateTimeParseBucket._combine_buckets(used_fields, self._date, self._time, value)
+        if not local_result.success:
+            return local_result.convert_error(OffsetDateTime)
+        return ParseResult.for_value(local_result.value.with_offset(self._offset))
+
+
+def handle_forward_slash(pattern: _PatternCursor, builder: _SteppedPatternBuilder[OffsetDateTime]) -> None:
+    builder._add_literal(
+        expected_text=builder._format_info.date_separator, failure=ParseResult._date_separator_mismatch
+    )
+
+
+def handle_uppercase_t(pattern: _PatternCursor, builder: _SteppedPatternBuilder[OffsetDateTime]) -> None:
+    builder._add_literal(expected_char="T", failure_selector=ParseResult._mismatched_character)
+
+
+def handle_colon(pattern: _PatternCursor, builder: _SteppedPatternBuilder[OffsetDateTime]) -> None:
+    builder._add_literal(
+        expected_text=builder._format_info.time_separator, failure=ParseResult._time_separator_mismatch
+    )
+
+
+def handle_offset(pattern: _PatternCursor, builder: _SteppedPatternBuilder[OffsetDateTime]) -> None:
+    builder._add_field(_PatternFields.EMBEDDED_OFFSET, pattern.current)
+    embedded_pattern = pattern.get_embedded_pattern()
+    offset_pattern = OffsetPattern._create(embedded_pattern, builder._format_info)._underlying_pattern
+
+    def offset_setter(bucket: _ParseBucket[OffsetDateTime], offset: Offset) -> None:
+        assert isinstance(bucket, _OffsetDateTimeParseBucket)
+        bucket._offset = offset
+
+    builder._add_embedded_pattern(offset_pattern, offset_setter, get_offset, OffsetDateTime)
+
+
+def handle_l(cursor: _PatternCursor, builder: _SteppedPatternBuilder[OffsetDateTime]) -> None:
+    def time_bucket_extractor(
+        bucket: _ParseBucket[OffsetDateTime],
+    ) -> _LocalTimePatternParser._LocalTimeParseBucket:
+        assert isinstance(bucket, _OffsetDateTimeParseBucket)
+        return bucket._time
+
+    def date_extractor(value: OffsetDateTime) -> LocalDate:
+        return value.date
+
+    def time_extractor(value: OffsetDateTime) -> LocalTime:
+        return value.time_of_day
+
+    def date_time_extractor(value: OffsetDateTime) -> LocalDateTime:
+        return value.local_date_time
+
+    builder._add_embedded_local_partial(
+        cursor,
+        date_bucket_from_bucket,
+        time_bucket_extractor,
+        date_extractor,
+        time_extractor,
+        date_time_extractor,
+        OffsetDateTime,
+    )
+
+
+def get_offset(value: OffsetDateTime) -> Offset:
+    return value.offset
+
+
+def get_year(value: OffsetDateTime) -> int:
+    return value.year
+
+
+def set_year(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._year = value
+
+
+def get_year_of_era(value: OffsetDateTime) -> int:
+    return value.year_of_era
+
+
+def set_year_of_era(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._year_of_era = value
+
+
+def get_month(value: OffsetDateTime) -> int:
+    return value.month
+
+
+def month_text_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._month_of_year_text = value
+
+
+def month_number_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._month_of_year_numeric = value
+
+
+def get_day_of_month(value: OffsetDateTime) -> int:
+    return value.day
+
+
+def get_day_of_week(value: OffsetDateTime) -> int:
+    return value.day_of_week.value
+
+
+def day_of_month_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._day_of_month = value
+
+
+def day_of_week_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._day_of_week = value
+
+
+def get_nanosecond_of_second(value: OffsetDateTime) -> int:
+    return value.nanosecond_of_second
+
+
+def fractional_seconds_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._fractional_seconds = value
+
+
+def get_hour(value: OffsetDateTime) -> int:
+    return value.hour
+
+
+def hours_24_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._hours_24 = value
+
+
+def get_clock_hour_of_half_day(value: OffsetDateTime) -> int:
+    return value.clock_hour_of_half_day
+
+
+def hours_12_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._hours_12 = value
+
+
+def get_minute(value: OffsetDateTime) -> int:
+    return value.minute
+
+
+def minutes_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._minutes = value
+
+
+def get_second(value: OffsetDateTime) -> int:
+    return value.second
+
+
+def seconds_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._seconds = value
+
+
+def am_pm_setter(bucket: _ParseBucket[OffsetDateTime], value: int) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._time._am_pm = value
+
+
+def get_calendar(value: OffsetDateTime) -> CalendarSystem:
+    return value.calendar
+
+
+def calendar_setter(bucket: _ParseBucket[OffsetDateTime], value: CalendarSystem) -> None:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    bucket._date._calendar = value
+
+
+def get_era(value: OffsetDateTime) -> Era:
+    return value.era
+
+
+def date_bucket_from_bucket(bucket: _ParseBucket[OffsetDateTime]) -> _LocalDatePatternParser._LocalDateParseBucket:
+    assert isinstance(bucket, _OffsetDateTimeParseBucket)
+    return bucket._date
+
+
+@_sealed
+@final
+@_private
+class _OffsetDateTimePatternParser(_IPatternParser[OffsetDateTime]):
+    """Parser for patterns of ``OffsetDateTime`` values."""
+
+    __template_value: OffsetDateTime
+    __two_digit_year_max: int
+
+    __pattern_character_handlers: Mapping[
+        str, Callable[[_PatternCursor, _SteppedPatternBuilder[OffsetDateTime]], None]
+    ] = {
+        "%": _SteppedPatternBuilder._handle_percent,
+        "'": _SteppedPatternBuilder._handle_quote,
+        '"': _SteppedPatternBuilder._handle_quote,
+        "\\": _SteppedPatternBuilder._handle_backslash,
+        "/": handle_forward_slash,
+        "T": handle_uppercase_t,
+        "y": _DatePatternHelper._create_year_of_era_handler(get_year_of_era, set_year_of_era, OffsetDateTime),
+        "u": _SteppedPatternBuilder._handle_padded_field(
+            4, _PatternFields.YEAR, -9999, 9999, get_year, set_year, OffsetDateTime
+        ),
+        "M": _DatePatternHelper._create_month_of_year_handler(
+            get_month, month_text_setter, month_number_setter, OffsetDateTime
+        ),
+        "d": _DatePatternHelper._create_day_handler(
+            get_day_of_month, get_day_of_week, day_of_month_setter, day_of_week_setter, OffsetDateTime
+        ),
+        ".": _TimePatternHelper._create_period_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        ";": _TimePatternHelper._create_comma_dot_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        ":": handle_colon,
+        "h": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.HOURS_12, 1, 12, get_clock_hour_of_half_day, hours_12_setter, OffsetDateTime
+        ),
+        "H": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.HOURS_24, 0, 24, get_hour, hours_24_setter, OffsetDateTime
+        ),
+        "m": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.MINUTES, 0, 59, get_minute, minutes_setter, OffsetDateTime
+        ),
+        "s": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.SECONDS, 0, 59, get_second, seconds_setter, OffsetDateTime
+        ),
+        "f": _TimePatternHelper._create_fraction_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        "F": _TimePatternHelper._create_fraction_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        "t": _TimePatternHelper._create_am_pm_handler(get_hour, am_pm_setter),
+        "c": _DatePatternHelper._create_calendar_handler(get_calendar, calendar_setter),
+        "g": _DatePatternHelper._create_era_handler(get_era, date_bucket_from_bucket),
+        "o": handle_offset,
+        "l": handle_l,
+    }
+
+    @classmethod
+    def _ctor(cls, template_value: OffsetDateTime, two_digit_year_max: int) -> _OffsetDateTimePatternParser:
+        _Preconditions._check_argument_range("two_digit_year_max", two_digit_year_max, 0, 99)
+        self = super().__new__(cls)
+        self.__template_value = template_value
+        self.__two_digit_year_max = two_digit_year_max
+        return self
+
+    def parse_pattern(self, pattern_text: str, format_info: _PyodaFormatInfo) -> IPattern[OffsetDateTime]:
+        # Nullity check is performed in OffsetDateTimePattern.
+        if len(pattern_text) == 0:
+            raise InvalidPatternError(_TextErrorMessages.FORMAT_STRING_EMPTY)
+
+        # Handle standard patterns
+        if len(pattern_text) == 1:
+            match pattern_text:
+                case "G":
+                    return OffsetDateTimePattern._Patterns._general_iso_pattern_impl
+                case "o":
+                    return OffsetDateTimePattern._Patterns._extended_iso_pattern_impl
+                case "r":
+                    return OffsetDateTimePattern._Patterns._full_roundtrip_pattern_impl
+                case _:
+                    raise InvalidPatternError(
+                        _TextErrorMessages.UNKNOWN_STANDARD_FORMAT, pattern_text, OffsetDateTime.__name__
+                    )
+
+        def bucket_provider() -> _ParseBucket[OffsetDateTime]:
+            return _OffsetDateTimeParseBucket._ctor(self.__template_value, self.__two_digit_year_max)
+
+        pattern_builder = _SteppedPatternBuilder[OffsetDateTime](format_info, bucket_provider)
+        pattern_builder._parse_custom_pattern(pattern_text, self.__pattern_character_handlers)
+        pattern_builder._validate_used_fields()
+        # Need to reconstruct the template value from the bits...
+        return pattern_builder._build(self.__template_value)
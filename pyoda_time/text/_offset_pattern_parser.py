@@ -53,7 +53,7 @@ class _OffsetParseBucket(_ParseBucket[Offset]):
         )
         if self._is_negative:
             seconds = -seconds
-        return ParseResult[Offset].for_value(Offset.from_seconds(seconds))
+        return ParseResult.for_value(Offset.from_seconds(seconds))
 
 
 @_sealed
@@ -95,7 +95,7 @@ class _OffsetPatternParser(_IPatternParser[Offset]):
     @staticmethod
     def __handle_colon(_: _PatternCursor, builder: _SteppedPatternBuilder[Offset]) -> None:
         builder._add_literal(
-            expected_text=builder._format_info.time_separator, failure=ParseResult[Offset]._time_separator_mismatch
+            expected_text=builder._format_info.time_separator, failure=ParseResult._time_separator_mismatch
         )
 
     @staticmethod
@@ -243,7 +243,7 @@ class _OffsetPatternParser(_IPatternParser[Offset]):
 
         def parse(self, text: str) -> ParseResult[Offset]:
             if text == "Z":
-                return ParseResult[Offset].for_value(Offset.zero)
+                return ParseResult.for_value(Offset.zero)
             return self.__full_pattern.parse(text)
 
         def format(self, value: Offset) -> str:
@@ -254,7 +254,7 @@ class _OffsetPatternParser(_IPatternParser[Offset]):
         def parse_partial(self, cursor: _ValueCursor) -> ParseResult[Offset]:
             if cursor.current == "Z":
                 cursor.move_next()
-                return ParseResult[Offset].for_value(Offset.zero)
+                return ParseResult.for_value(Offset.zero)
             return self.__full_pattern.parse_partial(cursor)
 
         def append_format(self, value: Offset, builder: StringBuilder) -> StringBuilder:
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, final, overload
 
 from ..utility._csharp_compatibility import _private, _sealed
 from ..utility._preconditions import _Preconditions
+from ._text_cursor import _TextCursor
 from ._text_error_messages import _TextErrorMessages
 from ._unparsable_value_error import UnparsableValueError
 
@@ -20,6 +21,45 @@ if TYPE_CHECKING:
     from ._value_cursor import _ValueCursor
 
 
+@final
+@_sealed
+class _ParseError:
+    """The cause of a parse failure, used as the exception provider of a failed ``ParseResult``.
+
+    Parsing often fails without the exception ever being requested (for example when a composite pattern moves on to
+    its next pattern, or when only ``success`` is checked), so rather than formatting the message up front, this holds
+    just the message format string and its parameters along with the text being parsed and the position of the cursor.
+    The message is only formatted, and the exception only created, when the failure is called.
+    """
+
+    __slots__ = ("__index", "__message", "__parameters", "__text")
+
+    def __init__(self, message: str, parameters: tuple[Any, ...], text: str | None, index: int | None) -> None:
+        """Creates a failure.
+
+        :param message: The format string for the detail of the message, from ``_TextErrorMessages``.
+        :param parameters: The parameters for ``message``.
+        :param text: The text being parsed, or ``None`` if the message shouldn't include it.
+        :param index: The index of the cursor within ``text`` when the failure occurred, or ``None`` if the failure
+            was found after the whole text was parsed.
+        """
+        self.__message = message
+        self.__parameters = parameters
+        self.__text = text
+        self.__index = index
+
+    def __call__(self) -> Exception:
+        detail_message = self.__message.format(*self.__parameters)
+        if self.__text is None:
+            return UnparsableValueError(detail_message)
+        if self.__index is None:
+            overall_message = _TextErrorMessages.UNPARSABLE_VALUE_POST_PARSE.format(detail_message, self.__text)
+        else:
+            position = _TextCursor._describe_position(self.__text, self.__index)
+            overall_message = _TextErrorMessages.UNPARSABLE_VALUE.format(detail_message, position)
+        return UnparsableValueError(overall_message)
+
+
 class _ParseResultMeta(type):
     @property
     @functools.cache
@@ -39,7 +79,7 @@ class _ParseResultMeta(type):
         # operator is not implemented for ParseResult, and equality
         # checks fall back to default object.__eq__() behaviour.
         return ParseResult._ctor(
-            exception_provider=functools.partial(UnparsableValueError, _TextErrorMessages.FORMAT_ONLY_PATTERN),
+            exception_provider=_ParseError(_TextErrorMessages.FORMAT_ONLY_PATTERN, (), None, None),
             continue_with_multiple=True,
         )
 
@@ -50,11 +90,12 @@ class _ParseResultMeta(type):
 class ParseResult[T](metaclass=_ParseResultMeta):
     """The result of a parse operation."""
 
-    # Invariant: exactly one of value or exceptionProvider is null.
-    __value: T | None = None
-    __exception_provider: Callable[[], Exception] | None = None
+    __slots__ = ("__continue_after_error_with_multiple_formats", "__exception_provider", "__value")
 
-    __continue_after_error_with_multiple_formats: bool = False
+    # Invariant: exactly one of value or exceptionProvider is null.
+    __value: T | None
+    __exception_provider: Callable[[], Exception] | None
+    __continue_after_error_with_multiple_formats: bool
 
     @property
     def _continue_after_error_with_multiple_formats(self) -> bool:
@@ -73,17 +114,29 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         # but we need this one to be accessible to the metaclass
         # for @property usage.
 
-        if (value and exception_provider) or (value is None and exception_provider is None):
+        if (value is None) == (exception_provider is None):
             raise RuntimeError("Exactly one of value and exception_provider can be specified")
 
         self = super().__new__(cls)
+        self.__value = value
+        self.__exception_provider = exception_provider
+        self.__continue_after_error_with_multiple_formats = exception_provider is not None and continue_with_multiple
+        return self
 
-        if value:
-            self.__value = value
-        elif exception_provider:
-            self.__exception_provider = exception_provider
-            self.__continue_after_error_with_multiple_formats = continue_with_multiple
-
+    @classmethod
+    def __for_error(
+        cls,
+        message: str,
+        parameters: tuple[Any, ...],
+        text: str | None,
+        index: int | None,
+        continue_with_multiple: bool,
+    ) -> ParseResult[T]:
+        """Produces a failure whose exception is only created when requested; see ``_ParseError``."""
+        self = super().__new__(cls)
+        self.__value = None
+        self.__exception_provider = _ParseError(message, parameters, text, index)
+        self.__continue_after_error_with_multiple_formats = continue_with_multiple
         return self
 
     @property
@@ -107,7 +160,7 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         :return: The exception indicating the cause of the parse failure.
         :raises RuntimeError: The parse operation succeeded.
         """
-        if self.__exception_provider:
+        if self.__exception_provider is not None:
             return self.__exception_provider()
         raise RuntimeError("Parse operation succeeded, so no exception is available")
 
@@ -131,7 +184,7 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         :param failure_value: The "default" value to set in ``result`` if parsing failed.
         :return: A two-tuple of a boolean representing success, and either the parsed value or the default value.
         """
-        return (self.success, self.value) if self.success else (self.success, failure_value)
+        return (True, self.get_value_or_throw()) if self.__exception_provider is None else (False, failure_value)
 
     @property
     def success(self) -> bool:
@@ -150,10 +203,12 @@ class ParseResult[T](metaclass=_ParseResultMeta):
             the value in this result, or with the same error as this result.
         """
         _Preconditions._check_not_null(projection, "projection")
+        # Runtime subscripting of a generic class creates (or looks up) an alias object, so it's avoided here and in
+        # the other methods which are called for every parse.
         return (
-            ParseResult[TTarget].for_value(projection(self.value))
+            ParseResult.for_value(projection(self.value))
             if self.success
-            else ParseResult[TTarget]._ctor(
+            else ParseResult._ctor(
                 exception_provider=self.__exception_provider,
                 continue_with_multiple=self._continue_after_error_with_multiple_formats,
             )
@@ -163,7 +218,7 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         # TODO: docstring
         if self.success:
             raise RuntimeError("convert_error should not be called on a successful parse result")
-        return ParseResult[TTarget]._ctor(
+        return ParseResult._ctor(
             exception_provider=self.__exception_provider,
             continue_with_multiple=self.__continue_after_error_with_multiple_formats,
         )
@@ -177,7 +232,12 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         :param value: The successfully parsed value.
         :return: A ParseResult representing a successful parsing operation.
         """
-        return cls._ctor(value)
+        # This is called for every successful parse, so it skips the checks in _ctor.
+        self = super().__new__(cls)
+        self.__value = value
+        self.__exception_provider = None
+        self.__continue_after_error_with_multiple_formats = False
+        return self
 
     @classmethod
     def for_exception(cls: type[ParseResult[T]], exception_provider: Callable[[], Exception]) -> ParseResult[T]:
@@ -198,12 +258,7 @@ class ParseResult[T](metaclass=_ParseResultMeta):
 
     @classmethod
     def _for_invalid_value_post_parse(cls, text: str, format_string: str, *args: Any) -> ParseResult[T]:
-        def expection_provider() -> Exception:
-            detail_message = format_string.format(*args)
-            overall_message = _TextErrorMessages.UNPARSABLE_VALUE_POST_PARSE.format(detail_message, text)
-            return UnparsableValueError(overall_message)
-
-        return cls._for_invalid_value(expection_provider)
+        return cls.__for_error(format_string, args, text, None, True)
 
     @classmethod
     @overload
@@ -217,26 +272,13 @@ class ParseResult[T](metaclass=_ParseResultMeta):
     def _for_invalid_value(
         cls, cursor_or_exception_provider: _ValueCursor | Callable[[], Exception], *args: Any
     ) -> ParseResult[T]:
-        from ._value_cursor import _ValueCursor
-
-        exception_provider: Callable[[], Exception]
-
-        if isinstance(cursor_or_exception_provider, _ValueCursor):
-            cursor: _ValueCursor = cursor_or_exception_provider
-            format_string: str = args[0]
-            parameters = args[1:]
-            detail_message = format_string.format(*parameters)
-            overall_message = _TextErrorMessages.UNPARSABLE_VALUE.format(detail_message, cursor)
-
-            def exception_provider() -> Exception:
-                return UnparsableValueError(overall_message)
-
-        elif callable(cursor_or_exception_provider):
-            exception_provider = cursor_or_exception_provider
-        else:
-            raise TypeError(f"Expected cursor or exception_provider, got {type(cursor_or_exception_provider)}")
-
-        return cls._ctor(exception_provider=exception_provider, continue_with_multiple=True)
+        if isinstance(cursor_or_exception_provider, _TextCursor):
+            # The cursor moves on after this, so its position is recorded now.
+            cursor = cursor_or_exception_provider
+            return cls.__for_error(args[0], args[1:], cursor.value, cursor.index, True)
+        if callable(cursor_or_exception_provider):
+            return cls._ctor(exception_provider=cursor_or_exception_provider, continue_with_multiple=True)
+        raise TypeError(f"Expected cursor or exception_provider, got {type(cursor_or_exception_provider)}")
 
     @classmethod
     def _argument_null(cls, parameter: str) -> ParseResult[T]:
@@ -255,11 +297,7 @@ class ParseResult[T](metaclass=_ParseResultMeta):
         """Special case: it's a fault with the value, but we still don't want to continue with multiple patterns.
         Also, there's no point in including the text.
         """
-
-        def exception_provider() -> Exception:
-            return UnparsableValueError(_TextErrorMessages.VALUE_STRING_EMPTY)
-
-        return cls._ctor(exception_provider=exception_provider, continue_with_multiple=False)
+        return cls.__for_error(_TextErrorMessages.VALUE_STRING_EMPTY, (), None, None, False)
 
     @classmethod
     def _extra_value_characters(cls, cursor: _ValueCursor, remainder: str) -> ParseResult[T]:
@@ -0,0 +1,205 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, final
+
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._annual_date_pattern import AnnualDatePattern
+from pyoda_time.text._duration_pattern import DurationPattern
+from pyoda_time.text._instant_pattern import InstantPattern
+from pyoda_time.text._local_date_pattern import LocalDatePattern
+from pyoda_time.text._local_date_time_pattern import LocalDateTimePattern
+from pyoda_time.text._local_time_pattern import LocalTimePattern
+from pyoda_time.text._offset_date_time_pattern import OffsetDateTimePattern
+from pyoda_time.text._offset_pattern import OffsetPattern
+from pyoda_time.text._zoned_date_time_pattern import ZonedDateTimePattern
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from pyoda_time._compatibility._culture_info import CultureInfo
+    from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+    from pyoda_time.utility._cache import _CacheStatistics
+
+
+@final
+@_sealed
+@_private
+class PatternCacheStatistics:
+    """A snapshot of the counters of the cache of parsed patterns for one pattern type and culture, as returned by
+    ``PatternCache.statistics``.
+
+    The counters are those at the time of the call; they are not updated afterwards.
+    """
+
+    __hits: int
+    __misses: int
+    __size: int
+    __capacity: int
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of patterns which were found in the cache rather than being parsed.
+
+        :return: The number of patterns which were found in the cache.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of patterns which had to be parsed (and were then cached).
+
+        :return: The number of patterns which had to be parsed.
+        """
+        return self.__misses
+
+    @property
+    def size(self) -> int:
+        """Gets the number of patterns in the cache.
+
+        :return: The number of patterns in the cache.
+        """
+        return self.__size
+
+    @property
+    def capacity(self) -> int:
+        """Gets the maximum number of patterns in the cache.
+
+        :return: The maximum number of patterns in the cache.
+        """
+        return self.__capacity
+
+    @property
+    def lookups(self) -> int:
+        """Gets the total number of lookups, i.e. the sum of ``hits`` and ``misses``.
+
+        :return: The total number of lookups.
+        """
+        return self.__hits + self.__misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Gets the proportion of lookups which were found in the cache, or 0.0 if there have been no lookups.
+
+        A low ratio with ``size`` equal to ``capacity`` indicates that the application uses more patterns than the cache
+        holds; see ``PatternCache.capacity``.
+
+        :return: The proportion of lookups which were found in the cache.
+        """
+        lookups = self.lookups
+        return self.__hits / lookups if lookups else 0.0
+
+    @classmethod
+    def _ctor(cls, statistics: _CacheStatistics) -> PatternCacheStatistics:
+        self = super().__new__(cls)
+        self.__hits = statistics.hits
+        self.__misses = statistics.misses
+        self.__size = statistics.size
+        self.__capacity = statistics.capacity
+        return self
+
+    def __repr__(self) -> str:
+        return (
+            f"PatternCacheStatistics(hits={self.__hits}, misses={self.__misses}, size={self.__size}, "
+            f"capacity={self.__capacity}, hit_ratio={self.hit_ratio:.3f})"
+        )
+
+
+@final
+@_sealed
+class PatternCache:
+    """The caches of parsed patterns for a single culture.
+
+    Creating a pattern with the default template value (e.g. ``LocalDatePattern.create("dd/MM/uuuu", culture)``) looks
+    the pattern text up in a cache belonging to the culture and pattern type, and only parses it if it isn't there.
+    Each of these caches holds up to ``capacity`` patterns (50 by default, as in Noda Time), evicting the least recently
+    used pattern when it is full. Earlier versions of Pyoda Time never evicted patterns, so an application which
+    creates more than 50 distinct patterns of one type for a culture may need to raise the capacity to avoid parsing
+    them repeatedly; ``statistics`` shows whether that is happening.
+
+    Patterns are only cached for read-only cultures, such as ``CultureInfo.invariant_culture`` and those returned by
+    ``CultureInfo.get_culture_info``. The settings of the caches belong to the culture, and apply to every
+    ``PatternCache`` for it.
+    """
+
+    __PARSERS: Final[dict[type[Any], Callable[[_PyodaFormatInfo], _FixedFormatInfoPatternParser[Any]]]] = {
+        AnnualDatePattern: lambda format_info: format_info._annual_date_pattern_parser,
+        DurationPattern: lambda format_info: format_info._duration_pattern_parser,
+        InstantPattern: lambda format_info: format_info._instant_pattern_parser,
+        LocalDatePattern: lambda format_info: format_info._local_date_pattern_parser,
+        LocalDateTimePattern: lambda format_info: format_info._local_date_time_pattern_parser,
+        LocalTimePattern: lambda format_info: format_info._local_time_pattern_parser,
+        OffsetDateTimePattern: lambda format_info: format_info._offset_date_time_pattern_parser,
+        OffsetPattern: lambda format_info: format_info._offset_pattern_parser,
+        ZonedDateTimePattern: lambda format_info: format_info._zoned_date_time_pattern_parser,
+    }
+
+    def __init__(self, culture_info: CultureInfo) -> None:
+        """Gets the pattern caches for the given culture.
+
+        :param culture_info: The culture whose pattern caches to use.
+        :raises ValueError: ``culture_info`` is not read-only, so patterns for it are not cached.
+        """
+        _Preconditions._check_not_null(culture_info, "culture_info")
+        _Preconditions._check_argument(
+            culture_info.is_read_only, "culture_info", "Patterns are only cached for read-only cultures"
+        )
+        self.__format_info: Final[_PyodaFormatInfo] = _PyodaFormatInfo._get_format_info(culture_info)
+
+    @property
+    def culture_info(self) -> CultureInfo:
+        """Gets the culture whose pattern caches this object uses.
+
+        :return: The culture whose pattern caches this object uses.
+        """
+        return self.__format_info.culture_info
+
+    @property
+    def capacity(self) -> int:
+        """Gets or sets the maximum number of patterns cached for each pattern type for this culture.
+
+        Reducing the capacity evicts the least recently used patterns immediately.
+
+        :return: The maximum number of patterns cached for each pattern type.
+        """
+        return self.__format_info._pattern_cache_size
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        self.__format_info._pattern_cache_size = value
+
+    def precompile(self, pattern_type: type[Any], patterns: Iterable[str]) -> None:
+        """Parses and caches the given pattern text values, so that creating patterns from them later doesn't parse
+        them.
+
+        This is intended for use at startup, with the patterns an application is known to use. Patterns beyond the
+        capacity of the cache evict the least recently used ones, as usual.
+
+        :param pattern_type: The pattern class to parse the patterns for, such as ``LocalDatePattern``.
+        :param patterns: The pattern text values to parse.
+        :raises ValueError: ``pattern_type`` is not a pattern class whose patterns are cached.
+        :raises InvalidPatternError: One of the patterns is invalid. The patterns before it are still cached.
+        """
+        self.__get_parser(pattern_type)._precompile(patterns)
+
+    def statistics(self, pattern_type: type[Any]) -> PatternCacheStatistics:
+        """Returns the hit and miss counts, size and capacity of the cache of patterns of the given type for this
+        culture.
+
+        :param pattern_type: The pattern class to return the statistics for, such as ``LocalDatePattern``.
+        :return: A snapshot of the counters of the cache.
+        :raises ValueError: ``pattern_type`` is not a pattern class whose patterns are cached.
+        """
+        return PatternCacheStatistics._ctor(self.__get_parser(pattern_type)._cache_statistics)
+
+    def __get_parser(self, pattern_type: type[Any]) -> _FixedFormatInfoPatternParser[Any]:
+        get_parser = self.__PARSERS.get(pattern_type)
+        _Preconditions._check_argument(
+            get_parser is not None, "pattern_type", "{} is not a pattern class whose patterns are cached", pattern_type
+        )
+        assert get_parser is not None
+        return get_parser(self.__format_info)
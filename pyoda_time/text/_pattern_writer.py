@@ -0,0 +1,51 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Support for formatting values directly into a text stream.
+
+``format_to`` and ``format_many`` on the pattern classes delegate to the functions here. ``format_many`` formats
+values in chunks, joining each chunk and writing it to the stream with a single call, so the cost of a ``write`` call
+is shared by many values, and the text for all of the values is never held in memory at once.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Final
+
+from ..utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from _typeshed import SupportsWrite
+
+    from ._i_pattern import IPattern
+
+# The number of values formatted before they are written to the stream.
+_CHUNK_SIZE: Final[int] = 1024
+
+
+def _format_to[T](pattern: IPattern[T], value: T, writer: SupportsWrite[str]) -> None:
+    """Formats a single value with the given pattern, writing the text to ``writer``."""
+    _Preconditions._check_not_null(writer, "writer")
+    writer.write(pattern.format(value))
+
+
+def _format_many[T](pattern: IPattern[T], values: Iterable[T], writer: SupportsWrite[str], separator: str) -> int:
+    """Formats each value with the given pattern, writing the text to ``writer`` with ``separator`` between values.
+
+    :return: The number of values written.
+    """
+    _Preconditions._check_not_null(values, "values")
+    _Preconditions._check_not_null(writer, "writer")
+    _Preconditions._check_not_null(separator, "separator")
+    format_value = pattern.format
+    iterator = iter(values)
+    count = 0
+    while chunk := [format_value(value) for value in islice(iterator, _CHUNK_SIZE)]:
+        if count:
+            writer.write(separator)
+        writer.write(separator.join(chunk))
+        count += len(chunk)
+    return count
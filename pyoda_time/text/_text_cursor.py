@@ -56,11 +56,16 @@ class _TextCursor(ABC):
         return self.value[self.index :]
 
     def __str__(self) -> str:
-        if self.index <= 0:
-            return f"^{self.value}"
-        if self.index >= self.length:
-            return f"{self.value}^"
-        return self.value[: self.index] + "^" + self.value[self.index :]
+        return self._describe_position(self.value, self.index)
+
+    @staticmethod
+    def _describe_position(value: str, index: int) -> str:
+        """Returns the given string with a ``^`` inserted at the given index, as used in the ``str()`` of a cursor."""
+        if index <= 0:
+            return f"^{value}"
+        if index >= len(value):
+            return f"{value}^"
+        return value[:index] + "^" + value[index:]
 
     def peek_next(self) -> str:
         """Eturns the next character if there is one or `_NUL` if there isn't."""
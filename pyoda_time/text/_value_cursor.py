@@ -1,13 +1,20 @@
 # Copyright 2024 The Pyoda Time Authors. All rights reserved.
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
-import math
-from typing import final
+import re
+from typing import Final, final
 
 from ..utility._csharp_compatibility import _CsharpConstants, _sealed
 from ._parse_result import ParseResult
 from ._text_cursor import _TextCursor
 
+# Matches a (possibly empty) run of ASCII digits. Unlike ``\d``, or ``str.isdigit()`` alone, this doesn't match digits
+# from other scripts, which Noda Time doesn't parse either.
+_ASCII_DIGITS: Final[re.Pattern[str]] = re.compile("[0-9]*")
+
+# The longest run of digits which can't overflow a signed 64-bit integer.
+_MAX_SAFE_INT64_DIGITS: Final[int] = 18
+
 
 @final
 @_sealed
@@ -83,9 +90,19 @@ class _ValueCursor(_TextCursor):
             value is non-null.
         """
         # TODO: unchecked
-        result = 0
         start_index = self.index
         negative = self.current == "-"
+        # Fast path: a run of digits short enough that it can't overflow is converted in one go. Anything else
+        # (including a missing number and an overflow) is left to the digit-by-digit loop below, which determines the
+        # exact failure and where the cursor is left.
+        digits_index = start_index + 1 if negative else start_index
+        if 0 <= digits_index < self.length:
+            digits = self.__ascii_digits(digits_index, digits_index + _MAX_SAFE_INT64_DIGITS + 1)
+            if 0 < len(digits) <= _MAX_SAFE_INT64_DIGITS:
+                self.move(digits_index + len(digits))
+                return None, -int(digits) if negative else int(digits)
+
+        result = 0
         if negative:
             if not self.move_next():
                 self.move(start_index)
@@ -143,21 +160,13 @@ class _ValueCursor(_TextCursor):
             guaranteed to be anything specific if the return value is false.
         """
         # TODO: unchecked
-        result = 0
         local_index = self.index
-        max_index = local_index + maximum_digits
-        max_index = min(self.length, max_index)
-        while local_index < max_index:
-            digit = self.value[local_index]
-            if not digit.isdigit() or not "0" <= digit <= "9":
-                break
-            result = result * 10 + int(digit)
-            local_index += 1
-        count: int = local_index - self.index
+        digits = self.__ascii_digits(local_index, local_index + maximum_digits)
+        count: int = len(digits)
         if count < minimum_digits:
-            return False, result
-        self.move(local_index)
-        return True, result
+            return False, 0
+        self.move(local_index + count)
+        return True, int(digits) if count else 0
 
     def _parse_fraction(self, maximum_digits: int, scale: int, minimum_digits: int) -> tuple[bool, int]:
         """Parses digits at the current point in the string as a fractional value.
@@ -172,26 +181,32 @@ class _ValueCursor(_TextCursor):
 
         # TODO: Preconditions.DebugCheckArgument
 
-        result = 0
         local_index = self.index
         min_index = local_index + minimum_digits
         if min_index > self.length:
             # If we don't have all the digits we're meant to have, we can't possibly succeed.
-            return False, result
-        max_index = min(local_index + maximum_digits, self.length)
-        while local_index < max_index:
-            digit = self.value[local_index]
-            if not digit.isdigit() or not ("0" <= digit <= "9"):
-                break
-            result = result * 10 + int(digit)
-            local_index += 1
-        count: int = local_index - self.index
+            return False, 0
+        digits = self.__ascii_digits(local_index, local_index + maximum_digits)
+        count: int = len(digits)
         # Couldn't parse the minimum number of digits required?
         if count < minimum_digits:
-            return False, result
-        result = int(result * math.pow(10.0, scale - count))
-        self.move(local_index)
-        return True, result
+            return False, 0
+        self.move(local_index + count)
+        return True, int(digits) * 10 ** (scale - count) if count else 0
+
+    def __ascii_digits(self, start_index: int, end_index: int) -> str:
+        """Returns the run of ASCII digits starting at ``start_index`` and ending no later than ``end_index``, which may
+        be empty.
+
+        This scans the run in a single call rather than a character at a time, as the digits are almost always a
+        fixed-width field; the slice is checked first, falling back to a regex for a shorter run.
+        """
+        text = self.value[start_index:end_index]
+        # str.isdigit() accepts digits from other scripts, so the ASCII check is needed too.
+        if text.isdigit() and text.isascii():
+            return text
+        match = _ASCII_DIGITS.match(self.value, start_index, end_index)
+        return match.group() if match else ""
 
     def __get_digit(self) -> int:
         """Gets the integer value of the current digit character, or -1 for "not a digit".
@@ -0,0 +1,541 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, _ProtocolMeta, cast, final
+
+from pyoda_time._local_date_time import LocalDateTime
+from pyoda_time._zoned_date_time import ZonedDateTime
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._batch_parse_result import BatchParseResult
+from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._iso_patterns import _IsoZonedDateTimePattern
+from pyoda_time.text._local_date_pattern import LocalDatePattern
+from pyoda_time.text._pattern_writer import _format_many, _format_to
+from pyoda_time.text.patterns._pattern_bcl_support import _PatternBclSupport
+from pyoda_time.time_zones._resolvers import Resolvers
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from _typeshed import SupportsWrite
+
+    from pyoda_time._calendar_system import CalendarSystem
+    from pyoda_time._compatibility._culture_info import CultureInfo
+    from pyoda_time._compatibility._string_builder import StringBuilder
+    from pyoda_time._i_date_time_zone_provider import IDateTimeZoneProvider
+    from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+    from pyoda_time.text._parse_result import ParseResult
+    from pyoda_time.time_zones import ZoneLocalMappingResolver
+
+
+class _ZonedDateTimePatternMeta(type):
+    __DEFAULT_FORMAT_PATTERN: Final[str] = "G"  # General invariant ISO
+    __pattern_bcl_support: _PatternBclSupport[ZonedDateTime] | None = None
+    __default_template_value: ZonedDateTime | None = None
+
+    @property
+    def _DEFAULT_TEMPLATE_VALUE(self) -> ZonedDateTime:
+        # Unlike the other patterns, this can't be a class attribute, as creating a value in UTC requires the time zone
+        # machinery, which can't be imported while the pyoda_time package itself is being imported.
+        if self.__default_template_value is None:
+            self.__default_template_value = LocalDateTime(2000, 1, 1, 0, 0).in_utc()
+        return self.__default_template_value
+
+    @property
+    def _bcl_support(self) -> _PatternBclSupport[ZonedDateTime]:
+        if self.__pattern_bcl_support is None:
+
+            def pattern_parser(format_info: _PyodaFormatInfo) -> _FixedFormatInfoPatternParser[ZonedDateTime]:
+                return format_info._zoned_date_time_pattern_parser
+
+            self.__pattern_bcl_support = _PatternBclSupport(self.__DEFAULT_FORMAT_PATTERN, pattern_parser)
+        return self.__pattern_bcl_support
+
+    @property
+    def general_format_only_iso(cls) -> ZonedDateTimePattern:
+        """Gets a zoned local date/time pattern based on ISO-8601 (down to the second) including offset from UTC and
+        zone ID. It corresponds to a custom pattern of "uuuu'-'MM'-'dd'T'HH':'mm':'ss z '('o<g>')'".
+
+        The calendar system is not formatted as part of this pattern, and it cannot be used for parsing, as no time
+        zone provider is included. Call ``with_zone_provider`` on the value of this property to obtain a pattern which
+        can be used for parsing. This pattern corresponds to the 'G' standard pattern.
+
+        :return: A zoned local date/time pattern based on ISO-8601 (down to the second) including offset from UTC and
+            zone ID.
+        """
+        return ZonedDateTimePattern._Patterns._general_format_only_pattern_impl
+
+    @property
+    def extended_format_only_iso(cls) -> ZonedDateTimePattern:
+        """Returns an invariant zoned date/time pattern based on ISO-8601 (down to the nanosecond) including offset
+        from UTC and zone ID. It corresponds to a custom pattern of
+        "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF z '('o<g>')'".
+
+        The calendar system is not formatted as part of this pattern, and it cannot be used for parsing, as no time
+        zone provider is included. Call ``with_zone_provider`` on the value of this property to obtain a pattern which
+        can be used for parsing. This pattern corresponds to the 'F' standard pattern.
+
+        :return: An invariant zoned date/time pattern based on ISO-8601 (down to the nanosecond) including offset from
+            UTC and zone ID.
+        """
+        return ZonedDateTimePattern._Patterns._extended_format_only_pattern_impl
+
+
+class _CombinedMeta(_ProtocolMeta, _ZonedDateTimePatternMeta):
+    """Intermediary class which prevents a metaclass conflict."""
+
+
+@_sealed
+@final
+@_private
+class ZonedDateTimePattern(IPattern[ZonedDateTime], metaclass=_CombinedMeta):
+    """Represents a pattern for parsing and formatting ``ZonedDateTime`` values."""
+
+    __pattern_text: str
+    __format_info: _PyodaFormatInfo
+    __underlying_pattern: _IPartialPattern[ZonedDateTime]
+    __template_value: ZonedDateTime
+    __resolver: ZoneLocalMappingResolver | None
+    __zone_provider: IDateTimeZoneProvider | None
+    __two_digit_year_max: int
+
+    class _PatternsMeta(type):
+        __general_format_only_pattern_impl: ZonedDateTimePattern | None = None
+        __extended_format_only_pattern_impl: ZonedDateTimePattern | None = None
+
+        @property
+        def _general_format_only_pattern_impl(self) -> ZonedDateTimePattern:
+            if self.__general_format_only_pattern_impl is None:
+                self.__general_format_only_pattern_impl = ZonedDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'ss z '('o<g>')'", None
+                )
+            return self.__general_format_only_pattern_impl
+
+        @property
+        def _extended_format_only_pattern_impl(self) -> ZonedDateTimePattern:
+            if self.__extended_format_only_pattern_impl is None:
+                self.__extended_format_only_pattern_impl = ZonedDateTimePattern.create_with_invariant_culture(
+                    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF z '('o<g>')'", None
+                )
+            return self.__extended_format_only_pattern_impl
+
+    class _Patterns(metaclass=_PatternsMeta):
+        pass
+
+    @property
+    def _underlying_pattern(self) -> _IPartialPattern[ZonedDateTime]:
+        """Returns the pattern that this object delegates to.
+
+        Mostly useful to avoid this public class implementing an internal interface.
+        """
+        return self.__underlying_pattern
+
+    @property
+    def pattern_text(self) -> str:
+        """Gets the pattern text for this pattern, as supplied on creation.
+
+        :return: The pattern text for this pattern, as supplied on creation.
+        """
+        return self.__pattern_text
+
+    @property
+    def template_value(self) -> ZonedDateTime:
+        """Gets the value used as a template for parsing: any field values unspecified in the pattern are taken from
+        the template.
+
+        :return: The value used as a template for parsing.
+        """
+        return self.__template_value
+
+    @property
+    def resolver(self) -> ZoneLocalMappingResolver | None:
+        """Gets the resolver which is used to map local date/times to zoned date/times, handling skipped and ambiguous
+        times appropriately (where the offset isn't specified in the pattern).
+
+        This may be None, in which case the pattern can only be used for formatting (not parsing).
+
+        :return: The resolver which is used to map local date/times to zoned date/times.
+        """
+        return self.__resolver
+
+    @property
+    def zone_provider(self) -> IDateTimeZoneProvider | None:
+        """Gets the provider which is used to look up time zones when parsing a pattern which contains a time zone
+        identifier.
+
+        This may be None, in which case the pattern can only be used for formatting (not parsing).
+
+        :return: The provider which is used to look up time zones when parsing a pattern which contains a time zone
+            identifier.
+        """
+        return self.__zone_provider
+
+    @property
+    def two_digit_year_max(self) -> int:
+        """Maximum two-digit-year in the template to treat as the current century. If the value parsed is higher than
+        this, the result is adjusted to the previous century. This value defaults to 30. To create a pattern with a
+        different value, use ``with_two_digit_year_max``.
+
+        :return: The value used for the maximum two-digit-year, in the range 0-99 inclusive.
+        """
+        return self.__two_digit_year_max
+
+    @classmethod
+    def __ctor(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        template_value: ZonedDateTime,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        two_digit_year_max: int,
+        pattern: _IPartialPattern[ZonedDateTime],
+    ) -> ZonedDateTimePattern:
+        self = super().__new__(cls)
+        self.__pattern_text = pattern_text
+        self.__format_info = format_info
+        self.__template_value = template_value
+        self.__resolver = resolver
+        self.__zone_provider = zone_provider
+        self.__two_digit_year_max = two_digit_year_max
+        self.__underlying_pattern = pattern
+        return self
+
+    def parse(self, text: str) -> ParseResult[ZonedDateTime]:
+        """Parses the given text value according to the rules of this pattern.
+
+        This method never throws an exception (barring a bug in Pyoda Time itself). Even errors such as the argument
+        being null are wrapped in a parse result.
+
+        :param text: The text value to parse.
+        :return: The result of parsing, which may be successful or unsuccessful.
+        """
+        return self.__underlying_pattern.parse(text)
+
+    def parse_many(self, texts: Iterable[str]) -> BatchParseResult[ZonedDateTime]:
+        """Parses each of the given text values according to the rules of this pattern.
+
+        Failures are recorded by position in the result, and the exception for each failure is only created on
+        demand. Like ``parse``, this method never raises an exception for invalid text values.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_many(self.__underlying_pattern, texts)
+
+    def parse_column(self, texts: Sequence[str]) -> BatchParseResult[ZonedDateTime]:
+        """Parses each text value in the given sequence according to the rules of this pattern.
+
+        This behaves like ``parse_many``, but as the sequence can be indexed, the text values which fail to parse are
+        not copied into the result.
+
+        :param texts: The text values to parse.
+        :return: The result of parsing the text values, in the same order.
+        """
+        return BatchParseResult._parse_column(self.__underlying_pattern, texts)
+
+    def format(self, value: ZonedDateTime) -> str:
+        """Formats the given zoned date/time as text according to the rules of this pattern.
+
+        :param value: The zoned date/time to format.
+        :return: The zoned date/time formatted according to this pattern.
+        """
+        return self.__underlying_pattern.format(value)
+
+    def append_format(self, value: ZonedDateTime, builder: StringBuilder) -> StringBuilder:
+        """Formats the given value as text according to the rules of this pattern, appending to the given
+        ``StringBuilder``.
+
+        :param value: The value to format.
+        :param builder: The ``StringBuilder`` to append to.
+        :return: The builder passed in as ``builder``.
+        """
+        return self.__underlying_pattern.append_format(value, builder)
+
+    def format_to(self, value: ZonedDateTime, writer: SupportsWrite[str]) -> None:
+        """Formats the given zoned date/time as text according to the rules of this pattern, writing it to the given
+        text stream.
+
+        :param value: The zoned date/time to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        """
+        _format_to(self.__underlying_pattern, value, writer)
+
+    def format_many(self, values: Iterable[ZonedDateTime], writer: SupportsWrite[str], separator: str = "\n") -> int:
+        """Formats each of the given values as text according to the rules of this pattern, writing them to the given
+        text stream.
+
+        The text is buffered and written in chunks, rather than being written (or returned) value by value. No
+        separator is written before the first value or after the last one.
+
+        :param values: The values to format.
+        :param writer: The text stream (or any other object with a ``write`` method accepting a string) to write to.
+        :param separator: The text to write between consecutive values.
+        :return: The number of values written.
+        """
+        return _format_many(self.__underlying_pattern, values, writer, separator)
+
+    @classmethod
+    def _create(
+        cls,
+        pattern_text: str,
+        format_info: _PyodaFormatInfo,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        template_value: ZonedDateTime,
+        two_digit_year_max: int,
+    ) -> ZonedDateTimePattern:
+        """Creates a pattern for the given pattern text, format info, resolver, zone provider, template value and
+        two-digit-year maximum.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param format_info: The format info to use in the pattern
+        :param resolver: Resolver to apply when mapping local date/time values into the zone.
+        :param zone_provider: Time zone provider, used when parsing text which contains a time zone identifier.
+        :param template_value: Template value to use for unspecified fields
+        :param two_digit_year_max: Maximum two-digit-year in the template to treat as the current century.
+        :return: A pattern for parsing and formatting zoned date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        _Preconditions._check_not_null(pattern_text, "pattern_text")
+        _Preconditions._check_not_null(format_info, "format_info")
+        # Use the "fixed" parser for the common case of the default template value and no zone provider.
+        pattern: IPattern[ZonedDateTime]
+        if (
+            template_value == cls._DEFAULT_TEMPLATE_VALUE
+            and resolver is Resolvers.strict_resolver
+            and zone_provider is None
+            and two_digit_year_max == LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX
+        ):
+            pattern = format_info._zoned_date_time_pattern_parser._parse_pattern(pattern_text)
+        else:
+            from pyoda_time.text._zoned_date_time_pattern_parser import _ZonedDateTimePatternParser
+
+            pattern = _ZonedDateTimePatternParser._ctor(
+                template_value, resolver, zone_provider, two_digit_year_max
+            ).parse_pattern(pattern_text, format_info)
+        # If ParsePattern returns a standard pattern instance, we need to get the underlying partial pattern.
+        if isinstance(pattern, ZonedDateTimePattern):
+            pattern = pattern._underlying_pattern
+        partial_pattern: _IPartialPattern[ZonedDateTime] = cast(_IPartialPattern[ZonedDateTime], pattern)
+        partial_pattern = _IsoZonedDateTimePattern._wrap(
+            pattern_text, format_info, template_value, resolver, zone_provider, partial_pattern
+        )
+        return ZonedDateTimePattern.__ctor(
+            pattern_text, format_info, template_value, resolver, zone_provider, two_digit_year_max, partial_pattern
+        )
+
+    @classmethod
+    def create(
+        cls,
+        pattern_text: str,
+        culture_info: CultureInfo,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        template_value: ZonedDateTime | None = None,
+    ) -> ZonedDateTimePattern:
+        """Creates a pattern for the given pattern text, culture, resolver, time zone provider, and template value.
+
+        See the user guide for the available pattern text options.
+
+        If ``zone_provider`` is None, the resulting pattern can be used for formatting but not parsing.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param culture_info: The culture to use in the pattern
+        :param resolver: Resolver to apply when mapping local date/time values into the zone.
+        :param zone_provider: Time zone provider, used when parsing text which contains a time zone identifier.
+        :param template_value: Template value to use for unspecified fields. Defaults to midnight on 2000-01-01 in UTC
+            if not provided.
+        :return: A pattern for parsing and formatting zoned date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        if template_value is None:
+            template_value = cls._DEFAULT_TEMPLATE_VALUE
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo._get_format_info(culture_info),
+            resolver,
+            zone_provider,
+            template_value,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    @classmethod
+    def create_with_invariant_culture(
+        cls, pattern_text: str, zone_provider: IDateTimeZoneProvider | None
+    ) -> ZonedDateTimePattern:
+        """Creates a pattern for the given pattern text and time zone provider, using a strict resolver, the invariant
+        culture, and a default template value of midnight January 1st 2000 UTC.
+
+        The resolver is only used if the pattern text doesn't include an offset. If ``zone_provider`` is None, the
+        resulting pattern can be used for formatting but not parsing.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param zone_provider: Time zone provider, used when parsing text which contains a time zone identifier.
+        :return: A pattern for parsing and formatting zoned date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo.invariant_info,
+            Resolvers.strict_resolver,
+            zone_provider,
+            cls._DEFAULT_TEMPLATE_VALUE,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    @classmethod
+    def create_with_current_culture(
+        cls, pattern_text: str, zone_provider: IDateTimeZoneProvider | None
+    ) -> ZonedDateTimePattern:
+        """Creates a pattern for the given pattern text and time zone provider, using a strict resolver, the current
+        thread's current culture, and a default template value of midnight January 1st 2000 UTC.
+
+        The resolver is only used if the pattern text doesn't include an offset. If ``zone_provider`` is None, the
+        resulting pattern can be used for formatting but not parsing. Note that the current culture is captured at the
+        time this method is called - it is not captured at the point of parsing or formatting values.
+
+        :param pattern_text: Pattern text to create the pattern for
+        :param zone_provider: Time zone provider, used when parsing text which contains a time zone identifier.
+        :return: A pattern for parsing and formatting zoned date/times.
+        :raises InvalidPatternError: The pattern text was invalid.
+        """
+        return cls._create(
+            pattern_text,
+            _PyodaFormatInfo.current_info,
+            Resolvers.strict_resolver,
+            zone_provider,
+            cls._DEFAULT_TEMPLATE_VALUE,
+            LocalDatePattern._DEFAULT_TWO_DIGIT_YEAR_MAX,
+        )
+
+    def with_pattern_text(self, pattern_text: str) -> ZonedDateTimePattern:
+        """Creates a pattern for the given pattern text, with the same localization information, resolver, zone
+        provider, template value and two-digit-year maximum as this pattern.
+
+        :param pattern_text: The pattern text to use in the new pattern.
+        :return: A new pattern with the given pattern text.
+        """
+        return self._create(
+            pattern_text,
+            self.__format_info,
+            self.__resolver,
+            self.__zone_provider,
+            self.__template_value,
+            self.__two_digit_year_max,
+        )
+
+    def __with_format_info(self, format_info: _PyodaFormatInfo) -> ZonedDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified localization
+        information.
+
+        :param format_info: The localization information to use in the new pattern.
+        :return: A new pattern with the given localization information.
+        """
+        return self._create(
+            self.__pattern_text,
+            format_info,
+            self.__resolver,
+            self.__zone_provider,
+            self.__template_value,
+            self.__two_digit_year_max,
+        )
+
+    def with_culture(self, culture_info: CultureInfo) -> ZonedDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified culture.
+
+        :param culture_info: The culture to use in the new pattern.
+        :return: A new pattern with the given culture.
+        """
+        return self.__with_format_info(_PyodaFormatInfo._get_format_info(culture_info))
+
+    def with_resolver(self, resolver: ZoneLocalMappingResolver | None) -> ZonedDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified resolver.
+
+        :param resolver: The new local mapping resolver to use.
+        :return: A new pattern with the given resolver.
+        """
+        if self.__resolver is resolver:
+            return self
+        return self._create(
+            self.__pattern_text,
+            self.__format_info,
+            resolver,
+            self.__zone_provider,
+            self.__template_value,
+            self.__two_digit_year_max,
+        )
+
+    def with_zone_provider(self, zone_provider: IDateTimeZoneProvider | None) -> ZonedDateTimePattern:
+        """Creates a pattern for the same original pattern text as this pattern, but with the specified time zone
+        provider.
+
+        If ``zone_provider`` is None, the resulting pattern can be used for formatting but not parsing.
+
+        :param zone_provider: The new time zone provider to use.
+        :return: A new pattern with the given time zone provider.
+        """
+        if self.__zone_provider is zone_provider:
+            return self
+        return self._create(
+            self.__pattern_text,
+            self.__format_info,
+            self.__resolver,
+            zone_provider,
+            self.__template_value,
+            self.__two_digit_year_max,
+        )
+
+    def with_template_value(self, new_template_value: ZonedDateTime) -> ZonedDateTimePattern:
+        """Creates a pattern like this one, but with the specified template value.
+
+        :param new_template_value: The template value for the new pattern, used to fill in unspecified fields.
+        :return: A new pattern with the given template value.
+        """
+        return self._create(
+            self.__pattern_text,
+            self.__format_info,
+            self.__resolver,
+            self.__zone_provider,
+            new_template_value,
+            self.__two_digit_year_max,
+        )
+
+    def with_calendar(self, calendar: CalendarSystem) -> ZonedDateTimePattern:
+        """Creates a pattern like this one, but with the template value modified to use the specified calendar system.
+
+        Care should be taken in two (relatively rare) scenarios. Although the default template value is supported by all
+        Pyoda Time calendar systems, if a pattern is created with a different template value and then this method is
+        called with a calendar system which doesn't support that date, an exception will be thrown. Additionally, if the
+        pattern only specifies some date fields, it's possible that the new template value will not be suitable for all
+        values.
+
+        :param calendar: The calendar system to convert the template value into.
+        :return: A new pattern with a template value in the specified calendar system.
+        """
+        template_value = self.__template_value
+        return self.with_template_value(
+            ZonedDateTime(instant=template_value.to_instant(), zone=template_value.zone, calendar=calendar)
+        )
+
+    def with_two_digit_year_max(self, two_digit_year_max: int) -> ZonedDateTimePattern:
+        """Creates a pattern like this one, but with a different ``two_digit_year_max`` value.
+
+        :param two_digit_year_max: The value to use for ``two_digit_year_max`` in the new pattern,
+            in the range 0-99 inclusive.
+        :return: A new pattern with the specified maximum two-digit-year.
+        """
+        return self._create(
+            self.__pattern_text,
+            self.__format_info,
+            self.__resolver,
+            self.__zone_provider,
+            self.__template_value,
+            two_digit_year_max,
+        )
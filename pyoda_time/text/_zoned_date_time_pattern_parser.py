@@ -0,0 +1,494 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, final
+
+from pyoda_time._ambiguous_time_error import AmbiguousTimeError
+from pyoda_time._date_time_zone import DateTimeZone
+from pyoda_time._skipped_time_error import SkippedTimeError
+from pyoda_time._zoned_date_time import ZonedDateTime
+from pyoda_time.text import ParseResult
+from pyoda_time.text._invalid_pattern_exception import InvalidPatternError
+from pyoda_time.text._local_date_pattern_parser import _LocalDatePatternParser
+from pyoda_time.text._local_date_time_pattern_parser import _LocalDateTimeParseBucket
+from pyoda_time.text._local_time_pattern_parser import _LocalTimePatternParser
+from pyoda_time.text._offset_pattern import OffsetPattern
+from pyoda_time.text._parse_bucket import _ParseBucket
+from pyoda_time.text._text_error_messages import _TextErrorMessages
+from pyoda_time.text._zoned_date_time_pattern import ZonedDateTimePattern
+from pyoda_time.text.patterns._date_pattern_helper import _DatePatternHelper
+from pyoda_time.text.patterns._i_pattern_parser import _IPatternParser
+from pyoda_time.text.patterns._pattern_fields import _PatternFields
+from pyoda_time.text.patterns._stepped_pattern_builder import _SteppedPatternBuilder
+from pyoda_time.text.patterns._time_pattern_helper import _TimePatternHelper
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from pyoda_time._calendar_system import CalendarSystem
+    from pyoda_time._compatibility._string_builder import StringBuilder
+    from pyoda_time._i_date_time_zone_provider import IDateTimeZoneProvider
+    from pyoda_time._local_date import LocalDate
+    from pyoda_time._local_date_time import LocalDateTime
+    from pyoda_time._local_time import LocalTime
+    from pyoda_time._offset import Offset
+    from pyoda_time.calendars import Era
+    from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+    from pyoda_time.text._i_pattern import IPattern
+    from pyoda_time.text._value_cursor import _ValueCursor
+    from pyoda_time.text.patterns._pattern_cursor import _PatternCursor
+    from pyoda_time.time_zones import ZoneLocalMappingResolver
+
+
+@final
+@_sealed
+@_private
+class _ZonedDateTimeParseBucket(_ParseBucket[ZonedDateTime]):
+    _date: _LocalDatePatternParser._LocalDateParseBucket
+    _time: _LocalTimePatternParser._LocalTimeParseBucket
+    _zone: DateTimeZone
+    _offset: Offset
+    __resolver: ZoneLocalMappingResolver | None
+    __zone_provider: IDateTimeZoneProvider | None
+    __zone_ids: Sequence[str]
+
+    @classmethod
+    def _ctor(
+        cls,
+        template_value: ZonedDateTime,
+        two_digit_year_max: int,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        zone_ids: Sequence[str],
+    ) -> _ZonedDateTimeParseBucket:
+        self = super().__new__(cls)
+        self._date = _LocalDatePatternParser._LocalDateParseBucket._ctor(template_value.date, two_digit_year_max)
+        self._time = _LocalTimePatternParser._LocalTimeParseBucket._ctor(template_value.time_of_day)
+        self._zone = template_value.zone
+        self._offset = template_value.offset
+        self.__resolver = resolver
+        self.__zone_provider = zone_provider
+        self.__zone_ids = zone_ids
+        return self
+
+    def _parse_zone(self, value: _ValueCursor) -> ParseResult[ZonedDateTime] | None:
+        zone = self.__try_parse_fixed_zone(value) or self.__try_parse_provider_zone(value)
+        if zone is None:
+            return ParseResult._no_matching_zone_id(value)
+        self._zone = zone
+        return None
+
+    @staticmethod
+    def __try_parse_fixed_zone(value: _ValueCursor) -> DateTimeZone | None:
+        """Attempts to parse a fixed time zone from "UTC" with an optional offset, expressed as +HH, +HH:mm, +HH:mm:ss
+        or +HH:mm:ss.fff - i.e. the general format.
+
+        If it manages, it will move the cursor and return the zone. Otherwise, it will return null and the cursor will
+        remain where it was.
+        """
+        if value._compare_ordinal(DateTimeZone._UTC_ID) != 0:
+            return None
+        value.move(value.index + 3)
+        pattern = OffsetPattern.general_invariant._underlying_pattern
+        parse_result = pattern.parse_partial(value)
+        return DateTimeZone.for_offset(parse_result.value) if parse_result.success else DateTimeZone.utc
+
+    def __try_parse_provider_zone(self, value: _ValueCursor) -> DateTimeZone | None:
+        """Tries to parse a time zone ID from the provider.
+
+        Returns the zone on success (after moving the cursor to the end of the ID) or null on failure (leaving the
+        cursor where it was).
+        """
+        assert self.__zone_provider is not None
+        # The IDs from the provider are guaranteed to be in order (using ordinal comparisons).
+        # Use a binary search to find a match, then make sure it's the longest possible match.
+        ids = self.__zone_ids
+        lower_bound = 0  # Inclusive
+        upper_bound = len(ids)  # Exclusive
+        while lower_bound < upper_bound:
+            guess = (lower_bound + upper_bound) // 2
+            result = value._compare_ordinal(ids[guess])
+            if result < 0:
+                # Guess is later than our text: lower the upper bound
+                upper_bound = guess
+            elif result > 0:
+                # Guess is earlier than our text: raise the lower bound
+                lower_bound = guess + 1
+            else:
+                # We've found a match! But it may not be as long as it could be. Keep track of a "longest match so
+                # far" (starting with the match we've found), and keep looking through the IDs until we find an ID
+                # which doesn't start with that "longest match so far", at which point we know we're done.
+                #
+                # We can't just look through all the IDs from "guess" to "lower_bound" and stop when we hit a
+                # non-match against "value", because of situations like this:
+                # value=Etc/GMT-12
+                # guess=Etc/GMT-1
+                # IDs includes { Etc/GMT-1, Etc/GMT-10, Etc/GMT-11, Etc/GMT-12, Etc/GMT-13 }
+                # We can't simply stop when we hit Etc/GMT-10, as otherwise we won't find Etc/GMT-12.
+                # We *can* stop when we get to Etc/GMT-13, as by then our longest match so far will
+                # be Etc/GMT-12, and we know that anything beyond Etc/GMT-13 won't match that.
+                # We can also stop when we hit upper_bound, without any more comparisons.
+                longest_so_far = ids[guess]
+                for i in range(guess + 1, upper_bound):
+                    candidate = ids[i]
+                    if len(candidate) < len(longest_so_far):
+                        break
+                    if not candidate.startswith(longest_so_far):
+                        break
+                    if value._compare_ordinal(candidate) == 0:
+                        longest_so_far = candidate
+                value.move(value.index + len(longest_so_far))
+                return self.__zone_provider[longest_so_far]
+        return None
+
+    def calculate_value(self, used_fields: _PatternFields, value: str) -> ParseResult[ZonedDateTime]:
+        local_result = _LocalDateTimeParseBucket._combine_buckets(used_fields, self._date, self._time, value)
+        if not local_result.success:
+            return local_result.convert_error(ZonedDateTime)
+
+        local_date_time = local_result.value
+
+        # No offset - so just use the resolver
+        if (used_fields & _PatternFields.EMBEDDED_OFFSET) == _PatternFields.NONE:
+            assert self.__resolver is not None
+            try:
+                return ParseResult.for_value(self._zone.resolve_local(local_date_time, self.__resolver))
+            except SkippedTimeError:
+                return ParseResult._skipped_local_time(value)
+            except AmbiguousTimeError:
+                return ParseResult._ambiguous_local_time(value)
+
+        # We were given an offset, so we can resolve and validate using that
+        mapping = self._zone.map_local(local_date_time)
+        result: ZonedDateTime
+        match mapping.count:
+            # If the local time was skipped, the offset has to be invalid.
+            case 0:
+                return ParseResult._invalid_offset(value)
+            case 1:
+                result = mapping.first()  # We'll validate in a minute
+            case 2:
+                result = mapping.first() if mapping.first().offset == self._offset else mapping.last()
+            case _:
+                raise RuntimeError("Mapping has count outside range 0-2; should not happen.")
+        if result.offset != self._offset:
+            return ParseResult._invalid_offset(value)
+        return ParseResult.for_value(result)
+
+
+def handle_forward_slash(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_literal(
+        expected_text=builder._format_info.date_separator, failure=ParseResult._date_separator_mismatch
+    )
+
+
+def handle_uppercase_t(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_literal(expected_char="T", failure_selector=ParseResult._mismatched_character)
+
+
+def handle_colon(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_literal(
+        expected_text=builder._format_info.time_separator, failure=ParseResult._time_separator_mismatch
+    )
+
+
+def handle_zone(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_field(_PatternFields.ZONE, pattern.current)
+
+    def parse_action(value: _ValueCursor, bucket: _ParseBucket[ZonedDateTime]) -> ParseResult[ZonedDateTime] | None:
+        assert isinstance(bucket, _ZonedDateTimeParseBucket)
+        return bucket._parse_zone(value)
+
+    def format_action(value: ZonedDateTime, builder: StringBuilder) -> None:
+        builder.append(value.zone.id)
+
+    builder._add_parse_action(parse_action)
+    builder._add_format_action(format_action)
+
+
+def handle_zone_abbreviation(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_field(_PatternFields.ZONE_ABBREVIATION, pattern.current)
+    builder._set_format_only()
+
+    def format_action(value: ZonedDateTime, builder: StringBuilder) -> None:
+        builder.append(value.zone.get_zone_interval(value.to_instant()).name)
+
+    builder._add_format_action(format_action)
+
+
+def handle_offset(pattern: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    builder._add_field(_PatternFields.EMBEDDED_OFFSET, pattern.current)
+    embedded_pattern = pattern.get_embedded_pattern()
+    offset_pattern = OffsetPattern._create(embedded_pattern, builder._format_info)._underlying_pattern
+
+    def offset_setter(bucket: _ParseBucket[ZonedDateTime], offset: Offset) -> None:
+        assert isinstance(bucket, _ZonedDateTimeParseBucket)
+        bucket._offset = offset
+
+    builder._add_embedded_pattern(offset_pattern, offset_setter, get_offset, ZonedDateTime)
+
+
+def handle_l(cursor: _PatternCursor, builder: _SteppedPatternBuilder[ZonedDateTime]) -> None:
+    def time_bucket_extractor(bucket: _ParseBucket[ZonedDateTime]) -> _LocalTimePatternParser._LocalTimeParseBucket:
+        assert isinstance(bucket, _ZonedDateTimeParseBucket)
+        return bucket._time
+
+    def date_extractor(value: ZonedDateTime) -> LocalDate:
+        return value.date
+
+    def time_extractor(value: ZonedDateTime) -> LocalTime:
+        return value.time_of_day
+
+    def date_time_extractor(value: ZonedDateTime) -> LocalDateTime:
+        return value.local_date_time
+
+    builder._add_embedded_local_partial(
+        cursor,
+        date_bucket_from_bucket,
+        time_bucket_extractor,
+        date_extractor,
+        time_extractor,
+        date_time_extractor,
+        ZonedDateTime,
+    )
+
+
+# ZonedDateTime doesn't expose every field as a property, so some of these go via the local date/time.
+
+
+def get_offset(value: ZonedDateTime) -> Offset:
+    return value.offset
+
+
+def get_year(value: ZonedDateTime) -> int:
+    return value.year
+
+
+def set_year(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._year = value
+
+
+def get_year_of_era(value: ZonedDateTime) -> int:
+    return value.local_date_time.year_of_era
+
+
+def set_year_of_era(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._year_of_era = value
+
+
+def get_month(value: ZonedDateTime) -> int:
+    return value.month
+
+
+def month_text_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._month_of_year_text = value
+
+
+def month_number_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._month_of_year_numeric = value
+
+
+def get_day_of_month(value: ZonedDateTime) -> int:
+    return value.day
+
+
+def get_day_of_week(value: ZonedDateTime) -> int:
+    return value.day_of_week.value
+
+
+def day_of_month_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._day_of_month = value
+
+
+def day_of_week_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._day_of_week = value
+
+
+def get_nanosecond_of_second(value: ZonedDateTime) -> int:
+    return value.local_date_time.nanosecond_of_second
+
+
+def fractional_seconds_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._fractional_seconds = value
+
+
+def get_hour(value: ZonedDateTime) -> int:
+    return value.hour
+
+
+def hours_24_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._hours_24 = value
+
+
+def get_clock_hour_of_half_day(value: ZonedDateTime) -> int:
+    return value.local_date_time.clock_hour_of_half_day
+
+
+def hours_12_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._hours_12 = value
+
+
+def get_minute(value: ZonedDateTime) -> int:
+    return value.minute
+
+
+def minutes_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._minutes = value
+
+
+def get_second(value: ZonedDateTime) -> int:
+    return value.second
+
+
+def seconds_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._seconds = value
+
+
+def am_pm_setter(bucket: _ParseBucket[ZonedDateTime], value: int) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._time._am_pm = value
+
+
+def get_calendar(value: ZonedDateTime) -> CalendarSystem:
+    return value.calendar
+
+
+def calendar_setter(bucket: _ParseBucket[ZonedDateTime], value: CalendarSystem) -> None:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    bucket._date._calendar = value
+
+
+def get_era(value: ZonedDateTime) -> Era:
+    return value.local_date_time.era
+
+
+def date_bucket_from_bucket(bucket: _ParseBucket[ZonedDateTime]) -> _LocalDatePatternParser._LocalDateParseBucket:
+    assert isinstance(bucket, _ZonedDateTimeParseBucket)
+    return bucket._date
+
+
+@_sealed
+@final
+@_private
+class _ZonedDateTimePatternParser(_IPatternParser[ZonedDateTime]):
+    """Parser for patterns of ``ZonedDateTime`` values."""
+
+    __template_value: ZonedDateTime
+    __resolver: ZoneLocalMappingResolver | None
+    __zone_provider: IDateTimeZoneProvider | None
+    __two_digit_year_max: int
+
+    __pattern_character_handlers: Mapping[
+        str, Callable[[_PatternCursor, _SteppedPatternBuilder[ZonedDateTime]], None]
+    ] = {
+        "%": _SteppedPatternBuilder._handle_percent,
+        "'": _SteppedPatternBuilder._handle_quote,
+        '"': _SteppedPatternBuilder._handle_quote,
+        "\\": _SteppedPatternBuilder._handle_backslash,
+        "/": handle_forward_slash,
+        "T": handle_uppercase_t,
+        "y": _DatePatternHelper._create_year_of_era_handler(get_year_of_era, set_year_of_era, ZonedDateTime),
+        "u": _SteppedPatternBuilder._handle_padded_field(
+            4, _PatternFields.YEAR, -9999, 9999, get_year, set_year, ZonedDateTime
+        ),
+        "M": _DatePatternHelper._create_month_of_year_handler(
+            get_month, month_text_setter, month_number_setter, ZonedDateTime
+        ),
+        "d": _DatePatternHelper._create_day_handler(
+            get_day_of_month, get_day_of_week, day_of_month_setter, day_of_week_setter, ZonedDateTime
+        ),
+        ".": _TimePatternHelper._create_period_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        ";": _TimePatternHelper._create_comma_dot_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        ":": handle_colon,
+        "h": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.HOURS_12, 1, 12, get_clock_hour_of_half_day, hours_12_setter, ZonedDateTime
+        ),
+        "H": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.HOURS_24, 0, 24, get_hour, hours_24_setter, ZonedDateTime
+        ),
+        "m": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.MINUTES, 0, 59, get_minute, minutes_setter, ZonedDateTime
+        ),
+        "s": _SteppedPatternBuilder._handle_padded_field(
+            2, _PatternFields.SECONDS, 0, 59, get_second, seconds_setter, ZonedDateTime
+        ),
+        "f": _TimePatternHelper._create_fraction_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        "F": _TimePatternHelper._create_fraction_handler(9, get_nanosecond_of_second, fractional_seconds_setter),
+        "t": _TimePatternHelper._create_am_pm_handler(get_hour, am_pm_setter),
+        "c": _DatePatternHelper._create_calendar_handler(get_calendar, calendar_setter),
+        "g": _DatePatternHelper._create_era_handler(get_era, date_bucket_from_bucket),
+        "z": handle_zone,
+        "x": handle_zone_abbreviation,
+        "o": handle_offset,
+        "l": handle_l,
+    }
+
+    @classmethod
+    def _ctor(
+        cls,
+        template_value: ZonedDateTime,
+        resolver: ZoneLocalMappingResolver | None,
+        zone_provider: IDateTimeZoneProvider | None,
+        two_digit_year_max: int,
+    ) -> _ZonedDateTimePatternParser:
+        _Preconditions._check_argument_range("two_digit_year_max", two_digit_year_max, 0, 99)
+        self = super().__new__(cls)
+        self.__template_value = template_value
+        self.__resolver = resolver
+        self.__zone_provider = zone_provider
+        self.__two_digit_year_max = two_digit_year_max
+        return self
+
+    def parse_pattern(self, pattern_text: str, format_info: _PyodaFormatInfo) -> IPattern[ZonedDateTime]:
+        # Nullity check is performed in ZonedDateTimePattern.
+        if len(pattern_text) == 0:
+            raise InvalidPatternError(_TextErrorMessages.FORMAT_STRING_EMPTY)
+
+        # Handle standard patterns
+        if len(pattern_text) == 1:
+            match pattern_text:
+                case "G":
+                    return ZonedDateTimePattern._Patterns._general_format_only_pattern_impl.with_zone_provider(
+                        self.__zone_provider
+                    ).with_resolver(self.__resolver)
+                case "F":
+                    return ZonedDateTimePattern._Patterns._extended_format_only_pattern_impl.with_zone_provider(
+                        self.__zone_provider
+                    ).with_resolver(self.__resolver)
+                case _:
+                    raise InvalidPatternError(
+                        _TextErrorMessages.UNKNOWN_STANDARD_FORMAT, pattern_text, ZonedDateTime.__name__
+                    )
+
+        zone_ids: Sequence[str] = ()
+        if self.__zone_provider is not None:
+            ids = self.__zone_provider.ids
+            zone_ids = ids if isinstance(ids, Sequence) else tuple(ids)
+
+        def bucket_provider() -> _ParseBucket[ZonedDateTime]:
+            return _ZonedDateTimeParseBucket._ctor(
+                self.__template_value, self.__two_digit_year_max, self.__resolver, self.__zone_provider, zone_ids
+            )
+
+        pattern_builder = _SteppedPatternBuilder[ZonedDateTime](format_info, bucket_provider)
+        if self.__zone_provider is None or self.__resolver is None:
+            pattern_builder._set_format_only()
+        pattern_builder._parse_custom_pattern(pattern_text, self.__pattern_character_handlers)
+        pattern_builder._validate_used_fields()
+        return pattern_builder._build(self.__template_value)
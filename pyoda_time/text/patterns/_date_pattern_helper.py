@@ -82,27 +82,12 @@ class _DatePatternHelper:
                 case 3 | 4:
                     field = _PatternFields.MONTH_OF_YEAR_TEXT
                     format_info = builder._format_info
-                    non_genitive_text_values = (
-                        format_info.short_month_names if count == 3 else format_info.long_month_names
-                    )
-                    genitive_text_values = (
-                        format_info.short_month_genitive_names if count == 3 else format_info.long_month_genitive_names
+                    builder._add_parse_longest_text_action(
+                        pattern.current,
+                        text_setter,
+                        # TODO: format.compare_info,
+                        format_info._short_month_name_trie if count == 3 else format_info._long_month_name_trie,
                     )
-                    if non_genitive_text_values == genitive_text_values:
-                        builder._add_parse_longest_text_action(
-                            pattern.current,
-                            text_setter,
-                            # TODO: format.compare_info,
-                            non_genitive_text_values,
-                        )
-                    else:
-                        builder._add_parse_longest_text_action(
-                            pattern.current,
-                            text_setter,
-                            # TODO: format.compare_info,
-                            genitive_text_values,
-                            non_genitive_text_values,
-                        )
                     # Hack: see below
                     builder._add_format_action(
                         _DatePatternHelper._MonthFormatActionHandler(format_info, count, number_getter)._dummy_method
@@ -186,7 +171,7 @@ class _DatePatternHelper:
                         pattern.current,
                         day_of_week_setter,
                         # TODO: format_info.compare_info,
-                        text_values,
+                        format_info._short_day_name_trie if count == 3 else format_info._long_day_name_trie,
                     )
 
                     def format_action(value: T, sb: StringBuilder) -> None:
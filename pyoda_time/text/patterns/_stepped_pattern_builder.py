@@ -3,6 +3,7 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
+import re
 from typing import (
     TYPE_CHECKING,
     Final,
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
     from ...globalization._pyoda_format_info import _PyodaFormatInfo
     from .._local_date_pattern_parser import _LocalDatePatternParser
     from .._local_time_pattern_parser import _LocalTimePatternParser
+    from .._name_trie import _NameTrie
 
 # TODO: In Noda Time, SteppedPatternBuilder has two generic type parameters:
 #  `SteppedPatternBuilder<TResult, TBucket> where TBucket : ParseBucket<TResult>`
@@ -89,6 +91,9 @@ class _SteppedPatternBuilder[TResult]:
         self.__bucket_provider: Final[Callable[[], _ParseBucket[TResult]]] = bucket_provider
         self.__used_fields: _PatternFields = _PatternFields.NONE
         self.__format_only: bool = False
+        # The regular expression and setter for each parse action, or None once any parse action has been added
+        # without them.
+        self.__regex_steps: list[tuple[str, Callable[[_ParseBucket[TResult], str], bool] | None]] | None = []
 
     def _create_sample_bucket(self) -> _ParseBucket[TResult]:
         """Calls the bucket provider and returns a sample bucket.
@@ -177,12 +182,20 @@ class _SteppedPatternBuilder[TResult]:
             for d in delegates:
                 d(result, sb)
 
+        parse_regex: re.Pattern[str] | None = None
+        regex_setters: list[Callable[[_ParseBucket[TResult], str], bool]] = []
+        if not self.__format_only and self.__regex_steps is not None:
+            parse_regex = re.compile("".join(regex for regex, _ in self.__regex_steps))
+            regex_setters = [setter for _, setter in self.__regex_steps if setter is not None]
+
         return _SteppedPattern(
             format_actions=multicast_delegate,
             parse_actions=None if self.__format_only else self.__parse_actions,
             bucket_provider=self.__bucket_provider,
             used_fields=self.__used_fields,
             sample=sample,
+            parse_regex=parse_regex,
+            regex_setters=regex_setters,
         )
 
     def _add_field(self, field: _PatternFields, character_in_pattern: str) -> None:
@@ -194,9 +207,31 @@ class _SteppedPatternBuilder[TResult]:
         self.__used_fields = new_used_fields
 
     def _add_parse_action(
-        self, parse_action: Callable[[_ValueCursor, _ParseBucket[TResult]], ParseResult[TResult] | None]
+        self,
+        parse_action: Callable[[_ValueCursor, _ParseBucket[TResult]], ParseResult[TResult] | None],
+        regex: str | None = None,
+        regex_setter: Callable[[_ParseBucket[TResult], str], bool] | None = None,
     ) -> None:
+        """Adds a parse action, optionally along with an equivalent regular expression.
+
+        If every parse action in a pattern has a regular expression, the built pattern first tries to parse text by
+        matching the concatenation of them, which avoids stepping through the text a character at a time. If that
+        match fails, or any setter returns False, the parse actions are used instead, so that failures are reported
+        exactly as they would have been otherwise.
+
+        :param parse_action: The parse action.
+        :param regex: A regular expression which matches exactly the text which ``parse_action`` consumes when it
+            succeeds. It must never need to backtrack (so quantifiers should be possessive), and may contain at most one
+            capturing group.
+        :param regex_setter: Required if ``regex`` has a capturing group. Called with the text captured by the group (or
+            an empty string if the group didn't participate in the match), it must update the bucket as
+            ``parse_action`` would, or return False if ``parse_action`` would fail.
+        """
         self.__parse_actions.append(parse_action)
+        if regex is None:
+            self.__regex_steps = None
+        elif self.__regex_steps is not None:
+            self.__regex_steps.append((regex, regex_setter))
 
     def _add_format_action(self, format_action: Callable[[TResult, StringBuilder], None]) -> None:
         self.__format_actions.append(format_action)
@@ -218,7 +253,7 @@ class _SteppedPatternBuilder[TResult]:
             negative = cursor._match("-")
             if negative and minimum_value >= 0:
                 cursor.move(starting_index)
-                return ParseResult[TResult]._unexpected_negative(cursor)
+                return ParseResult._unexpected_negative(cursor)
             success, value = cursor._parse_digits(minimum_digits, maximum_digits)
             if not success:
                 cursor.move(starting_index)
@@ -227,12 +262,22 @@ class _SteppedPatternBuilder[TResult]:
                 value = -value
             if value < minimum_value or value > maximum_value:
                 cursor.move(starting_index)
-                return ParseResult[TResult]._field_value_out_of_range(cursor, value, pattern_char, type_)
+                return ParseResult._field_value_out_of_range(cursor, value, pattern_char, type_)
 
             value_setter(bucket, value)
             return None
 
-        self._add_parse_action(parse_value_action)
+        def regex_setter(bucket: _ParseBucket[TResult], text: str) -> bool:
+            value = int(text)
+            if value < minimum_value or value > maximum_value:
+                return False
+            value_setter(bucket, value)
+            return True
+
+        digits = f"[0-9]{{{minimum_digits},{maximum_digits}}}+"
+        self._add_parse_action(
+            parse_value_action, f"(-?+{digits})" if minimum_value < 0 else f"({digits})", regex_setter
+        )
 
     @overload
     def _add_literal(self, *, expected_text: str, failure: Callable[[_ValueCursor], ParseResult[TResult]]) -> None: ...
@@ -264,7 +309,7 @@ class _SteppedPatternBuilder[TResult]:
             def overload_1_format_action(value: TResult, builder: StringBuilder) -> None:
                 builder.append(expected_text)
 
-            self._add_parse_action(overload_1_parse_action)
+            self._add_parse_action(overload_1_parse_action, re.escape(expected_text))
             self._add_format_action(overload_1_format_action)
             return
 
@@ -281,7 +326,7 @@ class _SteppedPatternBuilder[TResult]:
             def overload_2_format_action(value: TResult, builder: StringBuilder) -> None:
                 builder.append(expected_char)
 
-            self._add_parse_action(overload_2_parse_action)
+            self._add_parse_action(overload_2_parse_action, re.escape(expected_char))
             self._add_format_action(overload_2_format_action)
             return
 
@@ -292,55 +337,35 @@ class _SteppedPatternBuilder[TResult]:
         field: str,
         setter: Callable[[_ParseBucket[TResult], int], None],
         # TODO: compare_info: CompareInfo,
-        text_values_1: Sequence[str],
-        text_values_2: Sequence[str] | None = None,
+        text_values: _NameTrie[int],
     ) -> None:
-        """Adds parse actions for up to two list of strings, such as non-genitive and genitive month names.
+        """Adds a parse action for a set of strings, such as the genitive and non-genitive month names from one of the
+        tries of ``_PyodaFormatInfo``.
 
         The parsing is performed case-insensitively. All candidates are tested, and only the longest match is used.
         """
 
         def parse_action(cursor: _ValueCursor, bucket: _ParseBucket[TResult]) -> ParseResult[TResult] | None:
-            best_index = -1
-            longest_match = 0
-            best_index, longest_match = self.__find_longest_match(cursor, text_values_1, best_index, longest_match)
-            if text_values_2:
-                best_index, longest_match = self.__find_longest_match(cursor, text_values_2, best_index, longest_match)
-            if best_index != -1:
-                setter(bucket, best_index)
-                cursor.move(cursor.index + longest_match)
+            if (match := text_values._match_longest(cursor)) is not None:
+                value, length = match
+                setter(bucket, value)
+                cursor.move(cursor.index + length)
                 return None
             return ParseResult._mismatched_text(cursor, field)
 
         self._add_parse_action(parse_action)
 
-    @staticmethod
-    def __find_longest_match(
-        cursor: _ValueCursor, values: Sequence[str], best_index: int, longest_match: int
-    ) -> tuple[int, int]:
-        """Find the longest match from a given set of candidate strings, updating the index/length of the best value
-        accordingly."""
-        for i, candidate in enumerate(values):
-            if candidate is None or len(candidate) <= longest_match:
-                continue
-            if cursor._match_case_insensitive(candidate, False):
-                best_index = i
-                longest_match = len(candidate)
-        return best_index, longest_match
-
     @classmethod
     def _handle_quote(cls, pattern: _PatternCursor, builder: _SteppedPatternBuilder[TResult]) -> None:
         quoted: str = pattern.get_quoted_string(pattern.current)
-        builder._add_literal(expected_text=quoted, failure=ParseResult[TResult]._quoted_string_mismatch)
+        builder._add_literal(expected_text=quoted, failure=ParseResult._quoted_string_mismatch)
 
     @classmethod
     def _handle_backslash(cls, pattern: _PatternCursor, builder: _SteppedPatternBuilder[TResult]) -> None:
         if not pattern.move_next():
             raise InvalidPatternError(_TextErrorMessages.ESCAPE_AT_END_OF_STRING)
 
-        builder._add_literal(
-            expected_char=pattern.current, failure_selector=ParseResult[TResult]._escaped_character_missmatch
-        )
+        builder._add_literal(expected_char=pattern.current, failure_selector=ParseResult._escaped_character_missmatch)
 
     @classmethod
     def _handle_percent(cls, pattern: _PatternCursor, _builder: _SteppedPatternBuilder[TResult]) -> None:
@@ -390,12 +415,16 @@ class _SteppedPatternBuilder[TResult]:
                 sign_setter(bucket, True)
                 return None
 
-            return ParseResult[TResult]._missing_sign(string)
+            return ParseResult._missing_sign(string)
+
+        def regex_setter(bucket: _ParseBucket[TResult], text: str) -> bool:
+            sign_setter(bucket, text == "+")
+            return True
 
         def format_action(value: TResult, sb: StringBuilder) -> None:
             sb.append("+" if non_negative_predicate(value) else "-")
 
-        self._add_parse_action(parse_action)
+        self._add_parse_action(parse_action, "([+-])", regex_setter)
         self._add_format_action(format_action)
 
     def add_negative_only_sign(
@@ -411,16 +440,21 @@ class _SteppedPatternBuilder[TResult]:
                 return None
 
             if string._match("+"):
-                return ParseResult[TResult]._positive_sign_invalid(string)
+                return ParseResult._positive_sign_invalid(string)
 
             sign_setter(bucket, True)
             return None
 
+        def regex_setter(bucket: _ParseBucket[TResult], text: str) -> bool:
+            sign_setter(bucket, text != "-")
+            return True
+
         def format_action(value: TResult, sb: StringBuilder) -> None:
             if not non_negative_predicate(value):
                 sb.append("-")
 
-        self._add_parse_action(parse_action)
+        # A "+" is an error rather than something for the next step to match.
+        self._add_parse_action(parse_action, r"(-|(?!\+))", regex_setter)
         self._add_format_action(format_action)
 
     def add_format_left_pad(
@@ -626,6 +660,8 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
         bucket_provider: Callable[[], _ParseBucket[TResult]],
         used_fields: _PatternFields,
         sample: TResult,
+        parse_regex: re.Pattern[str] | None = None,
+        regex_setters: Sequence[Callable[[_ParseBucket[TResult], str], bool]] = (),
     ) -> None:
         self.__format_actions: Final[Callable[[TResult, StringBuilder], None]] = format_actions
         # This will be null if the pattern is only capable of formatting.
@@ -634,6 +670,10 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
         ] = parse_actions
         self.__bucket_provider: Final[Callable[[], _ParseBucket[TResult]]] = bucket_provider
         self.__used_fields: Final[_PatternFields] = used_fields
+        # If every parse action has an equivalent regular expression, this is their concatenation, and the setters
+        # correspond to its groups. See _SteppedPatternBuilder._add_parse_action.
+        self.__parse_regex: Final[re.Pattern[str] | None] = parse_regex
+        self.__regex_setters: Final[Sequence[Callable[[_ParseBucket[TResult], str], bool]]] = regex_setters
 
         # Format the sample value to work out the expected length, so we
         # can use that when creating a StringBuilder. This will definitely not always
@@ -644,15 +684,20 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
 
     def parse(self, text: str) -> ParseResult[TResult]:
         if self.__parse_actions is None:
-            return ParseResult[TResult]._format_only_pattern
+            return ParseResult._format_only_pattern
         if text is None:
             # TODO: The type:ignore here is because text is str, not str|None.
             #  This faithfully recreates a quirk in the Noda Time implementation
             #  where the type is string in a non-nullable context, but the code
             #  checks whether text is null anyway. Can this be safely removed?
-            return ParseResult[TResult]._argument_null("text")  # type: ignore[unreachable]
+            return ParseResult._argument_null("text")  # type: ignore[unreachable]
         if len(text) == 0:
-            return ParseResult[TResult]._value_string_empty()
+            return ParseResult._value_string_empty()
+
+        if self.__parse_regex is not None and (match := self.__parse_regex.fullmatch(text)) is not None:
+            bucket = self.__bucket_provider()
+            if self.__apply_match(match, bucket):
+                return bucket.calculate_value(self.__used_fields, text)
 
         value_cursor = _ValueCursor(text)
         # Prime the pump... the value cursor ends up *before* the first character, but
@@ -663,9 +708,23 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
             return result
         # Check that we've used up all the text
         if value_cursor.current != _ValueCursor._NUL:
-            return ParseResult[TResult]._extra_value_characters(value_cursor, value_cursor.remainder)
+            return ParseResult._extra_value_characters(value_cursor, value_cursor.remainder)
         return result
 
+    def _get_try_parse(self) -> Callable[[str], TResult | None] | None:
+        return self.__try_parse if self.__parse_regex is not None and self.__parse_actions is not None else None
+
+    def __try_parse(self, text: str) -> TResult | None:
+        # Only the regular expression is tried here; anything it can't handle is left for parse().
+        assert self.__parse_regex is not None
+        if text and (match := self.__parse_regex.fullmatch(text)) is not None:
+            bucket = self.__bucket_provider()
+            if self.__apply_match(match, bucket):
+                result = bucket.calculate_value(self.__used_fields, text)
+                if result.success:
+                    return result.value
+        return None
+
     def format(self, value: TResult) -> str:
         builder = StringBuilder(capacity=self.__expected_length)
         # This will call all the actions in the multicast delegate.
@@ -676,7 +735,17 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
         # At the moment we shouldn't get a partial parse for a format-only pattern, but
         # let's guard against it for the future.
         if self.__parse_actions is None:
-            return ParseResult[TResult]._format_only_pattern
+            return ParseResult._format_only_pattern
+
+        if (
+            self.__parse_regex is not None
+            and cursor.index >= 0
+            and (match := self.__parse_regex.match(cursor.value, cursor.index)) is not None
+        ):
+            bucket = self.__bucket_provider()
+            if self.__apply_match(match, bucket):
+                cursor.move(match.end())
+                return bucket.calculate_value(self.__used_fields, cursor.value)
 
         bucket = self.__bucket_provider()
 
@@ -687,6 +756,14 @@ class _SteppedPattern[TResult](_IPartialPattern[TResult]):
 
         return bucket.calculate_value(self.__used_fields, cursor.value)
 
+    def __apply_match(self, match: re.Match[str], bucket: _ParseBucket[TResult]) -> bool:
+        """Applies the groups of a match of the parse regex to a bucket, returning False if the parse actions need to
+        be used instead."""
+        for setter, text in zip(self.__regex_setters, match.groups(default=""), strict=True):
+            if not setter(bucket, text):
+                return False
+        return True
+
     def append_format(self, value: TResult, builder: StringBuilder) -> StringBuilder:
         _Preconditions._check_not_null(builder, "builder")
         self.__format_actions(value, builder)
@@ -60,7 +60,11 @@ class _TimePatternHelper:
                     setter(bucket, fractional_seconds)
                     return None
 
-                builder._add_parse_action(parse_action)
+                builder._add_parse_action(
+                    parse_action,
+                    rf"(?:\.([0-9]{{1,{count}}}+)|(?!\.))",
+                    cls.__create_fraction_regex_setter(max_count, setter),
+                )
 
                 def format_action(local_time: T, sb: StringBuilder) -> None:
                     sb.append(".")
@@ -114,7 +118,11 @@ class _TimePatternHelper:
                     setter(bucket, fractional_seconds)
                     return None
 
-                builder._add_parse_action(parse_action)
+                builder._add_parse_action(
+                    parse_action,
+                    rf"(?:[.,]([0-9]{{1,{count}}}+)|(?![.,]))",
+                    cls.__create_fraction_regex_setter(max_count, setter),
+                )
 
                 def format_action(local_time: T, sb: StringBuilder) -> None:
                     sb.append(".")
@@ -129,7 +137,7 @@ class _TimePatternHelper:
                         return None
                     return ParseResult._mismatched_character(value_cursor, ";")
 
-                builder._add_parse_action(parse_action)
+                builder._add_parse_action(parse_action, "[.,]")
 
                 def format_action(local_time: T, sb: StringBuilder) -> None:
                     sb.append(".")
@@ -164,7 +172,12 @@ class _TimePatternHelper:
                 setter(bucket, fractional_seconds)
                 return None
 
-            builder._add_parse_action(parse_action)
+            minimum_digits = count if pattern_character == "f" else 0
+            builder._add_parse_action(
+                parse_action,
+                f"([0-9]{{{minimum_digits},{count}}}+)",
+                cls.__create_fraction_regex_setter(max_count, setter),
+            )
 
             if pattern_character == "f":
                 builder._add_format_fraction(count, max_count, getter)
@@ -173,6 +186,23 @@ class _TimePatternHelper:
 
         return fraction_handler
 
+    @staticmethod
+    def __create_fraction_regex_setter(
+        scale: int, setter: Callable[[_ParseBucket[T], int], None]
+    ) -> Callable[[_ParseBucket[T], str], bool]:
+        """Creates a regex setter (see ``_SteppedPatternBuilder._add_parse_action``) for the digits of a fractional
+        value with the given scale, as parsed by ``_ValueCursor._parse_fraction``.
+
+        An empty string means that an optional fraction was omitted, so the setter isn't called.
+        """
+
+        def regex_setter(bucket: _ParseBucket[T], text: str) -> bool:
+            if text:
+                setter(bucket, int(text) * 10 ** (scale - len(text)))
+            return True
+
+        return regex_setter
+
     @classmethod
     def _create_am_pm_handler(
         cls,
@@ -236,17 +266,14 @@ class _TimePatternHelper:
                 return
 
             # Full designator
+            designator_trie = builder._format_info._am_pm_designator_trie
+
             def full_designator_parse_action(cursor: _ValueCursor, bucket: _ParseBucket[T]) -> ParseResult[T] | None:
-                # Could use the "match longest" approach, but with only two it feels a bit silly to build a list...
-                pm_longer_than_am: bool = len(pm_designator) > len(am_designator)
-                longer_designator: str = pm_designator if pm_longer_than_am else am_designator
-                shorter_designator: str = am_designator if pm_longer_than_am else pm_designator
-                longer_value: int = 1 if pm_longer_than_am else 0
-                if cursor._match_case_insensitive(longer_designator, True):
-                    am_pm_setter(bucket, longer_value)
-                    return None
-                if cursor._match_case_insensitive(shorter_designator, True):
-                    am_pm_setter(bucket, 1 - longer_value)
+                # The longest matching designator wins, as one may be a prefix of the other.
+                if (match := designator_trie._match_longest(cursor)) is not None:
+                    value, length = match
+                    am_pm_setter(bucket, value)
+                    cursor.move(cursor.index + length)
                     return None
                 return ParseResult._missing_am_pm_designator(cursor)
 
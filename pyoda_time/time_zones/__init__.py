@@ -13,6 +13,7 @@ __all__ = [
     "TzdbZone1970Location",
     "TzdbZoneLocation",
     "ZoneInterval",
+    "ZoneIntervalCacheStatistics",
     "ZoneLocalMapping",
     "ZoneLocalMappingResolver",
     "cldr",
@@ -29,4 +30,5 @@ from ._resolvers import Resolvers
 from ._tzdb_zone_1970_location import TzdbZone1970Location
 from ._tzdb_zone_location import TzdbZoneLocation
 from ._zone_interval import ZoneInterval
+from ._zone_interval_cache_statistics import ZoneIntervalCacheStatistics
 from ._zone_local_mapping import ZoneLocalMapping
@@ -6,14 +6,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, final
 
 from pyoda_time._date_time_zone import DateTimeZone
-from pyoda_time.time_zones._caching_zone_interval_map import _CachingZoneIntervalMap
+from pyoda_time.time_zones._caching_zone_interval_map import _CACHE_SIZE, _PERIOD_SHIFT, _CachingZoneIntervalMap
+from pyoda_time.time_zones._zone_local_mapping import ZoneLocalMapping
 from pyoda_time.utility._csharp_compatibility import _private, _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pyoda_time._instant import Instant
+    from pyoda_time._local_date_time import LocalDateTime
+    from pyoda_time._local_instant import _LocalInstant
     from pyoda_time.time_zones import ZoneInterval
     from pyoda_time.time_zones._i_zone_interval_map import _IZoneIntervalMap
+    from pyoda_time.time_zones._zone_interval_cache_statistics import ZoneIntervalCacheStatistics
 
 
 @final
@@ -24,6 +30,7 @@ class _CachedDateTimeZone(DateTimeZone):
     transitions."""
 
     __map: _IZoneIntervalMap
+    __map_local_instant: Callable[[_LocalInstant], tuple[ZoneInterval, ZoneInterval, int] | None] | None
     __time_zone: DateTimeZone
 
     @property
@@ -34,6 +41,14 @@ class _CachedDateTimeZone(DateTimeZone):
         """
         return self.__time_zone
 
+    @property
+    def _statistics(self) -> ZoneIntervalCacheStatistics | None:
+        """Gets the statistics of the caching map.
+
+        :return: The statistics of the caching map.
+        """
+        return _CachingZoneIntervalMap._statistics(self.__map)
+
     @classmethod
     def __ctor(cls, time_zone: DateTimeZone, map: _IZoneIntervalMap) -> _CachedDateTimeZone:
         """Initializes a new instance of the ``_CachedDateTimeZone`` class.
@@ -46,14 +61,46 @@ class _CachedDateTimeZone(DateTimeZone):
         super(_CachedDateTimeZone, self).__init__(time_zone.id, False, time_zone.min_offset, time_zone.max_offset)
         self.__time_zone = time_zone
         self.__map = map
+        self.__map_local_instant = _CachingZoneIntervalMap._local_instant_mapper(map)
         return self
 
     @classmethod
-    def _for_zone(cls, time_zone: DateTimeZone) -> DateTimeZone:
+    def _for_zone(
+        cls,
+        time_zone: DateTimeZone,
+        cache_size: int = _CACHE_SIZE,
+        period_shift: int = _PERIOD_SHIFT,
+        statistics: ZoneIntervalCacheStatistics | None = None,
+    ) -> DateTimeZone:
+        """Returns a cached time zone for the given zone, or the zone itself if it is fixed or already cached.
+
+        See ``_CachingZoneIntervalMap._cache_map`` for the meaning of the cache parameters.
+        """
         _Preconditions._check_not_null(time_zone, "time_zone")
         if isinstance(time_zone, _CachedDateTimeZone) or time_zone._is_fixed:
             return time_zone
-        return cls.__ctor(time_zone, _CachingZoneIntervalMap._cache_map(time_zone))
+        return cls.__ctor(
+            time_zone, _CachingZoneIntervalMap._cache_map(time_zone, cache_size, period_shift, statistics)
+        )
+
+    def map_local(self, local_date_time: LocalDateTime) -> ZoneLocalMapping:
+        """Maps the given ``LocalDateTime`` using the caching map's local instant cache, which usually avoids any
+        zone interval lookups at all."""
+        if self.__map_local_instant is not None and (
+            mapping := self.__map_local_instant(local_date_time._to_local_instant())
+        ):
+            early, late, count = mapping
+            return ZoneLocalMapping._ctor(self, local_date_time, early, late, count)
+        return super().map_local(local_date_time)
+
+    def _warm(self, start: Instant, end: Instant) -> None:
+        """Prepopulates the cache for the instants in ``[start, end]``, first expanding the interval table of a
+        precalculated zone up to ``end``."""
+        from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+
+        if isinstance(self.__time_zone, _PrecalculatedDateTimeZone):
+            self.__time_zone._expand_tail_zone(end)
+        _CachingZoneIntervalMap._warm(self.__map, start, end)
 
     def get_zone_interval(self, instant: Instant) -> ZoneInterval:
         """Delegates fetching a zone interval to the caching map."""
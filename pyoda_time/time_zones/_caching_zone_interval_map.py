@@ -3,24 +3,40 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
+import bisect
 from typing import TYPE_CHECKING, Self, final
 
 from pyoda_time._duration import Duration
 from pyoda_time._instant import Instant
+from pyoda_time._pyoda_constants import PyodaConstants
 from pyoda_time.time_zones._i_zone_interval_map import _IZoneIntervalMap
+from pyoda_time.time_zones._zone_interval_cache_statistics import ZoneIntervalCacheStatistics
 from pyoda_time.utility._csharp_compatibility import _private, _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyoda_time._local_instant import _LocalInstant
     from pyoda_time._offset import Offset
     from pyoda_time.time_zones import ZoneInterval
 
+    _LocalMapping = tuple[ZoneInterval, ZoneInterval, int]
+    """The early interval, late interval and count of a ``ZoneLocalMapping``."""
+
 _PERIOD_SHIFT: int = 5
 """Defines the number of bits to shift an instant's "days since epoch" to get the period.
 
-This converts an instant into a number of 32 day periods.
+This converts an instant into a number of 32 day periods. This is the default; the value can be configured per
+provider.
 """
 
+_CACHE_SIZE: int = 512
+"""The default number of entries in each cache. This must always be a power of 2."""
+
+_MAX_PERIOD_SHIFT: int = 16
+"""The largest supported period shift, giving periods of 65536 days (roughly 180 years)."""
+
 
 @final
 @_sealed
@@ -29,9 +45,69 @@ class _CachingZoneIntervalMap:
     """Helper methods for creating IZoneIntervalMaps which cache results."""
 
     @classmethod
-    def _cache_map(cls, map_: _IZoneIntervalMap) -> _IZoneIntervalMap:
-        """Returns a caching map for the given input map."""
-        return cls.__HashArrayCache._ctor(map_)
+    def _cache_map(
+        cls,
+        map_: _IZoneIntervalMap,
+        cache_size: int = _CACHE_SIZE,
+        period_shift: int = _PERIOD_SHIFT,
+        statistics: ZoneIntervalCacheStatistics | None = None,
+    ) -> _IZoneIntervalMap:
+        """Returns a caching map for the given input map.
+
+        :param map_: The map to cache.
+        :param cache_size: The number of cache entries; must be a positive power of 2.
+        :param period_shift: The number of bits to shift the days since the epoch by to get the cache period, i.e. each
+            cache entry covers ``2 ** period_shift`` days.
+        :param statistics: The statistics to update, which may be shared between several caches. If this is None, the
+            cache has statistics of its own.
+        :return: The caching map.
+        """
+        return cls.__HashArrayCache._ctor(
+            map_, cache_size, period_shift, statistics or ZoneIntervalCacheStatistics._ctor()
+        )
+
+    @classmethod
+    def _validate_settings(cls, cache_size: int, period_shift: int) -> None:
+        """Validates the size and period shift of a cache.
+
+        :raises ValueError: The cache size is not a positive power of 2, or the period shift is out of range.
+        """
+        _Preconditions._check_argument(
+            cache_size > 0 and (cache_size & (cache_size - 1)) == 0,
+            "cache_size",
+            "Cache size must be a positive power of 2; was {0}",
+            cache_size,
+        )
+        _Preconditions._check_argument_range("period_shift", period_shift, 0, _MAX_PERIOD_SHIFT)
+
+    @classmethod
+    def _statistics(cls, map_: _IZoneIntervalMap) -> ZoneIntervalCacheStatistics | None:
+        """Returns the statistics for the given map if it is a caching map, or None otherwise."""
+        if isinstance(map_, cls.__HashArrayCache):
+            return map_._statistics
+        return None
+
+    @classmethod
+    def _local_instant_mapper(cls, map_: _IZoneIntervalMap) -> Callable[[_LocalInstant], _LocalMapping | None] | None:
+        """Returns the function which maps local instants using the local instant cache of the given map, if it is a
+        caching map, or None otherwise.
+
+        The function returns the early interval, late interval and count for a ``ZoneLocalMapping``, or None for the
+        (pathological) local instants which more than two zone intervals map to.
+        """
+        if isinstance(map_, cls.__HashArrayCache):
+            return map_._map_local
+        return None
+
+    @classmethod
+    def _warm(cls, map_: _IZoneIntervalMap, start: Instant, end: Instant) -> None:
+        """Populates the cache entries covering ``[start, end]`` if the given map is a caching map.
+
+        Warming does not count towards the hit/miss statistics. If the range covers more periods than the cache has
+        entries, only the later periods will remain cached.
+        """
+        if isinstance(map_, cls.__HashArrayCache):
+            map_._warm(start, end)
 
     # region Nested type: HashArrayCache
 
@@ -42,7 +118,7 @@ class _CachingZoneIntervalMap:
         """This provides a simple cache based on two hash tables (one for local instants, another for instants).
 
         Each hash table entry is either entry or contains a node with enough
-        information for a particular "period" of 32 days - so multiple calls for time
+        information for a particular "period" of 32 days (by default) - so multiple calls for time
         zone information within the same few years are likely to hit the cache. Note that
         a single "period" may include a daylight saving change (or conceivably more than one);
         a node therefore has to contain enough intervals to completely represent that period.
@@ -74,12 +150,12 @@ class _CachingZoneIntervalMap:
                 return self.__previous
 
             @classmethod
-            def _create_node(cls, period: int, map_: _IZoneIntervalMap) -> Self:
-                days = period << _PERIOD_SHIFT
+            def _create_node(cls, period: int, period_shift: int, map_: _IZoneIntervalMap) -> Self:
+                days = period << period_shift
                 period_start = Instant._from_untrusted_duration(
                     Duration._ctor(days=max(days, Instant._MIN_DAYS), nano_of_day=0)
                 )
-                next_period_start_days = days + (1 << _PERIOD_SHIFT)
+                next_period_start_days = days + (1 << period_shift)
 
                 interval = map_.get_zone_interval(period_start)
                 node = cls.__ctor(interval, period, None)
@@ -111,18 +187,93 @@ class _CachingZoneIntervalMap:
 
         # endregion
 
-        __CACHE_SIZE: int = 512
-        """Currently we have no need or way to create hash cache zones with different cache sizes.
+        # region Nested type: _LocalHashCacheNode
 
-        But the cache size should always be a power of 2 to get the "period to cache entry" conversion simply as a
-        bitmask operation.
-        """
+        @final
+        @_sealed
+        @_private
+        class _LocalHashCacheNode:
+            """The local instant mappings for a period of local time.
 
-        __CACHE_PERIOD_MASK: int = __CACHE_SIZE - 1
-        """Mask to AND the period number with in order to get the cache entry index.
+            Within a period, the mapping of a local instant only changes at the local start or end of a zone interval.
+            The period is split at each of those points into segments, each of which has a single precomputed mapping.
+            Most periods don't contain a transition at all, and so consist of a single segment.
+            """
 
-        The result will always be in the range [0, CacheSize).
-        """
+            _period: int
+            _boundaries: list[int]
+            """The local nanoseconds since the epoch at which each segment after the first starts."""
+            _mappings: list[_LocalMapping | None]
+            """The mapping for each segment, or None if more than two zone intervals contain the segment."""
+
+            @classmethod
+            def _create_node(cls, period: int, period_shift: int, map_: _IZoneIntervalMap) -> Self:
+                days = period << period_shift
+                next_period_start_days = days + (1 << period_shift)
+                period_start = days * PyodaConstants.NANOSECONDS_PER_DAY
+                period_end = next_period_start_days * PyodaConstants.NANOSECONDS_PER_DAY
+
+                # Offsets are always less than a day, so the intervals which a local instant in this period could map
+                # to (or which could surround a gap) all overlap these instants.
+                interval = map_.get_zone_interval(
+                    Instant._from_untrusted_duration(
+                        Duration._ctor(days=max(days - 1, Instant._MIN_DAYS), nano_of_day=0)
+                    )
+                )
+                intervals = [interval]
+                while interval.has_end and interval._raw_end._days_since_epoch <= next_period_start_days:
+                    interval = map_.get_zone_interval(interval._raw_end)
+                    intervals.append(interval)
+
+                # Local [start, end) of each interval, in nanoseconds since the local epoch, or None if infinite.
+                local_bounds = [
+                    (
+                        interval._raw_start._to_unix_time_nanoseconds() + interval.wall_offset.nanoseconds
+                        if interval.has_start
+                        else None,
+                        interval._raw_end._to_unix_time_nanoseconds() + interval.wall_offset.nanoseconds
+                        if interval.has_end
+                        else None,
+                    )
+                    for interval in intervals
+                ]
+                boundaries = sorted(
+                    {
+                        bound
+                        for bounds in local_bounds
+                        for bound in bounds
+                        if bound is not None and period_start < bound < period_end
+                    }
+                )
+                mappings: list[_LocalMapping | None] = []
+                for segment_start in [period_start, *boundaries]:
+                    matches = [
+                        interval
+                        for interval, (start, end) in zip(intervals, local_bounds, strict=True)
+                        if (start is None or start <= segment_start) and (end is None or segment_start < end)
+                    ]
+                    if len(matches) == 1:
+                        mappings.append((matches[0], matches[0], 1))
+                    elif len(matches) == 2:
+                        mappings.append((matches[0], matches[1], 2))
+                    elif not matches:
+                        # In a gap: the intervals either side are the last one to start before it, and the next.
+                        after_gap = next(
+                            index
+                            for index, (start, _) in enumerate(local_bounds)
+                            if start is not None and start > segment_start
+                        )
+                        mappings.append((intervals[after_gap - 1], intervals[after_gap], 0))
+                    else:
+                        mappings.append(None)
+
+                self = super().__new__(cls)
+                self._period = period
+                self._boundaries = boundaries
+                self._mappings = mappings
+                return self
+
+        # endregion
 
         @property
         def min_offset(self) -> Offset:
@@ -133,15 +284,42 @@ class _CachingZoneIntervalMap:
             return self.__map.max_offset
 
         __instant_cache: list[_HashCacheNode | None]
+        __local_instant_cache: list[_LocalHashCacheNode | None]
         __map: _IZoneIntervalMap
+        __cache_period_mask: int
+        """Mask to AND the period number with in order to get the cache entry index.
+
+        The cache size is always a power of 2, so the result will always be in the range [0, cache size).
+        """
+        __period_shift: int
+        _statistics: ZoneIntervalCacheStatistics
 
         @classmethod
-        def _ctor(cls, map_: _IZoneIntervalMap) -> Self:
+        def _ctor(
+            cls, map_: _IZoneIntervalMap, cache_size: int, period_shift: int, statistics: ZoneIntervalCacheStatistics
+        ) -> Self:
+            _CachingZoneIntervalMap._validate_settings(cache_size, period_shift)
             self = super().__new__(cls)
             self.__map = _Preconditions._check_not_null(map_, "map_")
-            self.__instant_cache = [None] * cls.__CACHE_SIZE
+            self.__instant_cache = [None] * cache_size
+            self.__local_instant_cache = [None] * cache_size
+            self.__cache_period_mask = cache_size - 1
+            self.__period_shift = period_shift
+            self._statistics = statistics
             return self
 
+        def _warm(self, start: Instant, end: Instant) -> None:
+            """Populates the cache entries for every period overlapping ``[start, end]``."""
+            shift = self.__period_shift
+            for period in range(start._days_since_epoch >> shift, (end._days_since_epoch >> shift) + 1):
+                index = period & self.__cache_period_mask
+                node = self.__instant_cache[index]
+                if node is None or node._period != period:
+                    self.__instant_cache[index] = self._HashCacheNode._create_node(period, shift, self.__map)
+                local_node = self.__local_instant_cache[index]
+                if local_node is None or local_node._period != period:
+                    self.__local_instant_cache[index] = self._LocalHashCacheNode._create_node(period, shift, self.__map)
+
         def get_zone_interval(self, instant: Instant) -> ZoneInterval:
             """Gets the zone offset period for the given instant. Null is returned if no period is defined by the time
             zone for the given instant.
@@ -149,11 +327,16 @@ class _CachingZoneIntervalMap:
             :param instant: The Instant to test.
             :return: The defined ZoneOffsetPeriod or null.
             """
-            period = instant._days_since_epoch >> _PERIOD_SHIFT
-            index = period & self.__CACHE_PERIOD_MASK
+            period = instant._days_since_epoch >> self.__period_shift
+            index = period & self.__cache_period_mask
             node = self.__instant_cache[index]
-            if (node is None) or (node._period != period):
-                node = self._HashCacheNode._create_node(period, self.__map)
+            if node is not None and node._period == period:
+                self._statistics._hits += 1
+            else:
+                self._statistics._misses += 1
+                if node is not None:
+                    self._statistics._evictions += 1
+                node = self._HashCacheNode._create_node(period, self.__period_shift, self.__map)
                 self.__instant_cache[index] = node
 
             # Note: moving this code into an instance method in HashCacheNode makes a surprisingly
@@ -162,4 +345,33 @@ class _CachingZoneIntervalMap:
                 node = node._previous
             return node._interval
 
+        def _map_local(self, local_instant: _LocalInstant) -> _LocalMapping | None:
+            """Returns the early interval, late interval and count of the ``ZoneLocalMapping`` for the given local
+            instant, or None if more than two zone intervals contain it.
+
+            :param local_instant: The local instant to map.
+            :return: The early interval, late interval and count of the mapping.
+            """
+            days = local_instant._days_since_epoch
+            period = days >> self.__period_shift
+            index = period & self.__cache_period_mask
+            node = self.__local_instant_cache[index]
+            if node is not None and node._period == period:
+                self._statistics._hits += 1
+            else:
+                self._statistics._misses += 1
+                if node is not None:
+                    self._statistics._evictions += 1
+                node = self._LocalHashCacheNode._create_node(period, self.__period_shift, self.__map)
+                self.__local_instant_cache[index] = node
+
+            if not node._boundaries:
+                return node._mappings[0]
+            return node._mappings[
+                bisect.bisect_right(
+                    node._boundaries,
+                    days * PyodaConstants.NANOSECONDS_PER_DAY + local_instant._nanosecond_of_day,
+                )
+            ]
+
     # endregion
@@ -3,19 +3,22 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Final, final
+from typing import TYPE_CHECKING, BinaryIO, Final, final
 
 from .._i_date_time_zone_provider import IDateTimeZoneProvider
 from ..utility._csharp_compatibility import _sealed
 from ..utility._preconditions import _Preconditions
+from ._caching_zone_interval_map import _CACHE_SIZE, _PERIOD_SHIFT, _CachingZoneIntervalMap
 from ._date_time_zone_not_found_error import DateTimeZoneNotFoundError
 from ._invalid_date_time_zone_source_error import InvalidDateTimeZoneSourceError
+from ._zone_interval_cache_statistics import ZoneIntervalCacheStatistics
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Buffer, Iterable
 
     from .._date_time_zone import DateTimeZone
     from ._i_date_time_zone_source import IDateTimeZoneSource
+    from .io._date_time_zone_snapshot import _DateTimeZoneSnapshot
 
 
 @final
@@ -26,6 +29,9 @@ class DateTimeZoneCache(IDateTimeZoneProvider):
     The process of loading or creating time zones may be an expensive operation. This class implements an
     unlimited-size non-expiring cache over a time zone source, and adapts an implementation of the
     ``IDateTimeZoneSource`` interface to an ``IDateTimeZoneProvider``.
+
+    Time zones which the source returns with a zone interval cache (such as those from ``TzdbDateTimeZoneSource``) are
+    given a cache configured by this provider, and report their hits and misses through ``cache_statistics``.
     """
 
     @property
@@ -42,22 +48,64 @@ class DateTimeZoneCache(IDateTimeZoneProvider):
         # TODO: inheritdoc?
         return self.__ids
 
-    def __init__(self, source: IDateTimeZoneSource) -> None:
+    @property
+    def cache_statistics(self) -> ZoneIntervalCacheStatistics:
+        """Gets the hit, miss and eviction counters shared by the zone interval caches of the zones from this provider.
+
+        :return: The zone interval cache statistics for this provider.
+        """
+        return self.__cache_statistics
+
+    def __init__(
+        self,
+        source: IDateTimeZoneSource,
+        *,
+        cache_size: int = _CACHE_SIZE,
+        period_shift: int = _PERIOD_SHIFT,
+        snapshot: Buffer | None = None,
+        tail_zone_horizon_year: int | None = None,
+    ) -> None:
         """Creates a provider backed by the given ``IDateTimeZoneSource``.
 
         Note that the source will never be consulted for requests for the fixed-offset timezones "UTC" and
         "UTC+/-Offset" (a standard implementation will be returned instead). This is true even if these IDs are
         advertised by the source.
 
+        Each cached time zone holds ``cache_size`` entries, each of which covers ``2 ** period_shift`` days; the
+        defaults give 512 entries of 32 days, or roughly 45 years of instants per zone.
+
         :param source: The ``IDateTimeZoneSource`` for this provider.
+        :param cache_size: The number of entries in each zone's interval cache; must be a positive power of 2.
+        :param period_shift: The binary logarithm of the number of days covered by each cache entry, in the range
+            [0, 16].
+        :param snapshot: A snapshot written by ``write_snapshot`` from a provider over the same version of the source.
+            Zones in the snapshot are created from it rather than from the source. The snapshot is used in place, so it
+            must not be modified while this provider is in use.
+        :param tail_zone_horizon_year: The last year for which zones keep the zone intervals of their recurring rules
+            in flat tables once computed, and up to which ``warm`` expands those tables ahead of time; later instants
+            are computed from the rules on each lookup. If this is None, the zones keep the horizon they are created
+            with (2100 for ``TzdbDateTimeZoneSource``, or the horizon recorded in ``snapshot``).
         :raises InvalidTimeZoneSourceError: ``source`` violates its contract.
+        :raises InvalidPyodaDataError: ``snapshot`` is invalid, or was written on a machine with a different byte
+            order.
+        :raises ValueError: ``cache_size``, ``period_shift`` or ``tail_zone_horizon_year`` is invalid, or ``snapshot``
+            was written for a different version of the source.
         """
+        _CachingZoneIntervalMap._validate_settings(cache_size, period_shift)
+        if tail_zone_horizon_year is not None:
+            _Preconditions._check_argument_range("tail_zone_horizon_year", tail_zone_horizon_year, 1, 9998)
+        self.__cache_size: Final[int] = cache_size
+        self.__period_shift: Final[int] = period_shift
+        self.__tail_zone_horizon_year: Final[int | None] = tail_zone_horizon_year
+        self.__cache_statistics: Final[ZoneIntervalCacheStatistics] = ZoneIntervalCacheStatistics._ctor()
         self.__source: Final[IDateTimeZoneSource] = _Preconditions._check_not_null(source, "source")
 
         self.__version_id: Final[str] = source.version_id
         if self.__version_id is None:
             raise InvalidDateTimeZoneSourceError("Source-returned version ID was None")
 
+        self.__snapshot: Final[_DateTimeZoneSnapshot | None] = self.__read_snapshot(snapshot)
+
         if (provider_ids := source.get_ids()) is None:
             raise InvalidDateTimeZoneSourceError("Source-returned ID sequence was None")
         if None in provider_ids:  # type: ignore[operator]
@@ -69,6 +117,21 @@ class DateTimeZoneCache(IDateTimeZoneProvider):
         for id_ in self.__ids:
             self.__time_zone_map[id_] = None
 
+    def __read_snapshot(self, snapshot: Buffer | None) -> _DateTimeZoneSnapshot | None:
+        if snapshot is None:
+            return None
+        from .io._date_time_zone_snapshot import _DateTimeZoneSnapshot
+
+        result = _DateTimeZoneSnapshot._ctor(memoryview(snapshot).cast("B"))
+        _Preconditions._check_argument(
+            result.version_id == self.__version_id,
+            "snapshot",
+            "Snapshot of {0} can't be used with source {1}",
+            result.version_id,
+            self.__version_id,
+        )
+        return result
+
     def get_system_default(self) -> DateTimeZone:
         # TODO: inheritdoc?
         if (id_ := self.__source.get_system_default_id()) is None:
@@ -87,14 +150,66 @@ class DateTimeZoneCache(IDateTimeZoneProvider):
             return None
 
         if (zone := self.__time_zone_map.get(zone_id)) is None:
-            if (zone := self.__source.for_id(zone_id)) is None:
+            from pyoda_time.time_zones._cached_date_time_zone import _CachedDateTimeZone
+            from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+
+            if self.__snapshot is not None and (zone := self.__snapshot._create_zone(zone_id)) is not None:
+                # Snapshots hold zones without their caches, which are always added for precalculated zones.
+                if isinstance(zone, _PrecalculatedDateTimeZone):
+                    zone = _CachedDateTimeZone._for_zone(
+                        self.__with_tail_zone_horizon(zone),
+                        self.__cache_size,
+                        self.__period_shift,
+                        self.__cache_statistics,
+                    )
+            elif (zone := self.__source.for_id(zone_id)) is None:
                 raise InvalidDateTimeZoneSourceError(
                     f"Time zone {zone_id} is supported by source {self.version_id} but not returned"
                 )
+            elif isinstance(zone, _CachedDateTimeZone):
+                zone = _CachedDateTimeZone._for_zone(
+                    self.__with_tail_zone_horizon(zone._time_zone),
+                    self.__cache_size,
+                    self.__period_shift,
+                    self.__cache_statistics,
+                )
             self.__time_zone_map[zone_id] = zone
 
         return zone
 
+    def __with_tail_zone_horizon(self, zone: DateTimeZone) -> DateTimeZone:
+        from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+
+        if self.__tail_zone_horizon_year is None or not isinstance(zone, _PrecalculatedDateTimeZone):
+            return zone
+        return zone._with_tail_zone_horizon_year(self.__tail_zone_horizon_year)
+
+    def write_snapshot(self, output: BinaryIO, zone_ids: Iterable[str] | None = None) -> None:
+        """Writes a binary snapshot of time zones from this provider, which other providers over the same version of
+        the source can be created from (see the ``snapshot`` parameter of the constructor).
+
+        Zones are written as they currently stand, including the zone intervals which ``warm`` has computed ahead of
+        time, so that providers created from the snapshot don't need to load or compute them
+        again. This is intended for applications with several worker processes: a parent process can write the
+        snapshot to a file, which each worker then opens with ``mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)``
+        and passes to its provider. The zone interval tables are used directly from the mapped file, so the memory
+        they occupy is shared between the workers.
+
+        The snapshot is a compact binary format which is specific to this version of Pyoda Time and to the byte order
+        of the machine; it isn't a substitute for the source data. Zones of types which can't be written to a snapshot
+        are left out, and will be loaded from the source as usual.
+
+        :param output: The stream to write the snapshot to.
+        :param zone_ids: The IDs of the zones to write; if this is None, every zone advertised by the source is
+            written.
+        :raises DateTimeZoneNotFoundError: One of ``zone_ids`` is unknown to this provider.
+        """
+        _Preconditions._check_not_null(output, "output")
+        from .io._date_time_zone_snapshot import _DateTimeZoneSnapshot
+
+        zones = {zone_id: self[zone_id] for zone_id in (self.__ids if zone_ids is None else zone_ids)}
+        _DateTimeZoneSnapshot._write(output, self.__version_id, zones)
+
     def __getitem__(self, zone_id: str) -> DateTimeZone:
         if (zone := self.get_zone_or_none(zone_id)) is None:
             from pyoda_time.time_zones._fixed_date_time_zone import _FixedDateTimeZone
@@ -102,3 +217,32 @@ class DateTimeZoneCache(IDateTimeZoneProvider):
             if (zone := _FixedDateTimeZone._get_fixed_zone_or_null(zone_id)) is None:
                 raise DateTimeZoneNotFoundError(f"Time zone {zone_id} is unknown to source {self.version_id}")
         return zone
+
+    def warm(self, start_year: int, end_year: int, zone_ids: Iterable[str] | None = None) -> None:
+        """Loads the given time zones and prepopulates their zone interval caches for a range of years.
+
+        Zones with recurring rules also have the zone intervals up to ``end_year`` (or the tail zone horizon, if
+        earlier) expanded into their flat interval tables, which ``write_snapshot`` then includes.
+
+        This is intended to be called once at startup, so that the cost of loading zones and computing their zone
+        intervals isn't paid by the first requests which use them. Warming doesn't count towards ``cache_statistics``.
+
+        If the range covers more than ``cache_size`` cache periods, only the later part of it will remain cached.
+
+        :param start_year: The first (ISO) year to prepopulate.
+        :param end_year: The last (ISO) year to prepopulate, inclusive.
+        :param zone_ids: The IDs of the zones to warm; if this is None, every zone advertised by the source is warmed.
+        :raises DateTimeZoneNotFoundError: One of ``zone_ids`` is unknown to this provider.
+        :raises ValueError: ``end_year`` is earlier than ``start_year``, or either year is out of range.
+        """
+        _Preconditions._check_argument(
+            start_year <= end_year, "end_year", "End year {0} is earlier than start year {1}", end_year, start_year
+        )
+        from pyoda_time._instant import Instant
+        from pyoda_time.time_zones._cached_date_time_zone import _CachedDateTimeZone
+
+        start = Instant.from_utc(start_year, 1, 1, 0, 0)
+        end = Instant.from_utc(end_year, 12, 31, 0, 0)
+        for zone_id in self.__ids if zone_ids is None else zone_ids:
+            if isinstance(zone := self[zone_id], _CachedDateTimeZone):
+                zone._warm(start, end)
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from .. import Instant, Offset
     from . import ZoneInterval
     from .io._i_date_time_zone_reader import _IDateTimeZoneReader
+    from .io._i_date_time_zone_writer import _IDateTimeZoneWriter
 
 from .._date_time_zone import DateTimeZone
 from ..utility._csharp_compatibility import _sealed
@@ -78,6 +79,15 @@ class _FixedDateTimeZone(DateTimeZone):
     def get_utc_offset(self, instant: Instant) -> Offset:
         return self.max_offset
 
+    def _write(self, writer: _IDateTimeZoneWriter) -> None:
+        """Writes the time zone to the specified writer.
+
+        :param writer: The writer to write to.
+        """
+        _Preconditions._check_not_null(writer, "writer")
+        writer.write_offset(self.offset)
+        writer.write_string(self.name)
+
     @classmethod
     def read(cls, reader: _IDateTimeZoneReader, id_: str) -> DateTimeZone:
         """Reads a fixed time zone from the specified reader.
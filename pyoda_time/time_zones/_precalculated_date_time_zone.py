@@ -3,24 +3,185 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast, final
+import bisect
+import sys
+from array import array
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO, Final, Literal, cast, final
 
 from pyoda_time._date_time_zone import DateTimeZone
 from pyoda_time._instant import Instant
 from pyoda_time._offset import Offset
 from pyoda_time.time_zones import ZoneInterval
 from pyoda_time.time_zones._standard_daylight_alternating_map import _StandardDaylightAlternatingMap
-from pyoda_time.utility._csharp_compatibility import _sealed, _towards_zero_division
+from pyoda_time.utility import InvalidPyodaDataError
+from pyoda_time.utility._csharp_compatibility import _sealed
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from pyoda_time.time_zones._i_zone_interval_map import _IZoneIntervalMap
     from pyoda_time.time_zones.io._i_date_time_zone_reader import _IDateTimeZoneReader
     from pyoda_time.time_zones.io._i_date_time_zone_writer import _IDateTimeZoneWriter
 
 
+@final
+class _ZoneIntervalTable:
+    """A flat, columnar representation of a contiguous run of zone intervals.
+
+    Interval ``i`` starts at ``transitions[i - 1]`` (or ``start``, for ``i == 0``) and ends at ``transitions[i]`` (or
+    ``end``, for the final interval). ``start`` is the start of time unless the table only covers part of a zone.
+    Transitions are stored as nanoseconds since the Unix epoch in an ``array('q')`` where they fit, so that lookups are
+    a single ``bisect`` over a C-level array. The ``ZoneInterval`` objects themselves are only created when they are
+    first asked for.
+
+    Instances are never mutated after construction, other than to populate the interval cache, so they can safely be
+    swapped in atomically when the table is extended.
+    """
+
+    __slots__ = (
+        "_end",
+        "_end_instant",
+        "_intervals",
+        "_name_indices",
+        "_names",
+        "_savings",
+        "_start",
+        "_start_instant",
+        "_transitions",
+        "_wall_offsets",
+    )
+
+    def __init__(
+        self,
+        transitions: Sequence[int],
+        end_instant: Instant,
+        names: list[str],
+        name_indices: Sequence[int],
+        wall_offsets: Sequence[int],
+        savings: Sequence[int],
+        *,
+        start_instant: Instant | None = None,
+    ) -> None:
+        """Initializes a new table directly from its columns, which are used as they are.
+
+        :param transitions: The start of each interval after the first, in nanoseconds since the Unix epoch.
+        :param end_instant: The end of the final interval.
+        :param names: The distinct names of the intervals.
+        :param name_indices: The index into ``names`` of the name of each interval.
+        :param wall_offsets: The wall offset of each interval, in seconds.
+        :param savings: The daylight savings of each interval, in seconds.
+        :param start_instant: The start of the first interval; defaults to the start of time.
+        """
+        self._start_instant: Final[Instant] = Instant._before_min_value() if start_instant is None else start_instant
+        self._start: Final[int] = self._start_instant._to_unix_time_nanoseconds()
+        self._transitions: Final[Sequence[int]] = transitions
+        self._end_instant: Final[Instant] = end_instant
+        self._end: Final[int] = end_instant._to_unix_time_nanoseconds()
+        self._names: Final[list[str]] = names
+        self._name_indices: Final[Sequence[int]] = name_indices
+        self._wall_offsets: Final[Sequence[int]] = wall_offsets
+        self._savings: Final[Sequence[int]] = savings
+        self._intervals: Final[list[ZoneInterval | None]] = [None] * len(wall_offsets)
+
+    @classmethod
+    def _create(
+        cls,
+        transitions: list[int],
+        end_instant: Instant,
+        names: list[str],
+        wall_offsets: list[int],
+        savings: list[int],
+        *,
+        start_instant: Instant | None = None,
+    ) -> _ZoneIntervalTable:
+        """Creates a table from per-interval lists, packing them into arrays and interning the names.
+
+        :param transitions: The start of each interval after the first, in nanoseconds since the Unix epoch.
+        :param end_instant: The end of the final interval.
+        :param names: The name of each interval.
+        :param wall_offsets: The wall offset of each interval, in seconds.
+        :param savings: The daylight savings of each interval, in seconds.
+        :param start_instant: The start of the first interval; defaults to the start of time.
+        """
+        packed_transitions: Sequence[int]
+        try:
+            packed_transitions = array("q", transitions)
+        except OverflowError:
+            # Only possible for hand-built zones with transitions outside roughly 1677-2262;
+            # bisect works just as well over the list.
+            packed_transitions = transitions
+        interned: dict[str, int] = {}
+        name_indices = array("H", [interned.setdefault(name, len(interned)) for name in names])
+        return cls(
+            packed_transitions,
+            end_instant,
+            [sys.intern(name) for name in interned],
+            name_indices,
+            array("i", wall_offsets),
+            array("i", savings),
+            start_instant=start_instant,
+        )
+
+    @classmethod
+    def _from_intervals(cls, intervals: Sequence[ZoneInterval]) -> _ZoneIntervalTable:
+        """Creates a table from a sequence of adjoining zone intervals."""
+        table = cls._create(
+            [interval._raw_start._to_unix_time_nanoseconds() for interval in intervals[1:]],
+            intervals[-1]._raw_end,
+            [interval.name for interval in intervals],
+            [interval.wall_offset.seconds for interval in intervals],
+            [interval.savings.seconds for interval in intervals],
+            start_instant=intervals[0]._raw_start,
+        )
+        table._intervals[:] = intervals
+        return table
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def _extend(self, intervals: Sequence[ZoneInterval]) -> _ZoneIntervalTable:
+        """Returns a new table consisting of the intervals in this table followed by the given adjoining intervals."""
+        count = len(self)
+        table = _ZoneIntervalTable._create(
+            [
+                *self._transitions,
+                *(interval._raw_start._to_unix_time_nanoseconds() for interval in intervals),
+            ],
+            intervals[-1]._raw_end if intervals else self._end_instant,
+            [self._names[index] for index in self._name_indices] + [interval.name for interval in intervals],
+            [*self._wall_offsets, *(interval.wall_offset.seconds for interval in intervals)],
+            [*self._savings, *(interval.savings.seconds for interval in intervals)],
+            start_instant=self._start_instant,
+        )
+        table._intervals[:count] = self._intervals
+        return table
+
+    def _find(self, nanoseconds: int) -> int:
+        """Returns the index of the interval containing the given number of nanoseconds since the Unix epoch.
+
+        The value must be in the range [``_start``, ``_end``).
+        """
+        return bisect.bisect_right(self._transitions, nanoseconds)
+
+    def _get(self, index: int) -> ZoneInterval:
+        """Returns the zone interval at the given index, creating it if necessary."""
+        if (interval := self._intervals[index]) is None:
+            interval = self._intervals[index] = ZoneInterval(
+                name=self._names[self._name_indices[index]],
+                start=self._start_instant
+                if index == 0
+                else Instant._from_unix_time_nanoseconds(self._transitions[index - 1]),
+                end=self._end_instant
+                if index == len(self._intervals) - 1
+                else Instant._from_unix_time_nanoseconds(self._transitions[index]),
+                wall_offset=Offset._ctor(seconds=self._wall_offsets[index]),
+                savings=Offset._ctor(seconds=self._savings[index]),
+            )
+        return interval
+
+
 @final
 @_sealed
 class _PrecalculatedDateTimeZone(DateTimeZone):
@@ -31,36 +192,126 @@ class _PrecalculatedDateTimeZone(DateTimeZone):
     rest until the end of time.
     """
 
-    __periods: list[ZoneInterval]
+    _DEFAULT_TAIL_ZONE_HORIZON_YEAR: Final[int] = 2100
+    """The year up to which (inclusive) the tail zone's intervals are kept in flat interval tables."""
+
+    __table: _ZoneIntervalTable
+    """The precalculated periods, followed by any tail zone intervals expanded into it by ``_expand_tail_zone``."""
+    __period_count: int
+    """The number of precalculated periods at the start of ``__table``."""
     __tail_zone: _IZoneIntervalMap | None
     __tail_zone_start: Instant
     """The first instant covered by the tail zone, or Instant.AfterMaxValue if there's no tail zone."""
     __first_tail_zone_interval: ZoneInterval | None
+    __tail_zone_horizon: Instant | None
+    """The instant up to which tail zone intervals are kept in ``__table`` or ``__tail_window``, or None once
+    ``__table`` reaches it."""
+    __tail_window: _ZoneIntervalTable | None
+    """A contiguous run of tail zone intervals after the end of ``__table``, around the instants looked up most
+    recently."""
 
-    def __init__(self, id_: str, intervals: list[ZoneInterval], tail_zone: _IZoneIntervalMap | None) -> None:
+    def __init__(
+        self,
+        id_: str,
+        intervals: list[ZoneInterval],
+        tail_zone: _IZoneIntervalMap | None,
+        tail_zone_horizon_year: int = _DEFAULT_TAIL_ZONE_HORIZON_YEAR,
+    ) -> None:
         """Initializes a new instance of the ``_PrecalculatedDateTimeZone`` class.
 
         :param id_: The id.
         :param intervals: The intervals before the tail zone.
         :param tail_zone: The tail zone - which can be any IZoneIntervalMap for normal operation,
             but must be a StandardDaylightAlternatingMap if the result is to be serialized.
+        :param tail_zone_horizon_year: The last year for which intervals from the tail zone are kept in flat
+            interval tables once they have been computed. Instants after that always go to the tail zone itself.
         """
         super().__init__(
             id_,
             False,
-            self.__compute_offset(intervals, tail_zone, Offset.min),
-            self.__compute_offset(intervals, tail_zone, Offset.max),
+            self.__compute_offset([interval.wall_offset for interval in intervals], tail_zone, Offset.min),
+            self.__compute_offset([interval.wall_offset for interval in intervals], tail_zone, Offset.max),
+        )
+        self._validate_periods(intervals, tail_zone)
+        self.__initialize(
+            _ZoneIntervalTable._from_intervals(intervals),
+            len(intervals),
+            tail_zone,
+            Instant.from_utc(tail_zone_horizon_year + 1, 1, 1, 0, 0),
         )
-        self.__periods = intervals
+
+    @classmethod
+    def __ctor(
+        cls,
+        id_: str,
+        table: _ZoneIntervalTable,
+        wall_offsets: list[Offset],
+        tail_zone: _IZoneIntervalMap | None,
+    ) -> _PrecalculatedDateTimeZone:
+        """Initializes a new instance directly from an interval table, without creating any ``ZoneInterval``."""
+        self = super().__new__(cls)
+        super(_PrecalculatedDateTimeZone, self).__init__(
+            id_,
+            False,
+            cls.__compute_offset(wall_offsets, tail_zone, Offset.min),
+            cls.__compute_offset(wall_offsets, tail_zone, Offset.max),
+        )
+        _Preconditions._check_argument(
+            tail_zone is not None or table._end_instant == Instant._after_max_value(),
+            "tail_zone",
+            "Null tail zone given but periods don't cover all of time",
+        )
+        self.__initialize(
+            table,
+            len(table),
+            tail_zone,
+            Instant.from_utc(cls._DEFAULT_TAIL_ZONE_HORIZON_YEAR + 1, 1, 1, 0, 0),
+        )
+        return self
+
+    def _with_tail_zone_horizon_year(self, tail_zone_horizon_year: int) -> _PrecalculatedDateTimeZone:
+        """Returns a zone with the same intervals as this one, but which keeps tail zone intervals in flat interval
+        tables up to (and including) the given year rather than its own horizon.
+
+        The new zone shares this zone's interval table as it currently stands.
+        """
+        zone = super().__new__(type(self))
+        super(_PrecalculatedDateTimeZone, zone).__init__(self.id, False, self.min_offset, self.max_offset)
+        zone.__initialize(
+            self.__table,
+            self.__period_count,
+            self.__tail_zone,
+            Instant.from_utc(tail_zone_horizon_year + 1, 1, 1, 0, 0),
+        )
+        return zone
+
+    def __initialize(
+        self,
+        table: _ZoneIntervalTable,
+        period_count: int,
+        tail_zone: _IZoneIntervalMap | None,
+        tail_zone_horizon: Instant | None,
+    ) -> None:
+        self.__table = table
+        self.__tail_window = None
+        self.__period_count = period_count
         self.__tail_zone = tail_zone
-        self.__tail_zone_start = intervals[-1]._raw_end  # We want this to be AfterMaxValue for tail-less zones.
+        # We want this to be AfterMaxValue for tail-less zones.
+        self.__tail_zone_start = (
+            table._end_instant
+            if period_count == len(table)
+            else Instant._from_unix_time_nanoseconds(table._transitions[period_count - 1])
+        )
         if tail_zone is not None:
             self.__first_tail_zone_interval = tail_zone.get_zone_interval(self.__tail_zone_start)._with_start(
                 self.__tail_zone_start
             )
+            self.__tail_zone_horizon = (
+                tail_zone_horizon if tail_zone_horizon is not None and table._end_instant < tail_zone_horizon else None
+            )
         else:
             self.__first_tail_zone_interval = None
-        self._validate_periods(intervals, tail_zone)
+            self.__tail_zone_horizon = None
 
     @staticmethod
     def _validate_periods(periods: list[ZoneInterval], tail_zone: _IZoneIntervalMap | None) -> None:
@@ -98,31 +349,74 @@ class _PrecalculatedDateTimeZone(DateTimeZone):
         :param instant: The Instant to find.
         :return: The ZoneInterval including the current instant.
         """
-        if self.__tail_zone is not None and instant >= self.__tail_zone_start:
-            # Clamp the tail zone interval to start at the end of our final period, if necessary, so that the
-            # join is seamless.
-            interval_from_tail_zone: ZoneInterval = self.__tail_zone.get_zone_interval(instant)
-            return (
-                cast(ZoneInterval, self.__first_tail_zone_interval)
-                if interval_from_tail_zone._raw_start < self.__tail_zone_start
-                else interval_from_tail_zone
-            )
+        table = self.__table
+        nanoseconds = instant._to_unix_time_nanoseconds()
+        if nanoseconds < table._end:
+            return table._get(table._find(nanoseconds))
+
+        if self.__tail_zone is None:
+            # Note: this would indicate a bug. The time zone is meant to cover the whole of time.
+            raise RuntimeError(f"Instant {instant} did not exist in time zone {self.id}")
+
+        if (window := self.__tail_window) is not None and window._start <= nanoseconds < window._end:
+            return window._get(window._find(nanoseconds))
+
+        # Clamp the tail zone interval to start at the end of our final period, if necessary, so that the
+        # join is seamless.
+        interval_from_tail_zone: ZoneInterval = self.__tail_zone.get_zone_interval(instant)
+        if interval_from_tail_zone._raw_start < self.__tail_zone_start:
+            interval_from_tail_zone = cast(ZoneInterval, self.__first_tail_zone_interval)
+        if self.__tail_zone_horizon is not None and instant < self.__tail_zone_horizon:
+            self.__add_to_tail_window(interval_from_tail_zone)
+        return interval_from_tail_zone
+
+    def __add_to_tail_window(self, interval: ZoneInterval) -> None:
+        """Adds a tail zone interval to ``__tail_window``, extending the window if the interval adjoins it and
+        replacing it otherwise.
+
+        Only the interval which was asked for is computed, so the first lookup in a zone costs no more than a lookup
+        in the tail zone itself; sequential lookups then build up a window which they can bisect. The window is
+        replaced rather than mutated, so concurrent readers always see a consistent table.
+        """
+        window = self.__tail_window
+        if window is not None and interval._raw_start == window._end_instant:
+            window = window._extend([interval])
+        elif window is not None and interval.has_end and interval._raw_end == window._start_instant:
+            window = _ZoneIntervalTable._from_intervals([interval, *map(window._get, range(len(window)))])
+        else:
+            window = _ZoneIntervalTable._from_intervals([interval])
+        self.__tail_window = window
 
-        lower = 0  # Inclusive
-        upper = len(self.__periods)  # Exclusive
-
-        while lower < upper:
-            current = _towards_zero_division(lower + upper, 2)
-            candidate = self.__periods[current]
-            if candidate._raw_start > instant:
-                upper = current
-            # Safe to use RawEnd, as it's just for the comparison.
-            elif candidate._raw_end <= instant:
-                lower = current + 1
-            else:
-                return candidate
-        # Note: this would indicate a bug. The time zone is meant to cover the whole of time.
-        raise RuntimeError(f"Instant {instant} did not exist in time zone {self.id}")
+    def _expand_tail_zone(self, end: Instant) -> None:
+        """Appends tail zone intervals to the interval table, so that it covers every instant up to ``end`` or the
+        horizon, whichever is earlier.
+
+        Unlike the intervals kept by ``get_zone_interval``, these are written to snapshots by ``_write_snapshot``.
+        This walks the tail zone one interval at a time from the end of the table, so it is intended for warming
+        a zone ahead of time (see ``DateTimeZoneCache.warm``) rather than for use on a lookup.
+        """
+        if (horizon := self.__tail_zone_horizon) is None or (tail_zone := self.__tail_zone) is None:
+            return
+        table = self.__table
+        limit = min(end, horizon)
+        if table._end_instant > limit:
+            return
+        interval = (
+            cast(ZoneInterval, self.__first_tail_zone_interval)
+            if len(table) == self.__period_count
+            else tail_zone.get_zone_interval(table._end_instant)
+        )
+        intervals: list[ZoneInterval] = []
+        while interval._raw_start <= limit:
+            intervals.append(interval)
+            if not interval.has_end:
+                break
+            interval = tail_zone.get_zone_interval(interval._raw_end)
+        table = self.__table = table._extend(intervals)
+        if table._end_instant >= horizon:
+            self.__tail_zone_horizon = None
+        if (window := self.__tail_window) is not None and window._end <= table._end:
+            self.__tail_window = None
 
     # region I/O
 
@@ -137,9 +431,9 @@ class _PrecalculatedDateTimeZone(DateTimeZone):
         # for some zones, as it meant that each string would be written out with just a single
         # byte after the pooling. Optimizing the string pool globally instead allows for
         # roughly the same efficiency, and simpler code here.
-        writer.write_count(len(self.__periods))
+        writer.write_count(self.__period_count)
         previous: Instant | None = None
-        for period in self.__periods:
+        for period in map(self.__table._get, range(self.__period_count)):
             writer.write_zone_interval_transition(previous, previous := period._raw_start)
             writer.write_string(period.name)
             writer.write_offset(period.wall_offset)
@@ -168,20 +462,152 @@ class _PrecalculatedDateTimeZone(DateTimeZone):
         #  Preconditions.DebugCheckNotNull(reader, nameof(reader));
         #  Preconditions.DebugCheckNotNull(id, nameof(id));
         size = reader.read_count()
-        periods: list[ZoneInterval] = []
+        transitions: list[int] = []
+        names: list[str] = []
+        wall_offsets: list[Offset] = []
+        savings: list[int] = []
         # It's not entirely clear why we don't just assume that the first zone interval always starts at
         # Instant.BeforeMinValue (given that we check that later) but we don't... and changing that now could cause
         # compatibility issues.
         start = reader.read_zone_interval_transition(None)
+        _Preconditions._check_argument(
+            not start._is_valid, "periods", "Periods in precalculated time zone must start with the beginning of time"
+        )
         for i in range(size):
-            name = reader.read_string()
-            offset = reader.read_offset()
-            savings = reader.read_offset()
+            names.append(reader.read_string())
+            wall_offsets.append(reader.read_offset())
+            savings.append(reader.read_offset().seconds)
             next_start = reader.read_zone_interval_transition(start)
-            periods.append(ZoneInterval(name=name, start=start, end=next_start, wall_offset=offset, savings=savings))
+            _Preconditions._check_argument(
+                start < next_start, "start", "The start Instant must be less than the end Instant. start: {0}", start
+            )
+            if i < size - 1:
+                transitions.append(next_start._to_unix_time_nanoseconds())
             start = next_start
         tail_zone = _StandardDaylightAlternatingMap._read(reader) if reader.read_byte() == 1 else None
-        return _PrecalculatedDateTimeZone(id_=id_, intervals=periods, tail_zone=tail_zone)
+        table = _ZoneIntervalTable._create(
+            transitions, start, names, [offset.seconds for offset in wall_offsets], savings
+        )
+        return _PrecalculatedDateTimeZone.__ctor(id_, table, wall_offsets, tail_zone)
+
+    # endregion
+
+    # region Snapshots
+
+    __SNAPSHOT_END_OF_TIME: Final[int] = 1
+    """Snapshot flag: the interval table extends to the end of time."""
+    __SNAPSHOT_HAS_HORIZON: Final[int] = 2
+    """Snapshot flag: the tail zone may still be expanded into the interval table."""
+    __SNAPSHOT_HAS_TAIL_ZONE: Final[int] = 4
+    """Snapshot flag: the zone has a tail zone."""
+
+    @property
+    def _supports_snapshot(self) -> bool:
+        """Whether this zone can be written by ``_write_snapshot``.
+
+        That requires the transitions to be held in an array (rather than a list, for hand-built zones with transitions
+        which don't fit in 64 bits) and any tail zone to be serializable.
+        """
+        return isinstance(self.__table._transitions, array | memoryview) and (
+            self.__tail_zone is None or isinstance(self.__tail_zone, _StandardDaylightAlternatingMap)
+        )
+
+    def _write_snapshot(self, output: BinaryIO) -> None:
+        """Writes the zone's interval table as it currently stands, including any tail zone intervals which have been
+        expanded into it, in the form read by ``_read_snapshot``.
+
+        Unlike ``_write``, the columns of the table are written as native arrays, at an offset from the start of the
+        data which is a multiple of 8 bytes, so that they can be used in place without being decoded.
+
+        :param output: The stream to write to.
+        """
+        from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter
+
+        _Preconditions._check_state(self._supports_snapshot, f"Zone {self.id} can't be written to a snapshot")
+        table = self.__table
+        with BytesIO() as header:
+            writer = _DateTimeZoneWriter._ctor(header, None)
+            writer.write_count(len(table))
+            writer.write_count(self.__period_count)
+            writer.write_offset(self.min_offset)
+            writer.write_offset(self.max_offset)
+            writer.write_count(len(table._names))
+            for name in table._names:
+                writer.write_string(name)
+            writer.write_byte(
+                (self.__SNAPSHOT_END_OF_TIME if table._end_instant == Instant._after_max_value() else 0)
+                | (self.__SNAPSHOT_HAS_HORIZON if self.__tail_zone_horizon is not None else 0)
+                | (self.__SNAPSHOT_HAS_TAIL_ZONE if self.__tail_zone is not None else 0)
+            )
+            if isinstance(self.__tail_zone, _StandardDaylightAlternatingMap):
+                self.__tail_zone._write(writer)
+            header.write(bytes(-header.tell() % 8))
+            output.write(header.getbuffer())
+        output.write(array("q", table._transitions))
+        extra = [
+            instant._to_unix_time_nanoseconds()
+            for instant in (table._end_instant, self.__tail_zone_horizon)
+            if instant is not None and instant != Instant._after_max_value()
+        ]
+        output.write(array("q", extra))
+        output.write(array("i", table._wall_offsets))
+        output.write(array("i", table._savings))
+        output.write(array("H", table._name_indices))
+
+    @classmethod
+    def _read_snapshot(cls, data: memoryview, id_: str) -> _PrecalculatedDateTimeZone:
+        """Reads a zone written by ``_write_snapshot``.
+
+        The columns of the interval table are views of ``data`` rather than copies of it, so ``data`` should be
+        read-only (e.g. a memory-mapped file) and must stay valid for as long as the zone is in use.
+
+        :param data: The data written by ``_write_snapshot``, starting at an 8-byte aligned address.
+        :param id_: The id.
+        :return: The time zone.
+        """
+        from pyoda_time.time_zones.io._date_time_zone_reader import _DateTimeZoneReader
+
+        with BytesIO(data) as stream:
+            reader = _DateTimeZoneReader._ctor(stream, None)
+            count = reader.read_count()
+            period_count = reader.read_count()
+            min_offset = reader.read_offset()
+            max_offset = reader.read_offset()
+            names = [sys.intern(reader.read_string()) for _ in range(reader.read_count())]
+            flags = reader.read_byte()
+            tail_zone = _StandardDaylightAlternatingMap._read(reader) if flags & cls.__SNAPSHOT_HAS_TAIL_ZONE else None
+            position = stream.tell()
+        position += -position % 8
+        if not 0 < period_count <= count:
+            raise InvalidPyodaDataError(f"Invalid period count {period_count} for a table of {count} intervals")
+
+        def column(format_: Literal["q", "i", "H"], length: int) -> memoryview[int]:
+            nonlocal position
+            start, position = position, position + length * array(format_).itemsize
+            if position > len(data):
+                raise InvalidPyodaDataError(f"Snapshot data for zone {id_} is truncated")
+            return data[start:position].cast(format_)
+
+        transitions = column("q", count - 1)
+        end_of_time = bool(flags & cls.__SNAPSHOT_END_OF_TIME)
+        extra = column("q", (0 if end_of_time else 1) + (1 if flags & cls.__SNAPSHOT_HAS_HORIZON else 0))
+        end = Instant._after_max_value() if end_of_time else Instant._from_unix_time_nanoseconds(extra[0])
+        horizon = Instant._from_unix_time_nanoseconds(extra[-1]) if flags & cls.__SNAPSHOT_HAS_HORIZON else None
+        wall_offsets = column("i", count)
+        savings = column("i", count)
+        name_indices = column("H", count)
+        if max(name_indices) >= len(names):
+            raise InvalidPyodaDataError(f"Invalid name index in snapshot data for zone {id_}")
+
+        self = super().__new__(cls)
+        super(_PrecalculatedDateTimeZone, self).__init__(id_, False, min_offset, max_offset)
+        self.__initialize(
+            _ZoneIntervalTable(transitions, end, names, name_indices, wall_offsets, savings),
+            period_count,
+            tail_zone,
+            horizon,
+        )
+        return self
 
     # endregion
 
@@ -189,17 +615,17 @@ class _PrecalculatedDateTimeZone(DateTimeZone):
 
     @staticmethod
     def __compute_offset(
-        intervals: list[ZoneInterval],
+        wall_offsets: Sequence[Offset],
         tail_zone: _IZoneIntervalMap | None,
         aggregator: Callable[[Offset, Offset], Offset],
     ) -> Offset:
         """Reasonably simple way of computing the maximum/minimum offset from either periods or transitions, with or
         without a tail zone."""
-        _Preconditions._check_not_null(intervals, "intervals")
-        _Preconditions._check_argument(len(intervals) > 0, "intervals", "No intervals specified")
-        ret: Offset = intervals[0].wall_offset
-        for i in range(len(intervals)):
-            ret = aggregator(ret, intervals[i].wall_offset)
+        _Preconditions._check_not_null(wall_offsets, "intervals")
+        _Preconditions._check_argument(len(wall_offsets) > 0, "intervals", "No intervals specified")
+        ret: Offset = wall_offsets[0]
+        for wall_offset in wall_offsets:
+            ret = aggregator(ret, wall_offset)
         if tail_zone is not None:
             # Effectively a shortcut for picking either tailZone.MinOffset or
             # tailZone.MaxOffset
@@ -3,12 +3,14 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
+import mmap
 import types
 from importlib import resources
-from typing import TYPE_CHECKING, BinaryIO, _ProtocolMeta, cast, final
+from typing import TYPE_CHECKING, BinaryIO, _ProtocolMeta, final
 
 from pyoda_time.time_zones import IDateTimeZoneSource, TzdbZone1970Location, TzdbZoneLocation
 from pyoda_time.time_zones.cldr import MapZone, WindowsZones
+from pyoda_time.time_zones.io._memory_view_stream import _MemoryViewStream
 from pyoda_time.time_zones.io._tzdb_stream_data import _TzdbStreamData
 from pyoda_time.utility import InvalidPyodaDataError
 from pyoda_time.utility._csharp_compatibility import _private, _sealed, _to_lookup
@@ -26,11 +28,25 @@ class __TzdbDateTimeZoneSourceMeta(_ProtocolMeta):
     @property
     def default(self) -> TzdbDateTimeZoneSource:
         if getattr(self, "_default", None) is None:
-            path = resources.files(__name__) / "Tzdb.nzd"
-            with cast(BinaryIO, path.open("rb")) as stream:
-                self._default = TzdbDateTimeZoneSource._ctor(_TzdbStreamData._from_stream(stream))
+            stream = _MemoryViewStream(self.__map_default_data())
+            self._default = TzdbDateTimeZoneSource._ctor(_TzdbStreamData._from_stream(stream))
         return self._default
 
+    @staticmethod
+    def __map_default_data() -> memoryview:
+        """Returns the bundled TZDB data, memory-mapped where possible.
+
+        Mapping the file (rather than reading it) means that processes using the default source share a single copy of
+        the data in the page cache, and that only the parts of the file which are used are ever read.
+        """
+        resource = resources.files(__name__) / "Tzdb.nzd"
+        with resources.as_file(resource) as path, path.open("rb") as file:
+            try:
+                return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            except (OSError, ValueError):
+                # The file can't be mapped (e.g. on some special file systems); read it instead.
+                return memoryview(file.read())
+
 
 @final
 @_sealed
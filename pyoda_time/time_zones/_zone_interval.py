@@ -33,6 +33,16 @@ class ZoneInterval:
     There is no ordering defined between zone intervals.
     """
 
+    __slots__ = (
+        "__local_end",
+        "__local_start",
+        "__name",
+        "__raw_end",
+        "__raw_start",
+        "__savings",
+        "__wall_offset",
+    )
+
     @property
     def _raw_start(self) -> Instant:
         """Returns the underlying start instant of this zone interval.
@@ -0,0 +1,88 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+from typing import final
+
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+
+
+@final
+@_sealed
+@_private
+class ZoneIntervalCacheStatistics:
+    """Hit, miss and eviction counters for the zone interval caches of the time zones returned by a
+    ``DateTimeZoneCache``.
+
+    A single instance is shared by every cached zone returned by the provider, so the counters describe the provider as
+    a whole. Lookups by instant (e.g. ``DateTimeZone.get_zone_interval``) and by local date and time (e.g.
+    ``DateTimeZone.map_local``) use separate caches, but are both counted here. The counters are updated without
+    locking; under concurrent use they are approximate, but never affect the results of any time zone computation.
+    """
+
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of lookups which were answered from a cache entry.
+
+        :return: The number of lookups which were answered from a cache entry.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of lookups which had to compute a new cache entry.
+
+        :return: The number of lookups which had to compute a new cache entry.
+        """
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Gets the number of misses which replaced an existing cache entry for a different period.
+
+        A high proportion of evictions to misses indicates that the cache is too small for the range of instants being
+        looked up; see the ``cache_size`` and ``period_shift`` parameters of ``DateTimeZoneCache``.
+
+        :return: The number of misses which replaced an existing cache entry for a different period.
+        """
+        return self._evictions
+
+    @property
+    def lookups(self) -> int:
+        """Gets the total number of lookups, i.e. the sum of ``hits`` and ``misses``.
+
+        :return: The total number of lookups.
+        """
+        return self._hits + self._misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Gets the proportion of lookups which were answered from a cache entry, or 0.0 if there have been no lookups.
+
+        :return: The proportion of lookups which were answered from a cache entry.
+        """
+        lookups = self.lookups
+        return self._hits / lookups if lookups else 0.0
+
+    @classmethod
+    def _ctor(cls) -> ZoneIntervalCacheStatistics:
+        self = super().__new__(cls)
+        self.reset()
+        return self
+
+    def reset(self) -> None:
+        """Resets all of the counters to zero."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ZoneIntervalCacheStatistics(hits={self._hits}, misses={self._misses}, evictions={self._evictions}, "
+            f"hit_ratio={self.hit_ratio:.3f})"
+        )
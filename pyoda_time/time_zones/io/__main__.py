@@ -0,0 +1,41 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Rewrites a TZDB stream (``.nzd`` file) with a zone index, as read by ``_TzdbStreamData``.
+
+This is how the bundled ``Tzdb.nzd`` is produced from the file published by Noda Time, which has no zone index::
+
+    python -m pyoda_time.time_zones.io tzdb2025b.nzd pyoda_time/time_zones/Tzdb.nzd
+"""
+
+from __future__ import annotations
+
+import argparse
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from pyoda_time.time_zones.io._date_time_zone_writer import _TzdbStreamWriter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _main(args: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyoda_time.time_zones.io",
+        description="Rewrite a TZDB stream (.nzd file), adding a zone index so that zones can be loaded lazily.",
+    )
+    parser.add_argument("input", help="the .nzd file to read, with or without a zone index")
+    parser.add_argument("output", help="the .nzd file to write; this may be the same as the input")
+    parser.add_argument(
+        "--sequential", action="store_true", help="write the zones without an index, in the original layout"
+    )
+    options = parser.parse_args(args)
+    with open(options.input, "rb") as input_:
+        data = BytesIO(input_.read())
+    with open(options.output, "wb") as output:
+        _TzdbStreamWriter._rewrite(data, output, indexed=not options.sequential)
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,157 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+import struct
+import sys
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO, Final, final
+
+from pyoda_time.time_zones._cached_date_time_zone import _CachedDateTimeZone
+from pyoda_time.time_zones._fixed_date_time_zone import _FixedDateTimeZone
+from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+from pyoda_time.time_zones.io._date_time_zone_reader import _DateTimeZoneReader
+from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter
+from pyoda_time.utility import InvalidPyodaDataError
+from pyoda_time.utility._csharp_compatibility import _private, _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pyoda_time._date_time_zone import DateTimeZone
+
+
+@final
+@_sealed
+@_private
+class _DateTimeZoneSnapshot:
+    """A read-only view of the time zones in a snapshot written by ``_DateTimeZoneSnapshot._write``.
+
+    A snapshot starts with two 32-bit integers: the format version, and the offset of the zone data from the start of
+    the snapshot, which is a multiple of 8. Between them and the zone data is a header written by
+    ``_DateTimeZoneWriter`` without a string pool: the byte order of the machine which wrote the snapshot, the version
+    ID of the provider, then the number of zones followed by the ID, ``_DateTimeZoneType``, offset (relative to the
+    start of the zone data, and also a multiple of 8) and length of each zone's data. Zones with identical data share
+    it.
+
+    Fixed zones are written by ``_FixedDateTimeZone._write``, and precalculated zones by
+    ``_PrecalculatedDateTimeZone._write_snapshot``, whose interval tables are used in place rather than decoded. The
+    snapshot is therefore specific to the byte order of the machine which wrote it, and its buffer must outlive the
+    zones created from it.
+    """
+
+    __VERSION: Final[int] = 0
+    __HEADER: Final[struct.Struct] = struct.Struct("ii")
+
+    __data: memoryview
+    __version_id: str
+    __zones: dict[str, tuple[_DateTimeZoneWriter._DateTimeZoneType, int, int]]
+
+    @property
+    def version_id(self) -> str:
+        """The version ID of the provider which wrote the snapshot."""
+        return self.__version_id
+
+    @classmethod
+    def _ctor(cls, data: memoryview) -> _DateTimeZoneSnapshot:
+        """Reads the header of a snapshot. The zones themselves are only read by ``_create_zone``.
+
+        :param data: The snapshot, which must start at an 8-byte aligned address.
+        :raises InvalidPyodaDataError: The snapshot is invalid, or was written on a machine with a different byte
+            order.
+        """
+        self = super().__new__(cls)
+        if len(data) < cls.__HEADER.size:
+            raise InvalidPyodaDataError("Snapshot is truncated")
+        version, zone_data_start = cls.__HEADER.unpack_from(data)
+        if version != cls.__VERSION:
+            raise InvalidPyodaDataError(f"Unable to read snapshot with version {version}")
+        if not cls.__HEADER.size <= zone_data_start <= len(data):
+            raise InvalidPyodaDataError("Snapshot is truncated")
+        with BytesIO(data[cls.__HEADER.size : zone_data_start]) as stream:
+            reader = _DateTimeZoneReader._ctor(stream, None)
+            if (byte_order := reader.read_string()) != sys.byteorder:
+                raise InvalidPyodaDataError(f"Unable to read snapshot with {byte_order}-endian data on this machine")
+            self.__version_id = reader.read_string()
+            self.__data = data[zone_data_start:]
+            self.__zones = {}
+            for _ in range(reader.read_count()):
+                id_ = reader.read_string()
+                type_ = _DateTimeZoneWriter._DateTimeZoneType(reader.read_byte())
+                offset = reader.read_count()
+                length = reader.read_count()
+                if offset + length > len(self.__data):
+                    raise InvalidPyodaDataError(f"Data for zone {id_} is outside the snapshot")
+                self.__zones[id_] = (type_, offset, length)
+        return self
+
+    def _create_zone(self, id_: str) -> DateTimeZone | None:
+        """Creates the zone with the given ID from the snapshot.
+
+        :param id_: The ID of the zone.
+        :return: The zone, or None if the snapshot doesn't contain it.
+        """
+        if (entry := self.__zones.get(id_)) is None:
+            return None
+        type_, offset, length = entry
+        data = self.__data[offset : offset + length]
+        match type_:
+            case _DateTimeZoneWriter._DateTimeZoneType.FIXED:
+                with BytesIO(data) as stream:
+                    return _FixedDateTimeZone.read(_DateTimeZoneReader._ctor(stream, None), id_)
+            case _DateTimeZoneWriter._DateTimeZoneType.PRECALCULATED:
+                return _PrecalculatedDateTimeZone._read_snapshot(data, id_)
+            case _:
+                raise InvalidPyodaDataError(f"Unknown time zone type {type_.name}")
+
+    @classmethod
+    def _write(cls, output: BinaryIO, version_id: str, zones: Mapping[str, DateTimeZone]) -> None:
+        """Writes a snapshot of the given zones.
+
+        Cached zones are written without their caches. Zones which can't be written (such as those of types other than
+        fixed and precalculated zones) are left out.
+
+        :param output: Where to send the serialized output.
+        :param version_id: The version ID of the provider the zones came from.
+        :param zones: The zones to write, keyed by the ID to use for them.
+        """
+        _Preconditions._check_not_null(output, "output")
+        _Preconditions._check_not_null(version_id, "version_id")
+        entries: list[tuple[str, _DateTimeZoneWriter._DateTimeZoneType, int, int]] = []
+        offsets: dict[tuple[_DateTimeZoneWriter._DateTimeZoneType, bytes], int] = {}
+        with BytesIO() as zone_data:
+            for id_, zone in zones.items():
+                if isinstance(zone, _CachedDateTimeZone):
+                    zone = zone._time_zone
+                with BytesIO() as stream:
+                    if isinstance(zone, _FixedDateTimeZone):
+                        type_ = _DateTimeZoneWriter._DateTimeZoneType.FIXED
+                        zone._write(_DateTimeZoneWriter._ctor(stream, None))
+                    elif isinstance(zone, _PrecalculatedDateTimeZone) and zone._supports_snapshot:
+                        type_ = _DateTimeZoneWriter._DateTimeZoneType.PRECALCULATED
+                        zone._write_snapshot(stream)
+                    else:
+                        continue
+                    data = stream.getvalue()
+                if (offset := offsets.get((type_, data))) is None:
+                    zone_data.write(bytes(-zone_data.tell() % 8))
+                    offset = offsets[type_, data] = zone_data.tell()
+                    zone_data.write(data)
+                entries.append((id_, type_, offset, len(data)))
+
+            with BytesIO() as header:
+                writer = _DateTimeZoneWriter._ctor(header, None)
+                writer.write_string(sys.byteorder)
+                writer.write_string(version_id)
+                writer.write_count(len(entries))
+                for id_, type_, offset, length in entries:
+                    writer.write_string(id_)
+                    writer.write_byte(type_)
+                    writer.write_count(offset)
+                    writer.write_count(length)
+                header.write(bytes(-(cls.__HEADER.size + header.tell()) % 8))
+                output.write(cls.__HEADER.pack(cls.__VERSION, cls.__HEADER.size + header.tell()))
+                output.write(header.getbuffer())
+            output.write(zone_data.getbuffer())
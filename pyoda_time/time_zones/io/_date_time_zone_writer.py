@@ -3,12 +3,15 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
+import struct
 from enum import IntEnum
+from io import BytesIO
 from typing import TYPE_CHECKING, BinaryIO, Final, final
 
 from pyoda_time._instant import Instant
 from pyoda_time._pyoda_constants import PyodaConstants
 from pyoda_time.time_zones.io._i_date_time_zone_writer import _IDateTimeZoneWriter
+from pyoda_time.time_zones.io._tzdb_stream_field_id import _TzdbStreamFieldId
 from pyoda_time.utility._csharp_compatibility import (
     _csharp_modulo,
     _CsharpConstants,
@@ -19,6 +22,8 @@ from pyoda_time.utility._csharp_compatibility import (
 from pyoda_time.utility._preconditions import _Preconditions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
     from pyoda_time._offset import Offset
 
 
@@ -264,3 +269,128 @@ class _DateTimeZoneWriter(_IDateTimeZoneWriter):
     def write_byte(self, value: int) -> None:
         # TODO unchecked (unused)
         self.__output.write(bytes([value]))
+
+
+@final
+@_sealed
+@_private
+class _TzdbStreamWriter:
+    """Writes complete TZDB streams, as read by ``_TzdbStreamData``.
+
+    A stream consists of the format version (a 32-bit integer) followed by a sequence of fields, each of which is a
+    ``_TzdbStreamFieldId`` byte, the length of the data (WriteCount) and then the data itself. The string pool is always
+    written first, and the ``TIME_ZONE`` fields last. By default the zones are preceded by a ``ZONE_INDEX`` field, so
+    that readers can find each zone directly instead of reading every zone field when the stream is opened.
+    """
+
+    __VERSION: Final[int] = 0
+
+    @classmethod
+    def _write(
+        cls,
+        output: BinaryIO,
+        string_pool: Sequence[str],
+        fields: Iterable[tuple[_TzdbStreamFieldId | int, bytes]],
+        zones: Mapping[str, bytes],
+        *,
+        indexed: bool = True,
+    ) -> None:
+        """Writes a TZDB stream.
+
+        :param output: Where to send the serialized output.
+        :param string_pool: The complete string pool used by the data of the other fields.
+        :param fields: The data of the fields other than the string pool and the time zones, in the order to write them.
+        :param zones: The data of each ``TIME_ZONE`` field (which starts with the zone ID), keyed by zone ID.
+        :param indexed: Whether to write a ``ZONE_INDEX`` field before the time zones. Streams written without one can
+            still be read, but every zone field has to be read when the stream is opened.
+        """
+        _Preconditions._check_not_null(output, "output")
+        _Preconditions._check_not_null(string_pool, "string_pool")
+        fields = list(fields)
+        for field_id, _ in fields:
+            _Preconditions._check_argument(
+                field_id
+                not in (_TzdbStreamFieldId.STRING_POOL, _TzdbStreamFieldId.TIME_ZONE, _TzdbStreamFieldId.ZONE_INDEX),
+                "fields",
+                "Field {0} is written by the stream writer itself",
+                field_id,
+            )
+
+        output.write(struct.pack("i", cls.__VERSION))
+        with BytesIO() as pool_data:
+            writer = _DateTimeZoneWriter._ctor(pool_data, None)
+            writer.write_count(len(string_pool))
+            for value in string_pool:
+                writer.write_string(value)
+            cls.__write_field(output, _TzdbStreamFieldId.STRING_POOL, pool_data.getvalue())
+        for field_id, data in fields:
+            cls.__write_field(output, field_id, data)
+
+        with BytesIO() as zone_block:
+            offsets: dict[str, int] = {}
+            for zone_id, data in zones.items():
+                offsets[zone_id] = zone_block.tell()
+                cls.__write_field(zone_block, _TzdbStreamFieldId.TIME_ZONE, data)
+            if indexed:
+                with BytesIO() as index_data:
+                    # The string pool has already been written, so the IDs must not add anything to it.
+                    writer = _DateTimeZoneWriter._ctor(index_data, list(string_pool))
+                    writer.write_count(zone_block.tell())
+                    writer.write_count(len(offsets))
+                    for zone_id, offset in offsets.items():
+                        _Preconditions._check_argument(
+                            zone_id in string_pool, "zones", "Zone ID {0} is not in the string pool", zone_id
+                        )
+                        writer.write_string(zone_id)
+                        writer.write_count(offset)
+                    cls.__write_field(output, _TzdbStreamFieldId.ZONE_INDEX, index_data.getvalue())
+            output.write(zone_block.getbuffer())
+
+    @classmethod
+    def _rewrite(cls, input_: BinaryIO, output: BinaryIO, *, indexed: bool = True) -> None:
+        """Copies a TZDB stream in either layout, with or without a zone index.
+
+        The fields are copied without being parsed, apart from reading the string pool and the ID of each zone.
+
+        :param input_: The stream to read, positioned at its start.
+        :param output: Where to send the serialized output.
+        :param indexed: Whether to write a ``ZONE_INDEX`` field before the time zones.
+        """
+        # Imported here rather than at module level, as this module is imported by those ones.
+        from pyoda_time.time_zones.io._date_time_zone_reader import _DateTimeZoneReader
+        from pyoda_time.time_zones.io._tzdb_stream_field import _TzdbStreamField
+        from pyoda_time.utility import InvalidPyodaDataError
+
+        _Preconditions._check_not_null(input_, "input_")
+        version = struct.unpack("i", input_.read(4))[0]
+        if version != cls.__VERSION:
+            raise InvalidPyodaDataError(f"Unable to read stream with version {version}")
+
+        string_pool: Sequence[str] | None = None
+        fields: list[tuple[_TzdbStreamFieldId | int, bytes]] = []
+        zones: dict[str, bytes] = {}
+        for field in _TzdbStreamField._read_fields(input_):
+            with field._create_stream() as stream:
+                data = stream.read()
+            match field.id:
+                case _TzdbStreamFieldId.STRING_POOL:
+                    reader = _DateTimeZoneReader._ctor(BytesIO(data), None)
+                    string_pool = [reader.read_string() for _ in range(reader.read_count())]
+                case _TzdbStreamFieldId.TIME_ZONE:
+                    if string_pool is None:
+                        raise InvalidPyodaDataError(f"String pool must be present before field {field.id}")
+                    zones[_DateTimeZoneReader._ctor(BytesIO(data), string_pool).read_string()] = data
+                case _TzdbStreamFieldId.ZONE_INDEX:
+                    # The zone fields follow the index as ordinary fields, and the index is rebuilt from them.
+                    pass
+                case _:
+                    fields.append((field.id, data))
+        if string_pool is None:
+            raise InvalidPyodaDataError("Incomplete TZDB data. Missing field: string pool")
+        cls._write(output, string_pool, fields, zones, indexed=indexed)
+
+    @staticmethod
+    def __write_field(output: BinaryIO, field_id: _TzdbStreamFieldId | int, data: bytes | memoryview) -> None:
+        output.write(bytes([field_id]))
+        _DateTimeZoneWriter._ctor(output, None).write_count(len(data))
+        output.write(data)
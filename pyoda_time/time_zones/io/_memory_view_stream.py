@@ -0,0 +1,68 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, BinaryIO, final
+
+from pyoda_time.utility._csharp_compatibility import _sealed
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+
+@final
+@_sealed
+class _MemoryViewStream(io.RawIOBase, BinaryIO):
+    """A read-only stream over a ``memoryview``, which never copies the underlying buffer.
+
+    Unlike ``io.BytesIO``, creating one of these over a slice of a larger buffer (such as a memory-mapped file) doesn't
+    copy the slice. ``_read_view`` allows callers which know about this class to read further slices without copying
+    them either.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        super().__init__()
+        self.__buffer: memoryview = buffer
+        self.__position: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self.__position + offset
+            case io.SEEK_END:
+                position = len(self.__buffer) + offset
+            case _:
+                raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self.__position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        return self._read_view(size).tobytes()
+
+    def readinto(self, buffer: Buffer) -> int:
+        view = self._read_view(len(target := memoryview(buffer).cast("B")))
+        target[: len(view)] = view
+        return len(view)
+
+    def _read_view(self, size: int | None = -1) -> memoryview:
+        """Reads up to ``size`` bytes (or the rest of the stream, if ``size`` is negative or None) as a slice of the
+        underlying buffer."""
+        start = self.__position
+        end = len(self.__buffer) if size is None or size < 0 else min(start + size, len(self.__buffer))
+        self.__position = max(start, end)
+        return self.__buffer[start:end]
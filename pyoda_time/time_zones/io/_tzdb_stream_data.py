@@ -3,6 +3,7 @@
 # as found in the LICENSE.txt file.
 from __future__ import annotations
 
+import io
 import struct
 import types
 from typing import TYPE_CHECKING, Any, BinaryIO, Final, TypeVar, final
@@ -15,6 +16,7 @@ from pyoda_time.time_zones._tzdb_zone_1970_location import TzdbZone1970Location
 from pyoda_time.time_zones.cldr import WindowsZones
 from pyoda_time.time_zones.io._date_time_zone_reader import _DateTimeZoneReader
 from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter
+from pyoda_time.time_zones.io._memory_view_stream import _MemoryViewStream
 from pyoda_time.time_zones.io._tzdb_stream_field import _TzdbStreamField
 from pyoda_time.time_zones.io._tzdb_stream_field_id import _TzdbStreamFieldId
 from pyoda_time.utility import InvalidPyodaDataError
@@ -51,6 +53,8 @@ class _TzdbStreamData:
             self._zone_1970_locations: Sequence[TzdbZone1970Location] | None = None
             self._windows_mapping: WindowsZones | None = windows_mapping
             self._zone_fields: dict[str, _TzdbStreamField] = {}
+            self._zone_index: dict[str, int] | None = None
+            self._zone_block: memoryview = memoryview(b"")
 
         def _handle_string_pool_field(self, field: _TzdbStreamField) -> None:
             self.__check_single_field(field, self._string_pool)
@@ -67,10 +71,68 @@ class _TzdbStreamData:
             with field._create_stream() as stream:
                 reader = _DateTimeZoneReader._ctor(stream, self._string_pool)
                 id_: str = reader.read_string()
-                if id_ in self._zone_fields:
+                if id_ in self._zone_fields or (self._zone_index is not None and id_ in self._zone_index):
                     raise InvalidPyodaDataError(f"Multiple definitions for zone {id_}")
                 self._zone_fields[id_] = field
 
+        def _handle_zone_index_field(self, field: _TzdbStreamField, stream: _MemoryViewStream) -> bool:
+            """Reads the zone index, and takes the block of zone fields which follows it from ``stream`` as a single
+            slice, leaving the individual fields to be found when each zone is created.
+
+            The index is only used if it is consistent with the stream: the block has to fit in what remains of the
+            stream and consist of ``TIME_ZONE`` fields alone, and the index has to give the offset of each of those
+            fields for exactly one zone. Otherwise the field is ignored and nothing is taken from ``stream``, so that
+            the zone fields are read sequentially instead (and any genuine problem with them is reported then).
+
+            :return: Whether the index was used.
+            """
+            self.__check_single_field(field, self._zone_index)
+            self.__check_string_pool_presence(field)
+            position = stream.tell()
+            if (zone_index := self.__read_zone_index(field, stream)) is None:
+                stream.seek(position)
+                return False
+            self._zone_block, self._zone_index = zone_index
+            return True
+
+        def __read_zone_index(
+            self, field: _TzdbStreamField, stream: _MemoryViewStream
+        ) -> tuple[memoryview, dict[str, int]] | None:
+            try:
+                with field._create_stream() as index_stream:
+                    reader = _DateTimeZoneReader._ctor(index_stream, self._string_pool)
+                    block_length = reader.read_count()
+                    count = reader.read_count()
+                    entries = [(reader.read_string(), reader.read_count()) for _ in range(count)]
+            except InvalidPyodaDataError:
+                return None
+            zone_block = stream._read_view(block_length)
+            zone_index = dict(entries)
+            if len(zone_block) < block_length or not zone_index.keys().isdisjoint(self._zone_fields):
+                return None
+            # Only the header of each zone field is read here, which is far cheaper than reading each zone's ID.
+            field_offsets: set[int] = set()
+            block_stream = _MemoryViewStream(zone_block)
+            reader = _DateTimeZoneReader._ctor(block_stream, None)
+            offset = 0
+            while offset < block_length:
+                if zone_block[offset] != _TzdbStreamFieldId.TIME_ZONE:
+                    return None
+                field_offsets.add(offset)
+                block_stream.seek(offset + 1)
+                try:
+                    offset = block_stream.seek(reader.read_count(), io.SEEK_CUR)
+                except InvalidPyodaDataError:
+                    return None
+            if (
+                offset != block_length
+                or len(zone_index) != count
+                or len(field_offsets) != count
+                or set(zone_index.values()) != field_offsets
+            ):
+                return None
+            return zone_block, zone_index
+
         def _handle_tzdb_version_field(self, field: _TzdbStreamField) -> None:
             self.__check_single_field(field, self._tzdb_version)
             self._tzdb_version = field._extract_single_value(lambda reader: reader.read_string(), None)
@@ -110,13 +172,14 @@ class _TzdbStreamData:
             if self._string_pool is None:
                 raise InvalidPyodaDataError(f"String pool must be present before field {field.id}")
 
-    __FIELD_HANDLERS: Final[dict[_TzdbStreamFieldId, Callable[[_Builder, _TzdbStreamField], None]]] = {
+    __FIELD_HANDLERS: Final[dict[_TzdbStreamFieldId | int, Callable[[_Builder, _TzdbStreamField], None]]] = {
         _TzdbStreamFieldId.STRING_POOL: lambda builder, field: builder._handle_string_pool_field(field),
         _TzdbStreamFieldId.TIME_ZONE: lambda builder, field: builder._handle_zone_field(field),
         _TzdbStreamFieldId.TZDB_ID_MAP: lambda builder, field: builder._handle_tzdb_id_map_field(field),
         _TzdbStreamFieldId.TZDB_VERSION: lambda builder, field: builder._handle_tzdb_version_field(field),
-        _TzdbStreamFieldId.CLDR_SUPPLEMENTAL_WINDOWS_ZONES: lambda builder,
-        field: builder._handle_supplemental_windows_zones_field(field),
+        _TzdbStreamFieldId.CLDR_SUPPLEMENTAL_WINDOWS_ZONES: lambda builder, field: (
+            builder._handle_supplemental_windows_zones_field(field)
+        ),
         _TzdbStreamFieldId.ZONE_LOCATIONS: lambda builder, field: builder._handle_zone_locations_field(field),
         _TzdbStreamFieldId.ZONE_1970_LOCATIONS: lambda builder, field: builder._handle_zone_1970_locations_field(field),
     }
@@ -157,12 +220,16 @@ class _TzdbStreamData:
         self.__tzdb_version = self._check_not_null(builder._tzdb_version, "TZDB version")
         self.__windows_mapping = self._check_not_null(builder._windows_mapping, "CLDR Supplemental Windows Zones")
         self.__zone_fields = builder._zone_fields
+        self.__zone_index: dict[str, int] = builder._zone_index or {}
+        self.__zone_block = builder._zone_block
         self.__zone_locations = builder._zone_locations
         self.__zone_1970_locations = builder._zone_1970_locations
 
         # Add in the canonical IDs as mappings to themselves
         for zone_id in self.__zone_fields:
             mutable_id_map[zone_id] = zone_id
+        for zone_id in self.__zone_index:
+            mutable_id_map[zone_id] = zone_id
         self.__tzdb_id_map: types.MappingProxyType[str, str] = types.MappingProxyType(mutable_id_map)
 
     def create_zone(self, id_: str, canonical_id: str) -> DateTimeZone:
@@ -175,10 +242,12 @@ class _TzdbStreamData:
         """
         _Preconditions._check_not_null(id_, "id_")
         _Preconditions._check_not_null(canonical_id, "canonical_id")
-        with self.__zone_fields[canonical_id]._create_stream() as stream:
+        field = self.__zone_fields.get(canonical_id) or self.__read_indexed_zone_field(canonical_id)
+        with field._create_stream() as stream:
             reader = _DateTimeZoneReader._ctor(stream, self.__string_pool)
-            # Skip over the ID before the zone data itself
-            reader.read_string()
+            # Skip over the ID before the zone data itself, checking it in case the field was found via the index
+            if reader.read_string() != canonical_id:
+                raise InvalidPyodaDataError(f"Zone index entry for {canonical_id} refers to a different zone")
             type_ = _DateTimeZoneWriter._DateTimeZoneType(reader.read_byte())
             match type_:
                 case _DateTimeZoneWriter._DateTimeZoneType.FIXED:
@@ -188,6 +257,14 @@ class _TzdbStreamData:
                 case _:
                     raise InvalidPyodaDataError(f"Unknown time zone type {type_.name}")
 
+    def __read_indexed_zone_field(self, canonical_id: str) -> _TzdbStreamField:
+        stream = _MemoryViewStream(self.__zone_block)
+        stream.seek(self.__zone_index[canonical_id])
+        field = next(_TzdbStreamField._read_fields(stream))
+        if field.id != _TzdbStreamFieldId.TIME_ZONE:
+            raise InvalidPyodaDataError(f"Zone index entry for {canonical_id} refers to a field of ID {field.id}")
+        return field
+
     @staticmethod
     def _check_not_null(input_: T | None, name: str) -> T:
         if input_ is None:
@@ -196,14 +273,26 @@ class _TzdbStreamData:
 
     @classmethod
     def _from_stream(cls, stream: BinaryIO) -> _TzdbStreamData:
+        """Reads the data from the given stream.
+
+        Unless the stream is a ``_MemoryViewStream``, the remainder of it is read into memory in one go after the
+        version; the fields are then slices of that single buffer. If the stream has a zone index, the zone fields which
+        follow it are skipped rather than read, and each one is only found when the zone is first created.
+        """
         _Preconditions._check_not_null(stream, "stream")
 
         version = struct.unpack("i", stream.read(4))[0]
         if version != cls.__ACCEPTED_VERSION:
             raise InvalidPyodaDataError(f"Unable to read stream with version {version}")
 
+        if not isinstance(stream, _MemoryViewStream):
+            stream = _MemoryViewStream(memoryview(stream.read()))
+
         builder = cls._Builder()
         for field in _TzdbStreamField._read_fields(stream):
+            if field.id == _TzdbStreamFieldId.ZONE_INDEX:
+                builder._handle_zone_index_field(field, stream)
+                continue
             handler = cls.__FIELD_HANDLERS.get(field.id)
             if handler:
                 handler(builder, field)
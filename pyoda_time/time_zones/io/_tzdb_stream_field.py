@@ -10,6 +10,7 @@ from pyoda_time.utility._csharp_compatibility import _private, _sealed
 
 from ...utility import InvalidPyodaDataError
 from ._date_time_zone_reader import _DateTimeZoneReader
+from ._memory_view_stream import _MemoryViewStream
 from ._tzdb_stream_field_id import _TzdbStreamFieldId
 
 if TYPE_CHECKING:
@@ -22,24 +23,33 @@ T = TypeVar("T")
 @_sealed
 @_private
 class _TzdbStreamField:
-    """An unparsed field within a stream."""
+    """An unparsed field within a stream.
 
-    __data: bytearray
-    __id: _TzdbStreamFieldId
+    The data is a ``memoryview``; for fields read from a ``_MemoryViewStream`` (such as the memory-mapped default TZDB
+    data) it is a slice of the whole stream's buffer rather than a copy.
+    """
+
+    __data: memoryview
+    __id: _TzdbStreamFieldId | int
 
     @property
-    def id(self) -> _TzdbStreamFieldId:
+    def id(self) -> _TzdbStreamFieldId | int:
+        """The ID of the field; this is a plain ``int`` for fields which this version of Pyoda Time doesn't know."""
         return self.__id
 
     @classmethod
-    def _ctor(cls, id_: _TzdbStreamFieldId, data: bytearray) -> _TzdbStreamField:
+    def _ctor(cls, id_: _TzdbStreamFieldId | int, data: bytes | bytearray | memoryview) -> _TzdbStreamField:
         self = super().__new__(cls)
         self.__id = id_
-        self.__data = data
+        self.__data = memoryview(data)
         return self
 
     def _create_stream(self) -> BinaryIO:
-        """Creates a new read-only stream over the data for this field."""
+        """Creates a new read-only stream over the data for this field.
+
+        This makes a short-lived copy of the field (at most a few kilobytes), as the readers consume their input a byte
+        at a time, which is far faster through ``BytesIO`` than through a stream implemented in Python.
+        """
         return BytesIO(self.__data)
 
     def _extract_single_value(
@@ -54,13 +64,17 @@ class _TzdbStreamField:
             field_id = stream.read(1)
             if not field_id:
                 break
-            id_ = _TzdbStreamFieldId(field_id[0])
+            id_: _TzdbStreamFieldId | int
+            try:
+                id_ = _TzdbStreamFieldId(field_id[0])
+            except ValueError:
+                # A field added by a later version of the format (or by Noda Time). It is passed on, to be ignored.
+                id_ = field_id[0]
             # Read 7-bit encoded length
             length = _DateTimeZoneReader._ctor(stream, None).read_count()
-            data = bytearray()
-            for offset in range(length):
-                bytes_read: bytes = stream.read(1)
-                if not bytes_read:
-                    raise InvalidPyodaDataError(f"Stream ended after reading {offset} bytes out of {length}")
-                data.extend(bytes_read)
+            data = (
+                stream._read_view(length) if isinstance(stream, _MemoryViewStream) else memoryview(stream.read(length))
+            )
+            if len(data) < length:
+                raise InvalidPyodaDataError(f"Stream ended after reading {len(data)} bytes out of {length}")
             yield _TzdbStreamField._ctor(id_, data)
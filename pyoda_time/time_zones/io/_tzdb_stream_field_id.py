@@ -50,3 +50,15 @@ class _TzdbStreamFieldId(IntEnum):
 
     The format is simply a count, and then that many copies of ``_TzdbZone1970Location`` data.
     """
+
+    ZONE_INDEX = 0xF0
+    """Single field giving the position of each time zone field, so that zones can be found without reading them all.
+
+    The format is: the length in bytes of the block of ``TIME_ZONE`` fields which immediately follows this field, the
+    number of zones, then for each zone its ID followed by the offset (WriteCount) of its ``TIME_ZONE`` field from the
+    start of that block. Streams without this field are read sequentially, as before it was introduced.
+
+    This field is specific to Pyoda Time. Noda Time allocates field IDs upwards from 0, so this one is taken from the
+    top of the range to stay clear of any field Noda Time adds later; IDs from 0xF0 upwards are reserved for Pyoda
+    Time. Readers still check that the index matches the fields which follow it before relying on it.
+    """
@@ -1,12 +1,26 @@
 # Copyright 2024 The Pyoda Time Authors. All rights reserved.
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
-from collections import deque
+from collections import OrderedDict
 from collections.abc import Callable
 from threading import Lock
-from typing import Final, final
+from typing import Final, NamedTuple, final
 
 from pyoda_time.utility._csharp_compatibility import _sealed
+from pyoda_time.utility._preconditions import _Preconditions
+
+_MISSING: Final = object()
+
+
+class _CacheStatistics(NamedTuple):
+    """A snapshot of the counters of a ``_Cache``, for diagnostic purposes."""
+
+    hits: int
+    misses: int
+    size: int
+    """The number of entries in the cache."""
+    capacity: int
+    """The maximum number of entries in the cache."""
 
 
 @_sealed
@@ -14,17 +28,23 @@ from pyoda_time.utility._csharp_compatibility import _sealed
 class _Cache[TKey, TValue]:
     """Implements a thread-safe cache with a single computation function.
 
-    For simplicity's sake, eviction is currently on a least-recently-added basis (not LRU). This may change in the
-    future.
+    Eviction is on a least-recently-used basis: when the cache is full, adding a value evicts the entry which was
+    fetched or added longest ago.
+
+    Values are computed outside the lock, so a slow (or re-entrant) value factory doesn't block other callers. If two
+    threads compute a value for the same key at the same time, the first one to be added wins, and both callers
+    receive it.
     """
 
     # TODO: IEqualityComparer?
     def __init__(self, size: int, value_factory: Callable[[TKey], TValue]) -> None:
-        self.__size: Final[int] = size
+        _Preconditions._check_argument_range("size", size, 1, 0x7FFFFFFF)
+        self.__size: int = size
         self.__value_factory: Final[Callable[[TKey], TValue]] = value_factory
         self.__lock: Final[Lock] = Lock()
-        self.__key_list: Final[deque[TKey]] = deque()  # For eviction tracking
-        self.__dictionary: Final[dict[TKey, TValue]] = {}  # Main storage
+        self.__dictionary: Final[OrderedDict[TKey, TValue]] = OrderedDict()  # Ordered from least to most recently used
+        self.__hits: int = 0
+        self.__misses: int = 0
 
     def get_or_add(self, key: TKey) -> TValue:
         """Fetches a value from the cache, populating it if necessary.
@@ -33,20 +53,38 @@ class _Cache[TKey, TValue]:
         :return: The value associated with the key.
         """
         with self.__lock:
-            if key in self.__dictionary:
-                return self.__dictionary[key]
-            # If not in the dictionary, prepare to add it
-            self.__key_list.append(key)
-            if key not in self.__dictionary:  # Check again to avoid race conditions
-                self.__dictionary[key] = self.__value_factory(key)
+            if (value := self.__dictionary.get(key, _MISSING)) is not _MISSING:
+                self.__dictionary.move_to_end(key)
+                self.__hits += 1
+                return value  # type: ignore[return-value]
+            self.__misses += 1
+        value = self.__value_factory(key)
+        with self.__lock:
+            value = self.__dictionary.setdefault(key, value)
+            self.__dictionary.move_to_end(key)
+            self.__evict()
+            return value
 
-            # Evict if necessary
-            while len(self.__dictionary) > self.__size:
-                evict_key = self.__key_list.popleft()
-                if evict_key in self.__dictionary:
-                    del self.__dictionary[evict_key]
+    def __evict(self) -> None:
+        """Evicts the least recently used entries until the cache is within its size. Must be called under the
+        lock."""
+        while len(self.__dictionary) > self.__size:
+            self.__dictionary.popitem(last=False)
 
-            return self.__dictionary[key]
+    @property
+    def capacity(self) -> int:
+        """The maximum number of entries in the cache, as initially specified by ``size``.
+
+        Reducing the capacity evicts the least recently used entries immediately.
+        """
+        return self.__size
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        _Preconditions._check_argument_range("value", value, 1, 0x7FFFFFFF)
+        with self.__lock:
+            self.__size = value
+            self.__evict()
 
     def count(self) -> int:
         """Returns the number of entries currently in the cache, primarily for diagnostic purposes."""
@@ -54,15 +92,23 @@ class _Cache[TKey, TValue]:
             return len(self.__dictionary)
 
     def keys(self) -> list[TKey]:
-        """Returns a copy of the keys in the cache as a list, for diagnostic purposes."""
+        """Returns a copy of the keys in the cache as a list, from least to most recently used, for diagnostic
+        purposes."""
         with self.__lock:
             return list(self.__dictionary.keys())
 
+    def statistics(self) -> _CacheStatistics:
+        """Returns the number of hits and misses since the cache was created or cleared, along with the number of
+        entries and the capacity, for diagnostic purposes."""
+        with self.__lock:
+            return _CacheStatistics(self.__hits, self.__misses, len(self.__dictionary), self.__size)
+
     def clear(self) -> None:
-        """Clears the cache.
+        """Clears the cache, and resets its statistics.
 
         This is never surfaced publicly (directly or indirectly) - it's just for testing.
         """
         with self.__lock:
-            self.__key_list.clear()
             self.__dictionary.clear()
+            self.__hits = 0
+            self.__misses = 0
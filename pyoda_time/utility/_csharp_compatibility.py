@@ -35,7 +35,17 @@ def _towards_zero_division(x: float | decimal.Decimal, y: float | decimal.Decima
     """Divide two numbers using "towards zero" rounding.
 
     This ensures that integer division produces the same result as it would do in C#.
+
+    When both operands are ``int`` (by far the most common case) the division is performed with integer arithmetic
+    alone. ``Decimal`` is only used when either operand is a ``float`` or a ``Decimal``.
     """
+    if type(x) is int and type(y) is int:
+        # Python's ``//`` rounds towards negative infinity, so the floored quotient needs adjusting by one when the
+        # operands have different signs and the division is inexact.
+        quotient, remainder = divmod(x, y)
+        if remainder and (x ^ y) < 0:
+            return quotient + 1
+        return quotient
     from decimal import ROUND_DOWN, Decimal
 
     return int((Decimal(x) / Decimal(y)).quantize(0, ROUND_DOWN))
@@ -177,10 +187,11 @@ def _int64_overflow(value: int) -> int:
 
 
 def _csharp_modulo(dividend: int, divisor: int) -> int:
-    """Perform a modulo operation with C# behavior, where the result has the same sign as the divisor.
+    """Perform a modulo operation with C# behavior, where the result has the same sign as the dividend.
 
-    In C#, the result of a modulo operation takes the sign of the divisor, unlike Python where it
-    takes the sign of the dividend. This function adjusts the Python modulo result to mimic C#'s behavior.
+    In C#, the result of a modulo operation takes the sign of the dividend, unlike Python where it
+    takes the sign of the divisor. This function adjusts the Python modulo result to mimic C#'s behavior,
+    such that ``_towards_zero_division(x, y) * y + _csharp_modulo(x, y) == x``.
 
     Args:
     dividend (int): The number to be divided.
@@ -190,6 +201,6 @@ def _csharp_modulo(dividend: int, divisor: int) -> int:
     int: The result of the modulo operation, adjusted for C# behavior.
     """
     result = dividend % divisor
-    if dividend < 0 < result:
-        result -= abs(divisor)
+    if result and (dividend ^ divisor) < 0:
+        result -= divisor
     return result
@@ -0,0 +1,59 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+
+import pytest
+
+from pyoda_time._compatibility._string_builder import StringBuilder
+
+
+def test_append_and_to_string() -> None:
+    builder = StringBuilder("ab")
+    assert builder.append("cd").append("").append("e") is builder
+    assert builder.length == 5
+    assert builder.to_string() == "abcde"
+    # The builder is still usable after the pieces have been joined.
+    builder.append("f")
+    assert builder.to_string() == "abcdef"
+
+
+def test_empty() -> None:
+    builder = StringBuilder()
+    assert builder.length == 0
+    assert builder.to_string() == ""
+    with pytest.raises(IndexError):
+        builder[0]
+
+
+def test_append_line() -> None:
+    assert StringBuilder().append_line("x").append_line().to_string() == "x\n\n"
+
+
+@pytest.mark.parametrize("index", range(-6, 6))
+def test_getitem(index: int) -> None:
+    builder = StringBuilder("ab").append("cde").append("f")
+    assert builder[index] == "abcdef"[index]
+
+
+@pytest.mark.parametrize("index", [-7, 6])
+def test_getitem_out_of_range(index: int) -> None:
+    builder = StringBuilder("ab").append("cde").append("f")
+    with pytest.raises(IndexError):
+        builder[index]
+
+
+@pytest.mark.parametrize("item", [slice(1, 3), slice(-2, None), slice(None, None, 2), slice(4, 1)])
+def test_getitem_slice(item: slice) -> None:
+    builder = StringBuilder("ab").append("cde").append("f")
+    assert builder[item] == "abcdef"[item]
+    assert StringBuilder()[item] == ""
+
+
+@pytest.mark.parametrize("length", range(7))
+def test_set_length(length: int) -> None:
+    builder = StringBuilder("ab").append("cde").append("f")
+    builder.length = length
+    assert builder.length == length
+    assert builder.to_string() == "abcdef"[:length]
+    builder.append("x")
+    assert builder.to_string() == "abcdef"[:length] + "x"
@@ -2,8 +2,14 @@
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
 
+import pytest
+
 from pyoda_time import CalendarSystem, LocalDate, LocalDateTime
+from pyoda_time._calendar_ordinal import _CalendarOrdinal
+from pyoda_time._year_month_day import _YearMonthDay
 from pyoda_time.calendars import Era
+from pyoda_time.calendars._gregorian_year_month_day_calculator import _GregorianYearMonthDayCalculator
+from pyoda_time.calendars._year_month_day_calculator import _YearMonthDayCalculator
 
 
 class TestGregorianCalendarSystem:
@@ -28,3 +34,22 @@ class TestGregorianCalendarSystem:
         end = start.plus_months(-19)
         expected = LocalDate(year=2016, month=1, day=20)
         assert end == expected
+
+    def test_days_since_epoch_conversions_match_year_based_calculation(self) -> None:
+        """The closed-form conversions are checked against the year-start-based calculation of the base class, around
+        every year and month boundary which behaves differently in leap years."""
+        calculator = CalendarSystem.iso._year_month_day_calculator
+        for year in range(calculator._min_year, calculator._max_year + 1):
+            for month, day in ((1, 1), (2, 28 + calculator._is_leap_year(year)), (3, 1), (12, 31)):
+                year_month_day = _YearMonthDay._ctor(year=year, month=month, day=day)
+                days = _YearMonthDayCalculator._get_days_since_epoch(calculator, year_month_day)
+                assert calculator._get_days_since_epoch(year_month_day) == days
+                assert calculator._get_year_month_day(days_since_epoch=days) == year_month_day
+                assert _GregorianYearMonthDayCalculator._get_gregorian_year_month_day_calendar_from_days_since_epoch(
+                    days
+                ) == year_month_day._with_calendar_ordinal(_CalendarOrdinal.ISO)
+
+    def test_get_gregorian_year_month_day_calendar_from_days_since_epoch_out_of_range(self) -> None:
+        for days in (CalendarSystem.iso._min_days - 1, CalendarSystem.iso._max_days + 1):
+            with pytest.raises(ValueError):
+                _GregorianYearMonthDayCalculator._get_gregorian_year_month_day_calendar_from_days_since_epoch(days)
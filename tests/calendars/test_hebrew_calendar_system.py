@@ -175,6 +175,39 @@ class TestHebrewCalendarSystem:
         with pytest.raises(ValueError):
             _HebrewScripturalCalculator._get_days_from_start_of_year_to_start_of_month(5502, 0)
 
+    def test_scriptural_year_table_matches_arithmetic(self) -> None:
+        elapsed_days_no_cache = _HebrewScripturalCalculator._HebrewScripturalCalculator__elapsed_days_no_cache  # type: ignore[attr-defined]
+        # Go backwards, so that most entries are computed using the (already populated) entry for the next year.
+        for year in range(_HebrewScripturalCalculator._MAX_YEAR + 1, _HebrewScripturalCalculator._MIN_YEAR - 2, -1):
+            assert _HebrewScripturalCalculator._elapsed_days(year) == elapsed_days_no_cache(year), f"Year {year}"
+            assert _HebrewScripturalCalculator._days_in_year(year) == elapsed_days_no_cache(
+                year + 1
+            ) - elapsed_days_no_cache(year), f"Days in {year}"
+
+    def test_scriptural_month_tables_match_month_lengths(self) -> None:
+        months_in_year_order = (7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6)
+        year_kinds = set()
+        for year in range(5400, 5440):
+            is_leap = _HebrewScripturalCalculator._is_leap_year(year)
+            year_kinds.add((is_leap, _HebrewScripturalCalculator._days_in_year(year)))
+            start_of_month = 0
+            for month in months_in_year_order:
+                assert (
+                    _HebrewScripturalCalculator._get_days_from_start_of_year_to_start_of_month(year, month)
+                    == start_of_month
+                ), f"{year}-{month}"
+                if month == 13 and not is_leap:
+                    continue
+                days_in_month = _HebrewScripturalCalculator._days_in_month(year, month)
+                for day in range(1, days_in_month + 1):
+                    assert _HebrewScripturalCalculator._get_year_month_day(
+                        year, start_of_month + day
+                    ) == _YearMonthDay._ctor(year=year, month=month, day=day)
+                start_of_month += days_in_month
+            assert start_of_month == _HebrewScripturalCalculator._days_in_year(year)
+        # Deficient, regular and complete years, both leap and non-leap.
+        assert year_kinds == {(False, 353), (False, 354), (False, 355), (True, 383), (True, 384), (True, 385)}
+
     @pytest.mark.parametrize(
         "month_numbering",
         (
@@ -2,13 +2,27 @@
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
 
+from array import array
+from collections.abc import Callable
+
 import pytest
 
 from pyoda_time import CalendarSystem, IsoDayOfWeek, LocalDate
-from pyoda_time.calendars import CalendarWeekRule, WeekYearRules
+from pyoda_time.calendars import CalendarWeekRule, IWeekYearRule, WeekYearRules
+from tests import helpers
 
 ISO_DAYS_OF_WEEK = list(IsoDayOfWeek)
 CALENDAR_WEEK_RULES = list(CalendarWeekRule)
+BATCH_RULES = {
+    "iso": WeekYearRules.iso,
+    "min_days_1_sunday": WeekYearRules.for_min_days_in_first_week(1, IsoDayOfWeek.SUNDAY),
+    "min_days_7": WeekYearRules.for_min_days_in_first_week(7),
+    "first_day_monday": WeekYearRules.from_calendar_week_rule(CalendarWeekRule.FIRST_DAY, IsoDayOfWeek.MONDAY),
+    "first_four_day_week_wednesday": WeekYearRules.from_calendar_week_rule(
+        CalendarWeekRule.FIRST_FOUR_DAY_WEEK, IsoDayOfWeek.WEDNESDAY
+    ),
+}
+BATCH_CALENDARS = [CalendarSystem.iso, CalendarSystem.julian, CalendarSystem.hebrew_civil]
 
 
 class TestSimpleWeekYearRule:
@@ -320,3 +334,80 @@ class TestSimpleWeekYearRule:
             )
             == date
         )
+
+    @pytest.mark.parametrize("rule", BATCH_RULES.values(), ids=BATCH_RULES.keys())
+    @pytest.mark.parametrize("calendar", BATCH_CALENDARS, ids=lambda x: x.id)
+    def test_batch_methods_match_single_values(self, rule: IWeekYearRule, calendar: CalendarSystem) -> None:
+        values = [
+            *range(calendar._min_days, calendar._min_days + 20),
+            *range(-1000, 1000),
+            *range(calendar._max_days - 20, calendar._max_days + 1),
+        ]
+        week_years = rule.get_week_year_many(values, calendar)
+        weeks = rule.get_week_of_week_year_many(values, calendar)
+        assert (week_years.typecode, weeks.typecode) == ("i", "B")
+        days_of_week = []
+        for index, value in enumerate(values):
+            date = LocalDate._ctor(days_since_epoch=value, calendar=calendar)
+            assert (week_years[index], weeks[index]) == (
+                rule.get_week_year(date),
+                rule.get_week_of_week_year(date),
+            ), f"Days since epoch: {value}"
+            days_of_week.append(date.day_of_week)
+        assert rule.get_local_date_many(week_years, weeks, days_of_week, calendar) == array("i", values)
+
+    @pytest.mark.parametrize("rule", BATCH_RULES.values(), ids=BATCH_RULES.keys())
+    @pytest.mark.parametrize("calendar_id", list(CalendarSystem.ids))
+    def test_batch_methods_match_single_values_at_calendar_limits(self, rule: IWeekYearRule, calendar_id: str) -> None:
+        # The week-years either side of the calendar's years can't always be computed (e.g. year 0 in the Badi
+        # calendar), so the batch methods mustn't compute them unless the single-value methods would.
+        def result_or_error(function: Callable[[], int]) -> int | type[Exception]:
+            try:
+                return function()
+            except ValueError as e:
+                return type(e)
+
+        calendar = CalendarSystem.for_id(calendar_id)
+        for value in (calendar._min_days, calendar._max_days):
+            date = LocalDate._ctor(days_since_epoch=value, calendar=calendar)
+            assert result_or_error(lambda: rule.get_week_year_many([value], calendar)[0]) == result_or_error(
+                lambda: rule.get_week_year(date)
+            ), f"Days since epoch: {value}"
+            assert result_or_error(lambda: rule.get_week_of_week_year_many([value], calendar)[0]) == result_or_error(
+                lambda: rule.get_week_of_week_year(date)
+            ), f"Days since epoch: {value}"
+
+    def test_batch_methods_empty(self) -> None:
+        rule = WeekYearRules.iso
+        assert rule.get_week_year_many([]) == array("i")
+        assert rule.get_week_of_week_year_many([]) == array("B")
+        assert rule.get_local_date_many([], [], []) == array("i")
+
+    def test_batch_methods_out_of_range(self) -> None:
+        rule = WeekYearRules.iso
+        calendar = CalendarSystem.iso
+        helpers.assert_out_of_range(rule.get_week_year_many, [0, calendar._min_days - 1])
+        helpers.assert_out_of_range(rule.get_week_of_week_year_many, [calendar._max_days + 1, 0])
+
+    def test_get_local_date_many_mismatched_lengths(self) -> None:
+        with pytest.raises(ValueError):
+            WeekYearRules.iso.get_local_date_many([2016, 2016], [1], [IsoDayOfWeek.MONDAY])
+
+    @pytest.mark.parametrize(
+        "rule,week_year,week,day_of_week",
+        [
+            (WeekYearRules.iso, 2016, 53, IsoDayOfWeek.MONDAY),
+            (WeekYearRules.iso, 2016, 0, IsoDayOfWeek.MONDAY),
+            (WeekYearRules.iso, 2016, 1, 8),
+            (WeekYearRules.iso, 10000, 1, IsoDayOfWeek.MONDAY),
+            (BATCH_RULES["first_day_monday"], 2015, 53, IsoDayOfWeek.SATURDAY),
+            (BATCH_RULES["first_day_monday"], 2016, 1, IsoDayOfWeek.THURSDAY),
+        ],
+    )
+    def test_get_local_date_many_invalid(
+        self, rule: IWeekYearRule, week_year: int, week: int, day_of_week: IsoDayOfWeek
+    ) -> None:
+        with pytest.raises(ValueError):
+            rule.get_local_date(week_year, week, day_of_week)
+        with pytest.raises(ValueError):
+            rule.get_local_date_many([2016, week_year], [1, week], [IsoDayOfWeek.MONDAY, day_of_week])
@@ -12,3 +12,6 @@ class TestWeekYearRules:
     def test_unsupported_calendar_week_rule(self) -> None:
         with pytest.raises(ValueError):
             WeekYearRules.from_calendar_week_rule(1000, IsoDayOfWeek.MONDAY)  # type: ignore
+
+    def test_iso_is_cached(self) -> None:
+        assert WeekYearRules.iso is WeekYearRules.iso
@@ -20,6 +20,7 @@ from pyoda_time.calendars._julian_year_month_day_calculator import _JulianYearMo
 from pyoda_time.calendars._persian_year_month_day_calculator import _PersianYearMonthDayCalculator
 from pyoda_time.calendars._um_al_qura_year_month_day_calculator import _UmAlQuraYearMonthDayCalculator
 from pyoda_time.calendars._year_month_day_calculator import _YearMonthDayCalculator
+from pyoda_time.calendars._year_start_cache_entry import _YearStartCacheEntry
 
 NON_ISLAMIC_CALCULATORS: Final[list[_YearMonthDayCalculator]] = [
     _GregorianYearMonthDayCalculator(),
@@ -58,3 +59,28 @@ class TestYearMonthDayCalculator:
             got_year, day_of_year = calculator._get_year(start_of_year_days - 1)
             assert got_year == year - 1, f"End of year {year - 1}"
             assert calculator._get_days_in_year(year - 1) - 1 == day_of_year
+
+    @pytest.mark.parametrize("calculator", ALL_CALCULATORS)
+    def test_start_of_year_consistent_with_calculation(self, calculator: _YearMonthDayCalculator) -> None:
+        """Whether the start of each year comes from a precomputed table, an override or the cache, it matches the
+        calculation for that year (for calendars which can calculate it directly)."""
+        try:
+            calculator._calculate_start_of_year_days(1)
+        except NotImplementedError:
+            return
+        for year in range(calculator._min_year - 1, calculator._max_year + 2):
+            expected = calculator._calculate_start_of_year_days(year)
+            assert calculator._get_start_of_year_in_days(year) == expected, f"Year {year}"
+            # The second call may be a cache hit.
+            assert calculator._get_start_of_year_in_days(year) == expected, f"Year {year}"
+
+    @pytest.mark.parametrize("year", [-9998, -1025, -1024, -1, 0, 1, 1023, 1024, 5000, 9999])
+    def test_year_start_cache(self, year: int) -> None:
+        cache = _YearStartCacheEntry._create_cache()
+        index = _YearStartCacheEntry._get_cache_index(year)
+        assert not _YearStartCacheEntry._is_valid_for_year(cache[index], year)
+        cache[index] = _YearStartCacheEntry._create_entry(year, -year * 365)
+        assert _YearStartCacheEntry._is_valid_for_year(cache[index], year)
+        assert _YearStartCacheEntry._get_start_of_year_days(cache[index]) == -year * 365
+        # Years which share the cache index are told apart by the validator.
+        assert not _YearStartCacheEntry._is_valid_for_year(cache[index], year + 1024)
@@ -5,10 +5,12 @@ from typing import Final
 
 import pytest
 
+from pyoda_time import CalendarSystem
 from pyoda_time._compatibility._culture_info import CultureInfo
 from pyoda_time._compatibility._date_time_format_info import DateTimeFormatInfo
 from pyoda_time.calendars import Era
 from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text._value_cursor import _ValueCursor
 
 from ..culture_saver import CultureSaver
 from ..globalization.failing_culture_info import FailingCultureInfo
@@ -161,6 +163,29 @@ class TestPyodaFormatInfo:
         with pytest.raises(TypeError):
             info.get_era_primary_name(None)  # type: ignore
 
+    def test_month_name_trie_includes_genitive_names(self) -> None:
+        info = _PyodaFormatInfo._get_format_info(Cultures._genitive_name_test_culture)
+        for text, month in (("FullGenName", 1), ("FullNonGenName", 1), ("February", 2)):
+            cursor = _ValueCursor(text)
+            cursor.move_next()
+            assert info._long_month_name_trie._match_longest(cursor) == (month, len(text))
+
+    def test_era_name_trie(self) -> None:
+        info = _PyodaFormatInfo._get_format_info(EN_US)
+        cursor = _ValueCursor("b.c.e.")
+        cursor.move_next()
+        assert info._get_era_name_trie(CalendarSystem.iso)._match_longest(cursor) == (Era.before_common, 6)
+        assert info._get_era_name_trie(CalendarSystem.iso) is info._get_era_name_trie(CalendarSystem.iso)
+
+    def test_am_pm_designator_trie_follows_designators(self) -> None:
+        culture = CultureInfo("en-US")
+        info = _PyodaFormatInfo._get_format_info(culture)
+        cursor = _ValueCursor("pm")
+        cursor.move_next()
+        assert info._am_pm_designator_trie._match_longest(cursor) == (1, 2)
+        culture.date_time_format.pm_designator = "p"
+        assert info._am_pm_designator_trie._match_longest(cursor) == (1, 1)
+
     def test_integer_genitive_month_names(self) -> None:
         # Emulate behaviour of Mono 3.0.6
         culture: CultureInfo = CultureInfo.invariant_culture.clone()
@@ -3,6 +3,7 @@
 # as found in the LICENSE.txt file.
 
 import inspect
+from array import array
 from typing import Final
 
 import pytest
@@ -80,6 +81,35 @@ class TestCalendarSystem:
         for name, prop in inspect.getmembers(LocalDate, lambda p: isinstance(p, property)):
             _ = getattr(local_date, name) is None
 
+    @pytest.mark.parametrize("calendar", _SUPPORTED_CALENDARS, ids=lambda x: x.id)
+    def test_split_days(self, calendar: CalendarSystem) -> None:
+        values = [
+            *range(calendar._min_days, calendar._max_days, (calendar._max_days - calendar._min_days) // 997),
+            *(value for value in range(-400, 400) if calendar._min_days <= value <= calendar._max_days),
+            calendar._max_days,
+        ]
+        result = calendar.split_days(values)
+        assert "".join(field.typecode for field in result) == "iBBHB"
+        years, months, days, days_of_year, days_of_week = result
+        for index, value in enumerate(values):
+            local_date = LocalDate._ctor(days_since_epoch=value, calendar=calendar)
+            assert (years[index], months[index], days[index], days_of_year[index]) == (
+                local_date.year,
+                local_date.month,
+                local_date.day,
+                local_date.day_of_year,
+            ), f"Days since epoch: {value}"
+            # The day of the week doesn't depend on the calendar.
+            assert days_of_week[index] == LocalDate._ctor(days_since_epoch=value).day_of_week
+
+    def test_split_days_empty(self) -> None:
+        assert CalendarSystem.iso.split_days([]) == tuple(array(typecode) for typecode in "iBBHB")
+
+    @pytest.mark.parametrize("calendar", _SUPPORTED_CALENDARS, ids=lambda x: x.id)
+    def test_split_days_out_of_range(self, calendar: CalendarSystem) -> None:
+        helpers.assert_out_of_range(calendar.split_days, [0, calendar._min_days - 1])
+        helpers.assert_out_of_range(calendar.split_days, [calendar._max_days + 1, 0])
+
 
 class TestCalendarSystemEra:
     """Tests using CopticCalendar as a simple example which doesn't override anything."""
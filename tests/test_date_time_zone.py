@@ -23,7 +23,7 @@ from pyoda_time import (
 )
 from pyoda_time.testing.time_zones import SingleTransitionDateTimeZone
 from pyoda_time.text import LocalDatePattern
-from pyoda_time.time_zones import Resolvers, ZoneInterval, ZoneLocalMapping
+from pyoda_time.time_zones import Resolvers, ZoneInterval, ZoneLocalMapping, ZoneLocalMappingResolver
 
 
 class TestDateTimeZone:
@@ -149,6 +149,111 @@ class TestDateTimeZoneGetZoneIntervals:
     # TODO: def test_get_zone_intervals_with_options_coalescing(self) -> None:
 
 
+class TestDateTimeZoneGetUtcOffsets:
+    @pytest.mark.parametrize("zone_id", ["Europe/London", "America/Los_Angeles", "Pacific/Apia", "Asia/Kolkata"])
+    def test_matches_get_utc_offset(self, zone_id: str) -> None:
+        zone = DateTimeZoneProviders.tzdb[zone_id]
+        start = Instant.from_utc(1850, 1, 1, 0, 0)
+        # Deliberately unsorted, spanning both the precalculated periods and the tail zone.
+        instants = [start + Duration.from_hours(hours) for hours in range(0, 250 * 365 * 24, 4999)][::-1]
+        actual = zone.get_utc_offsets(instant._to_unix_time_nanoseconds() for instant in instants)
+        assert list(actual) == [zone.get_utc_offset(instant).seconds for instant in instants]
+
+    def test_around_transition(self) -> None:
+        zone = TestDateTimeZoneGetZoneIntervals.TEST_ZONE
+        transition = zone.transition._to_unix_time_nanoseconds()
+        actual = zone.get_utc_offsets([transition + 1, transition - 1, transition])
+        assert actual.typecode == "i"
+        assert list(actual) == [4 * 3600, -3 * 3600, 4 * 3600]
+
+    def test_fixed_zone(self) -> None:
+        zone = DateTimeZone.for_offset(Offset.from_hours_and_minutes(5, 30))
+        assert list(zone.get_utc_offsets([0, -(10**18), 10**18])) == [19800, 19800, 19800]
+
+    def test_extremes(self) -> None:
+        zone = DateTimeZoneProviders.tzdb["Europe/London"]
+        instants = [Instant.min_value, Instant.max_value]
+        actual = zone.get_utc_offsets(instant._to_unix_time_nanoseconds() for instant in instants)
+        assert list(actual) == [zone.get_utc_offset(instant).seconds for instant in instants]
+
+    def test_empty(self) -> None:
+        assert len(DateTimeZone.utc.get_utc_offsets([])) == 0
+
+    def test_out_of_range(self) -> None:
+        with pytest.raises(ValueError):
+            DateTimeZone.utc.get_utc_offsets([0, Instant.max_value._to_unix_time_nanoseconds() + 1])
+
+
+class TestDateTimeZoneResolveLocalMany:
+    @staticmethod
+    def local_nanoseconds(local_date_time: LocalDateTime) -> int:
+        return local_date_time._to_local_instant()._time_since_local_epoch.to_nanoseconds()
+
+    @staticmethod
+    def values_around_transitions(zone: DateTimeZone) -> list[LocalDateTime]:
+        values: list[LocalDateTime] = []
+        intervals = zone.get_zone_intervals(
+            start=Instant.from_utc(1900, 1, 1, 0, 0), end=Instant.from_utc(2030, 1, 1, 0, 0)
+        )
+        for interval in intervals:
+            if interval.has_start:
+                values.extend(
+                    interval.iso_local_start.plus_minutes(minutes)
+                    for minutes in (-90, -60, -30, -1, 0, 1, 30, 59, 60, 90)
+                )
+        return values[::-1]
+
+    @pytest.mark.parametrize("zone_id", ["Europe/London", "America/St_Johns", "Pacific/Apia", "Australia/Lord_Howe"])
+    @pytest.mark.parametrize(
+        "resolver",
+        [
+            Resolvers.lenient_resolver,
+            Resolvers.strict_resolver,
+            Resolvers.create_mapping_resolver(Resolvers.return_later, Resolvers.return_end_of_interval_before),
+        ],
+    )
+    def test_matches_resolve_local(self, zone_id: str, resolver: ZoneLocalMappingResolver) -> None:
+        zone = DateTimeZoneProviders.tzdb[zone_id]
+        values = self.values_around_transitions(zone)
+        instants, offsets, mask = zone.resolve_local_many((self.local_nanoseconds(value) for value in values), resolver)
+        assert len(instants) == len(offsets) == len(mask) == len(values)
+        for value, instant, offset, flag in zip(values, instants, offsets, mask, strict=True):
+            mapping = zone.map_local(value)
+            assert flag == {0: 1, 1: 0, 2: 2}[mapping.count]
+            try:
+                expected = zone.resolve_local(value, resolver)
+            except (SkippedTimeError, AmbiguousTimeError):
+                assert (instant, offset) == (0, 0)
+            else:
+                assert instant == expected.to_instant()._to_unix_time_nanoseconds()
+                assert offset == expected.offset.seconds
+
+    def test_strict_resolver_flags_instead_of_raising(self) -> None:
+        zone = DateTimeZoneProviders.tzdb["Europe/London"]
+        values = [
+            LocalDateTime(2010, 3, 28, 1, 30),  # Skipped
+            LocalDateTime(2010, 10, 31, 1, 30),  # Ambiguous
+            LocalDateTime(2010, 6, 1, 12, 0),  # Unambiguous
+        ]
+        instants, offsets, mask = zone.resolve_local_many(
+            [self.local_nanoseconds(value) for value in values], Resolvers.strict_resolver
+        )
+        assert list(mask) == [1, 2, 0]
+        assert list(offsets) == [0, 0, 3600]
+        assert instants[2] == Instant.from_utc(2010, 6, 1, 11, 0)._to_unix_time_nanoseconds()
+
+    def test_fixed_zone(self) -> None:
+        zone = DateTimeZone.for_offset(Offset.from_hours(-5))
+        instants, offsets, mask = zone.resolve_local_many([0, 10**18], Resolvers.strict_resolver)
+        assert list(instants) == [5 * 3600 * 10**9, 10**18 + 5 * 3600 * 10**9]
+        assert list(offsets) == [-5 * 3600] * 2
+        assert list(mask) == [0, 0]
+
+    def test_empty(self) -> None:
+        instants, offsets, mask = DateTimeZone.utc.resolve_local_many([], Resolvers.strict_resolver)
+        assert len(instants) == len(offsets) == len(mask) == 0
+
+
 class TestDateTimeZoneIds:
     def test_utc_is_not_null(self) -> None:
         assert DateTimeZone.utc is not None
@@ -0,0 +1,50 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+"""Tests to ensure that the core value types, which applications may hold in large numbers, don't have a per-instance
+``__dict__``."""
+
+import pytest
+
+from pyoda_time import (
+    AnnualDate,
+    DateTimeZone,
+    Duration,
+    Instant,
+    Interval,
+    LocalDate,
+    LocalDateTime,
+    LocalTime,
+    Offset,
+    OffsetDateTime,
+    ZonedDateTime,
+)
+from pyoda_time._calendar_ordinal import _CalendarOrdinal
+from pyoda_time._local_instant import _LocalInstant
+from pyoda_time._year_month_day_calendar import _YearMonthDayCalendar
+from pyoda_time.time_zones import ZoneInterval
+
+INSTANT = Instant.from_utc(2020, 1, 2, 3, 4, 5)
+
+VALUES = [
+    AnnualDate(1, 2),
+    Duration.from_hours(1),
+    INSTANT,
+    Interval(INSTANT, INSTANT),
+    LocalDate(2020, 1, 2),
+    LocalDateTime(2020, 1, 2, 3, 4),
+    LocalTime(3, 4),
+    Offset.from_hours(1),
+    OffsetDateTime(LocalDateTime(2020, 1, 2, 3, 4), Offset.from_hours(1)),
+    ZonedDateTime(instant=INSTANT, zone=DateTimeZone.utc),
+    _LocalInstant._ctor(days=1, nano_of_day=2),
+    _YearMonthDayCalendar._ctor(year=2020, month=1, day=2, calendar_ordinal=_CalendarOrdinal.ISO),
+    ZoneInterval(name="Test", start=INSTANT, end=None, wall_offset=Offset.zero, savings=Offset.zero),
+]
+
+
+@pytest.mark.parametrize("value", VALUES, ids=lambda value: type(value).__name__)
+def test_no_instance_dict(value: object) -> None:
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        setattr(value, "unexpected_attribute", None)
@@ -2,12 +2,24 @@
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
 from abc import ABC
+from collections.abc import Sequence
+from typing import Any
 
 from pyoda_time.text._i_pattern import IPattern
 
 from .pattern_test_data import PatternTestData
 
 
+def parse_results(pattern: IPattern[Any], texts: Sequence[str]) -> list[tuple[bool, object]]:
+    """Parses each of the given texts, returning the value or the error message of each result, so that the results of
+    two patterns can be compared."""
+    results: list[tuple[bool, object]] = []
+    for text in texts:
+        result = pattern.parse(text)
+        results.append((True, result.value) if result.success else (False, str(result.exception)))
+    return results
+
+
 class PatternTestBase[T](ABC):
     @staticmethod
     def test_invalid_patterns(invalid_pattern_data: PatternTestData[T]) -> None:
@@ -1,7 +1,8 @@
 # Copyright 2024 The Pyoda Time Authors. All rights reserved.
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
-from typing import cast
+from collections.abc import Callable, Sequence
+from typing import Any, cast
 
 import pytest
 
@@ -9,19 +10,28 @@ from pyoda_time import LocalDate, Offset
 from pyoda_time._compatibility._string_builder import StringBuilder
 from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
 from pyoda_time.text import (
+    DurationPattern,
     InvalidPatternError,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    LocalTimePattern,
+    OffsetPattern,
     ParseResult,
     UnparsableValueError,
 )
 from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
 from pyoda_time.text._offset_pattern_parser import _OffsetPatternParser
 from pyoda_time.text._parse_bucket import _ParseBucket
 from pyoda_time.text._text_cursor import _TextCursor
 from pyoda_time.text._value_cursor import _ValueCursor
+from pyoda_time.text.patterns import _stepped_pattern_builder
 from pyoda_time.text.patterns._pattern_cursor import _PatternCursor
 from pyoda_time.text.patterns._pattern_fields import _PatternFields
 from pyoda_time.text.patterns._stepped_pattern_builder import _SteppedPatternBuilder
 
+from ..pattern_test_base import parse_results
+
 
 class SampleBucket(_ParseBucket[LocalDate]):
     def calculate_value(self, used_fields: _PatternFields, value: str) -> ParseResult[LocalDate]:
@@ -119,3 +129,108 @@ class TestSteppedPatternBuilder:
                 "be quoted to act as a literal. Note that each type of pattern "
                 "has its own set of valid format specifiers."
             )
+
+
+class TestCompiledParsing:
+    """Tests for patterns whose parse actions all have regular expressions, and so are parsed with a single match.
+
+    The results should always be the same as those of the parse actions.
+    """
+
+    @pytest.mark.parametrize(
+        "create,pattern_text,texts",
+        [
+            (
+                LocalDateTimePattern.create_with_invariant_culture,
+                "uuuu-MM-dd'T'HH:mm:ss.fffffffff",
+                [
+                    "2021-03-04T05:06:07.123456789",
+                    "-0001-03-04T05:06:07.123456789",
+                    "2021-13-04T05:06:07.123456789",
+                    "2021-02-30T05:06:07.123456789",
+                    "2021-03-04T25:06:07.123456789",
+                    "2021-03-04T05:06:07.12345678",
+                    "2021-03-04T05:06:07.1234567890",
+                    "2021-03-04 05:06:07.123456789",
+                    "2021-03-04T05:06:07.123456789\0",
+                ],
+            ),
+            (
+                LocalDateTimePattern.create_with_invariant_culture,
+                "yyyy-M-d H:m:s;FFF",
+                ["2021-3-4 5:6:7", "2021-3-4 5:6:7.1", "2021-3-4 5:6:7,123", "2021-3-4 5:6:7.", "2021-3-4 5:6:7.1234"],
+            ),
+            (
+                LocalTimePattern.create_with_invariant_culture,
+                "Hmm",
+                ["123", "1234", "0959", "960"],
+            ),
+            (
+                LocalTimePattern.create_with_invariant_culture,
+                "HH:mm:ss.FFF",
+                ["12:34:56", "12:34:56.7", "12:34:56.", "12:34:56.7890", "12:34:56.x"],
+            ),
+            (
+                OffsetPattern.create_with_invariant_culture,
+                "+HH:mm",
+                ["+05:30", "-05:30", "05:30", "+5:30", "+18:00", "+24:00"],
+            ),
+            (
+                DurationPattern.create_with_invariant_culture,
+                "-D:hh:mm:ss.FFFFFFFFF",
+                ["1:02:03:04.5", "-1:02:03:04", "+1:02:03:04", "1:24:03:04", "1073741825:00:00:00"],
+            ),
+        ],
+    )
+    def test_same_results_as_parse_actions(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        create: Callable[[str], IPattern[Any]],
+        pattern_text: str,
+        texts: Sequence[str],
+    ) -> None:
+        compiled = create(pattern_text)
+
+        add_parse_action = _SteppedPatternBuilder._add_parse_action
+
+        def add_parse_action_without_regex(
+            self: _SteppedPatternBuilder[Any], parse_action: Any, regex: str | None = None, regex_setter: Any = None
+        ) -> None:
+            add_parse_action(self, parse_action)
+
+        monkeypatch.setattr(_SteppedPatternBuilder, "_add_parse_action", add_parse_action_without_regex)
+        stepped = create(pattern_text)
+
+        assert parse_results(compiled, texts) == parse_results(stepped, texts)
+
+    @pytest.mark.parametrize(
+        "pattern,text",
+        [
+            (
+                LocalDateTimePattern.create_with_invariant_culture("uuuu-MM-dd'T'HH:mm:ss.fffffffff"),
+                "2021-03-04T05:06:07.123456789",
+            ),
+            (LocalDatePattern.iso, "2021-03-04"),
+            (OffsetPattern.create_with_invariant_culture("-HHmmss"), "-053015"),
+        ],
+    )
+    def test_fixed_width_patterns_are_compiled(
+        self, monkeypatch: pytest.MonkeyPatch, pattern: IPattern[Any], text: str
+    ) -> None:
+        # A valid value is parsed without ever creating a value cursor.
+        monkeypatch.setattr(_stepped_pattern_builder, "_ValueCursor", None)
+        assert pattern.parse(text).success
+
+    def test_patterns_with_names_are_not_compiled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pattern = LocalDatePattern.create_with_invariant_culture("dd MMM uuuu")
+        monkeypatch.setattr(_stepped_pattern_builder, "_ValueCursor", None)
+        with pytest.raises(TypeError):
+            pattern.parse("04 Mar 2021")
+
+    def test_parse_partial_moves_cursor(self) -> None:
+        value = _ValueCursor("x17:30:45y")
+        value.move_next()
+        value.move_next()
+        result = OffsetPattern.create_with_invariant_culture("HH:mm:ss")._underlying_pattern.parse_partial(value)
+        assert result.value == Offset.from_hours_and_minutes(17, 30) + Offset.from_seconds(45)
+        assert value.current == "y"
@@ -0,0 +1,106 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from typing import Any
+
+import pytest
+
+from pyoda_time import AnnualDate, Duration, Instant, LocalDate, LocalDateTime, LocalTime, Offset
+from pyoda_time.text import (
+    AnnualDatePattern,
+    BatchParseResult,
+    DurationPattern,
+    InstantPattern,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    LocalTimePattern,
+    OffsetPattern,
+    UnparsableValueError,
+)
+
+# Each pattern, with text values which parse successfully and which don't.
+BATCHES: list[tuple[Any, list[str], list[str]]] = [
+    (LocalDatePattern.iso, ["2021-03-04", "0000-01-01"], ["2021-02-29", "2021/03/04", ""]),
+    (LocalDatePattern.create_with_invariant_culture("dd MMMM uuuu"), ["04 March 2021"], ["04 Mar 2021"]),
+    (LocalDateTimePattern.extended_iso, ["2021-03-04T05:06:07.89"], ["2021-03-04T25:00:00"]),
+    (LocalTimePattern.extended_iso, ["05:06:07.123", "23:59:59"], ["24:00:00", "5:06"]),
+    (InstantPattern.extended_iso, ["2021-03-04T05:06:07Z"], ["2021-03-04T05:06:07"]),
+    (InstantPattern.create_with_invariant_culture("uuuu-MM-dd HH:mm"), ["2021-03-04 05:06"], ["2021-03-04"]),
+    (OffsetPattern.general_invariant, ["+05", "-03:30"], ["+25", "05"]),
+    (DurationPattern.roundtrip, ["1:02:03:04.5", "-0:00:00:01"], ["1:25:00:00", "x"]),
+    (AnnualDatePattern.iso, ["03-04", "02-29"], ["02-30", "3-4"]),
+]
+
+
+def _interleave(successes: list[str], failures: list[str]) -> list[str]:
+    texts: list[str] = []
+    for i in range(max(len(successes), len(failures))):
+        texts.extend(successes[i : i + 1])
+        texts.extend(failures[i : i + 1])
+    return texts
+
+
+class TestBatchParseResult:
+    @pytest.mark.parametrize(("pattern", "successes", "failures"), BATCHES)
+    @pytest.mark.parametrize("method", ["parse_many", "parse_column"])
+    def test_matches_parse(self, pattern: Any, successes: list[str], failures: list[str], method: str) -> None:
+        texts = _interleave(successes, failures)
+        batch: BatchParseResult[Any] = getattr(pattern, method)(texts)
+
+        assert len(batch) == len(texts)
+        assert batch.failure_count == len(failures)
+        assert not batch.success
+        for index, text in enumerate(texts):
+            result = pattern.parse(text)
+            if result.success:
+                assert batch.values[index] == result.value
+            else:
+                assert batch.values[index] is None
+                assert index in batch.failure_indices
+                assert batch.failed_text_at(index) == text
+                assert str(batch.exception_at(index)) == str(result.exception)
+
+    @pytest.mark.parametrize(("pattern", "successes", "failures"), BATCHES)
+    def test_all_successful(self, pattern: Any, successes: list[str], failures: list[str]) -> None:
+        batch = pattern.parse_many(iter(successes))
+        assert batch.success
+        assert batch.failure_count == 0
+        assert batch.get_values_or_throw() == [pattern.parse(text).value for text in successes]
+
+    def test_failure_indices_and_mask(self) -> None:
+        batch = LocalDatePattern.iso.parse_column(["2021-03-04", "x", "2021-03-05", "y", "z"])
+        assert list(batch.failure_indices) == [1, 3, 4]
+        assert batch.failure_mask() == bytearray([0, 1, 0, 1, 1])
+        assert batch.values == [LocalDate(2021, 3, 4), None, LocalDate(2021, 3, 5), None, None]
+
+    def test_get_values_or_throw_raises_first_failure(self) -> None:
+        batch = LocalTimePattern.extended_iso.parse_many(["05:06:07", "99:00:00", "x"])
+        with pytest.raises(UnparsableValueError) as e:
+            batch.get_values_or_throw()
+        assert str(e.value) == str(LocalTimePattern.extended_iso.parse("99:00:00").exception)
+
+    def test_exception_at_successful_index(self) -> None:
+        batch = LocalDatePattern.iso.parse_many(["2021-03-04", "x"])
+        with pytest.raises(ValueError):
+            batch.exception_at(0)
+        with pytest.raises(ValueError):
+            batch.failed_text_at(2)
+
+    def test_empty(self) -> None:
+        batch = OffsetPattern.general_invariant.parse_column([])
+        assert len(batch) == 0
+        assert batch.success
+        assert batch.failure_mask() == bytearray()
+        assert batch.get_values_or_throw() == []
+
+    def test_value_types(self) -> None:
+        assert LocalDateTimePattern.general_iso.parse_many(["2021-03-04T05:06:07"]).values == [
+            LocalDateTime(2021, 3, 4, 5, 6, 7)
+        ]
+        assert InstantPattern.general.parse_many(["2021-03-04T05:06:07Z"]).values == [
+            Instant.from_utc(2021, 3, 4, 5, 6, 7)
+        ]
+        assert LocalTimePattern.extended_iso.parse_many(["05:06:07"]).values == [LocalTime(5, 6, 7)]
+        assert OffsetPattern.general_invariant.parse_many(["+05"]).values == [Offset.from_hours(5)]
+        assert DurationPattern.roundtrip.parse_many(["1:00:00:00"]).values == [Duration.one_day]
+        assert AnnualDatePattern.iso.parse_many(["03-04"]).values == [AnnualDate(3, 4)]
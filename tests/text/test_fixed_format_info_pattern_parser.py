@@ -0,0 +1,52 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+import pytest
+
+from pyoda_time._local_date import LocalDate
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text import InvalidPatternError
+from pyoda_time.text._fixed_format_info_pattern_parser import _FixedFormatInfoPatternParser
+from pyoda_time.text._local_date_pattern_parser import _LocalDatePatternParser
+from pyoda_time.utility._cache import _CacheStatistics
+
+
+def _create_parser(
+    cache_size: int = _FixedFormatInfoPatternParser._DEFAULT_CACHE_SIZE,
+) -> _FixedFormatInfoPatternParser[LocalDate]:
+    return _FixedFormatInfoPatternParser(
+        _LocalDatePatternParser._ctor(LocalDate(2000, 1, 1), 29), _PyodaFormatInfo.invariant_info, cache_size
+    )
+
+
+class TestFixedFormatInfoPatternParser:
+    def test_patterns_are_cached(self) -> None:
+        parser = _create_parser()
+        pattern = parser._parse_pattern("uuuu-MM-dd")
+        assert parser._parse_pattern("uuuu-MM-dd") is pattern
+        assert parser._cache_statistics == _CacheStatistics(hits=1, misses=1, size=1, capacity=50)
+
+    def test_cache_is_bounded(self) -> None:
+        parser = _create_parser(cache_size=2)
+        for pattern_text in ["dd", "MM", "uuuu", "dd"]:
+            parser._parse_pattern(pattern_text)
+        assert parser._cache_statistics == _CacheStatistics(hits=0, misses=4, size=2, capacity=2)
+
+    def test_cache_size_can_be_changed(self) -> None:
+        parser = _create_parser()
+        parser._precompile(["dd", "MM", "uuuu"])
+        parser._cache_size = 1
+        assert parser._cache_size == 1
+        assert parser._cache_statistics.size == 1
+
+    def test_precompile(self) -> None:
+        parser = _create_parser()
+        parser._precompile(["uuuu-MM-dd", "dd/MM/uuuu"])
+        parser._parse_pattern("dd/MM/uuuu")
+        assert parser._cache_statistics == _CacheStatistics(hits=1, misses=2, size=2, capacity=50)
+
+    def test_precompile_invalid_pattern(self) -> None:
+        parser = _create_parser()
+        with pytest.raises(InvalidPatternError):
+            parser._precompile(["uuuu-MM-dd", "dd/MM/uuuu!!!'"])
+        assert parser._cache_statistics.size == 1
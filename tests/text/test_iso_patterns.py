@@ -0,0 +1,326 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from pyoda_time import (
+    CalendarSystem,
+    DateTimeZoneProviders,
+    Instant,
+    LocalDate,
+    LocalDateTime,
+    Offset,
+    OffsetDateTime,
+    ZonedDateTime,
+)
+from pyoda_time.text import (
+    InstantPattern,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    OffsetDateTimePattern,
+    ZonedDateTimePattern,
+)
+from pyoda_time.text._iso_patterns import (
+    _IsoInstantPattern,
+    _IsoLocalDatePattern,
+    _IsoLocalDateTimePattern,
+    _IsoOffsetDateTimePattern,
+    _IsoZonedDateTimePattern,
+)
+
+from .cultures import Cultures
+from .pattern_test_base import parse_results
+
+type PatternFactory = Callable[[Callable[[str], Any], str], Any]
+
+LOCAL_DATE_TEXTS = [
+    "2021-03-04",
+    "0000-01-01",
+    "9999-12-31",
+    "2000-02-29",
+    "1900-02-29",
+    "2021-02-29",
+    "2021-00-04",
+    "2021-13-04",
+    "2021-04-31",
+    "2021-03-00",
+    "-0001-03-04",
+    "+2021-03-04",
+    "2021-3-04",
+    "20210304",
+    "2021-03-04T",
+    "\uff12\uff10\uff12\uff11-03-04",
+    "",
+]
+
+LOCAL_DATE_TIME_TEXTS = [
+    "2021-03-04T05:06:07",
+    "2021-03-04T05:06:07.1",
+    "2021-03-04T05:06:07,1",
+    "2021-03-04T05:06:07.123456789",
+    "2021-03-04T05:06:07.1234567890",
+    "2021-03-04T05:06:07.",
+    "2021-03-04T05:06:07.x",
+    "2021-03-04T23:59:59.999999999",
+    "2021-03-04T24:00:00",
+    "2021-03-04T05:60:07",
+    "2021-03-04T05:06:60",
+    "2021-02-29T05:06:07",
+    "-0001-03-04T05:06:07",
+    "2021-03-04 05:06:07",
+    "2021-03-04T05:06",
+    "2021-03-04T05:06:07Z",
+]
+
+LOCAL_DATE_TIME_PATTERN_TEXTS = [
+    "uuuu'-'MM'-'dd'T'HH':'mm':'ss",
+    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF",
+]
+
+OFFSET_TEXTS = [
+    "Z",
+    "+01",
+    "-01",
+    "+00",
+    "-00",
+    "+01:30",
+    "-01:30",
+    "+01:30:15",
+    "+0130",
+    "+1",
+    "+01:60",
+    "+01:30:60",
+    "+18",
+    "-18:00:00",
+    "+01:",
+    "z",
+    "",
+]
+
+OFFSET_DATE_TIME_TEXTS = [
+    local + offset
+    for local in ["2021-03-04T05:06:07", "2021-03-04T05:06:07.123456789", "2021-03-04T24:00:00", "2021-02-29T05:06:07"]
+    for offset in OFFSET_TEXTS
+] + ["2021-03-04T05:06:07.1234567890Z", "2021-03-04T05:06:07+01 ", ""]
+
+OFFSET_DATE_TIME_PATTERN_TEXTS = [
+    OffsetDateTimePattern.general_iso.pattern_text,
+    OffsetDateTimePattern.extended_iso.pattern_text,
+    OffsetDateTimePattern.rfc3339.pattern_text,
+]
+
+ZONED_DATE_TIME_TEXTS = [
+    "2021-03-04T05:06:07 Europe/London (+00)",
+    "2021-03-04T05:06:07.5 Europe/London (+00)",
+    "2021-07-04T05:06:07 Europe/London (+01)",
+    "2021-07-04T05:06:07 Europe/London (+00)",
+    "2021-07-04T05:06:07 Europe/London (Z)",
+    "2021-07-04T05:06:07 Europe/Londo (+01)",
+    "2021-07-04T05:06:07 Europe/London/X (+01)",
+    "2021-07-04T05:06:07 America/St_Johns (-02:30)",
+    "2021-03-28T01:30:00 Europe/London (+00)",
+    "2021-03-28T01:30:00 Europe/London (+01)",
+    "2021-10-31T01:30:00 Europe/London (+00)",
+    "2021-10-31T01:30:00 Europe/London (+01)",
+    "2021-03-04T05:06:07 UTC (+00)",
+    "2021-03-04T05:06:07 UTC+01 (+01)",
+    "2021-03-04T05:06:07 UTC-01:30 (-01:30)",
+    "2021-03-04T05:06:07 Etc/GMT+1 (-01)",
+    "2021-03-04T05:06:07 Etc/GMT+1 (+01)",
+    "2021-03-04T24:00:00 Europe/London (+00)",
+    "2021-03-04T05:06:07  Europe/London (+00)",
+    "2021-03-04T05:06:07 Europe/London (+00) ",
+    "2021-03-04T05:06:07Z Europe/London",
+    "2021-07-04T05:06:07+01 Europe/London",
+    "2021-07-04T05:06:07+01:00 Europe/London",
+    "2021-07-04T05:06:07.123+01 Europe/London",
+    "2021-07-04T05:06:07-04 America/New_York",
+    "2021-07-04T05:06:07+01 UTC+01",
+    "2021-07-04T05:06:07Z UTC",
+    "2021-07-04T05:06:07+01 Nowhere/Special",
+    "",
+]
+
+ZONED_DATE_TIME_PATTERN_TEXTS = [
+    ZonedDateTimePattern.general_format_only_iso.pattern_text,
+    ZonedDateTimePattern.extended_format_only_iso.pattern_text,
+    "uuuu'-'MM'-'dd'T'HH':'mm':'sso<G> z",
+    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<G> z",
+]
+
+INSTANT_PATTERN_TEXTS = [
+    "uuuu-MM-ddTHH:mm:ss'Z'",
+    "uuuu'-'MM'-'dd'T'HH':'mm':'ss'Z'",
+    "uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFF'Z'",
+]
+
+
+@pytest.fixture
+def generic(monkeypatch: pytest.MonkeyPatch) -> PatternFactory:
+    """Returns a function which creates a pattern from its text without selecting a fast path."""
+
+    def create(factory: Callable[[str], Any], pattern_text: str) -> Any:
+        with monkeypatch.context() as m:
+            m.setattr(_IsoLocalDatePattern, "_wrap", lambda pattern_text, template_value, pattern: pattern)
+            m.setattr(_IsoLocalDateTimePattern, "_wrap", lambda pattern_text, format_info, template, pattern: pattern)
+            m.setattr(_IsoInstantPattern, "_wrap", lambda local_pattern, pattern: pattern)
+            m.setattr(_IsoOffsetDateTimePattern, "_wrap", lambda pattern_text, format_info, template, pattern: pattern)
+            m.setattr(_IsoZonedDateTimePattern, "_wrap", lambda *args: args[-1])
+            return factory(pattern_text)
+
+    return create
+
+
+class TestIsoPatterns:
+    """The fast paths must behave exactly like the generic patterns with the same pattern text."""
+
+    def test_fast_paths_are_selected(self) -> None:
+        assert isinstance(LocalDatePattern.iso._underlying_pattern, _IsoLocalDatePattern)
+        assert isinstance(LocalDateTimePattern.general_iso._underlying_pattern, _IsoLocalDateTimePattern)
+        assert isinstance(LocalDateTimePattern.extended_iso._underlying_pattern, _IsoLocalDateTimePattern)
+        assert isinstance(
+            LocalDateTimePattern.create_with_invariant_culture("S")._underlying_pattern, _IsoLocalDateTimePattern
+        )
+        for pattern in (InstantPattern.general, InstantPattern.extended_iso):
+            assert isinstance(getattr(pattern, "_InstantPattern__pattern"), _IsoInstantPattern)
+        for offset_pattern in (
+            OffsetDateTimePattern.general_iso,
+            OffsetDateTimePattern.extended_iso,
+            OffsetDateTimePattern.rfc3339,
+        ):
+            assert isinstance(offset_pattern._underlying_pattern, _IsoOffsetDateTimePattern)
+        zoned_pattern = ZonedDateTimePattern.extended_format_only_iso.with_zone_provider(DateTimeZoneProviders.tzdb)
+        assert isinstance(zoned_pattern._underlying_pattern, _IsoZonedDateTimePattern)
+
+    def test_fast_path_not_selected_for_other_calendars(self) -> None:
+        pattern = LocalDatePattern.iso.with_calendar(CalendarSystem.julian)
+        assert not isinstance(pattern._underlying_pattern, _IsoLocalDatePattern)
+        assert pattern.parse("2021-03-04").value == LocalDate(2021, 3, 4, CalendarSystem.julian)
+
+    def test_fast_path_not_selected_for_other_time_separators(self) -> None:
+        pattern = InstantPattern.general.with_culture(Cultures.dot_time_separator)
+        assert not isinstance(getattr(pattern, "_InstantPattern__pattern"), _IsoInstantPattern)
+        assert pattern.parse("2021-03-04T05.06.07Z").value == Instant.from_utc(2021, 3, 4, 5, 6, 7)
+
+    def test_parse_local_date(self, generic: PatternFactory) -> None:
+        pattern = generic(LocalDatePattern.create_with_invariant_culture, LocalDatePattern.iso.pattern_text)
+        assert parse_results(LocalDatePattern.iso, LOCAL_DATE_TEXTS) == parse_results(pattern, LOCAL_DATE_TEXTS)
+
+    @pytest.mark.parametrize("pattern_text", LOCAL_DATE_TIME_PATTERN_TEXTS)
+    def test_parse_local_date_time(self, generic: PatternFactory, pattern_text: str) -> None:
+        fast = LocalDateTimePattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(LocalDateTimePattern.create_with_invariant_culture, pattern_text)
+        assert parse_results(fast, LOCAL_DATE_TIME_TEXTS) == parse_results(pattern, LOCAL_DATE_TIME_TEXTS)
+
+    @pytest.mark.parametrize("pattern_text", INSTANT_PATTERN_TEXTS)
+    def test_parse_instant(self, generic: PatternFactory, pattern_text: str) -> None:
+        fast = InstantPattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(InstantPattern.create_with_invariant_culture, pattern_text)
+        texts = [text + "Z" for text in LOCAL_DATE_TIME_TEXTS]
+        assert parse_results(fast, texts) == parse_results(pattern, texts)
+
+    @pytest.mark.parametrize("pattern_text", OFFSET_DATE_TIME_PATTERN_TEXTS)
+    def test_parse_offset_date_time(self, generic: PatternFactory, pattern_text: str) -> None:
+        fast = OffsetDateTimePattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(OffsetDateTimePattern.create_with_invariant_culture, pattern_text)
+        assert parse_results(fast, OFFSET_DATE_TIME_TEXTS) == parse_results(pattern, OFFSET_DATE_TIME_TEXTS)
+
+    @pytest.mark.parametrize("pattern_text", ZONED_DATE_TIME_PATTERN_TEXTS)
+    def test_parse_zoned_date_time(self, generic: PatternFactory, pattern_text: str) -> None:
+        def create(text: str) -> ZonedDateTimePattern:
+            return ZonedDateTimePattern.create_with_invariant_culture(text, DateTimeZoneProviders.tzdb)
+
+        fast = create(pattern_text)
+        pattern = generic(create, pattern_text)
+        assert parse_results(fast, ZONED_DATE_TIME_TEXTS) == parse_results(pattern, ZONED_DATE_TIME_TEXTS)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            LocalDate(2021, 3, 4),
+            LocalDate(1, 1, 1),
+            LocalDate(0, 12, 31),
+            LocalDate(-1, 3, 4),
+            LocalDate(9999, 12, 31),
+            LocalDate(2021, 3, 4, CalendarSystem.julian),
+        ],
+    )
+    def test_format_local_date(self, generic: PatternFactory, value: LocalDate) -> None:
+        pattern = generic(LocalDatePattern.create_with_invariant_culture, LocalDatePattern.iso.pattern_text)
+        assert LocalDatePattern.iso.format(value) == pattern.format(value)
+
+    @pytest.mark.parametrize("pattern_text", LOCAL_DATE_TIME_PATTERN_TEXTS)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            LocalDateTime(2021, 3, 4, 5, 6, 7),
+            LocalDateTime(2021, 3, 4, 5, 6, 7, 120),
+            LocalDateTime(2021, 3, 4, 23, 59, 59).plus_nanoseconds(999_999_999),
+            LocalDateTime(2021, 3, 4, 0, 0, 0).plus_nanoseconds(1),
+            LocalDateTime(-1, 3, 4, 5, 6, 7, 8),
+            LocalDateTime(2021, 3, 4, 5, 6, 7, 8, CalendarSystem.coptic),
+        ],
+    )
+    def test_format_local_date_time(self, generic: PatternFactory, pattern_text: str, value: LocalDateTime) -> None:
+        fast = LocalDateTimePattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(LocalDateTimePattern.create_with_invariant_culture, pattern_text)
+        assert fast.format(value) == pattern.format(value)
+
+    @pytest.mark.parametrize("pattern_text", INSTANT_PATTERN_TEXTS)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Instant.from_utc(2021, 3, 4, 5, 6, 7),
+            Instant.from_unix_time_ticks(16148340671234567),
+            Instant.from_utc(-1, 3, 4, 5, 6),
+            Instant.min_value,
+            Instant.max_value,
+            Instant._before_min_value(),
+            Instant._after_max_value(),
+        ],
+    )
+    def test_format_instant(self, generic: PatternFactory, pattern_text: str, value: Instant) -> None:
+        fast = InstantPattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(InstantPattern.create_with_invariant_culture, pattern_text)
+        assert fast.format(value) == pattern.format(value)
+
+    @pytest.mark.parametrize("pattern_text", OFFSET_DATE_TIME_PATTERN_TEXTS)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            OffsetDateTime(LocalDateTime(2021, 3, 4, 5, 6, 7), Offset.zero),
+            OffsetDateTime(LocalDateTime(2021, 3, 4, 5, 6, 7, 120), Offset.from_hours(-5)),
+            OffsetDateTime(LocalDateTime(2021, 3, 4, 5, 6, 7), Offset.from_seconds(5400)),
+            OffsetDateTime(LocalDateTime(2021, 3, 4, 5, 6, 7), Offset.from_seconds(-5415)),
+            OffsetDateTime(LocalDateTime(-1, 3, 4, 5, 6, 7), Offset.max_value),
+            OffsetDateTime(LocalDateTime(2021, 3, 4, 5, 6, 7, calendar=CalendarSystem.julian), Offset.min_value),
+        ],
+    )
+    def test_format_offset_date_time(self, generic: PatternFactory, pattern_text: str, value: OffsetDateTime) -> None:
+        fast = OffsetDateTimePattern.create_with_invariant_culture(pattern_text)
+        pattern = generic(OffsetDateTimePattern.create_with_invariant_culture, pattern_text)
+        assert fast.format(value) == pattern.format(value)
+
+    @pytest.mark.parametrize("pattern_text", ZONED_DATE_TIME_PATTERN_TEXTS)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Instant.from_utc(2021, 3, 4, 5, 6, 7).in_utc(),
+            Instant.from_utc(2021, 7, 4, 5, 6, 7).in_zone(DateTimeZoneProviders.tzdb["Europe/London"]),
+            Instant.from_utc(2021, 7, 4, 5, 6, 7).in_zone(DateTimeZoneProviders.tzdb["America/St_Johns"]),
+            Instant.from_utc(-1, 7, 4, 5, 6, 7).in_zone(DateTimeZoneProviders.tzdb["Asia/Kolkata"]),
+            Instant.from_utc(2021, 7, 4, 5, 6, 7).in_zone(
+                DateTimeZoneProviders.tzdb["Europe/Paris"], CalendarSystem.julian
+            ),
+        ],
+    )
+    def test_format_zoned_date_time(self, generic: PatternFactory, pattern_text: str, value: ZonedDateTime) -> None:
+        def create(text: str) -> ZonedDateTimePattern:
+            return ZonedDateTimePattern.create_with_invariant_culture(text, DateTimeZoneProviders.tzdb)
+
+        fast = create(pattern_text)
+        pattern = generic(create, pattern_text)
+        assert fast.format(value) == pattern.format(value)
@@ -0,0 +1,47 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+
+from pyoda_time.text._name_trie import _NameTrie
+from pyoda_time.text._value_cursor import _ValueCursor
+
+
+def _cursor_at(value: str, index: int) -> _ValueCursor:
+    cursor = _ValueCursor(value)
+    cursor.move(index)
+    return cursor
+
+
+class TestNameTrie:
+    def test_match_longest_prefers_longest_name(self) -> None:
+        trie = _NameTrie([("Jun", 1), ("June", 2), ("Ju", 3)])
+        assert trie._match_longest(_cursor_at("x June 2024", 2)) == (2, 4)
+
+    def test_match_longest_falls_back_to_shorter_name(self) -> None:
+        trie = _NameTrie([("Jun", 1), ("June", 2)])
+        assert trie._match_longest(_cursor_at("Junk", 0)) == (1, 3)
+
+    def test_match_longest_is_case_insensitive(self) -> None:
+        trie = _NameTrie([("March", 3)])
+        assert trie._match_longest(_cursor_at("mARCH", 0)) == (3, 5)
+
+    def test_match_longest_does_not_move_cursor(self) -> None:
+        trie = _NameTrie([("abc", 1)])
+        cursor = _cursor_at("abcd", 0)
+        trie._match_longest(cursor)
+        assert cursor.index == 0
+
+    def test_match_longest_no_match(self) -> None:
+        trie = _NameTrie([("abc", 1)])
+        assert trie._match_longest(_cursor_at("ab", 0)) is None
+        assert trie._match_longest(_cursor_at("xabc", 0)) is None
+        assert trie._match_longest(_cursor_at("abc", 3)) is None
+
+    def test_first_value_wins_for_duplicate_names(self) -> None:
+        trie = _NameTrie([("mai", 5), ("MAI", 6)])
+        assert trie._match_longest(_cursor_at("Mai", 0)) == (5, 3)
+
+    def test_empty_and_none_names_are_ignored(self) -> None:
+        trie = _NameTrie([("", 0), (None, 1), ("a", 2)])
+        assert trie._match_longest(_cursor_at("a", 0)) == (2, 1)
+        assert trie._match_longest(_cursor_at("b", 0)) is None
@@ -0,0 +1,339 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from typing import Any, Final
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from pyoda_time import CalendarSystem, LocalDateTime, Offset, OffsetDateTime
+from pyoda_time._compatibility._culture_info import CultureInfo
+from pyoda_time.text import OffsetDateTimePattern
+from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._text_error_messages import _TextErrorMessages
+
+from ..culture_saver import CultureSaver
+from .cultures import Cultures
+from .pattern_test_base import PatternTestBase
+from .pattern_test_data import PatternTestData
+
+
+class Data(PatternTestData[OffsetDateTime]):
+    def __init__(
+        self,
+        *,
+        value: OffsetDateTime = OffsetDateTimePattern._DEFAULT_TEMPLATE_VALUE,
+        text: str | None = None,
+        pattern: str | None = None,
+        message: str | None = None,
+        parameters: list[Any] | None = None,
+        culture: CultureInfo = CultureInfo.invariant_culture,
+        template: OffsetDateTime | None = None,
+        standard_pattern: IPattern[OffsetDateTime] | None = None,
+    ) -> None:
+        super().__init__(
+            value,
+            text=text,
+            pattern=pattern,
+            message=message,
+            parameters=parameters,
+            culture=culture,
+            template=template,
+            standard_pattern=standard_pattern,
+        )
+
+    @property
+    def default_template(self) -> OffsetDateTime:
+        return OffsetDateTimePattern._DEFAULT_TEMPLATE_VALUE
+
+    def create_pattern(self) -> IPattern[OffsetDateTime]:
+        assert self.pattern is not None
+        return (
+            OffsetDateTimePattern.create_with_invariant_culture(self.pattern)
+            .with_template_value(self.template)
+            .with_culture(self.culture)
+        )
+
+    def create_partial_pattern(self) -> _IPartialPattern[OffsetDateTime]:
+        pattern = self.create_pattern()
+        assert isinstance(pattern, OffsetDateTimePattern)
+        return pattern._underlying_pattern
+
+
+# The standard example date/time used in all the MSDN samples, which means we can just cut and paste
+# the expected results of the standard patterns.
+MSDN_STANDARD_EXAMPLE: Final[OffsetDateTime] = LocalDateTime(2009, 6, 15, 13, 45, 30, 90).with_offset(
+    Offset.from_hours(1)
+)
+MSDN_STANDARD_EXAMPLE_NO_MILLIS: Final[OffsetDateTime] = LocalDateTime(2009, 6, 15, 13, 45, 30).with_offset(
+    Offset.from_hours(1)
+)
+SAMPLE_OFFSET_DATE_TIME_COPTIC: Final[OffsetDateTime] = (
+    LocalDateTime(1976, 6, 19, 21, 13, 34, calendar=CalendarSystem.coptic)
+    .plus_nanoseconds(123456789)
+    .with_offset(Offset.zero)
+)
+ATHENS_OFFSET: Final[Offset] = Offset.from_hours(3)
+
+INVALID_PATTERN_DATA = [
+    Data(pattern="", message=_TextErrorMessages.FORMAT_STRING_EMPTY),
+    Data(pattern="dd MM uuuu HH:MM:SS", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["M"]),
+    # Note incorrect use of "u" (year) instead of "y" (year of era)
+    Data(pattern="dd MM uuuu HH:mm:ss gg", message=_TextErrorMessages.ERA_WITHOUT_YEAR_OF_ERA),
+    # Era specifier and calendar specifier in the same pattern.
+    Data(pattern="dd MM yyyy HH:mm:ss gg c", message=_TextErrorMessages.CALENDAR_AND_ERA),
+    Data(pattern="g", message=_TextErrorMessages.UNKNOWN_STANDARD_FORMAT, parameters=["g", OffsetDateTime.__name__]),
+    # Invalid patterns involving embedded values
+    Data(pattern="ld<d> uuuu", message=_TextErrorMessages.DATE_FIELD_AND_EMBEDDED_DATE),
+    Data(pattern="l<uuuu-MM-dd HH:mm:ss> dd", message=_TextErrorMessages.DATE_FIELD_AND_EMBEDDED_DATE),
+    Data(pattern="ld<d> ld<f>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="lt<T> HH", message=_TextErrorMessages.TIME_FIELD_AND_EMBEDDED_TIME),
+    Data(pattern="l<uuuu-MM-dd HH:mm:ss> HH", message=_TextErrorMessages.TIME_FIELD_AND_EMBEDDED_TIME),
+    Data(pattern="lt<T> lt<t>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="ld<d> l<F>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="l<F> ld<d>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="lt<T> l<F>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="l<F> lt<T>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["l"]),
+    Data(pattern="l'<F>'", message=_TextErrorMessages.MISSING_EMBEDDED_PATTERN_START, parameters=["<"]),
+    Data(pattern="o<G> o<G>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["o"]),
+]
+
+PARSE_FAILURE_DATA = [
+    # Failures copied from LocalDateTimePatternTest
+    Data(
+        pattern="dd MM uuuu HH:mm:ss",
+        text="Complete mismatch",
+        message=_TextErrorMessages.MISMATCHED_NUMBER,
+        parameters=["dd"],
+    ),
+    Data(pattern="(c)", text="(xxx)", message=_TextErrorMessages.NO_MATCHING_CALENDAR_SYSTEM),
+    # 24 as an hour is only valid when the time is midnight
+    Data(pattern="uuuu-MM-dd HH:mm:ss", text="2011-10-19 24:00:05", message=_TextErrorMessages.INVALID_HOUR_24),
+    Data(pattern="uuuu-MM-dd HH:mm:ss", text="2011-10-19 24:01:00", message=_TextErrorMessages.INVALID_HOUR_24),
+    Data(pattern="uuuu-MM-dd HH:mm", text="2011-10-19 24:01", message=_TextErrorMessages.INVALID_HOUR_24),
+    Data(
+        pattern="uuuu-MM-dd HH:mm",
+        text="2011-10-19 24:00",
+        template=LocalDateTime(1970, 1, 1, 0, 0, 5).with_offset(Offset.zero),
+        message=_TextErrorMessages.INVALID_HOUR_24,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH",
+        text="2011-10-19 24",
+        template=LocalDateTime(1970, 1, 1, 0, 5, 0).with_offset(Offset.zero),
+        message=_TextErrorMessages.INVALID_HOUR_24,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH:mm:ss o<+HH>",
+        text="2011-10-19 16:02 +15:00",
+        message=_TextErrorMessages.TIME_SEPARATOR_MISMATCH,
+    ),
+]
+
+PARSE_ONLY_DATA = [
+    # Parsing using the semi-colon "comma dot" specifier
+    Data(
+        value=LocalDateTime(2011, 10, 19, 16, 5, 20, 352).with_offset(Offset.zero),
+        pattern="uuuu-MM-dd HH:mm:ss;fff",
+        text="2011-10-19 16:05:20,352",
+    ),
+    Data(
+        value=LocalDateTime(2011, 10, 19, 16, 5, 20, 352).with_offset(Offset.zero),
+        pattern="uuuu-MM-dd HH:mm:ss;FFF",
+        text="2011-10-19 16:05:20,352",
+    ),
+    # 24:00 meaning "start of next day"
+    Data(
+        value=LocalDateTime(2011, 10, 20, 0, 0).with_offset(Offset.from_hours(1)),
+        pattern="uuuu-MM-dd HH:mm:ss o<+HH>",
+        text="2011-10-19 24:00:00 +01",
+    ),
+    # The offset is taken from the template value when it isn't specified in the pattern.
+    Data(
+        value=LocalDateTime(2011, 10, 19, 16, 5, 20).with_offset(Offset.from_hours(5)),
+        pattern="uuuu-MM-dd HH:mm:ss",
+        text="2011-10-19 16:05:20",
+        template=LocalDateTime(2000, 1, 1, 0, 0).with_offset(Offset.from_hours(5)),
+    ),
+]
+
+FORMAT_ONLY_DATA = [
+    Data(
+        value=LocalDateTime(2011, 10, 19, 16, 5, 20).with_offset(Offset.zero),
+        pattern="ddd uuuu",
+        text="Wed 2011",
+    ),
+    # Our template value has an offset of 0, but the value has an offset of 1... which is ignored by the pattern
+    Data(value=MSDN_STANDARD_EXAMPLE, pattern="uuuu-MM-dd HH:mm:ss.ff", text="2009-06-15 13:45:30.09"),
+]
+
+FORMAT_AND_PARSE_DATA = [
+    Data(value=MSDN_STANDARD_EXAMPLE, pattern="uuuu-MM-dd HH:mm:ss.ff o<G>", text="2009-06-15 13:45:30.09 +01"),
+    Data(
+        value=MSDN_STANDARD_EXAMPLE,
+        pattern="uuuu-MM-dd HH:mm:ss.ff o<G>",
+        text="2009-06-15 13:45:30.09 +01",
+        culture=Cultures.fr_fr,
+    ),
+    Data(
+        value=MSDN_STANDARD_EXAMPLE_NO_MILLIS,
+        pattern="uuuu-MM-dd HH:mm:ss o<+HH:mm>",
+        text="2009-06-15 13:45:30 +01:00",
+    ),
+    # Standard patterns
+    Data(
+        value=MSDN_STANDARD_EXAMPLE_NO_MILLIS,
+        standard_pattern=OffsetDateTimePattern.general_iso,
+        pattern="G",
+        text="2009-06-15T13:45:30+01",
+    ),
+    Data(
+        value=MSDN_STANDARD_EXAMPLE,
+        standard_pattern=OffsetDateTimePattern.extended_iso,
+        pattern="o",
+        text="2009-06-15T13:45:30.09+01",
+    ),
+    Data(
+        value=MSDN_STANDARD_EXAMPLE,
+        standard_pattern=OffsetDateTimePattern.full_roundtrip,
+        pattern="r",
+        text="2009-06-15T13:45:30.09+01 (ISO)",
+    ),
+    Data(
+        value=SAMPLE_OFFSET_DATE_TIME_COPTIC,
+        standard_pattern=OffsetDateTimePattern.full_roundtrip,
+        pattern="r",
+        text="1976-06-19T21:13:34.123456789Z (Coptic)",
+    ),
+    # Property-only patterns
+    Data(
+        value=MSDN_STANDARD_EXAMPLE,
+        standard_pattern=OffsetDateTimePattern.rfc3339,
+        pattern="uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<Z+HH:mm>",
+        text="2009-06-15T13:45:30.09+01:00",
+    ),
+    Data(
+        value=LocalDateTime(2009, 6, 15, 13, 45, 30).with_offset(Offset.zero),
+        standard_pattern=OffsetDateTimePattern.rfc3339,
+        pattern="uuuu'-'MM'-'dd'T'HH':'mm':'ss;FFFFFFFFFo<Z+HH:mm>",
+        text="2009-06-15T13:45:30Z",
+    ),
+    # Embedded patterns
+    Data(
+        value=LocalDateTime(2015, 10, 24, 11, 55, 30).with_offset(ATHENS_OFFSET),
+        pattern="ld<uuuu*MM*dd>'X'lt<HH_mm_ss> o<g>",
+        text="2015*10*24X11_55_30 +03",
+    ),
+    Data(
+        value=LocalDateTime(2015, 10, 24, 11, 55, 30).with_offset(ATHENS_OFFSET),
+        pattern="lt<HH_mm_ss>'Y'ld<uuuu*MM*dd> o<g>",
+        text="11_55_30Y2015*10*24 +03",
+    ),
+    Data(
+        value=LocalDateTime(2015, 10, 24, 11, 55, 30).with_offset(ATHENS_OFFSET),
+        pattern="l<HH_mm_ss'Y'uuuu*MM*dd> o<g>",
+        text="11_55_30Y2015*10*24 +03",
+    ),
+    Data(
+        value=LocalDateTime(2015, 10, 24, 11, 55, 30).with_offset(ATHENS_OFFSET),
+        pattern="l<uuuu-MM-dd'T'HH:mm:ss>o<+HH>",
+        text="2015-10-24T11:55:30+03",
+    ),
+    # Offsets which can't be represented by the sub-pattern are still formatted
+    Data(
+        value=LocalDateTime(2015, 10, 24, 11, 55, 30).with_offset(Offset.from_seconds(-(5 * 3600 + 30 * 60 + 15))),
+        pattern="uuuu-MM-dd'T'HH:mm:sso<G>",
+        text="2015-10-24T11:55:30-05:30:15",
+    ),
+]
+
+PARSE_DATA = PARSE_ONLY_DATA + FORMAT_AND_PARSE_DATA
+FORMAT_DATA = FORMAT_ONLY_DATA + FORMAT_AND_PARSE_DATA
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=}") for data in INVALID_PATTERN_DATA])
+def invalid_pattern_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=}") for data in PARSE_FAILURE_DATA])
+def parse_failure_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=}") for data in PARSE_DATA])
+def parse_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=} {data.culture=}") for data in FORMAT_DATA])
+def format_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+class TestOffsetDateTimePattern(PatternTestBase[OffsetDateTime]):
+    def test_parse_null(self) -> None:
+        self.assert_parse_null(OffsetDateTimePattern.extended_iso)
+
+    def test_parse_partial(self, parse_data: Data) -> None:
+        parse_data.test_parse_partial()
+
+    def test_create_with_current_culture(self) -> None:
+        value = LocalDateTime(2017, 8, 23, 12, 34, 56).with_offset(Offset.from_hours(2))
+        with CultureSaver.set_cultures(Cultures.fr_fr):
+            pattern = OffsetDateTimePattern.create_with_current_culture("l<g> o<g>")
+            assert pattern.format(value) == "23/08/2017 12:34 +02"
+
+    def test_with_calendar(self) -> None:
+        pattern = OffsetDateTimePattern.general_iso.with_calendar(CalendarSystem.coptic)
+        value = pattern.parse("0284-08-29T12:34:56+01").value
+        expected = LocalDateTime(284, 8, 29, 12, 34, 56, calendar=CalendarSystem.coptic).with_offset(
+            Offset.from_hours(1)
+        )
+        assert value == expected
+
+    def test_with_pattern_text(self) -> None:
+        pattern = OffsetDateTimePattern.general_iso.with_pattern_text("uuuu-MM-dd o<g>")
+        assert pattern.pattern_text == "uuuu-MM-dd o<g>"
+        assert pattern.parse("2017-08-23 +05").value == LocalDateTime(2017, 8, 23, 0, 0).with_offset(
+            Offset.from_hours(5)
+        )
+
+    def test_with_template_value(self) -> None:
+        template = LocalDateTime(1970, 1, 1, 11, 30).with_offset(Offset.from_hours(2))
+        pattern = OffsetDateTimePattern.create_with_invariant_culture("uuuu-MM-dd").with_template_value(template)
+        assert pattern.template_value == template
+        assert pattern.parse("2017-08-23").value == LocalDateTime(2017, 8, 23, 11, 30).with_offset(Offset.from_hours(2))
+
+    @pytest.mark.parametrize(
+        "two_digit_year_max,text,expected_year",
+        [
+            (0, "00-01-01T00:00:00+00", 2000),
+            (0, "01-01-01T00:00:00+00", 1901),
+            (50, "49-01-01T00:00:00+00", 2049),
+            (50, "51-01-01T00:00:00+00", 1951),
+            (99, "99-01-01T00:00:00+00", 2099),
+        ],
+    )
+    def test_with_two_digit_year_max(self, two_digit_year_max: int, text: str, expected_year: int) -> None:
+        pattern = OffsetDateTimePattern.create_with_invariant_culture(
+            "yy-MM-dd'T'HH:mm:sso<g>"
+        ).with_two_digit_year_max(two_digit_year_max)
+        assert pattern.two_digit_year_max == two_digit_year_max
+        assert pattern.parse(text).value.year == expected_year
+
+    def test_repr_and_format(self) -> None:
+        value = MSDN_STANDARD_EXAMPLE
+        assert repr(value) == "2009-06-15T13:45:30+01"
+        assert f"{value:G}" == "2009-06-15T13:45:30+01"
+        assert f"{value:uuuu}" == "2009"
+
+    def test_round_trip_standard_patterns(self) -> None:
+        value = LocalDateTime(2017, 8, 23, 12, 34, 56).plus_nanoseconds(123456789).with_offset(Offset.from_seconds(-45))
+        for pattern in (OffsetDateTimePattern.extended_iso, OffsetDateTimePattern.full_roundtrip):
+            self.assert_round_trip(value, pattern)
@@ -78,3 +78,44 @@ class TestParseResult:
         result: ParseResult[int] = ParseResult[int].for_exception(lambda: e)
         assert not result.success
         assert result.exception is e
+
+    def test_for_value_with_falsy_value(self) -> None:
+        result: ParseResult[int] = ParseResult.for_value(0)
+        assert result.success
+        assert result.value == 0
+
+    def test_ctor_with_falsy_value(self) -> None:
+        result: ParseResult[int] = ParseResult._ctor(value=0)
+        assert result.success
+        assert result.value == 0
+
+    def test_invalid_value_records_cursor_position(self) -> None:
+        cursor = _ValueCursor("text")
+        cursor.move(2)
+        result: ParseResult[int] = ParseResult._for_invalid_value(cursor, "{0} failure", "Custom")
+        # The message reflects where the cursor was when the failure was created, not where it is now.
+        cursor.move(0)
+        assert str(result.exception) == "Custom failure Value being parsed: 'te^xt'. (^ indicates error position.)"
+
+    def test_exception_is_created_on_each_request(self) -> None:
+        first = self.FAILURE_RESULT.exception
+        second = self.FAILURE_RESULT.exception
+        assert first is not second
+        assert str(first) == str(second)
+
+    def test_invalid_value_post_parse(self) -> None:
+        result: ParseResult[int] = ParseResult._for_invalid_value_post_parse("text", "{0} failure", "Custom")
+        assert not result.success
+        assert result._continue_after_error_with_multiple_formats
+        assert str(result.exception) == "Custom failure Value being parsed: 'text'."
+
+    def test_value_string_empty(self) -> None:
+        result: ParseResult[int] = ParseResult._value_string_empty()
+        assert not result._continue_after_error_with_multiple_formats
+        assert isinstance(result.exception, UnparsableValueError)
+        assert str(result.exception) == "The value string is empty."
+
+    def test_convert_error_keeps_continue_after_error(self) -> None:
+        converted: ParseResult[str] = ParseResult._value_string_empty().convert_error(str)
+        assert not converted._continue_after_error_with_multiple_formats
+        assert str(converted.exception) == "The value string is empty."
@@ -0,0 +1,100 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from collections.abc import Generator
+
+import pytest
+
+from pyoda_time import LocalDate
+from pyoda_time._compatibility._culture_info import CultureInfo
+from pyoda_time.globalization._pyoda_format_info import _PyodaFormatInfo
+from pyoda_time.text import InstantPattern, InvalidPatternError, LocalDatePattern, PatternCache, PatternCacheStatistics
+
+
+@pytest.fixture(autouse=True)
+def clear_format_info_cache() -> Generator[None]:
+    # The caches belong to the cultures' format infos, which are shared by every test.
+    _PyodaFormatInfo._clear_cache()
+    yield
+    _PyodaFormatInfo._clear_cache()
+
+
+def test_patterns_are_cached_per_culture_and_type() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    LocalDatePattern.create_with_invariant_culture("uuuu-MM-dd")
+    LocalDatePattern.create_with_invariant_culture("uuuu-MM-dd")
+    LocalDatePattern.create("uuuu-MM-dd", CultureInfo.get_culture_info("fr-FR"))
+
+    statistics = cache.statistics(LocalDatePattern)
+    assert (statistics.hits, statistics.misses, statistics.size, statistics.capacity) == (1, 1, 1, 50)
+    assert statistics.lookups == 2
+    assert statistics.hit_ratio == 0.5
+    assert cache.statistics(InstantPattern).lookups == 0
+    assert PatternCache(CultureInfo.get_culture_info("fr-FR")).statistics(LocalDatePattern).misses == 1
+
+
+def test_statistics_are_a_snapshot() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    statistics = cache.statistics(LocalDatePattern)
+    LocalDatePattern.create_with_invariant_culture("uuuu-MM-dd")
+    assert statistics.lookups == 0
+    assert statistics.hit_ratio == 0.0
+    assert isinstance(statistics, PatternCacheStatistics)
+    assert repr(statistics) == "PatternCacheStatistics(hits=0, misses=0, size=0, capacity=50, hit_ratio=0.000)"
+
+
+def test_capacity_applies_to_existing_and_new_caches() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    cache.precompile(LocalDatePattern, ["dd", "MM", "uuuu"])
+    cache.capacity = 2
+    assert cache.capacity == 2
+    assert cache.statistics(LocalDatePattern).size == 2
+    assert cache.statistics(InstantPattern).capacity == 2
+    # The setting belongs to the culture, not to this object.
+    assert PatternCache(CultureInfo.invariant_culture).capacity == 2
+
+
+def test_capacity_is_per_culture() -> None:
+    PatternCache(CultureInfo.invariant_culture).capacity = 2
+    assert PatternCache(CultureInfo.get_culture_info("fr-FR")).capacity == 50
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_invalid_capacity(capacity: int) -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    with pytest.raises(ValueError):
+        cache.capacity = capacity
+
+
+def test_precompile() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    cache.precompile(LocalDatePattern, ["uuuu-MM-dd", "dd/MM/uuuu"])
+    pattern = LocalDatePattern.create_with_invariant_culture("dd/MM/uuuu")
+    assert pattern.format(LocalDate(2024, 2, 29)) == "29/02/2024"
+    statistics = cache.statistics(LocalDatePattern)
+    assert (statistics.hits, statistics.misses, statistics.size) == (1, 2, 2)
+
+
+def test_precompile_invalid_pattern() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    with pytest.raises(InvalidPatternError):
+        cache.precompile(LocalDatePattern, ["uuuu-MM-dd", "dd/MM/uuuu!!!'"])
+    assert cache.statistics(LocalDatePattern).size == 1
+
+
+def test_unsupported_pattern_type() -> None:
+    cache = PatternCache(CultureInfo.invariant_culture)
+    with pytest.raises(ValueError):
+        cache.precompile(LocalDate, ["uuuu-MM-dd"])
+    with pytest.raises(ValueError):
+        cache.statistics(LocalDate)
+
+
+def test_mutable_culture() -> None:
+    with pytest.raises(ValueError):
+        PatternCache(CultureInfo("en-US"))
+
+
+def test_culture_info() -> None:
+    culture = CultureInfo.get_culture_info("fr-FR")
+    assert PatternCache(culture).culture_info is culture
@@ -0,0 +1,82 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+import io
+from typing import Any
+
+import pytest
+
+from pyoda_time import AnnualDate, Duration, Instant, LocalDate, LocalDateTime, LocalTime, Offset
+from pyoda_time.text import (
+    AnnualDatePattern,
+    DurationPattern,
+    InstantPattern,
+    LocalDatePattern,
+    LocalDateTimePattern,
+    LocalTimePattern,
+    OffsetPattern,
+    _pattern_writer,
+)
+
+PATTERNS_AND_VALUES: list[tuple[Any, list[Any]]] = [
+    (LocalDatePattern.iso, [LocalDate(2021, 3, 4), LocalDate(-5, 1, 1)]),
+    (LocalDatePattern.create_with_invariant_culture("dd MMMM uuuu"), [LocalDate(2021, 3, 4)]),
+    (LocalDateTimePattern.extended_iso, [LocalDateTime(2021, 3, 4, 5, 6, 7, 8), LocalDateTime(2021, 3, 4, 5, 6)]),
+    (LocalTimePattern.extended_iso, [LocalTime(5, 6, 7), LocalTime.midnight]),
+    (InstantPattern.extended_iso, [Instant.from_utc(2021, 3, 4, 5, 6, 7), Instant.min_value]),
+    (OffsetPattern.general_invariant, [Offset.from_hours(5), Offset.from_hours_and_minutes(-3, -30)]),
+    (DurationPattern.roundtrip, [Duration.one_day, Duration.from_seconds(-1)]),
+    (AnnualDatePattern.iso, [AnnualDate(3, 4), AnnualDate(2, 29)]),
+]
+
+
+class RecordingWriter:
+    """A minimal writer, which isn't a stream, recording each call to ``write``."""
+
+    def __init__(self) -> None:
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return len(text)
+
+
+class TestPatternWriter:
+    @pytest.mark.parametrize(("pattern", "values"), PATTERNS_AND_VALUES)
+    def test_format_to(self, pattern: Any, values: list[Any]) -> None:
+        writer = io.StringIO()
+        for value in values:
+            pattern.format_to(value, writer)
+        assert writer.getvalue() == "".join(pattern.format(value) for value in values)
+
+    @pytest.mark.parametrize(("pattern", "values"), PATTERNS_AND_VALUES)
+    def test_format_many(self, pattern: Any, values: list[Any]) -> None:
+        writer = io.StringIO()
+        assert pattern.format_many(iter(values), writer) == len(values)
+        assert writer.getvalue() == "\n".join(pattern.format(value) for value in values)
+
+    def test_format_many_with_separator(self) -> None:
+        writer = io.StringIO()
+        LocalDatePattern.iso.format_many([LocalDate(2021, 3, 4), LocalDate(2021, 3, 5)], writer, separator=",")
+        assert writer.getvalue() == "2021-03-04,2021-03-05"
+
+    def test_format_many_empty(self) -> None:
+        writer = RecordingWriter()
+        assert LocalDatePattern.iso.format_many([], writer) == 0
+        assert writer.writes == []
+
+    def test_format_many_writes_in_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_pattern_writer, "_CHUNK_SIZE", 3)
+        values = [LocalDate(2021, 3, day) for day in range(1, 11)]
+        writer = RecordingWriter()
+        assert LocalDatePattern.iso.format_many(values, writer) == 10
+        assert "".join(writer.writes) == "\n".join(LocalDatePattern.iso.format(value) for value in values)
+        # Three chunks of three values and one of a single value, with a separator written between chunks.
+        assert writer.writes[1::2] == ["\n", "\n", "\n"]
+        assert len(writer.writes) == 7
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(TypeError):
+            LocalDatePattern.iso.format_to(LocalDate(2021, 3, 4), None)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            LocalDatePattern.iso.format_many([], io.StringIO(), separator=None)  # type: ignore[arg-type]
@@ -288,3 +288,74 @@ class TestValueCursor(TextCursorTestBase):
         assert not parse_result.success
         assert isinstance(parse_result.exception, UnparsableValueError)
         assert value.index == 0  # Cursor hasn't moved
+
+    def test_parse_digits_stops_at_non_ascii_digit(self) -> None:
+        # Arabic-Indic digit 1 after two ASCII digits.
+        value = _ValueCursor("12\u06613")
+        value.move_next()
+        success, actual = value._parse_digits(1, 4)
+        assert success
+        assert actual == 12
+        self._validate_current_character(value, 2, "\u0661")
+
+    def test_parse_digits_zero_minimum_no_number(self) -> None:
+        value = _ValueCursor("x")
+        value.move_next()
+        success, actual = value._parse_digits(0, 2)
+        assert success
+        assert actual == 0
+        self._validate_current_character(value, 0, "x")
+
+    @pytest.mark.parametrize(
+        "text,maximum_digits,minimum_digits,expected,expected_index",
+        [
+            ("123456789", 9, 1, 123456789, 9),
+            ("12Z", 9, 1, 120000000, 2),
+            ("1234", 3, 3, 123000000, 3),
+            ("05", 2, 2, 50000000, 2),
+        ],
+    )
+    def test_parse_fraction(
+        self, text: str, maximum_digits: int, minimum_digits: int, expected: int, expected_index: int
+    ) -> None:
+        value = _ValueCursor(text)
+        value.move_next()
+        success, actual = value._parse_fraction(maximum_digits, 9, minimum_digits)
+        assert success
+        assert actual == expected
+        assert value.index == expected_index
+
+    def test_parse_fraction_too_few_digits(self) -> None:
+        value = _ValueCursor("12Z")
+        value.move_next()
+        success, _actual = value._parse_fraction(3, 9, 3)
+        assert not success
+        assert value.index == 0  # Cursor hasn't moved
+
+    @pytest.mark.parametrize(
+        "text,expected,expected_index",
+        [
+            # The longest run of digits which can't overflow...
+            ("999999999999999999x", 999999999999999999, 18),
+            ("-999999999999999999x", -999999999999999999, 19),
+            # ... and runs which are longer, but still in range.
+            ("000000000000000000001x", 1, 21),
+            ("-0009223372036854775808", _CsharpConstants.LONG_MIN_VALUE, 23),
+            ("1000000000000000000", 1000000000000000000, 19),
+        ],
+    )
+    def test_parse_int64_long_runs(self, text: str, expected: int, expected_index: int) -> None:
+        value = _ValueCursor(text)
+        value.move_next()
+        parse_result, int64 = value._parse_int64()
+        assert parse_result is None
+        assert int64 == expected
+        assert value.index == expected_index
+
+    def test_parse_int64_stops_at_non_ascii_digit(self) -> None:
+        value = _ValueCursor("-12\u06613")
+        value.move_next()
+        parse_result, int64 = value._parse_int64()
+        assert parse_result is None
+        assert int64 == -12
+        assert value.index == 3
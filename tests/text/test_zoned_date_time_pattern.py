@@ -0,0 +1,334 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+from typing import Any, Final
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from pyoda_time import (
+    CalendarSystem,
+    DateTimeZone,
+    DateTimeZoneProviders,
+    IDateTimeZoneProvider,
+    Instant,
+    LocalDateTime,
+    Offset,
+    ZonedDateTime,
+)
+from pyoda_time._compatibility._culture_info import CultureInfo
+from pyoda_time.text import UnparsableValueError, ZonedDateTimePattern
+from pyoda_time.text._i_partial_pattern import _IPartialPattern
+from pyoda_time.text._i_pattern import IPattern
+from pyoda_time.text._text_error_messages import _TextErrorMessages
+from pyoda_time.time_zones import Resolvers, ZoneLocalMappingResolver
+
+from .pattern_test_base import PatternTestBase
+from .pattern_test_data import PatternTestData
+
+TZDB: Final[IDateTimeZoneProvider] = DateTimeZoneProviders.tzdb
+LONDON: Final[DateTimeZone] = TZDB["Europe/London"]
+NEW_YORK: Final[DateTimeZone] = TZDB["America/New_York"]
+ST_JOHNS: Final[DateTimeZone] = TZDB["America/St_Johns"]
+
+# The transitions in London in 2021: the clocks went forward at 01:00 on March 28th, and back at 02:00 on October 31st.
+LONDON_SKIPPED: Final[LocalDateTime] = LocalDateTime(2021, 3, 28, 1, 30)
+LONDON_AMBIGUOUS: Final[LocalDateTime] = LocalDateTime(2021, 10, 31, 1, 30)
+
+
+class Data(PatternTestData[ZonedDateTime]):
+    def __init__(
+        self,
+        *,
+        value: ZonedDateTime | None = None,
+        text: str | None = None,
+        pattern: str | None = None,
+        message: str | None = None,
+        parameters: list[Any] | None = None,
+        culture: CultureInfo = CultureInfo.invariant_culture,
+        template: ZonedDateTime | None = None,
+        standard_pattern: IPattern[ZonedDateTime] | None = None,
+        resolver: ZoneLocalMappingResolver = Resolvers.strict_resolver,
+        zone_provider: IDateTimeZoneProvider | None = TZDB,
+    ) -> None:
+        super().__init__(
+            value or ZonedDateTimePattern._DEFAULT_TEMPLATE_VALUE,
+            text=text,
+            pattern=pattern,
+            message=message,
+            parameters=parameters,
+            culture=culture,
+            template=template,
+            standard_pattern=standard_pattern,
+        )
+        self.resolver = resolver
+        self.zone_provider = zone_provider
+
+    @property
+    def default_template(self) -> ZonedDateTime:
+        return ZonedDateTimePattern._DEFAULT_TEMPLATE_VALUE
+
+    def create_pattern(self) -> IPattern[ZonedDateTime]:
+        assert self.pattern is not None
+        return ZonedDateTimePattern.create(self.pattern, self.culture, self.resolver, self.zone_provider, self.template)
+
+    def create_partial_pattern(self) -> _IPartialPattern[ZonedDateTime]:
+        pattern = self.create_pattern()
+        assert isinstance(pattern, ZonedDateTimePattern)
+        return pattern._underlying_pattern
+
+
+INVALID_PATTERN_DATA = [
+    Data(pattern="", message=_TextErrorMessages.FORMAT_STRING_EMPTY),
+    Data(pattern="dd MM uuuu HH:MM:SS", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["M"]),
+    # Note incorrect use of "u" (year) instead of "y" (year of era)
+    Data(pattern="dd MM uuuu HH:mm:ss gg", message=_TextErrorMessages.ERA_WITHOUT_YEAR_OF_ERA),
+    # Era specifier and calendar specifier in the same pattern.
+    Data(pattern="dd MM yyyy HH:mm:ss gg c", message=_TextErrorMessages.CALENDAR_AND_ERA),
+    Data(pattern="g", message=_TextErrorMessages.UNKNOWN_STANDARD_FORMAT, parameters=["g", ZonedDateTime.__name__]),
+    Data(pattern="z z", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["z"]),
+    Data(pattern="o<G> o<G>", message=_TextErrorMessages.REPEATED_FIELD_IN_PATTERN, parameters=["o"]),
+    Data(pattern="ld<d> uuuu", message=_TextErrorMessages.DATE_FIELD_AND_EMBEDDED_DATE),
+    Data(pattern="lt<T> HH", message=_TextErrorMessages.TIME_FIELD_AND_EMBEDDED_TIME),
+]
+
+PARSE_FAILURE_DATA = [
+    Data(
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-07-04 05:06 Europe/Nowhere",
+        message=_TextErrorMessages.NO_MATCHING_ZONE_ID,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-03-28 01:30 Europe/London",
+        message=_TextErrorMessages.SKIPPED_LOCAL_TIME,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-10-31 01:30 Europe/London",
+        message=_TextErrorMessages.AMBIGUOUS_LOCAL_TIME,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH:mm z o<g>",
+        text="2021-07-04 05:06 Europe/London +00",
+        message=_TextErrorMessages.INVALID_OFFSET,
+    ),
+    Data(
+        pattern="uuuu-MM-dd HH:mm z o<g>",
+        text="2021-03-28 01:30 Europe/London +00",
+        message=_TextErrorMessages.INVALID_OFFSET,
+    ),
+    # Formatting is always possible, but parsing needs a zone provider...
+    Data(
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-07-04 05:06 Europe/London",
+        message=_TextErrorMessages.FORMAT_ONLY_PATTERN,
+        zone_provider=None,
+    ),
+    # ... and the zone abbreviation can never be parsed.
+    Data(
+        pattern="uuuu-MM-dd HH:mm x",
+        text="2021-07-04 05:06 BST",
+        message=_TextErrorMessages.FORMAT_ONLY_PATTERN,
+    ),
+]
+
+PARSE_ONLY_DATA = [
+    # The lenient resolver shifts skipped times forward and takes the earlier of two ambiguous times...
+    Data(
+        value=LONDON.at_leniently(LONDON_SKIPPED),
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-03-28 01:30 Europe/London",
+        resolver=Resolvers.lenient_resolver,
+    ),
+    Data(
+        value=LONDON.at_leniently(LONDON_AMBIGUOUS),
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-10-31 01:30 Europe/London",
+        resolver=Resolvers.lenient_resolver,
+    ),
+    # ... but an explicit offset resolves an ambiguity regardless of the resolver.
+    Data(
+        value=ZonedDateTime._ctor(offset_date_time=LONDON_AMBIGUOUS.with_offset(Offset.zero), zone=LONDON),
+        pattern="uuuu-MM-dd HH:mm z o<g>",
+        text="2021-10-31 01:30 Europe/London +00",
+    ),
+    # The zone is taken from the template value when it isn't specified in the pattern.
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6).in_zone_strictly(NEW_YORK),
+        pattern="uuuu-MM-dd HH:mm",
+        text="2021-07-04 05:06",
+        template=LocalDateTime(2000, 1, 1, 0, 0).in_zone_strictly(NEW_YORK),
+    ),
+]
+
+FORMAT_ONLY_DATA = [
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6).in_zone_strictly(LONDON),
+        pattern="uuuu-MM-dd HH:mm x",
+        text="2021-07-04 05:06 BST",
+    ),
+    Data(
+        value=LocalDateTime(2021, 1, 4, 5, 6).in_zone_strictly(LONDON),
+        pattern="uuuu-MM-dd HH:mm x",
+        text="2021-01-04 05:06 GMT",
+    ),
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6).in_zone_strictly(LONDON),
+        pattern="uuuu-MM-dd HH:mm z",
+        text="2021-07-04 05:06 Europe/London",
+        zone_provider=None,
+    ),
+]
+
+FORMAT_AND_PARSE_DATA = [
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(LONDON),
+        pattern="uuuu-MM-dd'T'HH:mm:ss z",
+        text="2021-07-04T05:06:07 Europe/London",
+    ),
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(ST_JOHNS),
+        pattern="uuuu-MM-dd'T'HH:mm:ss z '('o<g>')'",
+        text="2021-07-04T05:06:07 America/St_Johns (-02:30)",
+    ),
+    # The longest matching zone ID is used
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(TZDB["America/Indiana/Indianapolis"]),
+        pattern="z HH:mm:ss uuuu-MM-dd",
+        text="America/Indiana/Indianapolis 05:06:07 2021-07-04",
+    ),
+    # Fixed-offset zones don't need to come from the provider
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_utc(),
+        pattern="uuuu-MM-dd'T'HH:mm:ss z",
+        text="2021-07-04T05:06:07 UTC",
+    ),
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(DateTimeZone.for_offset(Offset.from_hours(-5))),
+        pattern="uuuu-MM-dd'T'HH:mm:ss z",
+        text="2021-07-04T05:06:07 UTC-05",
+    ),
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(
+            DateTimeZone.for_offset(Offset.from_seconds(5 * 3600 + 30 * 60))
+        ),
+        pattern="uuuu-MM-dd'T'HH:mm:ss z",
+        text="2021-07-04T05:06:07 UTC+05:30",
+    ),
+    # Standard patterns, once given a zone provider
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(LONDON),
+        pattern="G",
+        text="2021-07-04T05:06:07 Europe/London (+01)",
+    ),
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7, 120).in_zone_strictly(LONDON),
+        pattern="F",
+        text="2021-07-04T05:06:07.12 Europe/London (+01)",
+    ),
+    Data(
+        value=ZonedDateTime._ctor(offset_date_time=LONDON_AMBIGUOUS.with_offset(Offset.from_hours(1)), zone=LONDON),
+        pattern="F",
+        text="2021-10-31T01:30:00 Europe/London (+01)",
+    ),
+    # Embedded patterns
+    Data(
+        value=LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(NEW_YORK),
+        pattern="l<uuuu-MM-dd'T'HH:mm:ss>o<G> z",
+        text="2021-07-04T05:06:07-04 America/New_York",
+    ),
+]
+
+PARSE_DATA = PARSE_ONLY_DATA + FORMAT_AND_PARSE_DATA
+FORMAT_DATA = FORMAT_ONLY_DATA + FORMAT_AND_PARSE_DATA
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=}") for data in INVALID_PATTERN_DATA])
+def invalid_pattern_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=}") for data in PARSE_FAILURE_DATA])
+def parse_failure_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=}") for data in PARSE_DATA])
+def parse_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+@pytest.fixture(params=[pytest.param(data, id=f"{data.pattern=} {data.text=}") for data in FORMAT_DATA])
+def format_data(request: FixtureRequest) -> Data:
+    assert isinstance(request.param, Data)
+    return request.param
+
+
+class TestZonedDateTimePattern(PatternTestBase[ZonedDateTime]):
+    def test_parse_null(self) -> None:
+        self.assert_parse_null(ZonedDateTimePattern.extended_format_only_iso.with_zone_provider(TZDB))
+
+    def test_parse_partial(self, parse_data: Data) -> None:
+        parse_data.test_parse_partial()
+
+    def test_format_only_iso_patterns(self) -> None:
+        value = LocalDateTime(2021, 7, 4, 5, 6, 7).in_zone_strictly(LONDON)
+        assert ZonedDateTimePattern.general_format_only_iso.format(value) == "2021-07-04T05:06:07 Europe/London (+01)"
+        result = ZonedDateTimePattern.general_format_only_iso.parse("2021-07-04T05:06:07 Europe/London (+01)")
+        assert not result.success
+        with pytest.raises(UnparsableValueError, match=_TextErrorMessages.FORMAT_ONLY_PATTERN):
+            result.get_value_or_throw()
+
+    def test_with_zone_provider_and_resolver(self) -> None:
+        pattern = ZonedDateTimePattern.general_format_only_iso
+        assert pattern.zone_provider is None
+        assert pattern.with_zone_provider(None) is pattern
+        assert pattern.with_resolver(pattern.resolver) is pattern
+
+        lenient = pattern.with_zone_provider(TZDB).with_resolver(Resolvers.lenient_resolver)
+        assert lenient.zone_provider is TZDB
+        assert lenient.resolver is Resolvers.lenient_resolver
+        assert lenient.parse("2021-07-04T05:06:07 Europe/London (+01)").value == LocalDateTime(
+            2021, 7, 4, 5, 6, 7
+        ).in_zone_strictly(LONDON)
+
+        # Without a resolver, the pattern is format-only again.
+        assert not lenient.with_resolver(None).parse("2021-07-04T05:06:07 Europe/London (+01)").success
+
+    def test_with_template_value(self) -> None:
+        template = LocalDateTime(1970, 1, 1, 11, 30).in_zone_strictly(NEW_YORK)
+        pattern = ZonedDateTimePattern.create_with_invariant_culture("uuuu-MM-dd", TZDB).with_template_value(template)
+        assert pattern.template_value == template
+        assert pattern.parse("2021-07-04").value == LocalDateTime(2021, 7, 4, 11, 30).in_zone_strictly(NEW_YORK)
+
+    def test_with_calendar(self) -> None:
+        pattern = ZonedDateTimePattern.create_with_invariant_culture("uuuu-MM-dd HH:mm z", TZDB).with_calendar(
+            CalendarSystem.coptic
+        )
+        assert pattern.template_value.calendar == CalendarSystem.coptic
+        value = pattern.parse("0284-08-29 12:34 UTC").value
+        assert value == LocalDateTime(284, 8, 29, 12, 34, calendar=CalendarSystem.coptic).in_utc()
+
+    def test_with_pattern_text(self) -> None:
+        pattern = ZonedDateTimePattern.create_with_invariant_culture("G", TZDB).with_pattern_text("uuuu z")
+        assert pattern.pattern_text == "uuuu z"
+        assert pattern.zone_provider is TZDB
+        assert pattern.parse("2021 Europe/London").value == LocalDateTime(2021, 1, 1, 0, 0).in_zone_strictly(LONDON)
+
+    def test_with_two_digit_year_max(self) -> None:
+        pattern = ZonedDateTimePattern.create_with_invariant_culture("yy-MM-dd z", TZDB).with_two_digit_year_max(50)
+        assert pattern.two_digit_year_max == 50
+        assert pattern.parse("51-01-01 UTC").value.year == 1951
+
+    def test_repr_and_format(self) -> None:
+        value = Instant.from_utc(2021, 7, 4, 5, 6, 7).in_zone(LONDON)
+        assert repr(value) == "2021-07-04T06:06:07 Europe/London (+01)"
+        assert f"{value:uuuu z}" == "2021 Europe/London"
+
+    def test_round_trip_extended_iso(self) -> None:
+        value = Instant.from_utc(2021, 7, 4, 5, 6, 7).plus_nanoseconds(123456789).in_zone(ST_JOHNS)
+        self.assert_round_trip(value, ZonedDateTimePattern.extended_format_only_iso.with_zone_provider(TZDB))
@@ -0,0 +1,54 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+import io
+
+import pytest
+
+from pyoda_time.time_zones.io._memory_view_stream import _MemoryViewStream
+
+
+class TestMemoryViewStream:
+    def test_read(self) -> None:
+        stream = _MemoryViewStream(memoryview(b"abcdef"))
+        assert stream.read(2) == b"ab"
+        assert stream.read(0) == b""
+        assert stream.tell() == 2
+        assert stream.read() == b"cdef"
+        assert stream.read(1) == b""
+
+    def test_read_view_does_not_copy(self) -> None:
+        buffer = bytearray(b"abcdef")
+        stream = _MemoryViewStream(memoryview(buffer))
+        stream.seek(1)
+        view = stream._read_view(3)
+        buffer[2] = ord("x")
+        assert view.tobytes() == b"bxd"
+        assert stream.tell() == 4
+
+    def test_readinto(self) -> None:
+        stream = _MemoryViewStream(memoryview(b"abc"))
+        target = bytearray(5)
+        assert stream.readinto(target) == 3
+        assert target == bytearray(b"abc\0\0")
+
+    @pytest.mark.parametrize(
+        ("offset", "whence", "expected"), [(2, io.SEEK_SET, 2), (1, io.SEEK_CUR, 2), (-1, io.SEEK_END, 5), (10, 0, 10)]
+    )
+    def test_seek(self, offset: int, whence: int, expected: int) -> None:
+        stream = _MemoryViewStream(memoryview(b"abcdef"))
+        stream.read(1)
+        assert stream.seek(offset, whence) == expected
+        assert stream.read() == b"abcdef"[expected:]
+
+    def test_seek_invalid(self) -> None:
+        stream = _MemoryViewStream(memoryview(b"abcdef"))
+        with pytest.raises(ValueError):
+            stream.seek(-1)
+        with pytest.raises(ValueError):
+            stream.seek(0, 3)
+
+    def test_context_manager_closes(self) -> None:
+        with _MemoryViewStream(memoryview(b"abc")) as stream:
+            assert stream.readable()
+        assert stream.closed
@@ -2,11 +2,17 @@
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
 import io
+import pathlib
+from importlib import resources
 from typing import TYPE_CHECKING
 
 import pytest
 
+from pyoda_time import Instant, Offset, PyodaConstants
 from pyoda_time.time_zones.cldr import WindowsZones
+from pyoda_time.time_zones.io.__main__ import _main
+from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter, _TzdbStreamWriter
+from pyoda_time.time_zones.io._memory_view_stream import _MemoryViewStream
 from pyoda_time.time_zones.io._tzdb_stream_data import _TzdbStreamData
 from pyoda_time.time_zones.io._tzdb_stream_field import _TzdbStreamField
 from pyoda_time.time_zones.io._tzdb_stream_field_id import _TzdbStreamFieldId
@@ -105,6 +111,229 @@ class TestTzdbStreamData:
         with pytest.raises(InvalidPyodaDataError):
             builder._handle_zone_field(zone_field)
 
+    @pytest.mark.parametrize("indexed", [True, False])
+    def test_rewritten_default_data_is_equivalent(self, indexed: bool) -> None:
+        default_data = (resources.files("pyoda_time.time_zones") / "Tzdb.nzd").read_bytes()
+        expected = _TzdbStreamData._from_stream(io.BytesIO(default_data))
+        rewritten = io.BytesIO()
+        _TzdbStreamWriter._rewrite(io.BytesIO(default_data), rewritten, indexed=indexed)
+        rewritten.seek(0)
+        actual = _TzdbStreamData._from_stream(rewritten)
+
+        assert actual.tzdb_version == expected.tzdb_version
+        assert actual.tzdb_id_map == expected.tzdb_id_map
+        start = Instant.from_utc(1900, 1, 1, 0, 0)
+        end = Instant.from_utc(2100, 1, 1, 0, 0)
+        for zone_id in ("Europe/London", "America/New_York", "Etc/GMT+5", "UTC"):
+            canonical_id = expected.tzdb_id_map[zone_id]
+            expected_zone = expected.create_zone(zone_id, canonical_id)
+            actual_zone = actual.create_zone(zone_id, canonical_id)
+            assert list(actual_zone.get_zone_intervals(start=start, end=end)) == list(
+                expected_zone.get_zone_intervals(start=start, end=end)
+            )
+
+    @pytest.mark.parametrize("indexed", [True, False])
+    def test_minimal_stream(self, indexed: bool) -> None:
+        data = _TzdbStreamData._from_stream(self.__create_minimal_stream(["zone1", "zone2"], indexed=indexed))
+        assert dict(data.tzdb_id_map) == {"zone1": "zone1", "zone2": "zone2"}
+        zone = data.create_zone("zone2", "zone2")
+        assert zone.id == "zone2"
+        assert zone.get_utc_offset(PyodaConstants.UNIX_EPOCH) == Offset.from_hours(2)
+
+    def test_indexed_zones_are_only_read_when_created(self) -> None:
+        # The data for zone1 is truncated, but that's only noticed when it's used.
+        data = _TzdbStreamData._from_stream(self.__create_minimal_stream(["zone1", "zone2"], truncated_zone="zone1"))
+        assert data.create_zone("zone2", "zone2").id == "zone2"
+        with pytest.raises(InvalidPyodaDataError):
+            data.create_zone("zone1", "zone1")
+
+    def test_zone_index_entry_for_wrong_zone(self) -> None:
+        string_pool = ["zone1", "zone2"]
+        stream = io.BytesIO()
+        _TzdbStreamWriter._write(
+            stream,
+            string_pool,
+            self.__create_minimal_fields(string_pool),
+            # The index entry for zone1 will refer to a field containing zone2.
+            {
+                "zone1": self.__create_zone_data("zone2", string_pool),
+                "zone2": self.__create_zone_data("zone2", string_pool),
+            },
+        )
+        stream.seek(0)
+        data = _TzdbStreamData._from_stream(stream)
+        assert data.create_zone("zone2", "zone2").id == "zone2"
+        with pytest.raises(InvalidPyodaDataError):
+            data.create_zone("zone1", "zone1")
+
+    @pytest.mark.parametrize(
+        "block,entries",
+        [
+            # The block is five empty zone fields, at offsets 0, 2, 4, 6 and 8.
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 5, [(0, 0), (1, 2), (2, 4), (3, 6), (4, 10)]),  # Outside
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 5, [(0, 0), (1, 2), (2, 4), (3, 6), (4, 7)]),  # Not a start
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 5, [(0, 0), (1, 2), (2, 4), (3, 6)]),  # Field not indexed
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 5, [(0, 0), (1, 2), (2, 4), (3, 6), (3, 8)]),  # Zone twice
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 4 + bytes([0, 0]), [(0, 0), (1, 2), (2, 4), (3, 6)]),  # Other
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 4 + bytes([_TzdbStreamFieldId.TIME_ZONE, 5]), []),  # Overrun
+            (bytes([_TzdbStreamFieldId.TIME_ZONE, 0]) * 4 + bytes([_TzdbStreamFieldId.TIME_ZONE]), []),  # Truncated
+        ],
+    )
+    def test_zone_index_not_matching_stream_is_ignored(self, block: bytes, entries: list[tuple[int, int]]) -> None:
+        field = self.__create_zone_index_field(block_length=10, entries=entries)
+        builder = _TzdbStreamData._Builder(string_pool=[f"zone{i}" for i in range(5)])
+        stream = _MemoryViewStream(memoryview(block))
+        assert not builder._handle_zone_index_field(field, stream)
+        assert builder._zone_index is None
+        assert stream.tell() == 0
+
+    def test_stream_with_zone_index_not_matching_stream(self) -> None:
+        # An index which doesn't describe the fields after it (as a field from another version of the format which
+        # happened to use the same ID might not) is ignored, and the zones are read sequentially.
+        stream = self.__create_minimal_stream(["zone1", "zone2"], indexed=False)
+        data = bytearray(stream.getvalue())
+        fields = _MemoryViewStream(memoryview(bytes(data)))
+        fields.seek(4)
+        zone_start = fields.tell()
+        for field in _TzdbStreamField._read_fields(fields):
+            if field.id == _TzdbStreamFieldId.TIME_ZONE:
+                break
+            zone_start = fields.tell()
+        index = self.__create_zone_index_field(block_length=1, entries=[(0, 0)])
+        with index._create_stream() as index_data:
+            index_bytes = index_data.read()
+        data[zone_start:zone_start] = bytes([_TzdbStreamFieldId.ZONE_INDEX, len(index_bytes)]) + index_bytes
+        result = _TzdbStreamData._from_stream(io.BytesIO(data))
+        assert dict(result.tzdb_id_map) == {"zone1": "zone1", "zone2": "zone2"}
+        assert result.create_zone("zone1", "zone1").get_utc_offset(PyodaConstants.UNIX_EPOCH) == Offset.from_hours(2)
+
+    def test_unknown_fields_are_ignored_and_rewritten(self) -> None:
+        # Fields this version doesn't know about (8 is the next ID Noda Time would allocate) are ignored when reading,
+        # and kept when rewriting.
+        string_pool = ["zone1"]
+        stream = io.BytesIO()
+        _TzdbStreamWriter._write(
+            stream,
+            string_pool,
+            [*self.__create_minimal_fields(string_pool), (8, b"\x01\x02\x03")],
+            {"zone1": self.__create_zone_data("zone1", string_pool)},
+        )
+        stream.seek(0)
+        assert _TzdbStreamData._from_stream(stream).create_zone("zone1", "zone1").id == "zone1"
+
+        stream.seek(0)
+        rewritten = io.BytesIO()
+        _TzdbStreamWriter._rewrite(stream, rewritten, indexed=False)
+        rewritten.seek(4)
+        fields = list(_TzdbStreamField._read_fields(rewritten))
+        assert [field.id for field in fields if field.id not in list(_TzdbStreamFieldId)] == [8]
+
+    def test_bundled_data_has_zone_index(self) -> None:
+        # Tzdb.nzd is published by Noda Time without a zone index, and has to be rewritten by
+        # `python -m pyoda_time.time_zones.io` whenever it is updated.
+        stream = _MemoryViewStream(memoryview((resources.files("pyoda_time.time_zones") / "Tzdb.nzd").read_bytes()))
+        stream.seek(4)
+        builder = _TzdbStreamData._Builder()
+        for field in _TzdbStreamField._read_fields(stream):
+            if field.id == _TzdbStreamFieldId.STRING_POOL:
+                builder._handle_string_pool_field(field)
+            elif field.id == _TzdbStreamFieldId.ZONE_INDEX:
+                assert builder._handle_zone_index_field(field, stream), "The zone index in Tzdb.nzd doesn't match it"
+                break
+        else:
+            pytest.fail("Run `python -m pyoda_time.time_zones.io` over Tzdb.nzd")
+
+    def test_main(self, tmp_path: pathlib.Path) -> None:
+        sequential = tmp_path / "sequential.nzd"
+        sequential.write_bytes(self.__create_minimal_stream(["zone1", "zone2"], indexed=False).getvalue())
+        indexed = tmp_path / "indexed.nzd"
+        _main([str(sequential), str(indexed)])
+        assert indexed.read_bytes() == self.__create_minimal_stream(["zone1", "zone2"]).getvalue()
+        _main([str(indexed), str(indexed), "--sequential"])
+        assert indexed.read_bytes() == sequential.read_bytes()
+
+    def test_zone_index_missing_string_pool(self) -> None:
+        field = self.__create_zone_index_field(block_length=0, entries=[])
+        builder = _TzdbStreamData._Builder()
+        with pytest.raises(InvalidPyodaDataError):
+            builder._handle_zone_index_field(field, _MemoryViewStream(memoryview(b"")))
+
+    def test_duplicate_zone_index_field(self) -> None:
+        field = self.__create_zone_index_field(block_length=0, entries=[])
+        builder = _TzdbStreamData._Builder(string_pool=[])
+        builder._handle_zone_index_field(field, _MemoryViewStream(memoryview(b"")))
+        with pytest.raises(InvalidPyodaDataError):
+            builder._handle_zone_index_field(field, _MemoryViewStream(memoryview(b"")))
+
+    def test_duplicate_zone_in_index_and_field(self) -> None:
+        field = self.__create_zone_index_field(block_length=2, entries=[(0, 0)])
+        builder = _TzdbStreamData._Builder(string_pool=["zone1"])
+        assert builder._handle_zone_index_field(
+            field, _MemoryViewStream(memoryview(bytes([_TzdbStreamFieldId.TIME_ZONE, 0])))
+        )
+        with pytest.raises(InvalidPyodaDataError):
+            builder._handle_zone_field(_TzdbStreamField._ctor(_TzdbStreamFieldId.TIME_ZONE, bytearray(1)))
+
+    def test_writer_rejects_fields_it_writes_itself(self) -> None:
+        with pytest.raises(ValueError):
+            _TzdbStreamWriter._write(io.BytesIO(), [], [(_TzdbStreamFieldId.STRING_POOL, b"")], {})
+
+    def test_writer_rejects_zone_ids_missing_from_string_pool(self) -> None:
+        with pytest.raises(ValueError):
+            _TzdbStreamWriter._write(io.BytesIO(), [], [], {"zone1": b""})
+
+    @classmethod
+    def __create_minimal_stream(
+        cls, zone_ids: list[str], *, indexed: bool = True, truncated_zone: str | None = None
+    ) -> io.BytesIO:
+        string_pool = list(zone_ids)
+        zones = {
+            zone_id: cls.__create_zone_data(zone_id, string_pool, truncated=zone_id == truncated_zone)
+            for zone_id in zone_ids
+        }
+        stream = io.BytesIO()
+        _TzdbStreamWriter._write(stream, string_pool, cls.__create_minimal_fields(string_pool), zones, indexed=indexed)
+        stream.seek(0)
+        return stream
+
+    @staticmethod
+    def __create_minimal_fields(string_pool: list[str]) -> list[tuple[_TzdbStreamFieldId, bytes]]:
+        fields = []
+        with io.BytesIO() as data:
+            _DateTimeZoneWriter._ctor(data, None).write_string("tzdb-version")
+            fields.append((_TzdbStreamFieldId.TZDB_VERSION, data.getvalue()))
+        with io.BytesIO() as data:
+            _DateTimeZoneWriter._ctor(data, string_pool).write_dictionary({})
+            fields.append((_TzdbStreamFieldId.TZDB_ID_MAP, data.getvalue()))
+        with io.BytesIO() as data:
+            WindowsZones._ctor(
+                version="cldr-version", tzdb_version="tzdb-version", windows_version="windows-version", map_zones=[]
+            )._write(_DateTimeZoneWriter._ctor(data, string_pool))
+            fields.append((_TzdbStreamFieldId.CLDR_SUPPLEMENTAL_WINDOWS_ZONES, data.getvalue()))
+        return fields
+
+    @staticmethod
+    def __create_zone_data(zone_id: str, string_pool: list[str], *, truncated: bool = False) -> bytes:
+        with io.BytesIO() as data:
+            writer = _DateTimeZoneWriter._ctor(data, string_pool)
+            writer.write_string(zone_id)
+            if not truncated:
+                writer.write_byte(_DateTimeZoneWriter._DateTimeZoneType.FIXED)
+                writer.write_offset(Offset.from_hours(2))
+            return data.getvalue()
+
+    @staticmethod
+    def __create_zone_index_field(block_length: int, entries: list[tuple[int, int]]) -> _TzdbStreamField:
+        """Creates a zone index field from (string pool index, offset) pairs."""
+        with io.BytesIO() as data:
+            writer = _DateTimeZoneWriter._ctor(data, None)
+            writer.write_count(block_length)
+            writer.write_count(len(entries))
+            for string_pool_index, offset in entries:
+                writer.write_count(string_pool_index)
+                writer.write_count(offset)
+            return _TzdbStreamField._ctor(_TzdbStreamFieldId.ZONE_INDEX, data.getvalue())
+
     @staticmethod
     def __create_minimal_builder() -> _TzdbStreamData._Builder:
         return _TzdbStreamData._Builder(
@@ -6,7 +6,9 @@ import io
 import pytest
 
 from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter
+from pyoda_time.time_zones.io._memory_view_stream import _MemoryViewStream
 from pyoda_time.time_zones.io._tzdb_stream_field import _TzdbStreamField
+from pyoda_time.time_zones.io._tzdb_stream_field_id import _TzdbStreamFieldId
 from pyoda_time.utility import InvalidPyodaDataError
 
 
@@ -24,3 +26,34 @@ class TestTzdbStreamField:
 
         with pytest.raises(InvalidPyodaDataError):
             next(iterator)
+
+    def test_insufficient_data_memory_view_stream(self) -> None:
+        stream = io.BytesIO()
+        writer = _DateTimeZoneWriter._ctor(stream, None)
+        writer.write_byte(1)
+        writer.write_count(10)
+        writer.write_byte(0)
+
+        iterator = _TzdbStreamField._read_fields(_MemoryViewStream(memoryview(stream.getvalue())))
+
+        with pytest.raises(InvalidPyodaDataError):
+            next(iterator)
+
+    def test_fields_from_memory_view_stream_share_buffer(self) -> None:
+        stream = io.BytesIO()
+        writer = _DateTimeZoneWriter._ctor(stream, None)
+        writer.write_byte(1)
+        writer.write_count(3)
+        stream.write(b"abc")
+        writer.write_byte(2)
+        writer.write_count(2)
+        stream.write(b"de")
+        buffer = bytearray(stream.getvalue())
+
+        fields = list(_TzdbStreamField._read_fields(_MemoryViewStream(memoryview(buffer))))
+        assert [field.id for field in fields] == [_TzdbStreamFieldId(1), _TzdbStreamFieldId(2)]
+
+        # The fields are views onto the original buffer, not copies of it.
+        buffer[-1] = ord("x")
+        with fields[1]._create_stream() as field_stream:
+            assert field_stream.read() == b"dx"
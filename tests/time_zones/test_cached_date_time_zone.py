@@ -0,0 +1,113 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+import pytest
+
+from pyoda_time import DateTimeZone, DateTimeZoneProviders, Duration, Instant, LocalDateTime, Offset
+from pyoda_time.testing.time_zones import SingleTransitionDateTimeZone
+from pyoda_time.time_zones import ZoneInterval, ZoneLocalMapping
+from pyoda_time.time_zones._cached_date_time_zone import _CachedDateTimeZone
+from pyoda_time.time_zones._precalculated_date_time_zone import _PrecalculatedDateTimeZone
+from pyoda_time.time_zones._zone_interval_cache_statistics import ZoneIntervalCacheStatistics
+
+TRANSITION = Instant.from_utc(2000, 1, 1, 0, 0)
+
+# A zone with a 25 hour gap (from noon on December 31st 1999 to 1pm the next day), followed by a 2 hour overlap
+# (5pm to 7pm on January 2nd 2000).
+INTERVALS = [
+    ZoneInterval(
+        name="Before",
+        start=Instant._before_min_value(),
+        end=TRANSITION,
+        wall_offset=Offset.from_hours(-12),
+        savings=Offset.zero,
+    ),
+    ZoneInterval(
+        name="Skipped",
+        start=TRANSITION,
+        end=TRANSITION + Duration.from_hours(30),
+        wall_offset=Offset.from_hours(13),
+        savings=Offset.from_hours(1),
+    ),
+    ZoneInterval(
+        name="After",
+        start=TRANSITION + Duration.from_hours(30),
+        end=Instant._after_max_value(),
+        wall_offset=Offset.from_hours(11),
+        savings=Offset.zero,
+    ),
+]
+GAP_AND_OVERLAP_ZONE = _PrecalculatedDateTimeZone("GapAndOverlap", INTERVALS, None)
+
+
+def _mapping_tuple(mapping: ZoneLocalMapping) -> tuple[ZoneInterval, ZoneInterval, int]:
+    return mapping.early_interval, mapping.late_interval, mapping.count
+
+
+def _local_date_times_around_transitions(zone: DateTimeZone, start: Instant, end: Instant) -> list[LocalDateTime]:
+    local_date_times = []
+    for interval in zone.get_zone_intervals(start=start, end=end):
+        if not interval.has_start:
+            continue
+        for offset_hours in (-14, -1, 0, 1, 14):
+            for seconds in (-3601, -1, 0, 1, 1800, 3599, 3600):
+                instant = interval.start + Duration.from_seconds(seconds)
+                local_date_times.append(instant.with_offset(Offset.from_hours(offset_hours)).local_date_time)
+    return local_date_times
+
+
+class TestCachedDateTimeZone:
+    @pytest.mark.parametrize(("cache_size", "period_shift"), [(512, 5), (1, 0), (2, 1), (16, 10)])
+    def test_map_local_matches_uncached_zone(self, cache_size: int, period_shift: int) -> None:
+        zone = _CachedDateTimeZone._for_zone(GAP_AND_OVERLAP_ZONE, cache_size, period_shift)
+        local = LocalDateTime(1999, 12, 31, 0, 0)
+        while local < LocalDateTime(2000, 1, 4, 0, 0):
+            assert _mapping_tuple(zone.map_local(local)) == _mapping_tuple(GAP_AND_OVERLAP_ZONE.map_local(local))
+            local = local.plus_minutes(30)
+
+    @pytest.mark.parametrize(
+        "zone_id", ["Europe/London", "America/St_Johns", "Pacific/Apia", "Australia/Lord_Howe", "Asia/Kolkata"]
+    )
+    def test_map_local_matches_uncached_tzdb_zone(self, zone_id: str) -> None:
+        cached = DateTimeZoneProviders.tzdb[zone_id]
+        assert isinstance(cached, _CachedDateTimeZone)
+        uncached = cached._time_zone
+        for local in _local_date_times_around_transitions(
+            uncached, Instant.from_utc(1900, 1, 1, 0, 0), Instant.from_utc(2030, 1, 1, 0, 0)
+        ):
+            assert _mapping_tuple(cached.map_local(local)) == _mapping_tuple(uncached.map_local(local))
+
+    def test_map_local_returns_mapping_for_cached_zone(self) -> None:
+        zone = _CachedDateTimeZone._for_zone(GAP_AND_OVERLAP_ZONE)
+        mapping = zone.map_local(LocalDateTime(2000, 1, 2, 12, 0))
+        assert mapping.zone is zone
+        assert mapping.local_date_time == LocalDateTime(2000, 1, 2, 12, 0)
+        assert mapping.count == 1
+        assert mapping.early_interval == INTERVALS[1]
+
+    @pytest.mark.parametrize("local", [LocalDateTime.min_iso_value, LocalDateTime.max_iso_value])
+    def test_map_local_extremes(self, local: LocalDateTime) -> None:
+        uncached = SingleTransitionDateTimeZone(TRANSITION, Offset.from_hours(-5), Offset.from_hours(5))
+        zone = _CachedDateTimeZone._for_zone(uncached)
+        assert _mapping_tuple(zone.map_local(local)) == _mapping_tuple(uncached.map_local(local))
+
+    def test_conversions_use_local_instant_cache(self) -> None:
+        statistics = ZoneIntervalCacheStatistics._ctor()
+        zone = _CachedDateTimeZone._for_zone(GAP_AND_OVERLAP_ZONE, statistics=statistics)
+        local = LocalDateTime(2005, 6, 1, 12, 0)
+        zone.at_strictly(local)
+        assert (statistics.hits, statistics.misses) == (0, 1)
+        zone.at_leniently(local)
+        zone.at_start_of_day(local.date)
+        assert (statistics.hits, statistics.misses) == (2, 1)
+
+    def test_resolve_local_skipped_and_ambiguous(self) -> None:
+        zone = _CachedDateTimeZone._for_zone(GAP_AND_OVERLAP_ZONE)
+        # Noon on January 1st is skipped...
+        skipped = zone.at_leniently(LocalDateTime(2000, 1, 1, 12, 0))
+        expected = GAP_AND_OVERLAP_ZONE.at_leniently(LocalDateTime(2000, 1, 1, 12, 0))
+        assert skipped.to_offset_date_time() == expected.to_offset_date_time()
+        assert skipped.zone is zone
+        # ... and 6pm on January 2nd happens twice.
+        ambiguous = zone.map_local(LocalDateTime(2000, 1, 2, 18, 0))
+        assert _mapping_tuple(ambiguous) == (INTERVALS[1], INTERVALS[2], 2)
@@ -1,12 +1,16 @@
 # Copyright 2024 The Pyoda Time Authors. All rights reserved.
 # Use of this source code is governed by the Apache License 2.0,
 # as found in the LICENSE.txt file.
+import io
+import mmap
+import pathlib
+import struct
 from collections.abc import Iterable
 from typing import Final, cast
 
 import pytest
 
-from pyoda_time import DateTimeZone, Offset, PyodaConstants
+from pyoda_time import DateTimeZone, Duration, Instant, Offset, PyodaConstants
 from pyoda_time._date_time_zone_providers import DateTimeZoneProviders
 from pyoda_time.testing.time_zones import SingleTransitionDateTimeZone
 from pyoda_time.time_zones import (
@@ -15,6 +19,9 @@ from pyoda_time.time_zones import (
     IDateTimeZoneSource,
     InvalidDateTimeZoneSourceError,
 )
+from pyoda_time.time_zones._cached_date_time_zone import _CachedDateTimeZone
+from pyoda_time.time_zones._tzdb_date_time_zone_source import TzdbDateTimeZoneSource
+from pyoda_time.utility import InvalidPyodaDataError
 from pyoda_time.utility._csharp_compatibility import _csharp_modulo
 
 
@@ -244,3 +251,197 @@ class TestDateTimeZoneCache:
         cache = DateTimeZoneCache(source)
         with pytest.raises(DateTimeZoneNotFoundError):
             cache.get_system_default()
+
+    @pytest.mark.parametrize("cache_size", [0, -1, 3, 100])
+    def test_invalid_cache_size(self, cache_size: int) -> None:
+        with pytest.raises(ValueError):
+            DateTimeZoneCache(DummyDateTimeZoneSource(("Test1",)), cache_size=cache_size)
+
+    @pytest.mark.parametrize("period_shift", [-1, 17])
+    def test_invalid_period_shift(self, period_shift: int) -> None:
+        with pytest.raises(ValueError):
+            DateTimeZoneCache(DummyDateTimeZoneSource(("Test1",)), period_shift=period_shift)
+
+    def test_uncached_source_zones_are_returned_unchanged(self) -> None:
+        source = DummyDateTimeZoneSource(("Test1",))
+        provider = DateTimeZoneCache(source, cache_size=4)
+        zone = provider["Test1"]
+        assert zone.get_zone_interval(PyodaConstants.UNIX_EPOCH)
+        assert provider.cache_statistics.lookups == 0
+
+    def test_cache_statistics(self) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        statistics = provider.cache_statistics
+        zone = provider["Europe/London"]
+        instant = Instant.from_utc(2020, 6, 1, 0, 0)
+
+        zone.get_zone_interval(instant)
+        assert (statistics.hits, statistics.misses, statistics.evictions) == (0, 1, 0)
+        zone.get_zone_interval(instant)
+        assert (statistics.hits, statistics.misses, statistics.evictions) == (1, 1, 0)
+        assert statistics.lookups == 2
+        assert statistics.hit_ratio == 0.5
+
+        # Statistics are shared by every zone from the provider.
+        provider["America/New_York"].get_zone_interval(instant)
+        assert statistics.misses == 2
+
+        statistics.reset()
+        assert (statistics.hits, statistics.misses, statistics.evictions, statistics.hit_ratio) == (0, 0, 0, 0.0)
+
+    def test_cache_statistics_evictions(self) -> None:
+        # Two entries of a single day each: instants a multiple of two days apart share an entry.
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default, cache_size=2, period_shift=0)
+        zone = provider["Europe/London"]
+        zone.get_zone_interval(Instant.from_utc(2020, 6, 1, 0, 0))
+        zone.get_zone_interval(Instant.from_utc(2020, 6, 3, 0, 0))
+        zone.get_zone_interval(Instant.from_utc(2020, 6, 4, 0, 0))
+        statistics = provider.cache_statistics
+        assert (statistics.hits, statistics.misses, statistics.evictions) == (0, 3, 1)
+
+    @pytest.mark.parametrize(("cache_size", "period_shift"), [(1, 0), (2, 3), (512, 5), (4096, 8), (1, 16)])
+    def test_cache_settings_do_not_affect_results(self, cache_size: int, period_shift: int) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default, cache_size=cache_size, period_shift=period_shift)
+        for zone_id in ("Europe/London", "America/Sao_Paulo", "Australia/Lord_Howe"):
+            zone = provider[zone_id]
+            expected = DateTimeZoneProviders.tzdb[zone_id]
+            instant = Instant.from_utc(1950, 1, 1, 0, 0)
+            while instant < Instant.from_utc(2050, 1, 1, 0, 0):
+                assert zone.get_zone_interval(instant) == expected.get_zone_interval(instant)
+                instant += Duration.from_days(17)
+
+    def test_warm(self) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        provider.warm(2000, 2029, ["Europe/London", "Asia/Tokyo"])
+        statistics = provider.cache_statistics
+        assert statistics.lookups == 0
+
+        instant = Instant.from_utc(2000, 1, 1, 0, 0)
+        while instant < Instant.from_utc(2030, 1, 1, 0, 0):
+            provider["Europe/London"].get_zone_interval(instant)
+            provider["Asia/Tokyo"].get_zone_interval(instant)
+            instant += Duration.from_days(10)
+        assert statistics.misses == 0
+        assert statistics.hits > 0
+
+    def test_warm_all_zones(self) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        provider.warm(2020, 2020)
+        provider["Europe/Paris"].get_zone_interval(Instant.from_utc(2020, 6, 1, 0, 0))
+        assert provider.cache_statistics.hits == 1
+
+    def test_warm_invalid_arguments(self) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        with pytest.raises(ValueError):
+            provider.warm(2020, 2019)
+        with pytest.raises(DateTimeZoneNotFoundError):
+            provider.warm(2020, 2020, ["Unknown"])
+
+    @pytest.mark.parametrize("tail_zone_horizon_year", [0, 9999])
+    def test_invalid_tail_zone_horizon_year(self, tail_zone_horizon_year: int) -> None:
+        with pytest.raises(ValueError):
+            DateTimeZoneCache(TzdbDateTimeZoneSource.default, tail_zone_horizon_year=tail_zone_horizon_year)
+
+    def test_tail_zone_horizon_year(self) -> None:
+        zone_ids = ["Europe/London", "Australia/Sydney"]
+        snapshots = []
+        for tail_zone_horizon_year in (2030, None, 2200):
+            provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default, tail_zone_horizon_year=tail_zone_horizon_year)
+            provider.warm(2020, 2300, zone_ids)
+            for zone_id in zone_ids:
+                expected = DateTimeZoneProviders.tzdb[zone_id]
+                for year in range(2020, 2300, 7):
+                    instant = Instant.from_utc(year, 3, 1, 0, 0)
+                    assert provider[zone_id].get_zone_interval(instant) == expected.get_zone_interval(instant)
+            with io.BytesIO() as output:
+                provider.write_snapshot(output, zone_ids)
+                snapshots.append(len(output.getvalue()))
+        # Warming expands the zones' interval tables up to the horizon, and no further.
+        assert snapshots[0] < snapshots[1] < snapshots[2]
+
+    def test_snapshot_round_trip(self, tmp_path: pathlib.Path) -> None:
+        zone_ids = ["Europe/London", "Europe/Belfast", "America/St_Johns", "Etc/GMT-5", "UTC"]
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        provider.warm(2020, 2030, zone_ids)
+        path = tmp_path / "zones.snapshot"
+        with path.open("wb") as output:
+            provider.write_snapshot(output, zone_ids)
+
+        # The zones use the mapped memory directly, so it has to stay open for as long as they're in use.
+        with path.open("rb") as file:
+            snapshot = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        reloaded = DateTimeZoneCache(TzdbDateTimeZoneSource.default, snapshot=snapshot)
+        for zone_id in zone_ids:
+            zone = reloaded[zone_id]
+            expected = provider[zone_id]
+            assert zone.id == zone_id
+            assert (zone.min_offset, zone.max_offset) == (expected.min_offset, expected.max_offset)
+            instant = Instant.from_utc(1850, 1, 1, 0, 0)
+            while instant < Instant.from_utc(2150, 1, 1, 0, 0):
+                assert zone.get_zone_interval(instant) == expected.get_zone_interval(instant)
+                instant += Duration.from_days(97)
+        # Zones from the snapshot use the provider's own caches.
+        assert isinstance(reloaded["Europe/London"], _CachedDateTimeZone)
+        assert reloaded.cache_statistics.lookups > 0
+        # Zones which aren't in the snapshot are loaded from the source.
+        assert reloaded["Asia/Tokyo"].get_utc_offset(PyodaConstants.UNIX_EPOCH) == Offset.from_hours(9)
+
+    def test_snapshot_of_zones_from_snapshot(self) -> None:
+        zone_ids = ["Europe/London", "Asia/Tokyo"]
+        first = io.BytesIO()
+        DateTimeZoneCache(TzdbDateTimeZoneSource.default).write_snapshot(first, zone_ids)
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default, snapshot=first.getvalue())
+        provider["Europe/London"].get_zone_interval(Instant.from_utc(2090, 1, 1, 0, 0))
+        second = io.BytesIO()
+        provider.write_snapshot(second, zone_ids)
+        reloaded = DateTimeZoneCache(TzdbDateTimeZoneSource.default, snapshot=second.getvalue())
+        for zone_id in zone_ids:
+            instant = Instant.from_utc(1900, 1, 1, 0, 0)
+            while instant < Instant.from_utc(2120, 1, 1, 0, 0):
+                assert reloaded[zone_id].get_zone_interval(instant) == DateTimeZoneProviders.tzdb[
+                    zone_id
+                ].get_zone_interval(instant)
+                instant += Duration.from_days(61)
+
+    def test_snapshot_defaults_to_all_zones(self) -> None:
+        provider = DateTimeZoneCache(TzdbDateTimeZoneSource.default)
+        output = io.BytesIO()
+        provider.write_snapshot(output)
+        # A source which advertises the same zones, but can't provide any of them.
+        source = DummyDateTimeZoneSource(provider.ids)
+        source.version_id = provider.version_id
+        reloaded = DateTimeZoneCache(source, snapshot=output.getvalue())
+        for zone_id in provider.ids:
+            assert reloaded[zone_id].get_utc_offset(PyodaConstants.UNIX_EPOCH) == provider[zone_id].get_utc_offset(
+                PyodaConstants.UNIX_EPOCH
+            )
+        assert source.last_requested_id is None
+
+    def test_snapshot_leaves_out_unsupported_zones(self) -> None:
+        source = DummyDateTimeZoneSource(("Test1",))
+        provider = DateTimeZoneCache(source)
+        output = io.BytesIO()
+        provider.write_snapshot(output)
+        reloaded = DateTimeZoneCache(source, snapshot=output.getvalue())
+        source.last_requested_id = None
+        assert reloaded["Test1"].id == "Test1"
+        assert source.last_requested_id == "Test1"
+
+    def test_snapshot_for_different_source_version(self) -> None:
+        source = DummyDateTimeZoneSource(("Test1",))
+        output = io.BytesIO()
+        DateTimeZoneCache(source).write_snapshot(output)
+        source.version_id = "other version"
+        with pytest.raises(ValueError):
+            DateTimeZoneCache(source, snapshot=output.getvalue())
+
+    @pytest.mark.parametrize("length", [0, 7, 20])
+    def test_snapshot_truncated(self, length: int) -> None:
+        output = io.BytesIO()
+        DateTimeZoneCache(TzdbDateTimeZoneSource.default).write_snapshot(output, ["Europe/London"])
+        with pytest.raises(InvalidPyodaDataError):
+            DateTimeZoneCache(TzdbDateTimeZoneSource.default, snapshot=output.getvalue()[:length])
+
+    def test_snapshot_invalid_version(self) -> None:
+        with pytest.raises(InvalidPyodaDataError):
+            DateTimeZoneCache(TzdbDateTimeZoneSource.default, snapshot=struct.pack("ii", 1, 8))
@@ -16,6 +16,7 @@ from pyoda_time.time_zones._zone_recurrence import _ZoneRecurrence
 from pyoda_time.time_zones._zone_year_offset import _ZoneYearOffset
 from pyoda_time.time_zones.io._date_time_zone_reader import _DateTimeZoneReader
 from pyoda_time.time_zones.io._date_time_zone_writer import _DateTimeZoneWriter
+from pyoda_time.utility import InvalidPyodaDataError
 from pyoda_time.utility._csharp_compatibility import _CsharpConstants
 
 FIRST_INTERVAL = ZoneInterval(
@@ -357,3 +358,142 @@ class TestPrecalculatedDateTimeZone:
                 assert reloaded.get_zone_interval(interval.start) == TEST_ZONE.get_zone_interval(interval.start)
             if interval.has_end:
                 assert reloaded.get_zone_interval(interval.end) == TEST_ZONE.get_zone_interval(interval.end)
+
+    @pytest.mark.parametrize("year", [2006, 2050, 2100, 2101, 2500])
+    def test_get_zone_interval_expanded_tail_zone_matches_tail_zone(self, year: int) -> None:
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE)
+        for month in range(1, 13):
+            instant = Instant.from_utc(year, month, 1, 0, 0)
+            assert zone.get_zone_interval(instant) == TAIL_ZONE.get_zone_interval(instant)
+
+    def test_get_zone_interval_expanded_tail_zone_is_clamped(self) -> None:
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE)
+        # Populate the flat table first, then check the join with the precalculated periods is still seamless.
+        zone._expand_tail_zone(Instant.from_utc(2050, 1, 1, 0, 0))
+        assert zone.get_zone_interval(THIRD_INTERVAL.end) == CLAMPED_TAIL_ZONE_INTERVAL
+        assert zone.get_zone_interval(THIRD_INTERVAL.end - Duration.epsilon) == THIRD_INTERVAL
+
+    def test_get_zone_interval_horizon(self) -> None:
+        zone = _PrecalculatedDateTimeZone(
+            "Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE, tail_zone_horizon_year=2010
+        )
+        for year in (2009, 2010, 2011, 2012):
+            instant = Instant.from_utc(year, 7, 1, 0, 0)
+            assert zone.get_zone_interval(instant) == TAIL_ZONE.get_zone_interval(instant)
+
+    def test_get_zone_interval_tail_window(self) -> None:
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE)
+        # Forwards, backwards, and then a jump which replaces the window; each lookup is checked twice, as the second
+        # comes from the window.
+        instants = [Instant.from_utc(2040, 1, 1, 0, 0) + Duration.from_days(days) for days in range(0, 1500, 50)]
+        instants += reversed([Instant.from_utc(2030, 1, 1, 0, 0) + Duration.from_days(days) for days in range(3700)])
+        instants += [Instant.from_utc(2090, 6, 1, 0, 0), Instant.from_utc(2005, 6, 1, 0, 0)]
+        for instant in instants:
+            expected = TAIL_ZONE.get_zone_interval(instant)
+            if expected._raw_start < THIRD_INTERVAL.end:
+                expected = CLAMPED_TAIL_ZONE_INTERVAL
+            assert zone.get_zone_interval(instant) == expected
+            assert zone.get_zone_interval(instant) is zone.get_zone_interval(instant)
+
+    @pytest.mark.parametrize("year", [2006, 2050, 2100, 2500])
+    def test_expand_tail_zone(self, year: int) -> None:
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE)
+        zone.get_zone_interval(Instant.from_utc(2080, 1, 1, 0, 0))
+        zone._expand_tail_zone(Instant.from_utc(year, 1, 1, 0, 0))
+        assert zone.get_zone_interval(CLAMPED_TAIL_ZONE_INTERVAL.end - Duration.epsilon) == CLAMPED_TAIL_ZONE_INTERVAL
+        instant = CLAMPED_TAIL_ZONE_INTERVAL.end
+        while instant < Instant.from_utc(2110, 1, 1, 0, 0):
+            assert zone.get_zone_interval(instant) == TAIL_ZONE.get_zone_interval(instant)
+            instant += Duration.from_days(45)
+
+    def test_with_tail_zone_horizon_year(self) -> None:
+        zone = _PrecalculatedDateTimeZone(
+            "Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE, tail_zone_horizon_year=2010
+        )
+        zone._expand_tail_zone(Instant.from_utc(2200, 1, 1, 0, 0))
+        extended = zone._with_tail_zone_horizon_year(2050)
+        assert (extended.id, extended.min_offset, extended.max_offset) == (zone.id, zone.min_offset, zone.max_offset)
+        extended._expand_tail_zone(Instant.from_utc(2200, 1, 1, 0, 0))
+
+        # Only the new zone's table reaches 2050, which is reflected in its snapshot.
+        original_snapshot, extended_snapshot = io.BytesIO(), io.BytesIO()
+        zone._write_snapshot(original_snapshot)
+        extended._write_snapshot(extended_snapshot)
+        assert len(extended_snapshot.getvalue()) > len(original_snapshot.getvalue())
+        for year in (2009, 2011, 2049, 2051, 2100):
+            instant = Instant.from_utc(year, 7, 1, 0, 0)
+            assert extended.get_zone_interval(instant) == zone.get_zone_interval(instant)
+
+    def test_get_zone_interval_returns_same_instance(self) -> None:
+        instant = Instant.from_utc(2000, 5, 1, 0, 0)
+        assert TEST_ZONE.get_zone_interval(instant) is TEST_ZONE.get_zone_interval(instant)
+
+    def test_serialization_round_trip_all_intervals(self) -> None:
+        stream = io.BytesIO()
+        TEST_ZONE._write(_DateTimeZoneWriter._ctor(stream, None))
+        stream.seek(0)
+        reloaded = _PrecalculatedDateTimeZone._read(_DateTimeZoneReader._ctor(stream, None), TEST_ZONE.id)
+
+        assert isinstance(reloaded, _PrecalculatedDateTimeZone)
+
+        instant = Instant.from_utc(1990, 1, 1, 0, 0)
+        while instant < Instant.from_utc(2120, 1, 1, 0, 0):
+            assert reloaded.get_zone_interval(instant) == TEST_ZONE.get_zone_interval(instant)
+            instant += Duration.from_days(45)
+
+        # Writing the reloaded zone produces identical data, regardless of how far its table has been expanded.
+        rewritten = io.BytesIO()
+        reloaded._write(_DateTimeZoneWriter._ctor(rewritten, None))
+        assert rewritten.getvalue() == stream.getvalue()
+
+    @pytest.mark.parametrize("expanded_to_year", [None, 2050, 2200])
+    def test_snapshot_round_trip(self, expanded_to_year: int | None) -> None:
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, THIRD_INTERVAL], TAIL_ZONE)
+        if expanded_to_year is not None:
+            zone._expand_tail_zone(Instant.from_utc(expanded_to_year, 1, 1, 0, 0))
+        stream = io.BytesIO()
+        zone._write_snapshot(stream)
+        reloaded = _PrecalculatedDateTimeZone._read_snapshot(memoryview(stream.getvalue()), zone.id)
+
+        assert reloaded.id == zone.id
+        assert reloaded.min_offset == zone.min_offset
+        assert reloaded.max_offset == zone.max_offset
+        instant = Instant.from_utc(1990, 1, 1, 0, 0)
+        while instant < Instant.from_utc(2220, 1, 1, 0, 0):
+            assert reloaded.get_zone_interval(instant) == zone.get_zone_interval(instant)
+            instant += Duration.from_days(45)
+
+        # The precalculated periods are still distinguished from the tail zone intervals expanded into the table.
+        original = io.BytesIO()
+        zone._write(_DateTimeZoneWriter._ctor(original, None))
+        rewritten = io.BytesIO()
+        reloaded._write(_DateTimeZoneWriter._ctor(rewritten, None))
+        assert rewritten.getvalue() == original.getvalue()
+
+    def test_snapshot_round_trip_without_tail_zone(self) -> None:
+        last_interval = THIRD_INTERVAL._with_end(Instant._after_max_value())
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL, SECOND_INTERVAL, last_interval], None)
+        stream = io.BytesIO()
+        zone._write_snapshot(stream)
+        reloaded = _PrecalculatedDateTimeZone._read_snapshot(memoryview(stream.getvalue()), zone.id)
+        assert reloaded.get_zone_interval(Instant.from_utc(1900, 1, 1, 0, 0)) == FIRST_INTERVAL
+        assert reloaded.get_zone_interval(SECOND_INTERVAL.start) == SECOND_INTERVAL
+        assert reloaded.get_zone_interval(THIRD_INTERVAL.start) == last_interval
+        assert reloaded.get_zone_interval(Instant.from_utc(9000, 1, 1, 0, 0)) == last_interval
+
+    def test_snapshot_truncated(self) -> None:
+        stream = io.BytesIO()
+        TEST_ZONE._write_snapshot(stream)
+        with pytest.raises(InvalidPyodaDataError):
+            _PrecalculatedDateTimeZone._read_snapshot(memoryview(stream.getvalue()[:-1]), TEST_ZONE.id)
+
+    def test_snapshot_unsupported_for_transitions_outside_64_bit_range(self) -> None:
+        transition = Instant.from_utc(2300, 1, 1, 0, 0)
+        later_interval = ZoneInterval(
+            name="Later", start=transition, end=Instant._after_max_value(), wall_offset=Offset.zero, savings=Offset.zero
+        )
+        zone = _PrecalculatedDateTimeZone("Test", [FIRST_INTERVAL._with_end(transition), later_interval], None)
+        assert not zone._supports_snapshot
+        assert TEST_ZONE._supports_snapshot
+        with pytest.raises(RuntimeError):
+            zone._write_snapshot(io.BytesIO())
@@ -0,0 +1,93 @@
+# Copyright 2024 The Pyoda Time Authors. All rights reserved.
+# Use of this source code is governed by the Apache License 2.0,
+# as found in the LICENSE.txt file.
+import threading
+
+import pytest
+
+from pyoda_time.utility._cache import _Cache, _CacheStatistics
+
+
+class TestCache:
+    def test_fetch_value(self) -> None:
+        cache: _Cache[str, int] = _Cache(10, int)
+        assert cache.get_or_add("5") == 5
+
+    def test_fetch_same_value_twice_only_creates_once(self) -> None:
+        created: list[str] = []
+
+        def factory(key: str) -> int:
+            created.append(key)
+            return int(key)
+
+        cache: _Cache[str, int] = _Cache(10, factory)
+        assert cache.get_or_add("1") == 1
+        assert cache.get_or_add("1") == 1
+        assert created == ["1"]
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache: _Cache[str, int] = _Cache(2, int)
+        cache.get_or_add("1")
+        cache.get_or_add("2")
+        # Touching "1" makes "2" the least recently used.
+        cache.get_or_add("1")
+        cache.get_or_add("3")
+        assert cache.keys() == ["1", "3"]
+
+    def test_statistics(self) -> None:
+        cache: _Cache[str, int] = _Cache(2, int)
+        for key in ["1", "2", "1", "3", "2"]:
+            cache.get_or_add(key)
+        assert cache.statistics() == _CacheStatistics(hits=1, misses=4, size=2, capacity=2)
+
+    def test_reducing_capacity_evicts(self) -> None:
+        cache: _Cache[str, int] = _Cache(3, int)
+        for key in ["1", "2", "3"]:
+            cache.get_or_add(key)
+        cache.capacity = 1
+        assert cache.capacity == 1
+        assert cache.keys() == ["3"]
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_invalid_size(self, size: int) -> None:
+        with pytest.raises(ValueError):
+            _Cache(size, int)
+
+    def test_failed_value_is_not_cached(self) -> None:
+        cache: _Cache[str, int] = _Cache(10, int)
+        with pytest.raises(ValueError):
+            cache.get_or_add("x")
+        assert cache.count() == 0
+
+    def test_clear(self) -> None:
+        cache: _Cache[str, int] = _Cache(10, int)
+        cache.get_or_add("1")
+        cache.get_or_add("1")
+        cache.clear()
+        assert cache.statistics() == _CacheStatistics(hits=0, misses=0, size=0, capacity=10)
+
+    def test_reentrant_value_factory(self) -> None:
+        cache: _Cache[int, int]
+
+        def factory(key: int) -> int:
+            return 0 if key == 0 else cache.get_or_add(key - 1) + 1
+
+        cache = _Cache(10, factory)
+        assert cache.get_or_add(3) == 3
+        assert cache.count() == 4
+
+    def test_concurrent_callers_receive_the_same_value(self) -> None:
+        cache: _Cache[str, object] = _Cache(10, lambda key: object())
+        barrier = threading.Barrier(8)
+        results: list[object] = []
+
+        def fetch() -> None:
+            barrier.wait()
+            results.append(cache.get_or_add("key"))
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(result) for result in results}) == 1
@@ -4,18 +4,21 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import Annotated
 
 import pytest
 
 from pyoda_time.utility._csharp_compatibility import (
     SEALED_CLASSES,
+    _csharp_modulo,
     _CsharpConstants,
     _int32_overflow,
     _int64_overflow,
     _private,
     _sealed,
     _to_lookup,
+    _towards_zero_division,
 )
 
 
@@ -145,3 +148,55 @@ def test_to_lookup() -> None:
         "spam eggs": ["baz"],
     }
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,expected",
+    [
+        (7, 2, 3),
+        (-7, 2, -3),
+        (7, -2, -3),
+        (-7, -2, 3),
+        (6, 3, 2),
+        (-6, 3, -2),
+        (0, 5, 0),
+        (0, -5, 0),
+        (1, 2, 0),
+        (-1, 2, 0),
+        # Values well beyond the default precision of the decimal module
+        (-(10**40) - 1, 10**20, -(10**20)),
+        (_CsharpConstants.LONG_MIN_VALUE, 864_000_000_000, -10675199),
+        (_CsharpConstants.LONG_MAX_VALUE, 864_000_000_000, 10675199),
+        # Non-integer operands
+        (7.9, 1, 7),
+        (-7.9, 1, -7),
+        (Decimal("-7.5"), 2, -3),
+        (7, 2.0, 3),
+    ],
+)
+def test_towards_zero_division(x: float | Decimal, y: float | Decimal, expected: int) -> None:
+    actual = _towards_zero_division(x, y)
+    assert actual == expected
+    assert type(actual) is int
+
+
+def test_towards_zero_division_by_zero() -> None:
+    with pytest.raises(ZeroDivisionError):
+        _towards_zero_division(1, 0)
+
+
+@pytest.mark.parametrize(
+    "dividend,divisor,expected",
+    [
+        (7, 3, 1),
+        (-7, 3, -1),
+        (7, -3, 1),
+        (-7, -3, -1),
+        (6, 3, 0),
+        (-6, 3, 0),
+        (0, 3, 0),
+    ],
+)
+def test_csharp_modulo(dividend: int, divisor: int, expected: int) -> None:
+    assert _csharp_modulo(dividend, divisor) == expected
+    assert _towards_zero_division(dividend, divisor) * divisor + _csharp_modulo(dividend, divisor) == dividend